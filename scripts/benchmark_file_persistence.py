@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""Compare fsync counts and write latency for each file_persistence durability tier."""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+
+def _add_app_to_path():
+    script_path = Path(__file__).resolve()
+    candidates = [
+        script_path.parents[1],
+        Path("/opt/SimpleSaferServer"),
+    ]
+    for candidate in candidates:
+        if (candidate / "simple_safer_server").exists():
+            sys.path.insert(0, str(candidate))
+            return
+
+
+_add_app_to_path()
+
+from simple_safer_server.services.file_persistence import (  # noqa: E402
+    BATCHED,
+    DURABLE,
+    VOLATILE,
+    CoalescingJsonWriter,
+    atomic_write_json,
+    flush_batched_writes,
+)
+
+PAYLOAD = {"status": "running", "phase": "Unpacking", "progress": 0, "error": None}
+
+
+def _measure(label, write, finish, writes):
+    real_fsync = os.fsync
+    fsync_calls = 0
+
+    def counting_fsync(fd):
+        nonlocal fsync_calls
+        fsync_calls += 1
+        real_fsync(fd)
+
+    latencies = []
+    with patch("os.fsync", counting_fsync):
+        started = time.perf_counter()
+        for index in range(writes):
+            write_started = time.perf_counter()
+            write({**PAYLOAD, "progress": index})
+            latencies.append(time.perf_counter() - write_started)
+        # Include the deferred commit so batched and coalesced tiers are
+        # charged for the disk work they postpone.
+        finish()
+        total = time.perf_counter() - started
+    latencies.sort()
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    print(
+        f"{label:<22} fsyncs={fsync_calls:<6} "
+        f"median={statistics.median(latencies) * 1e6:9.1f}us "
+        f"p99={p99 * 1e6:9.1f}us total={total * 1e3:8.1f}ms"
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--writes", type=int, default=200)
+    parser.add_argument(
+        "--dir", type=Path, default=None, help="directory on the disk to measure (default: tmp)"
+    )
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory(dir=args.dir) as temp_dir:
+        path = Path(temp_dir) / "state.json"
+        for tier in (DURABLE, BATCHED, VOLATILE):
+            _measure(
+                tier,
+                lambda payload, tier=tier: atomic_write_json(path, payload, durability=tier),
+                flush_batched_writes,
+                args.writes,
+            )
+        writer = CoalescingJsonWriter()
+        _measure(
+            "coalesced (volatile)",
+            lambda payload: writer.publish(path, payload, durability=VOLATILE),
+            writer.flush,
+            args.writes,
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -20,7 +20,11 @@ _add_app_to_path()
 
 from simple_safer_server.services.config_manager import ConfigManager  # noqa: E402
 from simple_safer_server.services.drive_health import (  # noqa: E402
+    DriveHealthSummaryService,
+    get_drive_health_settings,
+    get_drive_health_summary_path,
     hdsentinel_snapshot_has_health,
+    run_drive_health_monitor,
     run_scheduled_drive_health_check,
 )
 from simple_safer_server.services.runtime import get_runtime  # noqa: E402
@@ -32,12 +36,46 @@ def main():
     config_manager = ConfigManager(runtime=runtime)
     system_utils = SystemUtils(runtime=runtime)
 
+    # Publishing to the shared summary file lets the dashboard show this
+    # check in every web worker without probing the drive again.
     result = run_scheduled_drive_health_check(
         config_manager,
         system_utils,
         runtime=runtime,
+        summary_service=DriveHealthSummaryService(get_drive_health_summary_path(runtime)),
     )
 
+    if result.get('skipped'):
+        print(result['skipped'])
+    else:
+        _print_backup_drive_result(result)
+
+    _run_drive_monitor(config_manager, runtime, result)
+
+
+def _run_drive_monitor(config_manager, runtime, result):
+    # The backup drive check above owns alerting and the exit status; the
+    # per-drive summaries are only stored for the Drive Health page, so a
+    # failure here is reported without failing the check.
+    known_summaries = {}
+    if result.get('summary') and result.get('device'):
+        known_summaries[result['device']] = result['summary']
+    try:
+        drives = run_drive_health_monitor(
+            config_manager,
+            runtime=runtime,
+            wake_drives=get_drive_health_settings(config_manager)['wake_for_scheduled_check'],
+            known_summaries=known_summaries,
+        )
+    except Exception as exc:
+        print(f"All drives check failed: {exc}", file=sys.stderr)
+        return
+    for drive in drives:
+        if drive.get('connected'):
+            print(f"{drive['device']} ({drive['serial']}): {drive['detail']}")
+
+
+def _print_backup_drive_result(result):
     if result.get('smart') is not None and result.get('device'):
         print(f"SMART details collected for {result['device']}.")
 
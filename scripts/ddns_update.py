@@ -25,7 +25,7 @@ def _add_app_to_path():
 _add_app_to_path()
 
 from simple_safer_server.services.config_manager import ConfigManager  # noqa: E402
-from simple_safer_server.services.file_persistence import atomic_write_json  # noqa: E402
+from simple_safer_server.services.file_persistence import VOLATILE, atomic_write_json  # noqa: E402
 from simple_safer_server.services.runtime import get_runtime  # noqa: E402
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -177,13 +177,16 @@ def main():
     status_data['last_check'] = datetime.now().isoformat()
     provider_failures = []
 
+    # Decrypt both provider tokens in one pass over .secrets.
+    tokens = config.get_secrets(['duckdns_token', 'cloudflare_token'], '')
+
     previous_duckdns_message = status_data.get('duckdns', {}).get('message')
     # Copy the saved provider status before updating it, so alert de-dupe can
     # compare this run's message against the status from the last completed run.
     duckdns_new_status = dict(status_data.get('duckdns', {}))
     if duckdns_enabled:
         domain = config.get_value('ddns', 'duckdns_domain', '')
-        token = config.get_secret('duckdns_token', '')
+        token = tokens['duckdns_token']
         if domain and token:
             success, msg = update_duckdns(domain, token, ipv4)
             duckdns_new_status['status'] = 'Success' if success else 'Error'
@@ -212,7 +215,7 @@ def main():
         zone = config.get_value('ddns', 'cloudflare_zone', '')
         record = config.get_value('ddns', 'cloudflare_record', '')
         proxy = config.get_value('ddns', 'cloudflare_proxy', 'false')
-        token = config.get_secret('cloudflare_token', '')
+        token = tokens['cloudflare_token']
         if zone and record and token:
             if ipv4:
                 success, msg = update_cloudflare(zone, token, record, ipv4, proxy)
@@ -244,7 +247,7 @@ def main():
 
     # Write atomically: write to a temp file in the same directory then rename, so
     # concurrent reads by the web API never see a partial/empty file.
-    atomic_write_json(status_file, status_data, mode=0o644, durable=False)
+    atomic_write_json(status_file, status_data, mode=0o644, durability=VOLATILE)
 
     if provider_failures:
         # The status file is still the source of provider details; the exit code
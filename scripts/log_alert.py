@@ -23,22 +23,28 @@ def _add_app_to_path():
 
 _add_app_to_path()
 
-from simple_safer_server.services.alert_store import AlertStore  # noqa: E402
+from simple_safer_server.services.alert_store import (  # noqa: E402
+    ALERTS_DB_FILENAME,
+    AlertStore,
+)
 
 
 def log_alert(title, message, alert_type="info", source="script"):
-    """Log an alert to the alerts file"""
+    """Log an alert to the shared alert store"""
     try:
         config_dir = Path(os.environ.get('SSS_CONFIG_DIR', '/etc/SimpleSaferServer'))
-        alerts_path = config_dir / 'alerts.json'
+        alerts_path = config_dir / ALERTS_DB_FILENAME
 
         config_dir.mkdir(parents=True, exist_ok=True)
         # This directory also holds encrypted secrets, so the alert script must
         # preserve ConfigManager's private-directory policy when it runs first.
         config_dir.chmod(0o700)
         store = AlertStore(alerts_path)
-        store.initialize()
-        store.append_alert(title, message, alert_type=alert_type, source=source)
+        try:
+            store.initialize()
+            store.append_alert(title, message, alert_type=alert_type, source=source)
+        finally:
+            store.close()
 
         print(f"Alert logged: {title}")
         return True
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""Record a finished task unit run in the task history store (ExecStopPost hook)."""
+
+import logging
+import os
+import sys
+from pathlib import Path
+
+
+def _add_app_to_path():
+    script_path = Path(__file__).resolve()
+    candidates = [
+        script_path.parents[1],
+        Path("/opt/SimpleSaferServer"),
+    ]
+    for candidate in candidates:
+        if (candidate / "simple_safer_server").exists():
+            sys.path.insert(0, str(candidate))
+            return
+
+
+_add_app_to_path()
+
+from simple_safer_server.adapters.systemd import SystemdAdapter  # noqa: E402
+from simple_safer_server.services.runtime import get_runtime  # noqa: E402
+from simple_safer_server.services.task_history import (  # noqa: E402
+    TASK_HISTORY_FILENAME,
+    TaskHistoryStore,
+)
+from simple_safer_server.services.task_service import (  # noqa: E402
+    TASK_SYSTEMD_PROPERTIES,
+    finished_run_from_properties,
+)
+
+logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
+LOGGER = logging.getLogger(__name__)
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) != 1:
+        print("Usage: record_task_run.py <unit-name>", file=sys.stderr)
+        return 2
+    unit_name = argv[0]
+    try:
+        properties = SystemdAdapter().snapshot([unit_name], TASK_SYSTEMD_PROPERTIES)[unit_name]
+        # systemd only settles Result after ExecStopPost, so use the outcome it
+        # hands to the hook instead.
+        run = finished_run_from_properties(
+            unit_name,
+            properties,
+            result=os.environ.get("SERVICE_RESULT") or "success",
+        )
+        if run is None:
+            LOGGER.info("No finished run to record for %s", unit_name)
+            return 0
+        exit_status = os.environ.get("EXIT_STATUS", "")
+        if exit_status.isdigit():
+            run["exit_code"] = int(exit_status)
+        store = TaskHistoryStore(get_runtime().data_dir / TASK_HISTORY_FILENAME)
+        try:
+            store.record_runs([run])
+            store.prune()
+        finally:
+            store.close()
+    except Exception:
+        # History is a convenience; never fail the unit because it could not be recorded.
+        LOGGER.exception("Could not record task run history for %s", unit_name)
+        return 0
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
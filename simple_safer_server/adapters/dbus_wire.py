@@ -0,0 +1,477 @@
+import os
+import socket
+import struct
+import threading
+from collections.abc import Callable
+from contextlib import suppress
+from dataclasses import dataclass, field
+from typing import Any
+
+SYSTEM_BUS_SOCKET_PATH = "/run/dbus/system_bus_socket"
+DBUS_CALL_TIMEOUT_SECONDS = 5.0
+
+METHOD_CALL = 1
+METHOD_RETURN = 2
+ERROR = 3
+SIGNAL = 4
+
+_HEADER_PATH = 1
+_HEADER_INTERFACE = 2
+_HEADER_MEMBER = 3
+_HEADER_ERROR_NAME = 4
+_HEADER_REPLY_SERIAL = 5
+_HEADER_DESTINATION = 6
+_HEADER_SENDER = 7
+_HEADER_SIGNATURE = 8
+
+_HEADER_FIELD_SIGNATURES = {
+    _HEADER_PATH: "o",
+    _HEADER_INTERFACE: "s",
+    _HEADER_MEMBER: "s",
+    _HEADER_ERROR_NAME: "s",
+    _HEADER_REPLY_SERIAL: "u",
+    _HEADER_DESTINATION: "s",
+    _HEADER_SENDER: "s",
+    _HEADER_SIGNATURE: "g",
+}
+
+_FIXED_TYPES = {
+    "y": ("B", 1),
+    "b": ("I", 4),
+    "n": ("h", 2),
+    "q": ("H", 2),
+    "i": ("i", 4),
+    "u": ("I", 4),
+    "x": ("q", 8),
+    "t": ("Q", 8),
+    "d": ("d", 8),
+    "h": ("I", 4),
+}
+_ALIGNMENT = {"s": 4, "o": 4, "g": 1, "a": 4, "(": 8, "{": 8, "v": 1}
+
+
+class DBusError(Exception):
+    """Raised when the bus answers a method call with an error message."""
+
+    def __init__(self, name: str, message: str = "") -> None:
+        super().__init__(f"{name}: {message}" if message else name)
+        self.name = name
+
+
+class DBusConnectionClosed(ConnectionError):
+    """Raised when a call cannot complete because the bus connection is gone."""
+
+
+@dataclass
+class DBusMessage:
+    message_type: int
+    serial: int = 0
+    path: str | None = None
+    interface: str | None = None
+    member: str | None = None
+    error_name: str | None = None
+    reply_serial: int | None = None
+    destination: str | None = None
+    sender: str | None = None
+    signature: str = ""
+    body: list[Any] = field(default_factory=list)
+    flags: int = 0
+
+
+def split_signature(signature: str) -> list[str]:
+    """Split a D-Bus signature into its complete single types."""
+    types: list[str] = []
+    index = 0
+    while index < len(signature):
+        end = _single_type_end(signature, index)
+        types.append(signature[index:end])
+        index = end
+    return types
+
+
+def _single_type_end(signature: str, index: int) -> int:
+    code = signature[index]
+    if code == "a":
+        return _single_type_end(signature, index + 1)
+    if code in "({":
+        closing = ")" if code == "(" else "}"
+        depth = 0
+        for position in range(index, len(signature)):
+            if signature[position] == code:
+                depth += 1
+            elif signature[position] == closing:
+                depth -= 1
+                if depth == 0:
+                    return position + 1
+        raise ValueError(f"Unterminated container in D-Bus signature: {signature!r}")
+    if code in _FIXED_TYPES or code in "sogv":
+        return index + 1
+    raise ValueError(f"Unsupported D-Bus type code {code!r} in {signature!r}")
+
+
+def _alignment(type_code: str) -> int:
+    if type_code in _FIXED_TYPES:
+        return _FIXED_TYPES[type_code][1]
+    return _ALIGNMENT[type_code]
+
+
+class _Writer:
+    def __init__(self) -> None:
+        self.buffer = bytearray()
+
+    def pad(self, alignment: int) -> None:
+        self.buffer.extend(b"\0" * (-len(self.buffer) % alignment))
+
+    def write(self, signature: str, value: Any) -> None:
+        code = signature[0]
+        self.pad(_alignment(code))
+        if code in _FIXED_TYPES:
+            fmt, _size = _FIXED_TYPES[code]
+            self.buffer.extend(struct.pack("<" + fmt, int(value) if code == "b" else value))
+        elif code in "so":
+            encoded = value.encode("utf-8")
+            self.buffer.extend(struct.pack("<I", len(encoded)))
+            self.buffer.extend(encoded + b"\0")
+        elif code == "g":
+            encoded = value.encode("ascii")
+            self.buffer.extend(struct.pack("<B", len(encoded)))
+            self.buffer.extend(encoded + b"\0")
+        elif code == "v":
+            # Variants are passed as (signature, value) pairs because Python types
+            # cannot say whether 1 should travel as a byte, int32, or uint64.
+            inner_signature, inner_value = value
+            self.write("g", inner_signature)
+            self.write(inner_signature, inner_value)
+        elif code == "a":
+            self._write_array(signature[1:], value)
+        elif code in "({":
+            for item_signature, item in zip(split_signature(signature[1:-1]), value, strict=True):
+                self.write(item_signature, item)
+        else:
+            raise ValueError(f"Unsupported D-Bus type code {code!r}")
+
+    def _write_array(self, element_signature: str, value: Any) -> None:
+        length_offset = len(self.buffer)
+        self.buffer.extend(b"\0\0\0\0")
+        self.pad(_alignment(element_signature[0]))
+        start = len(self.buffer)
+        items = value.items() if element_signature[0] == "{" else value
+        for item in items:
+            self.write(element_signature, item)
+        struct.pack_into("<I", self.buffer, length_offset, len(self.buffer) - start)
+
+
+class _Reader:
+    def __init__(self, data: bytes, endian: str, offset: int = 0) -> None:
+        self.data = data
+        self.endian = endian
+        self.offset = offset
+
+    def align(self, alignment: int) -> None:
+        self.offset += -self.offset % alignment
+
+    def read(self, signature: str) -> Any:
+        code = signature[0]
+        self.align(_alignment(code))
+        if code in _FIXED_TYPES:
+            fmt, size = _FIXED_TYPES[code]
+            (value,) = struct.unpack_from(self.endian + fmt, self.data, self.offset)
+            self.offset += size
+            return bool(value) if code == "b" else value
+        if code in "so":
+            (length,) = struct.unpack_from(self.endian + "I", self.data, self.offset)
+            start = self.offset + 4
+            self.offset = start + length + 1
+            return self.data[start : start + length].decode("utf-8")
+        if code == "g":
+            length = self.data[self.offset]
+            start = self.offset + 1
+            self.offset = start + length + 1
+            return self.data[start : start + length].decode("ascii")
+        if code == "v":
+            return self.read(self.read("g"))
+        if code == "a":
+            return self._read_array(signature[1:])
+        if code in "({":
+            values = [self.read(item) for item in split_signature(signature[1:-1])]
+            return tuple(values)
+        raise ValueError(f"Unsupported D-Bus type code {code!r}")
+
+    def _read_array(self, element_signature: str) -> Any:
+        (length,) = struct.unpack_from(self.endian + "I", self.data, self.offset)
+        self.offset += 4
+        self.align(_alignment(element_signature[0]))
+        end = self.offset + length
+        items = []
+        while self.offset < end:
+            items.append(self.read(element_signature))
+        if element_signature[0] == "{":
+            return dict(items)
+        if element_signature == "y":
+            return bytes(items)
+        return items
+
+
+def encode_message(message: DBusMessage) -> bytes:
+    body_writer = _Writer()
+    for item_signature, item in zip(split_signature(message.signature), message.body, strict=True):
+        body_writer.write(item_signature, item)
+    body = bytes(body_writer.buffer)
+
+    fields = []
+    for code, value in (
+        (_HEADER_PATH, message.path),
+        (_HEADER_INTERFACE, message.interface),
+        (_HEADER_MEMBER, message.member),
+        (_HEADER_ERROR_NAME, message.error_name),
+        (_HEADER_REPLY_SERIAL, message.reply_serial),
+        (_HEADER_DESTINATION, message.destination),
+        (_HEADER_SENDER, message.sender),
+        (_HEADER_SIGNATURE, message.signature or None),
+    ):
+        if value is not None:
+            fields.append((code, (_HEADER_FIELD_SIGNATURES[code], value)))
+
+    header = _Writer()
+    header.write("y", ord("l"))
+    header.write("y", message.message_type)
+    header.write("y", message.flags)
+    header.write("y", 1)
+    header.write("u", len(body))
+    header.write("u", message.serial)
+    header.write("a(yv)", fields)
+    header.pad(8)
+    return bytes(header.buffer) + body
+
+
+def message_length(data: bytes) -> int | None:
+    """Return the full length of the message at the start of ``data`` once known."""
+    if len(data) < 16:
+        return None
+    endian = "<" if data[0:1] == b"l" else ">"
+    body_length, _serial, fields_length = struct.unpack_from(endian + "III", data, 4)
+    header_length = 16 + fields_length
+    header_length += -header_length % 8
+    return header_length + body_length
+
+
+def decode_message(data: bytes) -> DBusMessage:
+    endian = "<" if data[0:1] == b"l" else ">"
+    reader = _Reader(data, endian, 1)
+    message_type = reader.read("y")
+    flags = reader.read("y")
+    reader.read("y")
+    body_length = reader.read("u")
+    serial = reader.read("u")
+    fields = dict(reader.read("a(yv)"))
+    reader.align(8)
+    signature = fields.get(_HEADER_SIGNATURE, "")
+    body_reader = _Reader(data[reader.offset : reader.offset + body_length], endian)
+    body = [body_reader.read(item) for item in split_signature(signature)]
+    return DBusMessage(
+        message_type=message_type,
+        serial=serial,
+        path=fields.get(_HEADER_PATH),
+        interface=fields.get(_HEADER_INTERFACE),
+        member=fields.get(_HEADER_MEMBER),
+        error_name=fields.get(_HEADER_ERROR_NAME),
+        reply_serial=fields.get(_HEADER_REPLY_SERIAL),
+        destination=fields.get(_HEADER_DESTINATION),
+        sender=fields.get(_HEADER_SENDER),
+        signature=signature,
+        body=body,
+        flags=flags,
+    )
+
+
+def system_bus_socket_path() -> str:
+    address = os.environ.get("DBUS_SYSTEM_BUS_ADDRESS", "").strip()
+    for entry in address.split(";"):
+        transport, _separator, options = entry.partition(":")
+        if transport != "unix":
+            continue
+        for option in options.split(","):
+            key, _separator, value = option.partition("=")
+            if key == "path" and value:
+                return value
+    return SYSTEM_BUS_SOCKET_PATH
+
+
+class DBusConnection:
+    """Long-lived client connection to a D-Bus message bus.
+
+    One reader thread owns the socket's receive side. Method calls wait for their
+    reply on an event, and signals go to registered handlers on the reader thread,
+    so handlers must not block or issue calls of their own.
+    """
+
+    def __init__(self, sock: socket.socket) -> None:
+        self._sock = sock
+        self._send_lock = threading.Lock()
+        self._state_lock = threading.Lock()
+        self._serial = 0
+        self._pending: dict[int, tuple[threading.Event, list[DBusMessage]]] = {}
+        self._signal_handlers: list[Callable[[DBusMessage], None]] = []
+        self._closed = False
+        self._reader: threading.Thread | None = None
+        self.unique_name = ""
+
+    @classmethod
+    def system_bus(cls, *, timeout: float = DBUS_CALL_TIMEOUT_SECONDS) -> DBusConnection:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.settimeout(timeout)
+            sock.connect(system_bus_socket_path())
+            connection = cls(sock)
+            connection.authenticate()
+            connection.start()
+            connection.unique_name = connection.call(
+                "org.freedesktop.DBus",
+                "/org/freedesktop/DBus",
+                "org.freedesktop.DBus",
+                "Hello",
+                timeout=timeout,
+            )[0]
+        except BaseException:
+            sock.close()
+            raise
+        return connection
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def authenticate(self) -> None:
+        # The service runs as root on the same host as the bus, so SASL EXTERNAL
+        # with the process uid is the only mechanism worth supporting here.
+        uid_hex = str(os.getuid()).encode("ascii").hex()
+        self._sock.sendall(b"\0" + f"AUTH EXTERNAL {uid_hex}\r\n".encode("ascii"))
+        response = self._read_auth_line()
+        if not response.startswith(b"OK "):
+            raise DBusError(
+                "org.freedesktop.DBus.Error.AuthFailed", response.decode(errors="replace")
+            )
+        self._sock.sendall(b"BEGIN\r\n")
+
+    def _read_auth_line(self) -> bytes:
+        line = b""
+        while not line.endswith(b"\r\n"):
+            chunk = self._sock.recv(1)
+            if not chunk:
+                raise DBusConnectionClosed("D-Bus closed the connection during authentication")
+            line += chunk
+        return line.strip()
+
+    def start(self) -> None:
+        self._sock.settimeout(None)
+        self._reader = threading.Thread(target=self._read_loop, name="dbus-reader", daemon=True)
+        self._reader.start()
+
+    def add_signal_handler(self, handler: Callable[[DBusMessage], None]) -> None:
+        self._signal_handlers.append(handler)
+
+    def add_match(self, rule: str) -> None:
+        self.call(
+            "org.freedesktop.DBus",
+            "/org/freedesktop/DBus",
+            "org.freedesktop.DBus",
+            "AddMatch",
+            "s",
+            [rule],
+        )
+
+    def call(
+        self,
+        destination: str,
+        path: str,
+        interface: str,
+        member: str,
+        signature: str = "",
+        body: list[Any] | None = None,
+        *,
+        timeout: float = DBUS_CALL_TIMEOUT_SECONDS,
+    ) -> list[Any]:
+        event = threading.Event()
+        replies: list[DBusMessage] = []
+        with self._state_lock:
+            if self._closed:
+                raise DBusConnectionClosed("D-Bus connection is closed")
+            self._serial += 1
+            serial = self._serial
+            self._pending[serial] = (event, replies)
+        message = DBusMessage(
+            METHOD_CALL,
+            serial=serial,
+            path=path,
+            interface=interface,
+            member=member,
+            destination=destination,
+            signature=signature,
+            body=list(body or []),
+        )
+        try:
+            try:
+                with self._send_lock:
+                    self._sock.sendall(encode_message(message))
+            except OSError as exc:
+                self.close()
+                raise DBusConnectionClosed(str(exc)) from exc
+            if not event.wait(timeout):
+                raise TimeoutError(f"D-Bus call {interface}.{member} timed out")
+        finally:
+            with self._state_lock:
+                self._pending.pop(serial, None)
+        if not replies:
+            raise DBusConnectionClosed("D-Bus connection closed before the reply arrived")
+        reply = replies[0]
+        if reply.message_type == ERROR:
+            detail = reply.body[0] if reply.body and isinstance(reply.body[0], str) else ""
+            raise DBusError(reply.error_name or "org.freedesktop.DBus.Error.Failed", detail)
+        return reply.body
+
+    def close(self) -> None:
+        with self._state_lock:
+            if self._closed:
+                return
+            self._closed = True
+            pending = list(self._pending.values())
+        for event, _replies in pending:
+            event.set()
+        with suppress(OSError):
+            self._sock.shutdown(socket.SHUT_RDWR)
+        self._sock.close()
+
+    def _read_loop(self) -> None:
+        buffer = b""
+        try:
+            while True:
+                chunk = self._sock.recv(65536)
+                if not chunk:
+                    break
+                buffer += chunk
+                while True:
+                    length = message_length(buffer)
+                    if length is None or len(buffer) < length:
+                        break
+                    message = decode_message(buffer[:length])
+                    buffer = buffer[length:]
+                    self._dispatch(message)
+        except OSError, ValueError, struct.error:
+            pass
+        finally:
+            self.close()
+
+    def _dispatch(self, message: DBusMessage) -> None:
+        if message.message_type in {METHOD_RETURN, ERROR}:
+            with self._state_lock:
+                pending = self._pending.get(message.reply_serial or 0)
+            if pending is not None:
+                event, replies = pending
+                replies.append(message)
+                event.set()
+        elif message.message_type == SIGNAL:
+            for handler in list(self._signal_handlers):
+                # A faulty handler must not take down the reader thread, or every
+                # later call on this connection would hang until its timeout.
+                with suppress(Exception):
+                    handler(message)
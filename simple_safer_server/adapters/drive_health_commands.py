@@ -10,6 +10,10 @@ from simple_safer_server.adapters.command_runner import (
 BLKID_TIMEOUT_SECONDS = 15
 HDSENTINEL_TIMEOUT_SECONDS = 45
 SMARTCTL_TIMEOUT_SECONDS = 60
+# The power-mode check is answered by the bridge/drive electronics without
+# spinning up the platters, so it does not need the wake-up allowance above.
+SMARTCTL_POWER_MODE_TIMEOUT_SECONDS = 15
+SMARTCTL_STANDBY_EXIT_CODE = 3
 ALERT_EMAIL_TIMEOUT_SECONDS = 30
 
 
@@ -27,6 +31,16 @@ class DriveHealthCommandAdapter:
             timeout=SMARTCTL_TIMEOUT_SECONDS,
         )
 
+    def smartctl_power_mode(self, device: str):
+        # "-n standby,N" makes smartctl exit with N instead of issuing any
+        # command that would wake a drive in STANDBY or SLEEP.
+        return self._command_runner.run(
+            ["smartctl", "-n", f"standby,{SMARTCTL_STANDBY_EXIT_CODE}", "-i", device],
+            capture_output=True,
+            text=True,
+            timeout=SMARTCTL_POWER_MODE_TIMEOUT_SECONDS,
+        )
+
     def find_device_by_uuid(self, uuid: str):
         return self._command_runner.run(
             ["blkid", "-t", f"UUID={uuid}", "-o", "device"],
@@ -35,20 +49,20 @@ class DriveHealthCommandAdapter:
             timeout=BLKID_TIMEOUT_SECONDS,
         )
 
-    def smartctl_attributes(self, command):
+    def smartctl_attributes(self, command, timeout: float = SMARTCTL_TIMEOUT_SECONDS):
         return self._command_runner.run(
             command,
             capture_output=True,
             text=True,
-            timeout=SMARTCTL_TIMEOUT_SECONDS,
+            timeout=timeout,
         )
 
-    def hdsentinel(self, command):
+    def hdsentinel(self, command, timeout: float = HDSENTINEL_TIMEOUT_SECONDS):
         return self._command_runner.run(
             command,
             capture_output=True,
             text=True,
-            timeout=HDSENTINEL_TIMEOUT_SECONDS,
+            timeout=timeout,
         )
 
     def send_email(self, from_address: str, email_address: str, email_body: str) -> None:
@@ -61,4 +75,11 @@ class DriveHealthCommandAdapter:
         )
 
 
-__all__ = ["CalledProcessError", "DriveHealthCommandAdapter", "TimeoutExpired"]
+__all__ = [
+    "HDSENTINEL_TIMEOUT_SECONDS",
+    "SMARTCTL_STANDBY_EXIT_CODE",
+    "SMARTCTL_TIMEOUT_SECONDS",
+    "CalledProcessError",
+    "DriveHealthCommandAdapter",
+    "TimeoutExpired",
+]
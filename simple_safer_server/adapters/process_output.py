@@ -0,0 +1,246 @@
+import codecs
+import os
+import selectors
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from contextlib import suppress
+from typing import Any
+
+PROCESS_OUTPUT_READ_SIZE = 64 * 1024
+# Matches the grace period task runners have always given a stopped child
+# before escalating from SIGTERM to SIGKILL.
+PROCESS_KILL_GRACE_SECONDS = 5.0
+PROCESS_OUTPUT_TAIL_LINES = 50
+
+LineCallback = Callable[[str, str], None]
+
+
+class _Stream:
+    def __init__(self, name: str, file: Any) -> None:
+        self.name = name
+        self.file = file
+        self.fd = file.fileno()
+        self.decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self.partial = ""
+
+
+class ProcessWatch:
+    """A child process whose stdout and stderr are read by the multiplexer.
+
+    ``tail`` keeps the last few lines so callers can build an error message
+    without holding the whole output in memory.
+    """
+
+    def __init__(
+        self,
+        proc: Any,
+        on_line: LineCallback | None,
+        cancel_event: threading.Event | None,
+        tail_lines: int,
+    ) -> None:
+        self.proc = proc
+        self.cancel_event = cancel_event
+        self.tail: deque[str] = deque(maxlen=tail_lines)
+        self.cancelled = False
+        self._on_line = on_line
+        self._streams: dict[int, _Stream] = {}
+        self._pidfd: int | None = None
+        self._exited = False
+        self._kill_at: float | None = None
+        self._done = threading.Event()
+
+    @property
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    def wait(self, timeout: float | None = None) -> int | None:
+        """Wait until all output has been delivered, then return the exit code."""
+        if not self._done.wait(timeout):
+            return None
+        return self.proc.wait()
+
+    def _emit(self, stream_name: str, line: str) -> None:
+        self.tail.append(line)
+        if self._on_line is not None:
+            # A failing callback must not stop output delivery for other children.
+            with suppress(Exception):
+                self._on_line(stream_name, line)
+
+
+class ProcessOutputMultiplexer:
+    """Reads the output of every watched child process from one selector thread.
+
+    Streams are read as data arrives and delivered line by line. Process exit
+    is detected through a pidfd where the kernel supports it, and cancellation
+    is handled when ``wake()`` is called, so no per-process thread or polling
+    loop is needed.
+    """
+
+    def __init__(self, *, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._pending: list[ProcessWatch] = []
+        self._watches: set[ProcessWatch] = set()
+        self._selector: selectors.BaseSelector | None = None
+        self._wake_read: int | None = None
+        self._wake_write: int | None = None
+        self._thread: threading.Thread | None = None
+
+    def watch(
+        self,
+        proc: Any,
+        on_line: LineCallback | None = None,
+        *,
+        cancel_event: threading.Event | None = None,
+        tail_lines: int = PROCESS_OUTPUT_TAIL_LINES,
+    ) -> ProcessWatch:
+        """Start delivering ``proc``'s output lines to ``on_line(stream, line)``."""
+        watch = ProcessWatch(proc, on_line, cancel_event, tail_lines)
+        for stream_name in ("stdout", "stderr"):
+            file = getattr(proc, stream_name, None)
+            if file is not None:
+                stream = _Stream(stream_name, file)
+                os.set_blocking(stream.fd, False)
+                watch._streams[stream.fd] = stream
+        pid = getattr(proc, "pid", None)
+        if isinstance(pid, int) and hasattr(os, "pidfd_open"):
+            with suppress(OSError):
+                watch._pidfd = os.pidfd_open(pid)
+        with self._lock:
+            self._ensure_started()
+            self._pending.append(watch)
+        self.wake()
+        return watch
+
+    def wake(self) -> None:
+        """Make the reader re-check cancel events; call after setting one."""
+        if self._wake_write is None:
+            return
+        with suppress(BlockingIOError, OSError):
+            os.write(self._wake_write, b"\0")
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+        self._selector = selectors.DefaultSelector()
+        self._wake_read, self._wake_write = os.pipe()
+        os.set_blocking(self._wake_read, False)
+        os.set_blocking(self._wake_write, False)
+        self._selector.register(self._wake_read, selectors.EVENT_READ, None)
+        self._thread = threading.Thread(target=self._run, name="process-output", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        assert self._selector is not None
+        while True:
+            for key, _events in self._selector.select(self._next_timeout()):
+                if key.data is None:
+                    with suppress(BlockingIOError):
+                        while os.read(key.fd, 4096):
+                            pass
+                    continue
+                watch, stream = key.data
+                if stream is None:
+                    self._process_exited(watch)
+                else:
+                    self._read_stream(watch, stream)
+            self._register_pending()
+            self._enforce_cancellation()
+
+    def _register_pending(self) -> None:
+        assert self._selector is not None
+        with self._lock:
+            pending, self._pending = self._pending, []
+        for watch in pending:
+            self._watches.add(watch)
+            for stream in watch._streams.values():
+                self._selector.register(stream.fd, selectors.EVENT_READ, (watch, stream))
+            if watch._pidfd is not None:
+                self._selector.register(watch._pidfd, selectors.EVENT_READ, (watch, None))
+            self._finish_if_complete(watch)
+
+    def _read_stream(self, watch: ProcessWatch, stream: _Stream) -> None:
+        try:
+            data = os.read(stream.fd, PROCESS_OUTPUT_READ_SIZE)
+        except BlockingIOError:
+            return
+        except OSError:
+            data = b""
+        if data:
+            self._deliver(watch, stream, data)
+            return
+        self._close_stream(watch, stream)
+        self._finish_if_complete(watch)
+
+    def _deliver(
+        self, watch: ProcessWatch, stream: _Stream, data: bytes, final: bool = False
+    ) -> None:
+        text = stream.partial + stream.decoder.decode(data, final)
+        lines = text.split("\n")
+        stream.partial = "" if final else lines.pop()
+        for line in lines:
+            if final and not line:
+                continue
+            watch._emit(stream.name, line.rstrip("\r"))
+
+    def _close_stream(self, watch: ProcessWatch, stream: _Stream) -> None:
+        assert self._selector is not None
+        self._deliver(watch, stream, b"", final=True)
+        with suppress(KeyError, ValueError):
+            self._selector.unregister(stream.fd)
+        with suppress(OSError):
+            stream.file.close()
+        watch._streams.pop(stream.fd, None)
+
+    def _process_exited(self, watch: ProcessWatch) -> None:
+        assert self._selector is not None
+        watch._exited = True
+        if watch._pidfd is not None:
+            with suppress(KeyError, ValueError):
+                self._selector.unregister(watch._pidfd)
+            os.close(watch._pidfd)
+            watch._pidfd = None
+        # Everything the child wrote is already in the pipe; drain it, then stop
+        # waiting for EOF that a lingering grandchild could hold off forever.
+        for stream in list(watch._streams.values()):
+            while True:
+                try:
+                    data = os.read(stream.fd, PROCESS_OUTPUT_READ_SIZE)
+                except BlockingIOError:
+                    break
+                except OSError:
+                    data = b""
+                if not data:
+                    break
+                self._deliver(watch, stream, data)
+            self._close_stream(watch, stream)
+        self._finish_if_complete(watch)
+
+    def _finish_if_complete(self, watch: ProcessWatch) -> None:
+        # With a pidfd the watch ends on process exit; without one, on EOF.
+        if watch._streams or (watch._pidfd is not None and not watch._exited):
+            return
+        self._watches.discard(watch)
+        watch._done.set()
+
+    def _enforce_cancellation(self) -> None:
+        now = self._clock()
+        for watch in list(self._watches):
+            cancel_event = watch.cancel_event
+            if cancel_event is not None and cancel_event.is_set() and not watch.cancelled:
+                watch.cancelled = True
+                watch._kill_at = now + PROCESS_KILL_GRACE_SECONDS
+                with suppress(OSError):
+                    watch.proc.terminate()
+            if watch._kill_at is not None and now >= watch._kill_at:
+                watch._kill_at = None
+                with suppress(OSError):
+                    watch.proc.kill()
+
+    def _next_timeout(self) -> float | None:
+        deadlines = [watch._kill_at for watch in self._watches if watch._kill_at is not None]
+        if not deadlines:
+            return None
+        return max(0.0, min(deadlines) - self._clock())
@@ -10,7 +10,7 @@ from simple_safer_server.adapters.command_runner import (
     CommandRunner,
     TimeoutExpired,
 )
-from simple_safer_server.services.file_persistence import atomic_write_text
+from simple_safer_server.services.file_persistence import DURABLE, atomic_write_text
 
 SYSTEM_UPDATES_SUPPORT_TIMEOUT_SECONDS = 60
 SYSTEM_UPDATES_PRO_ATTACH_TIMEOUT_SECONDS = 300
@@ -81,7 +81,7 @@ class SystemUpdatesCommandAdapter:
         temp_file.seek(0)
         # The web service runs as root, so write the managed apt config
         # directly instead of depending on sudo or shell redirection.
-        atomic_write_text(self._apt_periodic_path, temp_file.read(), mode=0o644)
+        atomic_write_text(self._apt_periodic_path, temp_file.read(), mode=0o644, durability=DURABLE)
 
     def livepatch_status_json(self, binary: str):
         return self._command_runner.run(
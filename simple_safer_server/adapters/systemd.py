@@ -3,6 +3,7 @@ import subprocess
 from simple_safer_server.adapters.command_runner import DEVNULL, CommandRunner
 
 SYSTEMD_COMMAND_TIMEOUT_SECONDS = 30
+JOURNAL_CURSOR_PREFIX = "-- cursor: "
 
 
 class SystemdAdapter:
@@ -21,6 +22,36 @@ class SystemdAdapter:
         )
         return result.stdout
 
+    def journal_page(
+        self, unit_name: str, lines: int, after_cursor: str | None = None
+    ) -> tuple[str, str | None]:
+        """Return journal text and the cursor of its last entry.
+
+        With ``after_cursor`` only entries newer than that cursor are returned,
+        capped at ``lines``. The cursor is None when the page had no entries.
+        """
+        command = [
+            "journalctl",
+            "-a",
+            "-u",
+            unit_name,
+            "-n",
+            str(lines),
+            "--no-pager",
+            "--show-cursor",
+        ]
+        if after_cursor:
+            # -q drops the "-- No entries --" banner so an idle poll appends nothing.
+            command.extend([f"--after-cursor={after_cursor}", "-q"])
+        result = self._command_runner.run(
+            command,
+            capture_output=True,
+            text=True,
+            check=True,
+            timeout=SYSTEMD_COMMAND_TIMEOUT_SECONDS,
+        )
+        return split_journal_cursor(result.stdout)
+
     def start_unit(self, unit_name: str) -> None:
         self._command_runner.run(
             ["systemctl", "start", unit_name, "--no-block"],
@@ -79,6 +110,25 @@ class SystemdAdapter:
         )
         return result.stdout
 
+    def snapshot(
+        self,
+        unit_names: list[str],
+        property_names: tuple[str, ...] | list[str],
+    ) -> dict[str, dict[str, str]]:
+        """Read many properties of many units with one ``systemctl show`` call."""
+        if not unit_names:
+            return {}
+        command = ["systemctl", "show", *unit_names]
+        command.extend(f"--property={property_name}" for property_name in property_names)
+        result = self._command_runner.run(
+            command,
+            capture_output=True,
+            text=True,
+            check=True,
+            timeout=SYSTEMD_COMMAND_TIMEOUT_SECONDS,
+        )
+        return parse_show_output(result.stdout, unit_names, property_names)
+
     def is_active(self, unit_name: str) -> str:
         result = self._command_runner.run(
             ["systemctl", "is-active", unit_name],
@@ -90,4 +140,50 @@ class SystemdAdapter:
         return result.stdout.strip()
 
 
+def parse_show_output(
+    output: str,
+    unit_names: list[str],
+    property_names: tuple[str, ...] | list[str],
+) -> dict[str, dict[str, str]]:
+    """Split multi-unit ``systemctl show`` output into one property map per unit."""
+    # systemctl prints one block per unit in argument order, separated by a blank
+    # line. Properties that do not apply to a unit type (for example a service's
+    # ExecMain* fields on a timer) are omitted, so missing keys default to "".
+    blocks: list[dict[str, str]] = []
+    current: dict[str, str] | None = None
+    for line in output.splitlines():
+        if not line.strip():
+            current = None
+            continue
+        if current is None:
+            current = {}
+            blocks.append(current)
+        key, separator, value = line.partition("=")
+        if separator:
+            current[key.strip()] = value.strip()
+    if len(blocks) > len(unit_names):
+        raise ValueError(
+            f"systemctl show returned {len(blocks)} unit blocks for {len(unit_names)} units"
+        )
+
+    snapshot: dict[str, dict[str, str]] = {}
+    for index, unit_name in enumerate(unit_names):
+        values = blocks[index] if index < len(blocks) else {}
+        snapshot[unit_name] = {
+            property_name: values.get(property_name, "") for property_name in property_names
+        }
+    return snapshot
+
+
+def split_journal_cursor(output: str) -> tuple[str, str | None]:
+    """Split the trailing ``-- cursor: ...`` line that --show-cursor appends."""
+    body, separator, last_line = output.rstrip("\n").rpartition("\n")
+    if not separator:
+        body, last_line = "", output.rstrip("\n")
+    if not last_line.startswith(JOURNAL_CURSOR_PREFIX):
+        return output, None
+    cursor = last_line[len(JOURNAL_CURSOR_PREFIX) :].strip()
+    return (f"{body}\n" if body else ""), cursor or None
+
+
 CalledProcessError = subprocess.CalledProcessError
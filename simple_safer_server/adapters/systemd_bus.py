@@ -0,0 +1,394 @@
+import threading
+import time
+from collections.abc import Callable
+from datetime import datetime
+from typing import Any
+
+from simple_safer_server.adapters.command_runner import CommandRunner
+from simple_safer_server.adapters.dbus_wire import (
+    DBUS_CALL_TIMEOUT_SECONDS,
+    SIGNAL,
+    DBusConnection,
+    DBusError,
+    DBusMessage,
+)
+from simple_safer_server.adapters.systemd import SystemdAdapter
+
+SYSTEMD_BUS_NAME = "org.freedesktop.systemd1"
+SYSTEMD_OBJECT_PATH = "/org/freedesktop/systemd1"
+SYSTEMD_UNIT_PATH_PREFIX = "/org/freedesktop/systemd1/unit/"
+MANAGER_INTERFACE = "org.freedesktop.systemd1.Manager"
+UNIT_INTERFACE = "org.freedesktop.systemd1.Unit"
+PROPERTIES_INTERFACE = "org.freedesktop.DBus.Properties"
+UNIT_TYPE_INTERFACES = {
+    "service": "org.freedesktop.systemd1.Service",
+    "timer": "org.freedesktop.systemd1.Timer",
+}
+# Properties systemd publishes on the generic Unit interface. The fake bus uses
+# this to split a flat property map the same way the real objects do.
+UNIT_INTERFACE_PROPERTIES = frozenset(
+    {"Id", "Description", "LoadState", "ActiveState", "SubState", "UnitFileState"}
+)
+# Manager signals after which cached unit state can no longer be trusted.
+# UnitFileState in particular never emits PropertiesChanged; enable/disable only
+# shows up as UnitFilesChanged.
+MANAGER_RELOAD_SIGNALS = frozenset({"UnitFilesChanged", "Reloading"})
+BUS_RECONNECT_BACKOFF_SECONDS = 30.0
+USEC_INFINITY = 2**64 - 1
+
+
+def unit_type_interface(unit_name: str) -> str | None:
+    return UNIT_TYPE_INTERFACES.get(unit_name.rsplit(".", 1)[-1])
+
+
+def format_property_value(property_name: str, value: Any) -> str:
+    """Render a raw D-Bus property value the way `systemctl show` prints it."""
+    if isinstance(value, bool):
+        return "yes" if value else "no"
+    if isinstance(value, int) and property_name.endswith(("Timestamp", "USecRealtime")):
+        if value in {0, USEC_INFINITY}:
+            return ""
+        return (
+            datetime.fromtimestamp(value / 1_000_000)
+            .astimezone()
+            .strftime("%a %Y-%m-%d %H:%M:%S %Z")
+        )
+    if isinstance(value, list):
+        return " ".join(str(item) for item in value)
+    return str(value)
+
+
+class SystemdBusAdapter(SystemdAdapter):
+    """Serves unit properties from a table kept current by systemd D-Bus signals.
+
+    The first read of a unit loads its properties over a long-lived system bus
+    connection and subscribes to that unit's PropertiesChanged signal; later
+    reads are dictionary lookups. Start/stop/enable/disable and journal reads
+    still go through the subprocess adapter. When the bus is unavailable, reads
+    fall back to `systemctl show` and reconnects are retried after a backoff.
+    """
+
+    def __init__(
+        self,
+        command_runner: CommandRunner | None = None,
+        *,
+        connect: Callable[[], Any] | None = None,
+        logger: Any | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        super().__init__(command_runner)
+        self._connect = connect or DBusConnection.system_bus
+        self._logger = logger
+        self._clock = clock
+        self._connect_lock = threading.Lock()
+        self._lock = threading.Lock()
+        self._connection: Any | None = None
+        self._retry_after = 0.0
+        self._units: dict[str, dict[str, Any]] = {}
+        self._unit_paths: dict[str, str] = {}
+        self._path_units: dict[str, str] = {}
+        self._stale: set[str] = set()
+        self._change_counts: dict[str, int] = {}
+
+    def snapshot(
+        self,
+        unit_names: list[str],
+        property_names: tuple[str, ...] | list[str],
+    ) -> dict[str, dict[str, str]]:
+        connection = self._ensure_connection()
+        if connection is not None:
+            try:
+                for unit_name in unit_names:
+                    self._ensure_unit(connection, unit_name)
+                with self._lock:
+                    return {
+                        unit_name: {
+                            property_name: format_property_value(
+                                property_name,
+                                self._units.get(unit_name, {}).get(property_name, ""),
+                            )
+                            for property_name in property_names
+                        }
+                        for unit_name in unit_names
+                    }
+            except (DBusError, OSError, ValueError) as exc:
+                self._drop_connection(exc)
+        return super().snapshot(unit_names, property_names)
+
+    def start_unit(self, unit_name: str) -> None:
+        super().start_unit(unit_name)
+        self._mark_stale(unit_name)
+
+    def stop_unit(self, unit_name: str) -> None:
+        super().stop_unit(unit_name)
+        self._mark_stale(unit_name)
+
+    def disable_timer_now(self, unit_name: str) -> None:
+        super().disable_timer_now(unit_name)
+        self._mark_stale(unit_name)
+
+    def enable_timer_now(self, unit_name: str) -> None:
+        super().enable_timer_now(unit_name)
+        self._mark_stale(unit_name)
+
+    def close(self) -> None:
+        with self._lock:
+            connection = self._connection
+            self._reset_table()
+        if connection is not None:
+            connection.close()
+
+    def _mark_stale(self, unit_name: str) -> None:
+        # Our own systemctl calls race the matching bus signal, so never trust
+        # the cached entry for the next read after changing a unit ourselves.
+        with self._lock:
+            if unit_name in self._units:
+                self._stale.add(unit_name)
+
+    def _ensure_connection(self) -> Any | None:
+        with self._lock:
+            if self._connection is not None and not self._connection.closed:
+                return self._connection
+        with self._connect_lock:
+            with self._lock:
+                if self._connection is not None and not self._connection.closed:
+                    return self._connection
+                if self._clock() < self._retry_after:
+                    return None
+            connection = None
+            try:
+                connection = self._connect()
+                connection.add_signal_handler(self._handle_signal)
+                connection.call(
+                    SYSTEMD_BUS_NAME,
+                    SYSTEMD_OBJECT_PATH,
+                    MANAGER_INTERFACE,
+                    "Subscribe",
+                    timeout=DBUS_CALL_TIMEOUT_SECONDS,
+                )
+                for member in sorted(MANAGER_RELOAD_SIGNALS):
+                    connection.add_match(
+                        f"type='signal',sender='{SYSTEMD_BUS_NAME}',"
+                        f"interface='{MANAGER_INTERFACE}',member='{member}'"
+                    )
+            except (DBusError, OSError, ValueError) as exc:
+                if connection is not None:
+                    connection.close()
+                with self._lock:
+                    self._retry_after = self._clock() + BUS_RECONNECT_BACKOFF_SECONDS
+                if self._logger:
+                    self._logger.info("systemd D-Bus unavailable, using systemctl: %s", exc)
+                return None
+            with self._lock:
+                self._reset_table()
+                self._connection = connection
+            return connection
+
+    def _drop_connection(self, exc: Exception) -> None:
+        if self._logger:
+            self._logger.warning("Dropping systemd D-Bus connection: %s", exc)
+        with self._lock:
+            connection = self._connection
+            self._reset_table()
+            self._retry_after = self._clock() + BUS_RECONNECT_BACKOFF_SECONDS
+        if connection is not None:
+            connection.close()
+
+    def _reset_table(self) -> None:
+        self._connection = None
+        self._units.clear()
+        self._unit_paths.clear()
+        self._path_units.clear()
+        self._stale.clear()
+        self._change_counts.clear()
+
+    def _ensure_unit(self, connection: Any, unit_name: str) -> None:
+        with self._lock:
+            if unit_name in self._units and unit_name not in self._stale:
+                return
+            path = self._unit_paths.get(unit_name)
+            change_count = self._change_counts.get(unit_name, 0)
+
+        if path is None:
+            path = connection.call(
+                SYSTEMD_BUS_NAME,
+                SYSTEMD_OBJECT_PATH,
+                MANAGER_INTERFACE,
+                "LoadUnit",
+                "s",
+                [unit_name],
+            )[0]
+            with self._lock:
+                self._unit_paths[unit_name] = path
+                self._path_units[path] = unit_name
+            connection.add_match(
+                f"type='signal',sender='{SYSTEMD_BUS_NAME}',path='{path}',"
+                f"interface='{PROPERTIES_INTERFACE}',member='PropertiesChanged'"
+            )
+
+        values: dict[str, Any] = {}
+        for interface in (UNIT_INTERFACE, unit_type_interface(unit_name)):
+            if interface is None:
+                continue
+            values.update(
+                connection.call(
+                    SYSTEMD_BUS_NAME,
+                    path,
+                    PROPERTIES_INTERFACE,
+                    "GetAll",
+                    "s",
+                    [interface],
+                )[0]
+            )
+
+        with self._lock:
+            self._units[unit_name] = values
+            # A signal that landed while GetAll was in flight may be newer than
+            # the values we just stored; keep the entry stale so the next read
+            # fetches again instead of serving the older reply forever.
+            if self._change_counts.get(unit_name, 0) == change_count:
+                self._stale.discard(unit_name)
+            else:
+                self._stale.add(unit_name)
+
+    def _handle_signal(self, message: DBusMessage) -> None:
+        with self._lock:
+            if message.interface == PROPERTIES_INTERFACE and message.member == "PropertiesChanged":
+                unit_name = self._path_units.get(message.path or "")
+                if unit_name is None:
+                    return
+                self._change_counts[unit_name] = self._change_counts.get(unit_name, 0) + 1
+                _interface, changed, invalidated = message.body
+                values = self._units.get(unit_name)
+                if values is not None:
+                    values.update(changed)
+                if invalidated or values is None:
+                    self._stale.add(unit_name)
+            elif (
+                message.interface == MANAGER_INTERFACE and message.member in MANAGER_RELOAD_SIGNALS
+            ):
+                self._stale.update(self._units)
+
+
+def bus_path_escape(unit_name: str) -> str:
+    """Escape a unit name into a systemd object path label."""
+    return "".join(
+        character if character.isascii() and character.isalnum() else f"_{ord(character):02x}"
+        for character in unit_name
+    )
+
+
+class FakeSystemdBus:
+    """In-process stand-in for the systemd bus connection.
+
+    It answers the handful of calls SystemdBusAdapter makes and lets tests emit
+    PropertiesChanged and manager signals, so the event-driven table can be
+    exercised without a running systemd or D-Bus daemon.
+    """
+
+    def __init__(self, units: dict[str, dict[str, Any]] | None = None) -> None:
+        self.units: dict[str, dict[str, Any]] = {}
+        self.calls: list[tuple[str, str, list[Any]]] = []
+        self.matches: list[str] = []
+        self.subscribed = False
+        self.closed = False
+        self._handlers: list[Callable[[DBusMessage], None]] = []
+        for unit_name, properties in (units or {}).items():
+            self.set_unit(unit_name, properties)
+
+    def set_unit(self, unit_name: str, properties: dict[str, Any]) -> None:
+        self.units[unit_name] = {"Id": unit_name, **properties}
+
+    def unit_path(self, unit_name: str) -> str:
+        return SYSTEMD_UNIT_PATH_PREFIX + bus_path_escape(unit_name)
+
+    def add_signal_handler(self, handler: Callable[[DBusMessage], None]) -> None:
+        self._handlers.append(handler)
+
+    def add_match(self, rule: str) -> None:
+        self.matches.append(rule)
+
+    def call(
+        self,
+        destination: str,
+        path: str,
+        interface: str,
+        member: str,
+        signature: str = "",
+        body: list[Any] | None = None,
+        *,
+        timeout: float = DBUS_CALL_TIMEOUT_SECONDS,
+    ) -> list[Any]:
+        args = list(body or [])
+        self.calls.append((path, member, args))
+        if self.closed:
+            raise ConnectionError("fake bus is closed")
+        if interface == MANAGER_INTERFACE and member == "Subscribe":
+            self.subscribed = True
+            return []
+        if interface == MANAGER_INTERFACE and member == "LoadUnit":
+            unit_name = args[0]
+            self.units.setdefault(
+                unit_name,
+                {"Id": unit_name, "LoadState": "not-found", "ActiveState": "inactive"},
+            )
+            return [self.unit_path(unit_name)]
+        if interface == PROPERTIES_INTERFACE and member == "GetAll":
+            unit_name = self._unit_for_path(path)
+            is_unit_interface = args[0] == UNIT_INTERFACE
+            if not is_unit_interface and args[0] != unit_type_interface(unit_name):
+                return [{}]
+            return [
+                {
+                    name: value
+                    for name, value in self.units[unit_name].items()
+                    if (name in UNIT_INTERFACE_PROPERTIES) == is_unit_interface
+                }
+            ]
+        raise DBusError("org.freedesktop.DBus.Error.UnknownMethod", f"{interface}.{member}")
+
+    def emit_properties_changed(
+        self,
+        unit_name: str,
+        changed: dict[str, Any],
+        invalidated: list[str] | None = None,
+    ) -> None:
+        self.units[unit_name].update(changed)
+        interface = (
+            UNIT_INTERFACE
+            if set(changed) <= UNIT_INTERFACE_PROPERTIES
+            else unit_type_interface(unit_name) or UNIT_INTERFACE
+        )
+        self._emit(
+            DBusMessage(
+                SIGNAL,
+                path=self.unit_path(unit_name),
+                interface=PROPERTIES_INTERFACE,
+                member="PropertiesChanged",
+                signature="sa{sv}as",
+                body=[interface, dict(changed), list(invalidated or [])],
+            )
+        )
+
+    def emit_manager_signal(self, member: str) -> None:
+        self._emit(
+            DBusMessage(
+                SIGNAL,
+                path=SYSTEMD_OBJECT_PATH,
+                interface=MANAGER_INTERFACE,
+                member=member,
+            )
+        )
+
+    def close(self) -> None:
+        self.closed = True
+
+    def _emit(self, message: DBusMessage) -> None:
+        for handler in list(self._handlers):
+            handler(message)
+
+    def _unit_for_path(self, path: str) -> str:
+        for unit_name in self.units:
+            if self.unit_path(unit_name) == path:
+                return unit_name
+        raise DBusError("org.freedesktop.DBus.Error.UnknownObject", path)
@@ -14,9 +14,10 @@ from flask import (
 )
 
 from simple_safer_server.adapters.command_runner import CommandRunner
+from simple_safer_server.adapters.process_output import ProcessOutputMultiplexer
 from simple_safer_server.adapters.rclone import RcloneAdapter
 from simple_safer_server.adapters.storage_commands import StorageCommandAdapter
-from simple_safer_server.adapters.systemd import SystemdAdapter
+from simple_safer_server.adapters.systemd_bus import SystemdBusAdapter
 from simple_safer_server.routes.alerts import alerts as alerts_routes
 from simple_safer_server.routes.cloud_backup import cloud_backup as cloud_backup_routes
 from simple_safer_server.routes.ddns import ddns as ddns_routes
@@ -36,15 +37,25 @@ from simple_safer_server.services.config_manager import ConfigManager
 from simple_safer_server.services.container import AppServices
 from simple_safer_server.services.ddns_service import DdnsService
 from simple_safer_server.services.disabled_timers import DisabledTimerService
-from simple_safer_server.services.drive_health import DriveHealthSummaryService
+from simple_safer_server.services.drive_health import (
+    DriveHealthSummaryService,
+    get_drive_health_history_path,
+    get_drive_health_summary_path,
+)
+from simple_safer_server.services.drive_health_history import DriveHealthHistoryStore
 from simple_safer_server.services.runtime import get_fake_state, get_flask_secret_key, get_runtime
 from simple_safer_server.services.server_identity import ServerIdentityService
 from simple_safer_server.services.smb_manager import SMB_DOCS_URL, SMBManager
 from simple_safer_server.services.storage_service import StorageService
 from simple_safer_server.services.system_updates import SystemUpdatesManager
 from simple_safer_server.services.system_utils import SystemUtils
+from simple_safer_server.services.task_history import TASK_HISTORY_FILENAME, TaskHistoryStore
 from simple_safer_server.services.task_service import TaskService
-from simple_safer_server.services.user_manager import UserManager, admin_required
+from simple_safer_server.services.user_manager import (
+    UserManager,
+    admin_required,
+    get_user_registry,
+)
 from simple_safer_server.web.api import json_data, json_problem
 from simple_safer_server.web.problems import (
     ApiProblem,
@@ -62,6 +73,7 @@ def create_app() -> Flask:
     # invalidate every login cookie when the app's config directory persists.
     app.secret_key = get_flask_secret_key(runtime)
     user_manager = UserManager(runtime=runtime)
+    user_registry = get_user_registry(runtime)
 
     system_utils = SystemUtils(runtime=runtime)
     smb_manager = SMBManager(runtime=runtime)
@@ -90,6 +102,9 @@ def create_app() -> Flask:
     handler.setLevel(logging.INFO)
     app.logger.setLevel(logging.INFO)
     app.logger.info("SimpleSaferServer startup")
+    # Benchmark the password KDF now, not inside the first login or
+    # user-creation request; a persisted calibration is simply reloaded.
+    user_manager.password_hash_policy()
 
     if (
         runtime.is_fake
@@ -103,8 +118,11 @@ def create_app() -> Flask:
 
     config_manager = ConfigManager(runtime=runtime)
     command_runner = CommandRunner()
-    systemd_adapter = SystemdAdapter(command_runner)
+    # Connects lazily on the first unit read, so fake mode never opens the bus.
+    systemd_adapter = SystemdBusAdapter(command_runner, logger=app.logger)
     rclone_adapter = RcloneAdapter(command_runner)
+    # One reader thread serves every child whose output the app streams.
+    process_output = ProcessOutputMultiplexer()
     storage_command_adapter = StorageCommandAdapter(command_runner)
     alert_notifier = AlertNotifier(config_manager, runtime, logger=app.logger)
     disabled_timer_service = DisabledTimerService(
@@ -113,7 +131,11 @@ def create_app() -> Flask:
         alert_notifier=alert_notifier,
         logger=app.logger,
     )
-    system_updates_manager = SystemUpdatesManager(config_manager, runtime=runtime)
+    system_updates_manager = SystemUpdatesManager(
+        config_manager,
+        runtime=runtime,
+        process_output=process_output,
+    )
     app_update_manager = AppUpdateManager(runtime=runtime)
     task_service = TaskService(
         runtime=runtime,
@@ -125,6 +147,8 @@ def create_app() -> Flask:
         systemd_adapter=systemd_adapter,
         rclone_adapter=rclone_adapter,
         disabled_timer_service=disabled_timer_service,
+        history_store=TaskHistoryStore(runtime.data_dir / TASK_HISTORY_FILENAME),
+        process_output=process_output,
     )
     ddns_service = DdnsService(
         runtime=runtime,
@@ -155,7 +179,8 @@ def create_app() -> Flask:
         config_manager=config_manager,
         command_adapter=storage_command_adapter,
     )
-    drive_health_summary_service = DriveHealthSummaryService()
+    drive_health_summary_service = DriveHealthSummaryService(get_drive_health_summary_path(runtime))
+    drive_health_history = DriveHealthHistoryStore(get_drive_health_history_path(runtime))
     app.extensions["simple_safer_server"] = AppServices(
         runtime=runtime,
         fake_state=fake_state,
@@ -166,6 +191,7 @@ def create_app() -> Flask:
         app_update_manager=app_update_manager,
         smb_manager=smb_manager,
         user_manager=user_manager,
+        user_registry=user_registry,
         task_service=task_service,
         ddns_service=ddns_service,
         cloud_backup_service=cloud_backup_service,
@@ -173,6 +199,7 @@ def create_app() -> Flask:
         server_identity_service=server_identity_service,
         storage_service=storage_service,
         drive_health_summary_service=drive_health_summary_service,
+        drive_health_history=drive_health_history,
     )
 
     app.register_blueprint(setup)
@@ -262,6 +289,13 @@ def create_app() -> Flask:
             session["auto_logged_in"] = True
         return None
 
+    @app.teardown_request
+    def flush_fake_state(_exc):
+        # Request-driven changes are written when the response is done; the
+        # write-behind timer only covers changes made by background tasks.
+        if fake_state is not None:
+            fake_state.flush()
+
     @app.route("/network_file_sharing")
     @admin_required
     def network_file_sharing():
@@ -304,7 +338,7 @@ def create_app() -> Flask:
             "default_mount_point": runtime.default_mount_point,
             "browser_title": browser_title,
             # Expose admin status so templates can conditionally show admin-only nav items.
-            "is_admin": user_manager.is_admin(username) if username else False,
+            "is_admin": user_registry.is_admin(username) if username else False,
         }
 
     @app.errorhandler(ApiProblem)
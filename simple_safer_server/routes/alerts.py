@@ -1,10 +1,11 @@
 from typing import Any
 
-from flask import Blueprint, current_app, render_template, session
+from flask import Blueprint, current_app, render_template, request, session
 
+from simple_safer_server.services.alerts_service import ALERTS_PAGE_SIZE
 from simple_safer_server.services.user_manager import admin_required, api_admin_required
 from simple_safer_server.web.api import json_data, json_problem, json_request_data
-from simple_safer_server.web.problems import ApiProblem, OperationProblem
+from simple_safer_server.web.problems import ApiProblem, OperationProblem, ValidationProblem
 
 alerts = Blueprint("alerts_routes", __name__)
 
@@ -37,7 +38,21 @@ def api_generate_test_alerts():
 @api_admin_required
 def api_get_alerts():
     try:
-        return json_data(_get_services().alerts_service.get_alerts())
+        try:
+            limit = int(request.args.get("limit", ALERTS_PAGE_SIZE))
+            before = request.args.get("before")
+            before_id = int(before) if before else None
+        except ValueError:
+            raise ValidationProblem(
+                "limit and before must be whole numbers.", slug="alerts-validation-error"
+            ) from None
+        return json_data(
+            _get_services().alerts_service.get_alerts(
+                limit=limit,
+                before_id=before_id,
+                unread_only=request.args.get("unread") == "1",
+            )
+        )
     except ApiProblem as exc:
         return json_problem(exc)
     except Exception:
@@ -45,6 +60,18 @@ def api_get_alerts():
         return json_problem(OperationProblem("Failed to get alerts."))
 
 
+@alerts.route("/api/alerts/unread-count", methods=["GET"])
+@api_admin_required
+def api_get_unread_alert_count():
+    try:
+        return json_data(_get_services().alerts_service.get_unread_count())
+    except ApiProblem as exc:
+        return json_problem(exc)
+    except Exception:
+        current_app.logger.exception("Error counting unread alerts")
+        return json_problem(OperationProblem("Failed to count unread alerts."))
+
+
 @alerts.route("/api/alerts/<int:alert_id>", methods=["GET"])
 @api_admin_required
 def api_get_alert(alert_id):
@@ -1,4 +1,5 @@
 import subprocess
+import time
 from datetime import datetime
 from typing import Any
 
@@ -6,22 +7,39 @@ from flask import Blueprint, current_app, render_template, request
 
 from simple_safer_server.services.backup_drive_setup import get_managed_ntfs_driver
 from simple_safer_server.services.drive_health import (
+    DRIVE_HEALTH_REFRESH_DEADLINE_SECONDS,
+    DRIVE_HEALTH_TIMEOUT_MESSAGE,
+    HISTORY_METRICS,
+    POWER_STATE_STANDBY,
     SMART_FIELDS,
     SMARTCTL_JSON_UPGRADE_MESSAGE,
+    apply_drive_risk,
     build_drive_health_summary,
     collect_hdsentinel_snapshot,
+    drive_history_key,
+    get_drive_power_state,
     get_hdsentinel_settings,
     get_smart_attributes,
     get_smartctl_json_support,
     hdsentinel_snapshot_has_health,
     hdsentinel_summary_status,
+    list_drive_health_snapshots,
+    load_drive_health_snapshots,
+    load_hdsentinel_state,
+    probes_can_run_in_parallel,
+    record_drive_health_history,
+    resolve_backup_parent_device,
+    run_drive_health_monitor,
+    run_drive_probes,
     save_hdsentinel_settings,
 )
+from simple_safer_server.services.drive_health_history import HISTORY_RESOLUTIONS
 from simple_safer_server.services.user_manager import admin_required, api_admin_required
 from simple_safer_server.web.api import json_data, json_problem
-from simple_safer_server.web.problems import OperationProblem
+from simple_safer_server.web.problems import OperationProblem, ValidationProblem
 
 drive_health = Blueprint("drive_health_routes", __name__)
+HISTORY_MAX_DAYS = 3650
 
 
 def _get_services() -> Any:
@@ -38,6 +56,8 @@ def drives():
     missing_attrs = []
     settings_message = None
     settings_error = None
+    drive_asleep = False
+    monitored_drives = None
     hdsentinel_settings = get_hdsentinel_settings(services.config_manager)
     # Page loads and settings saves must not probe disks or publish stale health.
     # HDSentinel data appears here only after an explicit health check POST.
@@ -75,50 +95,111 @@ def drives():
                 settings_message = "HDSentinel settings saved successfully."
             except Exception as exc:
                 settings_error = f"Failed to save HDSentinel settings: {exc}"
-        else:
-            smart, missing_attrs, smart_error = get_smart_attributes(
-                services.config_manager,
-                services.system_utils,
-                runtime=services.runtime,
-            )
-            if smart is None:
-                if smart_error == SMARTCTL_JSON_UPGRADE_MESSAGE:
-                    smart_support_warning = smart_error
-                    error = smart_error
-                else:
-                    error = smart_error or "Could not retrieve SMART data"
-
-            if hdsentinel_settings["enabled"]:
-                hdsentinel_snapshot = collect_hdsentinel_snapshot(
+        elif form_action == "check_all_drives":
+            try:
+                # Like the dashboard refresh, a manual check leaves sleeping
+                # drives in standby and shows their last reading instead.
+                monitored_drives = run_drive_health_monitor(
                     services.config_manager,
-                    services.system_utils,
                     runtime=services.runtime,
+                    deadline_seconds=DRIVE_HEALTH_REFRESH_DEADLINE_SECONDS,
+                )
+            except Exception as exc:
+                current_app.logger.exception("Multi-drive health check failed")
+                error = f"Could not check all drives: {exc}"
+        else:
+            # Resolved even when waking the drive, because its transport
+            # decides whether the probes below may overlap.
+            device, _, _ = resolve_backup_parent_device(
+                services.config_manager, services.system_utils, runtime=services.runtime
+            )
+            if request.form.get("wake_drive") != "on":
+                drive_asleep = bool(device) and (
+                    get_drive_power_state(device, runtime=services.runtime) == POWER_STATE_STANDBY
+                )
+            if drive_asleep:
+                # Show the last scheduled snapshot and let the admin decide
+                # whether a spin-up is worth it.
+                hdsentinel_snapshot = load_hdsentinel_state(services.runtime)
+            else:
+                probes = {
+                    "smart": lambda deadline: get_smart_attributes(
+                        services.config_manager,
+                        services.system_utils,
+                        device=device,
+                        runtime=services.runtime,
+                        deadline=deadline,
+                    ),
+                }
+                if hdsentinel_settings["enabled"]:
+                    probes["hdsentinel"] = lambda deadline: collect_hdsentinel_snapshot(
+                        services.config_manager,
+                        services.system_utils,
+                        runtime=services.runtime,
+                        device=device,
+                        deadline=deadline,
+                    )
+                outcome = run_drive_probes(
+                    probes,
+                    DRIVE_HEALTH_REFRESH_DEADLINE_SECONDS,
+                    parallel=probes_can_run_in_parallel(device),
+                )
+                smart, missing_attrs, smart_error = outcome["results"].get(
+                    "smart", (None, [], DRIVE_HEALTH_TIMEOUT_MESSAGE)
+                )
+                if "hdsentinel" in probes:
+                    hdsentinel_snapshot = outcome["results"].get(
+                        "hdsentinel", {"error": DRIVE_HEALTH_TIMEOUT_MESSAGE}
+                    )
+                if smart is None:
+                    if smart_error == SMARTCTL_JSON_UPGRADE_MESSAGE:
+                        smart_support_warning = smart_error
+                        error = smart_error
+                    else:
+                        error = smart_error or "Could not retrieve SMART data"
+
+                # The Drive Health page already did the live probe above, so reuse
+                # that result instead of waking or querying the drive a second time.
+                checked_at = datetime.now().isoformat(timespec="seconds")
+                summary = {
+                    "status": "unknown",
+                    "source": "live",
+                    "checked_at": checked_at,
+                    "temperature": smart.get("smart_194_raw") if smart else None,
+                    "hdsentinel_health": None,
+                    "hdsentinel_performance": None,
+                    "detail": error or "Drive health data is not available.",
+                    "error": error,
+                    "reading_at": checked_at,
+                    "probe_ms": outcome["probe_ms"],
+                }
+                if smart is not None:
+                    summary["detail"] = "SMART details were collected."
+                if hdsentinel_snapshot is not None and hdsentinel_snapshot_has_health(
+                    hdsentinel_snapshot
+                ):
+                    health_pct = hdsentinel_snapshot.get("health_pct")
+                    summary["hdsentinel_health"] = health_pct
+                    summary["hdsentinel_performance"] = hdsentinel_snapshot.get("performance_pct")
+                    summary["status"] = hdsentinel_summary_status(health_pct)
+                    summary["detail"] = f"HDSentinel health: {health_pct}%."
+                    if summary["temperature"] is None:
+                        summary["temperature"] = hdsentinel_snapshot.get("temperature_c")
+                history_key = drive_history_key(services.config_manager)
+                apply_drive_risk(summary, services.drive_health_history, history_key, smart)
+                services.drive_health_summary_service.publish(summary)
+                record_drive_health_history(
+                    services.drive_health_history,
+                    history_key,
+                    smart,
+                    hdsentinel_snapshot,
                 )
-            # The Drive Health page already did the live probe above, so reuse
-            # that result instead of waking or querying the drive a second time.
-            summary = {
-                "status": "unknown",
-                "source": "live",
-                "checked_at": datetime.now().isoformat(timespec="seconds"),
-                "temperature": smart.get("smart_194_raw") if smart else None,
-                "hdsentinel_health": None,
-                "hdsentinel_performance": None,
-                "detail": error or "Drive health data is not available.",
-                "error": error,
-            }
-            if smart is not None:
-                summary["detail"] = "SMART details were collected."
-            if hdsentinel_snapshot is not None and hdsentinel_snapshot_has_health(
-                hdsentinel_snapshot
-            ):
-                health_pct = hdsentinel_snapshot.get("health_pct")
-                summary["hdsentinel_health"] = health_pct
-                summary["hdsentinel_performance"] = hdsentinel_snapshot.get("performance_pct")
-                summary["status"] = hdsentinel_summary_status(health_pct)
-                summary["detail"] = f"HDSentinel health: {health_pct}%."
-                if summary["temperature"] is None:
-                    summary["temperature"] = hdsentinel_snapshot.get("temperature_c")
-            services.drive_health_summary_service.publish(summary)
+
+    if monitored_drives is None:
+        # Page loads show stored per-drive summaries and never probe disks.
+        monitored_drives = list_drive_health_snapshots(
+            load_drive_health_snapshots(services.runtime)
+        )
 
     return render_template(
         "drive_health.html",
@@ -128,10 +209,13 @@ def drives():
         smart_fields=SMART_FIELDS,
         hdsentinel_settings=hdsentinel_settings,
         hdsentinel_snapshot=hdsentinel_snapshot,
+        history_metrics=HISTORY_METRICS,
         drive_config=drive_config,
         smart_support_warning=smart_support_warning,
         settings_message=settings_message,
         settings_error=settings_error,
+        drive_asleep=drive_asleep,
+        monitored_drives=monitored_drives,
     )
 
 
@@ -153,19 +237,76 @@ def api_drive_health_summary():
                 "hdsentinel_performance": None,
                 "detail": "Drive health summary is unavailable.",
                 "error": None,
+                "power_state": None,
+                "reading_at": None,
+                "probe_ms": None,
+                "risk_score": None,
+                "risk_level": None,
             }
         )
 
 
+@drive_health.route("/api/drive_health/history")
+@api_admin_required
+def api_drive_health_history():
+    services = _get_services()
+    metric = request.args.get("metric", "")
+    resolution = request.args.get("resolution", "auto")
+    if metric not in HISTORY_METRICS or resolution not in HISTORY_RESOLUTIONS:
+        return json_problem(
+            ValidationProblem(
+                "Unknown history metric or resolution.",
+                slug="drive-health-history-validation-error",
+            )
+        )
+    try:
+        days = max(1, min(int(request.args.get("days", 30)), HISTORY_MAX_DAYS))
+    except ValueError:
+        return json_problem(
+            ValidationProblem(
+                "days must be a whole number.", slug="drive-health-history-validation-error"
+            )
+        )
+    # Charts are served from recorded checks only; this endpoint never wakes
+    # or queries the drive.
+    history = services.drive_health_history
+    try:
+        drives = history.drives()
+        drive = (
+            request.args.get("drive")
+            or services.config_manager.get_value("backup", "uuid", "")
+            or (drives[0] if drives else "")
+        )
+        end = int(time.time())
+        series = history.query(drive, metric, end - days * 86400, end, resolution)
+    except Exception:
+        current_app.logger.exception("Drive health history lookup failed")
+        return json_problem(OperationProblem("Drive health history is unavailable."))
+    return json_data(
+        {
+            "drive": drive,
+            "drives": drives,
+            "metric": metric,
+            "label": HISTORY_METRICS[metric],
+            "days": days,
+            **series,
+        }
+    )
+
+
 @drive_health.route("/api/drive_health/refresh", methods=["POST"])
 @api_admin_required
 def api_drive_health_refresh():
     services = _get_services()
     try:
+        payload = request.get_json(silent=True) or {}
         summary = build_drive_health_summary(
             services.config_manager,
             services.system_utils,
             runtime=services.runtime,
+            previous_summary=services.drive_health_summary_service.get_summary(),
+            wake_drive=payload.get("wake") is True,
+            history_store=services.drive_health_history,
         )
         return json_data(services.drive_health_summary_service.publish(summary))
     except Exception:
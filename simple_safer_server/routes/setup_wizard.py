@@ -2,7 +2,6 @@ import logging
 import os
 import stat
 import time
-from datetime import UTC, datetime
 from functools import wraps
 
 from flask import Blueprint, current_app, redirect, render_template, session
@@ -663,8 +662,9 @@ def setup_email():
             return _operation_problem('Failed to write msmtp configuration')
 
         # Persist the UI-facing addresses only after msmtp is safely written.
-        config_manager.set_value('backup', 'email_address', email)
-        config_manager.set_value('backup', 'from_address', from_address)
+        config_manager.set_values(
+            {'backup': {'email_address': email, 'from_address': from_address}}
+        )
 
         return json_data()
     except ApiProblem:
@@ -696,9 +696,10 @@ def save_schedule():
 
         # Store the same HH:MM shape emitted by browser time inputs so later
         # timer generation does not need to guess which UI contract produced it.
-        config_manager.set_value('schedule', 'backup_cloud_time', schedule_time)
+        schedule_values = {'schedule': {'backup_cloud_time': schedule_time}}
         if bandwidth_limit is not None:
-            config_manager.set_value('backup', 'bandwidth_limit', bandwidth_limit)
+            schedule_values['backup'] = {'bandwidth_limit': bandwidth_limit}
+        config_manager.set_values(schedule_values)
 
         logger.info(f"Schedule saved: daily at {schedule_time}, bandwidth limit: {bandwidth_limit}")
         return json_data(message='Backup settings saved successfully')
@@ -836,8 +837,7 @@ def complete_setup():
         if 'username' in session:
             username = session['username']
             if username in user_manager.users:
-                user_manager.users[username]['last_login'] = str(datetime.now(UTC))
-                user_manager._save_users()
+                user_manager.record_login(username)
                 logger.info(f"Updated last login time for user {username} after setup completion")
 
         # Install systemd services and timers
@@ -11,6 +11,7 @@ from flask import (
     url_for,
 )
 
+from simple_safer_server.services.task_history import TASK_HISTORY_PAGE_LIMIT
 from simple_safer_server.services.task_service import TASK_LOG_LINE_LIMIT, clamp_task_log_lines
 from simple_safer_server.services.user_manager import admin_required, api_admin_required
 from simple_safer_server.web.api import json_data, json_problem
@@ -18,6 +19,8 @@ from simple_safer_server.web.problems import NotFoundProblem, OperationProblem,
 
 tasks = Blueprint("task_routes", __name__)
 
+TASK_DETAIL_HISTORY_LIMIT = 10
+
 
 def _get_services() -> Any:
     """Return app-level services registered during Flask startup."""
@@ -81,13 +84,16 @@ def task_detail(task_name):
     if not task:
         abort(404)
     log_lines = TASK_LOG_LINE_LIMIT
-    logs = task.get_logs(log_lines)
+    log_page = task.get_log_page(lines=log_lines)
     return render_template(
         "task_detail.html",
         task=task,
         task_summary=task_service.task_summary(task),
-        logs=logs,
+        logs=log_page.text,
+        log_cursor=log_page.cursor or "",
         log_lines=log_lines,
+        run_history=task_service.task_history(task, limit=TASK_DETAIL_HISTORY_LIMIT),
+        run_stats=task_service.task_failure_stats().get(task.name),
     )
 
 
@@ -98,8 +104,18 @@ def task_logs(task_name):
     if not task:
         abort(404)
     lines = clamp_task_log_lines(request.args.get("lines", TASK_LOG_LINE_LIMIT))
-    logs = task.get_logs(lines)
-    return logs, 200, {"Content-Type": "text/plain; charset=utf-8"}
+    # Auto-refresh sends back the cursor from the previous response so each poll
+    # only reads and ships journal entries written since then.
+    log_page = task.get_log_page(request.args.get("cursor") or None, lines)
+    return (
+        log_page.text,
+        200,
+        {
+            "Content-Type": "text/plain; charset=utf-8",
+            "X-Log-Cursor": log_page.cursor or "",
+            "X-Log-Mode": "append" if log_page.append else "replace",
+        },
+    )
 
 
 @tasks.route("/api/tasks/<task_name>/status")
@@ -117,6 +133,36 @@ def api_task_status(task_name):
         return json_problem(OperationProblem("Failed to load task status."))
 
 
+@tasks.route("/api/tasks/<task_name>/history")
+@api_admin_required
+def api_task_history(task_name):
+    task_service = _get_services().task_service
+    task = task_service.get_task(task_name)
+    if not task:
+        return json_problem(
+            NotFoundProblem("Task not found.", title="Task not found", slug="task-not-found")
+        )
+    try:
+        limit = max(1, min(int(request.args.get("limit", 50)), TASK_HISTORY_PAGE_LIMIT))
+        before = request.args.get("before")
+        before_id = int(before) if before else None
+    except ValueError:
+        return json_problem(
+            ValidationProblem(
+                "limit and before must be whole numbers.", slug="task-history-validation-error"
+            )
+        )
+    runs = task_service.task_history(task, limit=limit, before_id=before_id)
+    return json_data(
+        {
+            "runs": runs,
+            "stats": task_service.task_failure_stats().get(task.name),
+            # Page backwards by passing the oldest run id on this page as ?before=.
+            "next_before": runs[-1]["id"] if len(runs) >= limit else None,
+        }
+    )
+
+
 @tasks.route("/task/<task_name>/start", methods=["POST"])
 @admin_required
 def start_task(task_name):
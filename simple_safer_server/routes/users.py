@@ -125,3 +125,21 @@ def api_delete_user(username):
             f"Failed to delete user {username}: {message}", slug="user-validation-error"
         )
     )
+
+
+@users.route("/api/users/password-hashing", methods=["GET"])
+@api_admin_required
+def api_password_hashing():
+    user_manager = _get_services().user_manager
+    return json_data({"password_hashing": user_manager.password_hash_policy()})
+
+
+@users.route("/api/users/password-hashing/calibrate", methods=["POST"])
+@api_admin_required
+def api_calibrate_password_hashing():
+    user_manager = _get_services().user_manager
+    policy = user_manager.calibrate_password_hashing()
+    return json_data(
+        {"password_hashing": policy},
+        message="Password hashing recalibrated. Existing passwords upgrade at their next login.",
+    )
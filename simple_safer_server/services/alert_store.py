@@ -1,41 +1,164 @@
+import sqlite3
+import threading
+from contextlib import suppress
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-from simple_safer_server.services.file_persistence import (
-    atomic_write_json,
-    locked_json_update,
-    locked_path,
-    read_json,
+from simple_safer_server.services.file_persistence import read_json
+
+ALERTS_DB_FILENAME = "alerts.sqlite3"
+LEGACY_ALERTS_FILENAME = "alerts.json"
+ALERT_RETENTION_COUNT = 1000
+ALERT_PAGE_LIMIT = 200
+
+# AUTOINCREMENT never reuses an id, so ids stay monotonic across retention
+# trims and Clear All. Every list query walks one of the (column, id) indexes.
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS alerts (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        title TEXT NOT NULL,
+        message TEXT NOT NULL,
+        type TEXT NOT NULL,
+        source TEXT NOT NULL,
+        timestamp TEXT NOT NULL,
+        read INTEGER NOT NULL DEFAULT 0
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS alerts_read ON alerts (read, id)",
+    "CREATE INDEX IF NOT EXISTS alerts_type ON alerts (type, id)",
+    "CREATE INDEX IF NOT EXISTS alerts_source ON alerts (source, id)",
+    "CREATE INDEX IF NOT EXISTS alerts_timestamp ON alerts (timestamp)",
 )
 
 
+def _alert_from_row(row: sqlite3.Row) -> dict[str, Any]:
+    return {
+        "id": row["id"],
+        "title": row["title"],
+        "message": row["message"],
+        "type": row["type"],
+        "source": row["source"],
+        "timestamp": row["timestamp"],
+        "read": bool(row["read"]),
+    }
+
+
 class AlertStore:
-    """Persist alerts with cross-process locking and atomic JSON replacement."""
+    """Indexed SQLite alert log shared by the web app and alert scripts.
 
-    def __init__(self, alerts_path: Path):
-        self.alerts_path = alerts_path
-        self.lock_path = alerts_path.with_suffix(".lock")
+    Appends and read-state changes touch single rows instead of rewriting the
+    whole history, and WAL mode lets the Alerts page read during alert bursts.
+    """
+
+    def __init__(self, db_path: Path, *, timeout: float = 5.0) -> None:
+        self.db_path = db_path
+        self.legacy_path = db_path.with_name(LEGACY_ALERTS_FILENAME)
+        self._timeout = timeout
+        self._local = threading.local()
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            return connection
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(str(self.db_path), timeout=self._timeout)
+        connection.row_factory = sqlite3.Row
+        connection.execute("PRAGMA journal_mode=WAL")
+        # Alerts are the operator's record of failures, so each commit is
+        # synced; in WAL mode that is one append, not a history rewrite.
+        connection.execute("PRAGMA synchronous=FULL")
+        self._local.connection = connection
+        return connection
 
     def initialize(self) -> None:
-        # Initialization uses the same stable sidecar lock as updates so a
-        # first-run script cannot overwrite another process's freshly appended alert.
-        with locked_path(self.lock_path, mode=0o644):
-            if not self.alerts_path.exists():
-                atomic_write_json(self.alerts_path, [], mode=0o644)
-            else:
-                self.alerts_path.chmod(0o644)
+        connection = self._connection()
+        with connection:
+            for statement in _SCHEMA:
+                connection.execute(statement)
+        self.db_path.chmod(0o644)
+        self._import_legacy_alerts()
+
+    def _import_legacy_alerts(self) -> None:
+        # Older releases kept alerts in one JSON array. Import it with its ids so
+        # open links and the id sequence carry over; INSERT OR IGNORE makes a
+        # concurrent or interrupted import harmless.
+        if not self.legacy_path.exists():
+            return
+        legacy_alerts = read_json(self.legacy_path, [])
+        rows = [
+            {
+                "id": alert["id"],
+                "title": str(alert.get("title", "")),
+                "message": str(alert.get("message", "")),
+                "type": str(alert.get("type", "info")),
+                "source": str(alert.get("source", "system")),
+                "timestamp": str(alert.get("timestamp", "")),
+                "read": 1 if alert.get("read") else 0,
+            }
+            for alert in legacy_alerts
+            if isinstance(alert, dict) and isinstance(alert.get("id"), int)
+        ]
+        connection = self._connection()
+        with connection:
+            connection.executemany(
+                "INSERT OR IGNORE INTO alerts (id, title, message, type, source, timestamp, read) "
+                "VALUES (:id, :title, :message, :type, :source, :timestamp, :read)",
+                rows,
+            )
+        with suppress(FileNotFoundError):
+            self.legacy_path.unlink()
 
     def list_alerts(
         self, limit: int | None = None, unread_only: bool = False
     ) -> list[dict[str, Any]]:
-        alerts = read_json(self.alerts_path, [])
-        if unread_only:
-            alerts = [alert for alert in alerts if not alert.get("read", False)]
-        if limit:
-            alerts = alerts[-limit:]
+        """Return the newest ``limit`` alerts (all when None) in oldest-first order."""
+        alerts = self.page_alerts(
+            limit=limit or ALERT_RETENTION_COUNT,
+            unread_only=unread_only,
+        )
+        alerts.reverse()
         return alerts
 
+    def page_alerts(
+        self,
+        limit: int = 50,
+        before_id: int | None = None,
+        unread_only: bool = False,
+        alert_type: str | None = None,
+        source: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Return alerts newest first, paging backwards from ``before_id``."""
+        query = "SELECT * FROM alerts WHERE 1 = 1"
+        params: list[Any] = []
+        if unread_only:
+            query += " AND read = 0"
+        if alert_type:
+            query += " AND type = ?"
+            params.append(alert_type)
+        if source:
+            query += " AND source = ?"
+            params.append(source)
+        if before_id is not None:
+            query += " AND id < ?"
+            params.append(before_id)
+        query += " ORDER BY id DESC LIMIT ?"
+        params.append(max(1, limit))
+        rows = self._connection().execute(query, params).fetchall()
+        return [_alert_from_row(row) for row in rows]
+
+    def get_alert(self, alert_id: int) -> dict[str, Any] | None:
+        row = (
+            self._connection().execute("SELECT * FROM alerts WHERE id = ?", (alert_id,)).fetchone()
+        )
+        return _alert_from_row(row) if row is not None else None
+
+    def unread_count(self) -> int:
+        return (
+            self._connection().execute("SELECT COUNT(*) FROM alerts WHERE read = 0").fetchone()[0]
+        )
+
     def append_alert(
         self,
         title: str,
@@ -43,87 +166,46 @@ class AlertStore:
         alert_type: str = "info",
         source: str = "system",
     ) -> dict[str, Any]:
-        new_alert = {}
-
-        def update(alerts):
-            next_id = (
-                max(
-                    (
-                        existing_alert.get("id", 0)
-                        for existing_alert in alerts
-                        if isinstance(existing_alert.get("id"), int)
-                    ),
-                    default=0,
-                )
-                + 1
+        alert = {
+            "title": title,
+            "message": message,
+            "type": alert_type,
+            "source": source,
+            "timestamp": datetime.now().isoformat(),
+            "read": False,
+        }
+        connection = self._connection()
+        with connection:
+            cursor = connection.execute(
+                "INSERT INTO alerts (title, message, type, source, timestamp, read) "
+                "VALUES (:title, :message, :type, :source, :timestamp, 0)",
+                alert,
             )
-            alert = {
-                # IDs stay monotonic even after retention trims old alerts.
-                "id": next_id,
-                "title": title,
-                "message": message,
-                "type": alert_type,
-                "source": source,
-                "timestamp": datetime.now().isoformat(),
-                "read": False,
-            }
-            alerts.append(alert)
-            if len(alerts) > 1000:
-                alerts = alerts[-1000:]
-            new_alert.update(alert)
-            return alerts
-
-        locked_json_update(
-            self.alerts_path,
-            self.lock_path,
-            [],
-            update,
-            file_mode=0o644,
-            lock_mode=0o644,
-        )
-        return new_alert
+            alert_id = cursor.lastrowid
+            # Ids are handed out one per insert, so the retention window is a
+            # primary-key range delete rather than a count over the table.
+            connection.execute(
+                "DELETE FROM alerts WHERE id <= ?", (alert_id - ALERT_RETENTION_COUNT,)
+            )
+        return {"id": alert_id, **alert}
 
     def mark_alert_read(self, alert_id: int) -> None:
-        def update(alerts):
-            for alert in alerts:
-                if alert["id"] == alert_id:
-                    alert["read"] = True
-                    break
-            return alerts
-
-        locked_json_update(
-            self.alerts_path,
-            self.lock_path,
-            [],
-            update,
-            file_mode=0o644,
-            lock_mode=0o644,
-        )
+        connection = self._connection()
+        with connection:
+            connection.execute("UPDATE alerts SET read = 1 WHERE id = ?", (alert_id,))
 
     def clear(self) -> None:
-        def update(_alerts):
-            return []
-
-        locked_json_update(
-            self.alerts_path,
-            self.lock_path,
-            [],
-            update,
-            file_mode=0o644,
-            lock_mode=0o644,
-        )
+        connection = self._connection()
+        with connection:
+            connection.execute("DELETE FROM alerts")
 
     def mark_all_read(self) -> None:
-        def update(alerts):
-            for alert in alerts:
-                alert["read"] = True
-            return alerts
-
-        locked_json_update(
-            self.alerts_path,
-            self.lock_path,
-            [],
-            update,
-            file_mode=0o644,
-            lock_mode=0o644,
-        )
+        connection = self._connection()
+        with connection:
+            connection.execute("UPDATE alerts SET read = 1 WHERE read = 0")
+
+    def close(self) -> None:
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
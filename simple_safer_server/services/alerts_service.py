@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from typing import Any
 
+from simple_safer_server.services.alert_store import ALERT_PAGE_LIMIT
 from simple_safer_server.web.problems import (
     ForbiddenProblem,
     NotFoundProblem,
@@ -8,10 +9,20 @@ from simple_safer_server.web.problems import (
     ValidationProblem,
 )
 
+ALERTS_PAGE_SIZE = 50
+
 
 @dataclass(frozen=True)
 class AlertsList:
     alerts: list[dict[str, Any]]
+    unread_count: int
+    # Pass back as ?before= to load the next, older page; None on the last page.
+    next_before: int | None
+
+
+@dataclass(frozen=True)
+class UnreadAlertCount:
+    unread_count: int
 
 
 @dataclass(frozen=True)
@@ -106,12 +117,27 @@ class AlertsService:
         )
         return None
 
-    def get_alerts(self) -> AlertsList:
-        return AlertsList(alerts=self._config_manager.get_alerts())
+    def get_alerts(
+        self,
+        limit: int = ALERTS_PAGE_SIZE,
+        before_id: int | None = None,
+        unread_only: bool = False,
+    ) -> AlertsList:
+        limit = max(1, min(limit, ALERT_PAGE_LIMIT))
+        alerts = self._config_manager.get_alerts_page(
+            limit=limit, before_id=before_id, unread_only=unread_only
+        )
+        return AlertsList(
+            alerts=alerts,
+            unread_count=self._config_manager.count_unread_alerts(),
+            next_before=alerts[-1]["id"] if len(alerts) >= limit else None,
+        )
+
+    def get_unread_count(self) -> UnreadAlertCount:
+        return UnreadAlertCount(unread_count=self._config_manager.count_unread_alerts())
 
     def get_alert(self, alert_id: int) -> AlertDetail:
-        alerts = self._config_manager.get_alerts()
-        alert = next((item for item in alerts if item["id"] == alert_id), None)
+        alert = self._config_manager.get_alert(alert_id)
         if alert:
             return AlertDetail(alert=alert)
         raise NotFoundProblem("Alert not found.", title="Alert not found", slug="alert-not-found")
@@ -170,8 +196,9 @@ class AlertsService:
             from_address, smtp_server, smtp_port_text, smtp_username, smtp_password
         ):
             raise OperationProblem("Failed to write msmtp configuration.")
-        self._config_manager.set_value("backup", "email_address", email)
-        self._config_manager.set_value("backup", "from_address", from_address)
+        self._config_manager.set_values(
+            {"backup": {"email_address": email, "from_address": from_address}}
+        )
         return None
 
     def _read_msmtp_config(self) -> dict[str, str]:
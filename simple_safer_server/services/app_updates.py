@@ -8,7 +8,12 @@ from typing import Any
 
 from simple_safer_server.adapters.app_update_commands import AppUpdateCommandAdapter
 from simple_safer_server.adapters.command_runner import CalledProcessError
-from simple_safer_server.services.file_persistence import atomic_write_json, read_json
+from simple_safer_server.services.file_persistence import (
+    BATCHED,
+    VOLATILE,
+    atomic_write_json,
+    read_json,
+)
 from simple_safer_server.services.runtime import get_runtime
 
 
@@ -115,7 +120,7 @@ class AppUpdateManager:
             return {}
 
     def _write_cache(self, status: dict[str, Any]) -> None:
-        atomic_write_json(self.cache_path, status, mode=0o644, durable=False)
+        atomic_write_json(self.cache_path, status, mode=0o644, durability=VOLATILE)
 
     def request_cleanup_update(self) -> None:
         """Ask the next app_update.service run to use the cleanup update path."""
@@ -123,7 +128,7 @@ class AppUpdateManager:
             self.request_path,
             {"mode": "cleanup", "requested_at": self._now()},
             mode=0o600,
-            durable=False,
+            durability=BATCHED,
         )
 
     def request_branch_switch(self, branch: str) -> None:
@@ -136,7 +141,7 @@ class AppUpdateManager:
                 "requested_at": self._now(),
             },
             mode=0o600,
-            durable=False,
+            durability=BATCHED,
         )
 
     def clear_update_request(self) -> None:
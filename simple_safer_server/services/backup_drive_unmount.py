@@ -7,6 +7,7 @@ from simple_safer_server.services.backup_drive_setup import (
     BackupDriveSetupError,
     _get_mount_for_partition,
 )
+from simple_safer_server.services.block_devices import block_device_index
 from simple_safer_server.services.runtime import get_fake_state, get_runtime
 
 LOGGER = logging.getLogger(__name__)
@@ -49,7 +50,9 @@ def _power_down_managed_backup_drive(configured_uuid, system_utils, command_adap
         return
 
     try:
-        partition_device = command_adapter.find_device_by_uuid(configured_uuid)
+        partition_device = block_device_index.device_for_uuid(
+            configured_uuid
+        ) or command_adapter.find_device_by_uuid(configured_uuid)
         if not partition_device:
             return
 
@@ -0,0 +1,131 @@
+import os
+from pathlib import Path
+from typing import Any
+
+SYS_CLASS_BLOCK = Path("/sys/class/block")
+DEV_DISK_BY_UUID = Path("/dev/disk/by-uuid")
+SECTOR_BYTES = 512
+
+# Ordered so the most specific bus wins: a USB-attached NVMe enclosure shows
+# both "/usb" and "/nvme" in its sysfs path and should count as USB.
+_TRANSPORT_MARKERS = (
+    ("/usb", "usb"),
+    ("/nvme", "nvme"),
+    ("/mmc", "mmc"),
+    ("/virtio", "virtio"),
+    ("/ata", "sata"),
+)
+
+
+def _read_attribute(path: Path) -> str | None:
+    try:
+        value = path.read_text().strip()
+    except OSError:
+        return None
+    return value or None
+
+
+class BlockDeviceIndex:
+    """Resolve block devices from udev symlinks and sysfs without forking.
+
+    Every lookup is a handful of readlink/read calls against kernel-backed
+    filesystems, so it never wakes a sleeping USB bridge the way blkid can.
+    Methods return ``None`` when sysfs cannot answer so callers can fall back
+    to the equivalent blkid/lsblk command.
+    """
+
+    def __init__(
+        self,
+        sys_class_block: Path = SYS_CLASS_BLOCK,
+        by_uuid_dir: Path = DEV_DISK_BY_UUID,
+    ) -> None:
+        self.sys_class_block = sys_class_block
+        self.by_uuid_dir = by_uuid_dir
+
+    def device_for_uuid(self, uuid: str) -> str | None:
+        # udev keeps one symlink per UUID, so clones sharing a filesystem UUID
+        # are invisible here; callers that must reject clones still use blkid.
+        if not uuid or "/" in uuid or uuid.startswith("."):
+            return None
+        link = self.by_uuid_dir / uuid
+        if not link.is_symlink():
+            return None
+        return os.path.realpath(link)
+
+    def _sys_entry(self, device: str) -> Path | None:
+        name = os.path.basename(os.path.realpath(device))
+        entry = self.sys_class_block / name
+        return entry if name and entry.exists() else None
+
+    def parent_device(self, device: str) -> str | None:
+        """Return the whole-disk device for a partition such as ``/dev/sdb1``."""
+        entry = self._sys_entry(device)
+        if entry is None or not (entry / "partition").exists():
+            return None
+        # /sys/class/block/sdb1 links into .../block/sdb/sdb1, so the parent
+        # directory of the resolved path is the disk.
+        parent = Path(os.path.realpath(entry)).parent
+        if not (parent / "dev").exists():
+            return None
+        return f"/dev/{parent.name}"
+
+    def device_info(self, device: str) -> dict[str, Any] | None:
+        """Return model, serial, transport and size for a whole disk or partition."""
+        entry = self._sys_entry(device)
+        if entry is None:
+            return None
+        disk = entry
+        if (entry / "partition").exists():
+            disk = Path(os.path.realpath(entry)).parent
+        resolved = os.path.realpath(disk)
+        transport = next((name for marker, name in _TRANSPORT_MARKERS if marker in resolved), None)
+        sectors = _read_attribute(entry / "size")
+        return {
+            "path": f"/dev/{entry.name}",
+            "disk": f"/dev/{disk.name}",
+            "model": _read_attribute(disk / "device" / "model"),
+            "serial": self._serial(disk),
+            "transport": transport,
+            "size_bytes": int(sectors) * SECTOR_BYTES if sectors and sectors.isdigit() else None,
+        }
+
+    def bus_key(self, device: str) -> str | None:
+        """Return an identifier shared by disks on the same USB hub or transport.
+
+        USB disks are keyed by the hub their device hangs off. Disks plugged
+        straight into the computer share the controller's root hub (``usb1``,
+        ``usb2``), so every port on one controller shares a key; disks behind
+        an external hub share that hub's key (``usb:2-1``).
+        """
+        entry = self._sys_entry(device)
+        if entry is None:
+            return None
+        if (entry / "partition").exists():
+            entry = Path(os.path.realpath(entry)).parent
+        resolved = os.path.realpath(entry)
+        transport = next((name for marker, name in _TRANSPORT_MARKERS if marker in resolved), None)
+        if transport != "usb":
+            return transport
+        parent = Path(os.path.realpath(entry / "device"))
+        while parent != parent.parent and parent.name != "devices":
+            if (parent / "idVendor").exists():
+                return f"usb:{parent.parent.name}"
+            parent = parent.parent
+        return "usb"
+
+    def _serial(self, disk: Path) -> str | None:
+        serial = _read_attribute(disk / "device" / "serial")
+        if serial:
+            return serial
+        # SCSI disks behind USB bridges expose the serial on the USB device
+        # node rather than the SCSI device, so walk up to the first ancestor
+        # that has one.
+        parent = Path(os.path.realpath(disk / "device"))
+        while parent != parent.parent and parent.name != "devices":
+            if (parent / "idVendor").exists():
+                return _read_attribute(parent / "serial")
+            parent = parent.parent
+        return None
+
+
+block_device_index = BlockDeviceIndex()
@@ -108,11 +108,12 @@ class CloudBackupService:
                 title="Cloud Backup task not found",
                 slug="cloud-backup-task-not-found",
             )
+        run_state = self._task_service.task_run_state(task)
         return CloudBackupStatus(
-            status=task.status,
-            last_run=task.last_run,
-            next_run=task.next_run,
-            last_run_duration=task.last_run_duration,
+            status=run_state["status"],
+            last_run=run_state["last_run"],
+            next_run=run_state["next_run"],
+            last_run_duration=run_state["last_run_duration"],
         )
 
     def run_backup(self) -> None:
@@ -211,18 +212,19 @@ class CloudBackupService:
             except ScheduleTimeError as exc:
                 raise ValidationProblem(str(exc)) from exc
 
+        updates: dict[str, dict[str, str]] = {}
+        if backup_time:
+            updates["schedule"] = {"backup_cloud_time": backup_time}
+        if has_bandwidth_limit:
+            updates["backup"] = {"bandwidth_limit": bandwidth_limit}
+
         if self._runtime.is_fake:
-            if backup_time:
-                self._config_manager.set_value("schedule", "backup_cloud_time", backup_time)
-            if has_bandwidth_limit:
-                self._config_manager.set_value("backup", "bandwidth_limit", bandwidth_limit)
+            self._config_manager.set_values(updates)
             return {}
 
         config = self._config_manager.get_all_config()
-        if backup_time:
-            config.setdefault("schedule", {})["backup_cloud_time"] = backup_time
-        if has_bandwidth_limit:
-            config.setdefault("backup", {})["bandwidth_limit"] = bandwidth_limit
+        for section, values in updates.items():
+            config.setdefault(section, {}).update(values)
         ok, err = self._system_utils.create_systemd_config_file(config)
         if not ok:
             raise OperationProblem(f"Failed to update systemd config: {err}")
@@ -231,10 +233,7 @@ class CloudBackupService:
         if not ok:
             raise OperationProblem(f"Failed to update systemd timers: {err}")
 
-        if backup_time:
-            self._config_manager.set_value("schedule", "backup_cloud_time", backup_time)
-        if has_bandwidth_limit:
-            self._config_manager.set_value("backup", "bandwidth_limit", bandwidth_limit)
+        self._config_manager.set_values(updates)
         return {}
 
     def validate_mega(self, data: dict[str, Any]) -> None:
@@ -259,9 +258,9 @@ class CloudBackupService:
                     "Failed to write rclone config for MEGA.",
                     slug="cloud-backup-rclone-config-write-failed",
                 )
-            self._config_manager.set_value("backup", "cloud_mode", "mega")
-            self._config_manager.set_value("backup", "mega_email", email)
-            self._config_manager.set_value("backup", "mega_pass", obscured_pw)
+            self._config_manager.set_values(
+                {"backup": {"cloud_mode": "mega", "mega_email": email, "mega_pass": obscured_pw}}
+            )
 
         finally:
             os.remove(config_path)
@@ -272,6 +271,7 @@ class CloudBackupService:
         folder = data.get("mega_folder")
         if not email or not folder:
             raise ValidationProblem("Email and folder are required.")
+        backup_values = {}
 
         if password:
             obscured_pw = self._obscure_password(password)
@@ -280,8 +280,8 @@ class CloudBackupService:
                     "Failed to write rclone config for MEGA.",
                     slug="cloud-backup-rclone-config-write-failed",
                 )
-            self._config_manager.set_value("backup", "mega_email", email)
-            self._config_manager.set_value("backup", "mega_pass", obscured_pw)
+            backup_values["mega_email"] = email
+            backup_values["mega_pass"] = obscured_pw
         else:
             stored_email = self._config_manager.get_value("backup", "mega_email", "")
             stored_pass = self._config_manager.get_value("backup", "mega_pass", "")
@@ -297,11 +297,12 @@ class CloudBackupService:
                     slug="cloud-backup-rclone-config-write-failed",
                 )
             if stored_email != email:
-                self._config_manager.set_value("backup", "mega_email", email)
+                backup_values["mega_email"] = email
 
-        self._config_manager.set_value("backup", "cloud_mode", "mega")
-        self._config_manager.set_value("backup", "mega_folder", folder)
-        self._config_manager.set_value("backup", "rclone_dir", f"mega:{folder}")
+        backup_values["cloud_mode"] = "mega"
+        backup_values["mega_folder"] = folder
+        backup_values["rclone_dir"] = f"mega:{folder}"
+        self._config_manager.set_values({"backup": backup_values})
 
     def _save_advanced_config(self, data: dict[str, Any]) -> None:
         rclone_config = data.get("rclone_config")
@@ -310,8 +311,9 @@ class CloudBackupService:
             raise ValidationProblem("Rclone config and remote name are required.")
         if not self._system_utils.setup_rclone(rclone_config):
             raise OperationProblem("Failed to write rclone config.")
-        self._config_manager.set_value("backup", "cloud_mode", "advanced")
-        self._config_manager.set_value("backup", "rclone_dir", remote_name)
+        self._config_manager.set_values(
+            {"backup": {"cloud_mode": "advanced", "rclone_dir": remote_name}}
+        )
 
     def _get_mega_credentials(self, data: dict[str, Any]) -> tuple[str, str] | None:
         email = data.get("email")
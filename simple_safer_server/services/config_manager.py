@@ -1,13 +1,16 @@
 import configparser
+import contextlib
 import io
 import logging
 import os
 import stat
+import threading
 
 from cryptography.fernet import Fernet
 
-from simple_safer_server.services.alert_store import AlertStore
+from simple_safer_server.services.alert_store import ALERTS_DB_FILENAME, AlertStore
 from simple_safer_server.services.file_persistence import (
+    DURABLE,
     atomic_write_json,
     atomic_write_text,
     locked_path,
@@ -25,9 +28,13 @@ class ConfigManager:
         self.secrets_path = self.config_dir / '.secrets'
         self.secrets_lock_path = self.config_dir / '.secrets.lock'
         self.key_path = self.config_dir / '.key'
-        self.alerts_path = self.config_dir / 'alerts.json'
+        self.alerts_path = self.config_dir / ALERTS_DB_FILENAME
         self.alert_store = AlertStore(self.alerts_path)
         self.config = configparser.ConfigParser()
+        self._config_signature = None
+        self._secrets_lock = threading.Lock()
+        self._secrets_cache = None
+        self._secrets_signature = None
         self.logger = logging.getLogger(__name__)
 
         self.config_dir.mkdir(parents=True, exist_ok=True)
@@ -78,16 +85,40 @@ class ConfigManager:
         """Initialize the alerts storage system"""
         self.alert_store.initialize()
 
+    @staticmethod
+    def _file_signature(path):
+        # Writers replace config files atomically, so a new inode catches other
+        # workers and shell scripts; mtime and size catch in-place edits.
+        try:
+            file_stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+        return (file_stat.st_ino, file_stat.st_mtime_ns, file_stat.st_size)
+
+    def _config_file_signature(self):
+        return self._file_signature(self.config_path)
+
     def load_config(self):
         """Load the configuration file"""
-        # ConfigParser.read() merges into existing state, so reloads need a
-        # fresh parser or deleted options can linger in memory.
-        self.config = configparser.ConfigParser()
-        if self.config_path.exists():
-            self.config.read(self.config_path)
-        else:
+        if not self._refresh_config():
             self.create_default_config()
 
+    def _refresh_config(self):
+        """Reparse config.conf only if it changed; returns False when it is missing."""
+        # Stat before reading: a replace that lands mid-parse changes the
+        # signature again, so the next call reparses instead of caching stale data.
+        signature = self._config_file_signature()
+        if signature is None:
+            return False
+        if signature != self._config_signature:
+            # ConfigParser.read() merges into existing state, so reloads need a
+            # fresh parser or deleted options can linger in memory.
+            config = configparser.ConfigParser()
+            config.read(self.config_path)
+            self.config = config
+            self._config_signature = signature
+        return True
+
     def _default_config_parser(self):
         """Build the first-run configuration without touching disk."""
         config = configparser.ConfigParser()
@@ -128,7 +159,7 @@ class ConfigManager:
     def _write_config_parser(self, config):
         stream = io.StringIO()
         config.write(stream)
-        atomic_write_text(self.config_path, stream.getvalue(), mode=0o644)
+        atomic_write_text(self.config_path, stream.getvalue(), mode=0o644, durability=DURABLE)
 
     def _locked_config_update(self, update_config):
         # config.conf is replaced atomically, so all writers must lock a stable
@@ -142,6 +173,7 @@ class ConfigManager:
             update_config(config)
             self._write_config_parser(config)
             self.config = config
+            self._config_signature = self._config_file_signature()
 
     def create_default_config(self):
         """Create default configuration if no on-disk config exists."""
@@ -168,6 +200,7 @@ class ConfigManager:
 
     def get_value(self, section, key, default=None):
         """Get a configuration value"""
+        self._refresh_config()
         try:
             return self.config.get(section, key)
         except configparser.NoSectionError, configparser.NoOptionError:
@@ -175,43 +208,89 @@ class ConfigManager:
 
     def set_value(self, section, key, value):
         """Set a configuration value"""
+        self.set_values({section: {key: value}})
+
+    def set_values(self, updates):
+        """Set many values, given as {section: {key: value}}, with one locked write"""
+        if not any(updates.values()):
+            return
 
         def update(config):
-            if not config.has_section(section):
-                config.add_section(section)
-            config.set(section, key, str(value))
+            for section, values in updates.items():
+                if not config.has_section(section):
+                    config.add_section(section)
+                for key, value in values.items():
+                    config.set(section, key, str(value))
 
         self._locked_config_update(update)
 
+    @contextlib.contextmanager
+    def transaction(self):
+        """Yield a set_value-style stager; staged values are written together on clean exit"""
+        # Each set_value() is a lock, reparse and fsynced replace of config.conf;
+        # save flows batch their fields here so a form save costs one write.
+        updates = {}
+
+        def stage(section, key, value):
+            updates.setdefault(section, {})[key] = value
+
+        yield stage
+        self.set_values(updates)
+
+    def _decrypted_secrets(self):
+        """Return the decrypted secrets map, decrypting only after .secrets changes."""
+        with self._secrets_lock:
+            signature = self._file_signature(self.secrets_path)
+            if signature is not None and signature == self._secrets_signature:
+                return self._secrets_cache
+            secrets = read_json(self.secrets_path, {})
+            decrypted = {}
+            for key, encrypted in secrets.items():
+                try:
+                    decrypted[key] = self.cipher.decrypt(encrypted.encode()).decode()
+                except Exception as e:
+                    self.logger.error(f"Error retrieving secret {key}: {e}")
+            self._secrets_cache = decrypted
+            self._secrets_signature = signature
+            return decrypted
+
     def store_secret(self, key, value):
         """Store a sensitive value"""
+        self.store_secrets({key: value})
+
+    def store_secrets(self, values):
+        """Store several sensitive values with one locked write"""
         try:
             # Multiple admin requests can update different credentials at once;
             # lock the whole read/modify/replace sequence so one request cannot
             # overwrite another request's freshly stored key.
             with locked_path(self.secrets_lock_path, mode=0o600):
                 secrets = read_json(self.secrets_path, {})
-                encrypted = self.cipher.encrypt(value.encode())
-                secrets[key] = encrypted.decode()
-                atomic_write_json(self.secrets_path, secrets, mode=0o600)
+                for key, value in values.items():
+                    secrets[key] = self.cipher.encrypt(value.encode()).decode()
+                atomic_write_json(self.secrets_path, secrets, mode=0o600, durability=DURABLE)
         except Exception as e:
             self.logger.error(f"Error storing secret: {e}")
             raise
+        finally:
+            with self._secrets_lock:
+                self._secrets_signature = None
 
     def get_secret(self, key, default=None):
         """Retrieve a sensitive value"""
+        return self.get_secrets([key], default)[key]
+
+    def get_secrets(self, keys, default=None):
+        """Retrieve several sensitive values, using ``default`` for missing ones"""
         try:
-            secrets = read_json(self.secrets_path, {})
-            if key not in secrets:
-                return default
-            encrypted = secrets[key].encode()
-            return self.cipher.decrypt(encrypted).decode()
+            secrets = self._decrypted_secrets()
         except Exception as e:
             self.logger.error(f"Error retrieving secret: {e}")
-            return default
+            secrets = {}
+        return {key: secrets.get(key, default) for key in keys}
 
     def log_alert(self, title, message, alert_type="info", source="system"):
-        """Log an alert to the alerts file"""
+        """Log an alert to the alert store"""
         try:
             self.alert_store.append_alert(title, message, alert_type=alert_type, source=source)
             self.logger.info(f"Alert logged: {title}")
@@ -221,13 +300,39 @@ class ConfigManager:
             return False
 
     def get_alerts(self, limit=None, unread_only=False):
-        """Get alerts from the alerts file"""
+        """Get alerts from the alert store, oldest first"""
         try:
             return self.alert_store.list_alerts(limit=limit, unread_only=unread_only)
         except Exception as e:
             self.logger.error(f"Error reading alerts: {e}")
             return []
 
+    def get_alerts_page(self, limit=50, before_id=None, unread_only=False):
+        """Get one page of alerts, newest first, older than before_id"""
+        try:
+            return self.alert_store.page_alerts(
+                limit=limit, before_id=before_id, unread_only=unread_only
+            )
+        except Exception as e:
+            self.logger.error(f"Error reading alerts: {e}")
+            return []
+
+    def get_alert(self, alert_id):
+        """Get a single alert, or None when it does not exist"""
+        try:
+            return self.alert_store.get_alert(alert_id)
+        except Exception as e:
+            self.logger.error(f"Error reading alert: {e}")
+            return None
+
+    def count_unread_alerts(self):
+        """Count unread alerts"""
+        try:
+            return self.alert_store.unread_count()
+        except Exception as e:
+            self.logger.error(f"Error counting unread alerts: {e}")
+            return 0
+
     def mark_alert_read(self, alert_id):
         """Mark an alert as read"""
         try:
@@ -257,7 +362,7 @@ class ConfigManager:
             return False
 
     def is_setup_complete(self):
-        """Check if initial setup is complete; always reload config to ensure freshness"""
+        """Check if initial setup is complete"""
         self.load_config()
         return str(self.get_value('system', 'setup_complete', 'false')).lower() == 'true'
 
@@ -267,6 +372,7 @@ class ConfigManager:
 
     def get_all_config(self):
         """Get all non-sensitive configuration"""
+        self._refresh_config()
         config_dict = {}
         for section in self.config.sections():
             config_dict[section] = dict(self.config[section])
@@ -7,6 +7,7 @@ from simple_safer_server.services.app_updates import AppUpdateManager
 from simple_safer_server.services.cloud_backup_service import CloudBackupService
 from simple_safer_server.services.ddns_service import DdnsService
 from simple_safer_server.services.drive_health import DriveHealthSummaryService
+from simple_safer_server.services.drive_health_history import DriveHealthHistoryStore
 from simple_safer_server.services.server_identity import ServerIdentityService
 from simple_safer_server.services.storage_service import StorageService
 from simple_safer_server.services.task_service import TaskService
@@ -25,6 +26,7 @@ class AppServices:
     app_update_manager: AppUpdateManager
     smb_manager: Any
     user_manager: Any
+    user_registry: Any
     task_service: TaskService
     ddns_service: DdnsService
     cloud_backup_service: CloudBackupService
@@ -32,3 +34,4 @@ class AppServices:
     server_identity_service: ServerIdentityService
     storage_service: StorageService
     drive_health_summary_service: DriveHealthSummaryService
+    drive_health_history: DriveHealthHistoryStore
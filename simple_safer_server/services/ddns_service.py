@@ -1,7 +1,9 @@
-import json
+from collections.abc import Callable
 from contextlib import suppress
 from typing import Any
 
+from simple_safer_server.services.file_persistence import read_json
+
 
 class DdnsService:
     """Coordinates DDNS page configuration without depending on Flask route state."""
@@ -15,7 +17,10 @@ class DdnsService:
     def get_config_payload(self) -> dict[str, Any]:
         status = self._read_status()
         ddns_task = self._task_service.get_task("DDNS Update")
-        next_run = ddns_task.next_run if ddns_task else "Unknown"
+        next_run = (
+            self._task_service.task_run_state(ddns_task)["next_run"] if ddns_task else "Unknown"
+        )
+        secrets = self._config_manager.get_secrets(["duckdns_token", "cloudflare_token"], "")
         return {
             "config": {
                 "duckdns": {
@@ -24,16 +29,16 @@ class DdnsService:
                     "domain": self._config_manager.get_value("ddns", "duckdns_domain", ""),
                     # DDNS settings are credential editors for trusted admins, so
                     # return the stored token to keep the UI useful for audits.
-                    "token": self._config_manager.get_secret("duckdns_token", ""),
-                    "token_present": self._config_manager.get_secret("duckdns_token", "") != "",
+                    "token": secrets["duckdns_token"],
+                    "token_present": secrets["duckdns_token"] != "",
                 },
                 "cloudflare": {
                     "enabled": self._config_manager.get_value("ddns", "cloudflare_enabled", "false")
                     == "true",
                     "zone": self._config_manager.get_value("ddns", "cloudflare_zone", ""),
                     "record": self._config_manager.get_value("ddns", "cloudflare_record", ""),
-                    "token": self._config_manager.get_secret("cloudflare_token", ""),
-                    "token_present": self._config_manager.get_secret("cloudflare_token", "") != "",
+                    "token": secrets["cloudflare_token"],
+                    "token_present": secrets["cloudflare_token"] != "",
                     "proxy": self._config_manager.get_value("ddns", "cloudflare_proxy", "false")
                     == "true",
                 },
@@ -43,14 +48,23 @@ class DdnsService:
         }
 
     def save_config(self, data: dict[str, Any]) -> str:
-        if "duckdns" in data:
-            if not isinstance(data["duckdns"], dict):
-                raise ValueError("duckdns settings must be a JSON object")
-            self._save_duckdns(data["duckdns"])
-        if "cloudflare" in data:
-            if not isinstance(data["cloudflare"], dict):
-                raise ValueError("cloudflare settings must be a JSON object")
-            self._save_cloudflare(data["cloudflare"])
+        new_secrets: dict[str, str] = {}
+        # Both providers' fields land in one config.conf write, and a validation
+        # error in either provider leaves the saved config untouched.
+        with self._config_manager.transaction() as set_value:
+            if "duckdns" in data:
+                if not isinstance(data["duckdns"], dict):
+                    raise ValueError("duckdns settings must be a JSON object")
+                self._save_duckdns(data["duckdns"], set_value, new_secrets)
+            if "cloudflare" in data:
+                if not isinstance(data["cloudflare"], dict):
+                    raise ValueError("cloudflare settings must be a JSON object")
+                self._save_cloudflare(data["cloudflare"], set_value, new_secrets)
+            if new_secrets:
+                # Both provider tokens land in one locked, fsynced .secrets
+                # write. It runs before the transaction commits, so a failed
+                # write never leaves a provider enabled without its token.
+                self._config_manager.store_secrets(new_secrets)
 
         if self._trigger_sync():
             return "DDNS configuration saved and update triggered."
@@ -68,22 +82,25 @@ class DdnsService:
 
     def _read_status(self) -> dict[str, Any]:
         status_file = self._runtime.volatile_dir / "ddns_status.json"
-        if not status_file.exists():
-            return {}
         with suppress(Exception):
-            status = json.loads(status_file.read_text())
+            status = read_json(status_file, {})
             if isinstance(status, dict):
                 return status
         return {}
 
-    def _save_duckdns(self, duckdns: dict[str, Any]) -> None:
+    def _save_duckdns(
+        self,
+        duckdns: dict[str, Any],
+        set_value: Callable[[str, str, str], None],
+        new_secrets: dict[str, str],
+    ) -> None:
         domain = duckdns.get("domain", "").strip()
         token = duckdns.get("token", "").strip()
         enabled = _coerce_bool(duckdns.get("enabled", False))
 
         if enabled:
             # A stored duckdns_token from get_secret lets admins update DuckDNS
-            # settings without re-entering the token; store_secret only runs
+            # settings without re-entering the token; a secret is only stored
             # when this request includes a replacement token.
             existing_token = self._config_manager.get_secret("duckdns_token")
             if not domain:
@@ -91,12 +108,17 @@ class DdnsService:
             if not token and not existing_token:
                 raise ValueError("DuckDNS token is required when enabled")
 
-        self._config_manager.set_value("ddns", "duckdns_domain", domain)
-        self._config_manager.set_value("ddns", "duckdns_enabled", str(enabled).lower())
+        set_value("ddns", "duckdns_domain", domain)
+        set_value("ddns", "duckdns_enabled", str(enabled).lower())
         if token:
-            self._config_manager.store_secret("duckdns_token", token)
-
-    def _save_cloudflare(self, cloudflare: dict[str, Any]) -> None:
+            new_secrets["duckdns_token"] = token
+
+    def _save_cloudflare(
+        self,
+        cloudflare: dict[str, Any],
+        set_value: Callable[[str, str, str], None],
+        new_secrets: dict[str, str],
+    ) -> None:
         zone = cloudflare.get("zone", "").strip()
         record = cloudflare.get("record", "").strip()
         token = cloudflare.get("token", "").strip()
@@ -112,12 +134,12 @@ class DdnsService:
             if not token and not existing_token:
                 raise ValueError("Cloudflare token is required when enabled")
 
-        self._config_manager.set_value("ddns", "cloudflare_zone", zone)
-        self._config_manager.set_value("ddns", "cloudflare_record", record)
-        self._config_manager.set_value("ddns", "cloudflare_proxy", str(proxy).lower())
-        self._config_manager.set_value("ddns", "cloudflare_enabled", str(enabled).lower())
+        set_value("ddns", "cloudflare_zone", zone)
+        set_value("ddns", "cloudflare_record", record)
+        set_value("ddns", "cloudflare_proxy", str(proxy).lower())
+        set_value("ddns", "cloudflare_enabled", str(enabled).lower())
         if token:
-            self._config_manager.store_secret("cloudflare_token", token)
+            new_secrets["cloudflare_token"] = token
 
     def _trigger_sync(self) -> bool:
         try:
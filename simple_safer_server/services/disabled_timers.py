@@ -1,7 +1,7 @@
 from datetime import UTC, datetime
 from typing import Any
 
-from simple_safer_server.services.file_persistence import locked_json_update, read_json
+from simple_safer_server.services.file_persistence import DURABLE, locked_json_update, read_json
 
 DISABLED_TIMERS_FILENAME = "disabled_timers.json"
 RESTORE_RETRY_LIMIT = 3
@@ -99,6 +99,7 @@ class DisabledTimerService:
             update,
             file_mode=0o644,
             lock_mode=0o644,
+            durability=DURABLE,
         )
         return record
 
@@ -118,6 +119,7 @@ class DisabledTimerService:
             update,
             file_mode=0o644,
             lock_mode=0o644,
+            durability=DURABLE,
         )
 
     def restore_expired(self, *, now: datetime | None = None) -> dict[str, list[str]]:
@@ -158,6 +160,7 @@ class DisabledTimerService:
             update,
             file_mode=0o644,
             lock_mode=0o644,
+            durability=DURABLE,
         )
 
     def _record_restore_failure(
@@ -185,6 +188,7 @@ class DisabledTimerService:
             update,
             file_mode=0o644,
             lock_mode=0o644,
+            durability=DURABLE,
         )
 
         if restore_failed and self.alert_notifier:
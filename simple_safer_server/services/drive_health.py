@@ -1,19 +1,42 @@
 import contextlib
 import json
 import logging
+import os
 import re
 import shutil
 import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime
 from pathlib import Path
 from tempfile import NamedTemporaryFile
 
 from simple_safer_server.adapters.drive_health_commands import (
+    HDSENTINEL_TIMEOUT_SECONDS,
+    SMARTCTL_STANDBY_EXIT_CODE,
+    SMARTCTL_TIMEOUT_SECONDS,
     DriveHealthCommandAdapter,
     TimeoutExpired,
 )
 from simple_safer_server.services.alert_notifications import AlertNotifier
-from simple_safer_server.services.file_persistence import atomic_write_json
+from simple_safer_server.services.backup_drive_setup import (
+    _get_system_drive_path,
+    _iter_non_system_disks,
+    _load_lsblk_devices,
+)
+from simple_safer_server.services.block_devices import block_device_index
+from simple_safer_server.services.drive_health_history import (
+    DRIVE_HEALTH_HISTORY_FILENAME,
+    DriveHealthHistoryStore,
+)
+from simple_safer_server.services.drive_risk import current_drive_risk
+from simple_safer_server.services.file_persistence import (
+    BATCHED,
+    VOLATILE,
+    atomic_write_json,
+    locked_path,
+    read_json,
+)
 from simple_safer_server.services.runtime import get_runtime
 
 LOGGER = logging.getLogger(__name__)
@@ -27,6 +50,26 @@ SMARTCTL_JSON_UPGRADE_MESSAGE = (
     "Upgrade smartmontools on this machine to enable SMART details."
 )
 
+POWER_STATE_ACTIVE = "active"
+POWER_STATE_STANDBY = "standby"
+POWER_STATE_UNKNOWN = "unknown"
+DRIVE_ASLEEP_MESSAGE = "The backup drive is asleep, so it was not woken for this check."
+# SMART and HDSentinel run side by side, so a refresh costs the slowest probe
+# rather than the sum. Scheduled checks allow for HDSentinel's two invocations
+# after a long spin-up; interactive refreshes give up sooner.
+DRIVE_HEALTH_REFRESH_DEADLINE_SECONDS = 60
+DRIVE_HEALTH_SCHEDULED_DEADLINE_SECONDS = 120
+DRIVE_HEALTH_DRIVES_FILENAME = "drive_health_drives.json"
+DRIVE_HEALTH_SUMMARY_FILENAME = "drive_health_summary.json"
+# USB bridges often serialize commands internally, and some drop off the bus
+# when several disks behind one hub are queried at once, so each hub gets one
+# probe at a time. SATA and NVMe controllers handle parallel reads fine.
+BUS_PROBE_CONCURRENCY = {"usb": 1}
+DEFAULT_BUS_PROBE_CONCURRENCY = 4
+# The same bridges also misbehave when SMART and HDSentinel query one disk at
+# once, so a single drive's probes only overlap on these transports.
+PARALLEL_PROBE_TRANSPORTS = frozenset({"sata", "nvme"})
+
 SMART_FIELDS = {
     "smart_1_raw": {
         "default": 0.0,
@@ -64,6 +107,12 @@ SMART_FIELDS = {
         "description": "The number of times the drive had to retry spinning up. A non-zero value indicates problems with the drive's motor or power supply.",
         "short_desc": "Number of spin-up retries",
     },
+    "smart_187_raw": {
+        "default": 0.0,
+        "name": "Reported Uncorrectable Errors",
+        "description": "The number of errors that could not be recovered using hardware error correction. A non-zero value that keeps rising is a strong sign of impending failure.",
+        "short_desc": "Number of uncorrectable read errors",
+    },
     "smart_192_raw": {
         "default": 0.0,
         "name": "Emergency Retract Count",
@@ -96,20 +145,40 @@ SMART_FIELDS = {
     },
 }
 
+HDSENTINEL_HISTORY_FIELDS = {
+    "hdsentinel_health": ("health_pct", "HDSentinel Health (%)"),
+    "hdsentinel_performance": ("performance_pct", "HDSentinel Performance (%)"),
+    "hdsentinel_temperature": ("temperature_c", "HDSentinel Temperature (°C)"),
+}
+HISTORY_METRICS = {
+    **{key: field["name"] for key, field in SMART_FIELDS.items()},
+    **{key: label for key, (_, label) in HDSENTINEL_HISTORY_FIELDS.items()},
+}
+
 HDSENTINEL_SECTION = "hdsentinel"
 HDSENTINEL_DEFAULTS = {
     "enabled": True,
     "health_change_alert": True,
 }
+DRIVE_HEALTH_SECTION = "drive_health"
+DRIVE_HEALTH_DEFAULTS = {
+    "wake_for_scheduled_check": True,
+}
 
 
 class DriveHealthSummaryService:
-    """Keep the dashboard health summary in process memory only."""
+    """Keep the latest dashboard health summary, shared through ``summary_path``.
 
-    def __init__(self):
+    With a path, every gunicorn worker, restarted worker and the scheduled
+    check script read and publish the same atomically replaced file, so they
+    all serve one summary without probing the drive. Without a path the
+    summary stays in process memory.
+    """
+
+    def __init__(self, summary_path: Path | None = None):
         self._lock = threading.Lock()
         self._summary = self._empty_summary()
-        self._publish_seq = 0
+        self._summary_path = summary_path
 
     def _empty_summary(self):
         return {
@@ -121,12 +190,36 @@ class DriveHealthSummaryService:
             "hdsentinel_performance": None,
             "detail": "No check yet",
             "error": None,
+            "power_state": None,
+            "reading_at": None,
+            "probe_ms": None,
+            "risk_score": None,
+            "risk_level": None,
         }
 
     def get_summary(self):
         # Return a copy so callers cannot mutate the last-known state in place.
         with self._lock:
-            return self._public_summary(self._summary)
+            return self._public_summary(self._current_summary())
+
+    def _current_summary(self):
+        if self._summary_path is None:
+            return self._summary
+        try:
+            # read_json only re-parses when another process replaced the file.
+            shared = read_json(self._summary_path, None)
+        except Exception as exc:
+            LOGGER.warning("Failed to read shared drive health summary: %s", exc)
+            return self._summary
+        return shared if isinstance(shared, dict) else self._summary
+
+    @contextlib.contextmanager
+    def _shared_lock(self):
+        if self._summary_path is None:
+            yield
+            return
+        with locked_path(self._summary_path.with_suffix(".lock")):
+            yield
 
     def _public_summary(self, summary):
         return {key: value for key, value in summary.items() if not key.startswith("_")}
@@ -136,20 +229,28 @@ class DriveHealthSummaryService:
         for key in latest:
             if key in summary:
                 latest[key] = summary[key]
-        with self._lock:
-            existing_checked_at = _summary_timestamp(self._summary)
+        # The sequence number lives in the summary itself, so publishers in
+        # other workers or the scheduled check continue the same sequence.
+        with self._lock, self._shared_lock():
+            current = self._current_summary()
+            existing_checked_at = _summary_timestamp(current)
             incoming_checked_at = _summary_timestamp(latest)
-            incoming_seq = self._publish_seq + 1
-            existing_seq = self._summary.get("_publish_seq", 0)
+            existing_seq = current.get("_publish_seq", 0)
+            incoming_seq = existing_seq + 1
             if (
                 existing_checked_at is not None
                 and incoming_checked_at is not None
                 and (incoming_checked_at, incoming_seq) <= (existing_checked_at, existing_seq)
             ):
-                return self._public_summary(self._summary)
-            self._publish_seq = incoming_seq
-            latest["_publish_seq"] = self._publish_seq
+                return self._public_summary(current)
+            latest["_publish_seq"] = incoming_seq
             self._summary = latest
+            if self._summary_path is not None:
+                try:
+                    # Rebuilt by the next check, so a power cut may lose it.
+                    atomic_write_json(self._summary_path, latest, durability=VOLATILE)
+                except Exception as exc:
+                    LOGGER.warning("Failed to share drive health summary: %s", exc)
         return self._public_summary(latest)
 
 
@@ -188,32 +289,207 @@ def hdsentinel_snapshot_has_health(snapshot):
     return hdsentinel_summary_status(health_pct) != "unknown"
 
 
+def _probe_timeout(default_seconds, deadline):
+    """Cap a probe's subprocess timeout so it cannot outlive the shared deadline."""
+    if deadline is None:
+        return default_seconds
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        raise TimeoutExpired("drive health probe", 0)
+    return min(default_seconds, remaining)
+
+
+def probes_can_run_in_parallel(device):
+    """Return whether SMART and HDSentinel may query ``device`` at the same time."""
+    if not device:
+        return False
+    info = block_device_index.device_info(device) or {}
+    return info.get("transport") in PARALLEL_PROBE_TRANSPORTS
+
+
+def run_drive_probes(probes, deadline_seconds, *, parallel=True):
+    """Run ``probes`` and stop waiting at one shared deadline.
+
+    ``probes`` maps a name to a callable taking the absolute ``time.monotonic``
+    deadline. They run concurrently, or back to back in the given order when
+    ``parallel`` is false. Returns ``{"results", "probe_ms", "timed_out"}``; a
+    probe that misses the deadline, or never got to start, is listed in
+    ``timed_out`` and has no result, so callers can still use whatever
+    finished in time.
+    """
+    deadline = time.monotonic() + deadline_seconds
+    probe_ms = {}
+
+    def timed(name, probe):
+        started = time.monotonic()
+        try:
+            return probe(deadline)
+        finally:
+            probe_ms[name] = round((time.monotonic() - started) * 1000)
+
+    # One worker runs the probes back to back while still letting the caller
+    # stop waiting at the deadline.
+    workers = len(probes) if parallel else 1
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="drive-probe")
+    try:
+        futures = {executor.submit(timed, name, probe): name for name, probe in probes.items()}
+        done, _ = wait(futures, timeout=max(0.0, deadline - time.monotonic()))
+    finally:
+        # Do not join stragglers: their subprocess timeouts are already capped
+        # at the deadline, so they exit on their own shortly after.
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    results = {}
+    timings = {}
+    timed_out = []
+    for future, name in futures.items():
+        if future in done:
+            results[name] = future.result()
+            timings[name] = probe_ms[name]
+        else:
+            timed_out.append(name)
+            timings[name] = round(deadline_seconds * 1000)
+    LOGGER.info("Drive health probe timings (ms): %s", timings)
+    return {"results": results, "probe_ms": timings, "timed_out": timed_out}
+
+
+def _asleep_summary(previous_summary, checked_at, runtime, *, state_fallback=True):
+    """Serve the last known reading instead of waking a drive in standby.
+
+    ``state_fallback`` reads the backup drive's HDSentinel state when there is
+    no previous summary; other drives have no such state to fall back to.
+    """
+    summary = {
+        "status": "unknown",
+        "source": "cache",
+        "checked_at": checked_at,
+        "temperature": None,
+        "hdsentinel_health": None,
+        "hdsentinel_performance": None,
+        "detail": DRIVE_ASLEEP_MESSAGE,
+        "error": None,
+        "power_state": POWER_STATE_STANDBY,
+        "reading_at": None,
+        "probe_ms": None,
+        "risk_score": None,
+        "risk_level": None,
+    }
+    previous_summary = previous_summary or {}
+    if previous_summary.get("reading_at") or previous_summary.get("checked_at"):
+        for key in (
+            "status",
+            "temperature",
+            "hdsentinel_health",
+            "hdsentinel_performance",
+            "risk_score",
+            "risk_level",
+        ):
+            summary[key] = previous_summary.get(key, summary[key])
+        summary["reading_at"] = previous_summary.get("reading_at") or previous_summary.get(
+            "checked_at"
+        )
+    elif state_fallback:
+        # After a restart the in-memory summary is empty; fall back to the
+        # snapshot the scheduled check keeps for change alerts.
+        snapshot = load_hdsentinel_state(runtime)
+        if hdsentinel_snapshot_has_health(snapshot):
+            summary["status"] = hdsentinel_summary_status(snapshot.get("health_pct"))
+            summary["temperature"] = snapshot.get("temperature_c")
+            summary["hdsentinel_health"] = snapshot.get("health_pct")
+            summary["hdsentinel_performance"] = snapshot.get("performance_pct")
+            summary["reading_at"] = snapshot.get("last_checked")
+    if summary["reading_at"]:
+        summary["detail"] = f"Drive asleep. Showing the reading from {summary['reading_at']}."
+    return summary
+
+
+def _new_probe_summary(checked_at, source="live"):
+    return {
+        "status": "unknown",
+        "source": source,
+        "checked_at": checked_at,
+        "temperature": None,
+        "hdsentinel_health": None,
+        "hdsentinel_performance": None,
+        "detail": "Drive health data is not available.",
+        "error": None,
+        "power_state": None,
+        "reading_at": checked_at,
+        "probe_ms": None,
+        "risk_score": None,
+        "risk_level": None,
+    }
+
+
 def build_drive_health_summary(
     config_manager,
     system_utils,
     runtime=None,
     *,
     collect_hdsentinel=True,
+    previous_summary=None,
+    wake_drive=False,
+    history_store=None,
 ):
-    """Run a live probe and convert it into the compact dashboard contract."""
+    """Run a live probe and convert it into the compact dashboard contract.
+
+    Unless ``wake_drive`` is set, a drive in standby is left asleep and the
+    last known reading from ``previous_summary`` is returned instead. The
+    failure-risk score uses ``history_store`` for rates of change when given.
+    """
     runtime = runtime or get_runtime()
     checked_at = datetime.now().isoformat()
-    summary = {
-        "status": "unknown",
-        "source": "live",
-        "checked_at": checked_at,
-        "temperature": None,
-        "hdsentinel_health": None,
-        "hdsentinel_performance": None,
-        "detail": "Drive health data is not available.",
-        "error": None,
+    summary = _new_probe_summary(checked_at)
+
+    # Resolve once so the concurrent probes do not each repeat the lookup.
+    device, _, _ = resolve_backup_parent_device(config_manager, system_utils, runtime=runtime)
+    if device and not wake_drive:
+        power_state = get_drive_power_state(device, runtime=runtime)
+        if power_state == POWER_STATE_STANDBY:
+            return _asleep_summary(previous_summary, checked_at, runtime)
+        summary["power_state"] = power_state
+
+    probes = {
+        "smart": lambda deadline: get_smart_attributes(
+            config_manager, system_utils, device=device, runtime=runtime, deadline=deadline
+        ),
     }
+    if collect_hdsentinel and get_hdsentinel_settings(config_manager)["enabled"]:
+        probes["hdsentinel"] = lambda deadline: collect_hdsentinel_snapshot(
+            config_manager, system_utils, runtime=runtime, device=device, deadline=deadline
+        )
+    outcome = run_drive_probes(
+        probes,
+        DRIVE_HEALTH_REFRESH_DEADLINE_SECONDS,
+        parallel=probes_can_run_in_parallel(device),
+    )
+    summary["probe_ms"] = outcome["probe_ms"]
 
-    smart, _missing_attrs, smart_error = get_smart_attributes(
-        config_manager,
-        system_utils,
-        runtime=runtime,
+    smart, _missing_attrs, smart_error = outcome["results"].get(
+        "smart", (None, None, DRIVE_HEALTH_TIMEOUT_MESSAGE)
+    )
+    hdsentinel_snapshot = None
+    if "hdsentinel" in probes:
+        hdsentinel_snapshot = outcome["results"].get(
+            "hdsentinel", {"error": DRIVE_HEALTH_TIMEOUT_MESSAGE}
+        )
+    _apply_probe_results(summary, smart, smart_error, hdsentinel_snapshot)
+    return apply_drive_risk(
+        summary, history_store, drive_history_key(config_manager, device), smart
     )
+
+
+def apply_drive_risk(summary, history_store, drive, smart):
+    """Add the failure-risk score; scoring problems never fail the check."""
+    try:
+        summary.update(current_drive_risk(history_store, drive, smart))
+    except Exception as exc:
+        LOGGER.warning("Failed to score drive failure risk: %s", exc)
+    return summary
+
+
+def _apply_probe_results(summary, smart, smart_error, hdsentinel_snapshot):
+    """Fold SMART and HDSentinel results into the compact summary contract."""
     if smart is not None:
         summary["temperature"] = smart.get("smart_194_raw")
         summary["detail"] = "SMART details were collected."
@@ -224,23 +500,17 @@ def build_drive_health_summary(
         summary["detail"] = smart_error or "Could not retrieve SMART data."
         summary["error"] = smart_error
 
-    if collect_hdsentinel and get_hdsentinel_settings(config_manager)["enabled"]:
-        hdsentinel_snapshot = collect_hdsentinel_snapshot(
-            config_manager,
-            system_utils,
-            runtime=runtime,
-        )
-        if hdsentinel_snapshot_has_health(hdsentinel_snapshot):
-            health_pct = hdsentinel_snapshot.get("health_pct")
-            summary["hdsentinel_health"] = health_pct
-            summary["hdsentinel_performance"] = hdsentinel_snapshot.get("performance_pct")
-            summary["status"] = hdsentinel_summary_status(health_pct)
-            summary["detail"] = f"HDSentinel health: {health_pct}%."
-            if summary["temperature"] is None:
-                summary["temperature"] = hdsentinel_snapshot.get("temperature_c")
-        elif hdsentinel_snapshot and hdsentinel_snapshot.get("error"):
-            summary["detail"] = hdsentinel_snapshot["error"]
-            summary["error"] = hdsentinel_snapshot["error"]
+    if hdsentinel_snapshot_has_health(hdsentinel_snapshot):
+        health_pct = hdsentinel_snapshot.get("health_pct")
+        summary["hdsentinel_health"] = health_pct
+        summary["hdsentinel_performance"] = hdsentinel_snapshot.get("performance_pct")
+        summary["status"] = hdsentinel_summary_status(health_pct)
+        summary["detail"] = f"HDSentinel health: {health_pct}%."
+        if summary["temperature"] is None:
+            summary["temperature"] = hdsentinel_snapshot.get("temperature_c")
+    elif hdsentinel_snapshot and hdsentinel_snapshot.get("error"):
+        summary["detail"] = hdsentinel_snapshot["error"]
+        summary["error"] = hdsentinel_snapshot["error"]
 
     return summary
 
@@ -255,6 +525,7 @@ def get_fake_smart_attributes():
             "smart_5_raw": 0.0,
             "smart_7_raw": 0.0,
             "smart_10_raw": 0.0,
+            "smart_187_raw": 0.0,
             "smart_192_raw": 2.0,
             "smart_193_raw": 145.0,
             "smart_194_raw": 31.0,
@@ -265,13 +536,59 @@ def get_fake_smart_attributes():
     return attrs, []
 
 
-def get_smartctl_json_support():
-    # Do not cache this result across the whole process. Operators can install
-    # or upgrade smartmontools while the web service keeps running, and a stale
-    # negative result would keep blocking SMART reads until restart.
-    if not shutil.which("smartctl"):
-        return False, "smartctl is not installed on this machine."
+def _binary_fingerprint(path):
+    try:
+        stat_result = os.stat(path)
+    except OSError:
+        return None
+    # st_mode is included so a chmod +x is noticed even though it leaves the
+    # inode, mtime and size untouched.
+    return (
+        stat_result.st_ino,
+        stat_result.st_mtime_ns,
+        stat_result.st_size,
+        stat_result.st_mode,
+    )
+
+
+class BinaryCapabilityCache:
+    """Remember a probe result per binary until the file on disk changes.
+
+    Keyed on inode, mtime, size and mode, so installing or upgrading a package in
+    place is noticed on the next call without restarting the web service,
+    while an unchanged binary is never forked just to ask what it supports.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._results = {}
+
+    def get(self, path, probe):
+        fingerprint = _binary_fingerprint(path)
+        if fingerprint is None:
+            # Missing binaries are cheap to re-check and may appear at any time.
+            return probe()
+        key = str(path)
+        with self._lock:
+            cached = self._results.get(key)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+        # Probe outside the lock; a concurrent duplicate probe is harmless and
+        # exceptions such as timeouts propagate without being cached.
+        result = probe()
+        with self._lock:
+            self._results[key] = (fingerprint, result)
+        return result
 
+    def clear(self):
+        with self._lock:
+            self._results.clear()
+
+
+binary_capability_cache = BinaryCapabilityCache()
+
+
+def _probe_smartctl_json_support():
     result = drive_health_command_adapter.smartctl_help()
     help_output = "\n".join(part for part in [result.stdout, result.stderr] if part)
     if "-j" in help_output or "--json" in help_output:
@@ -279,6 +596,39 @@ def get_smartctl_json_support():
     return False, SMARTCTL_JSON_UPGRADE_MESSAGE
 
 
+def get_smartctl_json_support():
+    smartctl_path = shutil.which("smartctl")
+    if not smartctl_path:
+        return False, "smartctl is not installed on this machine."
+    # Key on the real file so an upgrade that swaps a symlink target is seen too.
+    return binary_capability_cache.get(
+        os.path.realpath(smartctl_path), _probe_smartctl_json_support
+    )
+
+
+def get_drive_power_state(device, runtime=None):
+    """Report whether ``device`` is spun down, without waking it."""
+    runtime = runtime or get_runtime()
+    if runtime.is_fake:
+        return POWER_STATE_ACTIVE
+    if not shutil.which("smartctl"):
+        return POWER_STATE_UNKNOWN
+    try:
+        result = drive_health_command_adapter.smartctl_power_mode(device)
+    except TimeoutExpired:
+        return POWER_STATE_UNKNOWN
+    output = result.stdout or ""
+    if (
+        result.returncode == SMARTCTL_STANDBY_EXIT_CODE
+        or "STANDBY mode" in output
+        or "SLEEP mode" in output
+    ):
+        return POWER_STATE_STANDBY
+    # Any other failure (USB bridges that reject the query, permissions) is
+    # reported as unknown so callers keep their existing probe behaviour.
+    return POWER_STATE_ACTIVE if result.returncode == 0 else POWER_STATE_UNKNOWN
+
+
 def resolve_backup_partition_device(config_manager, runtime=None):
     runtime = runtime or get_runtime()
     if runtime.is_fake:
@@ -288,6 +638,10 @@ def resolve_backup_partition_device(config_manager, runtime=None):
     if not uuid:
         return None, "No backup drive UUID configured."
 
+    partition_device = block_device_index.device_for_uuid(uuid)
+    if partition_device:
+        return partition_device, None
+
     try:
         blkid_out = drive_health_command_adapter.find_device_by_uuid(uuid)
     except TimeoutExpired:
@@ -318,7 +672,7 @@ def resolve_backup_parent_device(config_manager, system_utils, runtime=None):
     return parent_device, partition_device, None
 
 
-def get_smart_attributes(config_manager, system_utils, device=None, runtime=None):
+def get_smart_attributes(config_manager, system_utils, device=None, runtime=None, deadline=None):
     runtime = runtime or get_runtime()
     if runtime.is_fake:
         attrs, missing = get_fake_smart_attributes()
@@ -340,7 +694,9 @@ def get_smart_attributes(config_manager, system_utils, device=None, runtime=None
 
         command = ["smartctl", "-A", "-j", device]
 
-        result = drive_health_command_adapter.smartctl_attributes(command)
+        result = drive_health_command_adapter.smartctl_attributes(
+            command, timeout=_probe_timeout(SMARTCTL_TIMEOUT_SECONDS, deadline)
+        )
         stdout = (result.stdout or "").strip()
         stderr = (result.stderr or "").strip()
 
@@ -430,28 +786,91 @@ def save_hdsentinel_settings(config_manager, *, enabled, health_change_alert):
     )
 
 
+def get_drive_health_settings(config_manager):
+    return {
+        "wake_for_scheduled_check": _parse_bool(
+            config_manager.get_value(DRIVE_HEALTH_SECTION, "wake_for_scheduled_check", None),
+            DRIVE_HEALTH_DEFAULTS["wake_for_scheduled_check"],
+        ),
+    }
+
+
 def get_hdsentinel_binary_path(runtime=None):
     runtime = runtime or get_runtime()
     return runtime.bin_dir / "hdsentinel"
 
 
+def _probe_hdsentinel_binary(binary_path):
+    if not binary_path.exists():
+        return False, f"HDSentinel binary is not installed at {binary_path}."
+    if not os.access(binary_path, os.X_OK):
+        return True, f"HDSentinel binary at {binary_path} is not executable."
+    return True, None
+
+
+def get_hdsentinel_binary_status(runtime=None):
+    """Return ``(installed, error)`` for the HDSentinel binary, cached on its fingerprint."""
+    binary_path = get_hdsentinel_binary_path(runtime)
+    return binary_capability_cache.get(binary_path, lambda: _probe_hdsentinel_binary(binary_path))
+
+
 def get_hdsentinel_state_path(runtime=None):
     runtime = runtime or get_runtime()
     return runtime.data_dir / "hdsentinel_state.json"
 
 
+def get_drive_health_summary_path(runtime=None):
+    runtime = runtime or get_runtime()
+    return runtime.volatile_dir / DRIVE_HEALTH_SUMMARY_FILENAME
+
+
+def get_drive_health_history_path(runtime=None):
+    runtime = runtime or get_runtime()
+    return runtime.data_dir / DRIVE_HEALTH_HISTORY_FILENAME
+
+
+def drive_history_key(config_manager, device=None):
+    """Identify the backup drive in history by filesystem UUID, falling back to the device."""
+    return config_manager.get_value("backup", "uuid", "") or device or "backup"
+
+
+def drive_health_history_values(smart, hdsentinel_snapshot):
+    values = {}
+    if smart:
+        values.update({key: smart.get(key) for key in SMART_FIELDS})
+    if hdsentinel_snapshot_has_health(hdsentinel_snapshot):
+        for metric, (field, _) in HDSENTINEL_HISTORY_FIELDS.items():
+            values[metric] = _parse_optional_int(hdsentinel_snapshot.get(field))
+    return values
+
+
+def record_drive_health_history(history_store, drive, smart, hdsentinel_snapshot, timestamp=None):
+    """Append one check to the history store; history failures never fail the check."""
+    values = drive_health_history_values(smart, hdsentinel_snapshot)
+    if not values:
+        return 0
+    try:
+        return history_store.record(
+            drive, timestamp if timestamp is not None else time.time(), values
+        )
+    except Exception as exc:
+        LOGGER.warning("Failed to record drive health history: %s", exc)
+        return 0
+
+
 def _write_json_atomically(path: Path, payload):
-    atomic_write_json(path, payload, mode=0o644)
+    # Health baselines are rewritten every check; losing the last one only
+    # re-baselines change alerts, so group commit is enough.
+    atomic_write_json(path, payload, mode=0o644, durability=BATCHED)
 
 
 def load_hdsentinel_state(runtime=None):
     runtime = runtime or get_runtime()
     path = get_hdsentinel_state_path(runtime)
-    if not path.exists():
-        return None
-
     try:
-        state = json.loads(path.read_text())
+        state = read_json(path, None)
+        if state is None:
+            return None
         return state.get("last_snapshot")
     except Exception as exc:
         LOGGER.warning("Failed to load HDSentinel state: %s", exc)
@@ -492,14 +911,6 @@ def _format_power_on_time_from_hours(hours):
     return f"{hours} hours"
 
 
-def _extract_first_match(patterns, text):
-    for pattern in patterns:
-        match = re.search(pattern, text, flags=re.IGNORECASE | re.MULTILINE)
-        if match:
-            return match.group(1).strip()
-    return None
-
-
 def _parse_power_on_hours_from_text(text):
     if not text:
         return None
@@ -582,52 +993,101 @@ def parse_hdsentinel_solid_output(output, device=None):
     return None
 
 
+# Report and console lines look like "Health . . . . : 100 %" or
+# "HDD Model ID : WDC ...", with dot leaders and spacing that vary between
+# HDSentinel builds. One precompiled pass splits each line into a normalized
+# key and value, replacing a MULTILINE regex search over the whole text per field.
+_HDSENTINEL_REPORT_LINE = re.compile(r"^\s*(?P<key>[^:]*?[^\s.:])[\s.]*:\s*(?P<value>.*?)\s*$")
+_HDSENTINEL_LEADING_INT = re.compile(r"-?\d+")
+_HDSENTINEL_SIZE_MB = re.compile(r"^(\d+)\s*MB\b", re.IGNORECASE)
+# Normalized key -> (snapshot field, priority). The lowest priority seen wins,
+# so "Model ID" beats a bare "Model" line wherever each appears.
+_HDSENTINEL_REPORT_KEYS = {
+    "health": ("health_pct", 0),
+    "performance": ("performance_pct", 0),
+    "current temperature": ("temperature_c", 0),
+    "temperature": ("temperature_c", 1),
+    "power on time": ("power_on_time_text", 0),
+    "power-on time": ("power_on_time_text", 0),
+    "hard disk model id": ("model", 0),
+    "hdd model id": ("model", 0),
+    "model id": ("model", 0),
+    "model": ("model", 1),
+    "hard disk serial number": ("serial", 0),
+    "serial number": ("serial", 0),
+    "hdd serial no": ("serial", 1),
+    "serial no": ("serial", 1),
+    "total size": ("size_text", 0),
+    "hdd size": ("size_text", 0),
+    "size": ("size_text", 1),
+    "capacity": ("size_text", 2),
+    "interface": ("interface", 0),
+    "firmware revision": ("firmware", 0),
+    "hdd revision": ("firmware", 1),
+    "revision": ("firmware", 1),
+}
+_HDSENTINEL_INT_FIELDS = {"health_pct", "performance_pct", "temperature_c"}
+
+
+def _leading_int(value):
+    match = _HDSENTINEL_LEADING_INT.match(value)
+    return int(match.group()) if match else None
+
+
 def parse_hdsentinel_report(report_text):
-    health_pct = _parse_optional_int(_extract_first_match([r"Health\s*:\s*(\d+)%"], report_text))
-    performance_pct = _parse_optional_int(
-        _extract_first_match([r"Performance\s*:\s*(\d+)%"], report_text)
-    )
-    temperature_c = _parse_optional_int(
-        _extract_first_match([r"Temperature\s*:\s*(-?\d+)\s*(?:°|deg)?\s*C"], report_text)
-    )
-    power_on_time_text = _extract_first_match(
-        [r"Power on time\s*:\s*(.+)$", r"Power-on time\s*:\s*(.+)$"],
-        report_text,
-    )
-    power_on_hours = _parse_power_on_hours_from_text(power_on_time_text)
+    fields = {}
+    priorities = {}
+    for line in report_text.splitlines():
+        match = _HDSENTINEL_REPORT_LINE.match(line)
+        if match is None:
+            continue
+        key = " ".join(match.group("key").lower().split())
+        entry = _HDSENTINEL_REPORT_KEYS.get(key)
+        if entry is None:
+            continue
+        field, priority = entry
+        value = match.group("value")
+        if field in _HDSENTINEL_INT_FIELDS:
+            value = _leading_int(value)
+        if value in {None, ""} or priorities.get(field, priority + 1) <= priority:
+            continue
+        fields[field] = value
+        priorities[field] = priority
 
+    power_on_time_text = fields.get("power_on_time_text")
+    size_text = fields.get("size_text")
+    size_match = _HDSENTINEL_SIZE_MB.match(size_text) if size_text else None
     return {
-        "health_pct": health_pct,
-        "performance_pct": performance_pct,
-        "temperature_c": temperature_c,
-        "power_on_hours": power_on_hours,
+        "health_pct": fields.get("health_pct"),
+        "performance_pct": fields.get("performance_pct"),
+        "temperature_c": fields.get("temperature_c"),
+        "power_on_hours": _parse_power_on_hours_from_text(power_on_time_text),
         "power_on_time_text": power_on_time_text,
-        "model": _extract_first_match([r"Model ID\s*:\s*(.+)$", r"Model\s*:\s*(.+)$"], report_text),
-        "serial": _extract_first_match(
-            [r"Serial Number\s*:\s*(.+)$", r"Serial No\.?\s*:\s*(.+)$"],
-            report_text,
-        ),
-        "size_text": _extract_first_match(
-            [r"Size\s*:\s*(.+)$", r"Capacity\s*:\s*(.+)$"], report_text
-        ),
-        "interface": _extract_first_match([r"Interface\s*:\s*(.+)$"], report_text),
-        "firmware": _extract_first_match(
-            [r"Revision\s*:\s*(.+)$", r"Firmware Revision\s*:\s*(.+)$"], report_text
-        ),
+        "model": fields.get("model"),
+        "serial": fields.get("serial"),
+        "size_mb": int(size_match.group(1)) if size_match else None,
+        "size_text": size_text,
+        "interface": fields.get("interface"),
+        "firmware": fields.get("firmware"),
     }
 
 
-def _run_hdsentinel_command(binary_path: Path, args):
+def _run_hdsentinel_command(binary_path: Path, args, deadline=None):
     command = [str(binary_path), *args]
-    return drive_health_command_adapter.hdsentinel(command)
+    return drive_health_command_adapter.hdsentinel(
+        command, timeout=_probe_timeout(HDSENTINEL_TIMEOUT_SECONDS, deadline)
+    )
 
 
-def collect_hdsentinel_snapshot(config_manager, system_utils, runtime=None, device=None):
+def collect_hdsentinel_snapshot(
+    config_manager, system_utils, runtime=None, device=None, deadline=None
+):
     runtime = runtime or get_runtime()
     settings = get_hdsentinel_settings(config_manager)
     binary_path = get_hdsentinel_binary_path(runtime)
+    installed, binary_error = get_hdsentinel_binary_status(runtime)
     snapshot = {
-        "installed": binary_path.exists() or runtime.is_fake,
+        "installed": installed or runtime.is_fake,
         "enabled": settings["enabled"],
         "health_change_alert": settings["health_change_alert"],
         "available": False,
@@ -655,8 +1115,8 @@ def collect_hdsentinel_snapshot(config_manager, system_utils, runtime=None, devi
         snapshot["error"] = "HDSentinel monitoring is disabled."
         return snapshot
 
-    if not binary_path.exists():
-        snapshot["error"] = f"HDSentinel binary is not installed at {binary_path}."
+    if binary_error:
+        snapshot["error"] = binary_error
         return snapshot
 
     if device is None:
@@ -667,21 +1127,56 @@ def collect_hdsentinel_snapshot(config_manager, system_utils, runtime=None, devi
             snapshot["error"] = error
             return snapshot
 
+    snapshot["device"] = device
     try:
-        solid_result = _run_hdsentinel_command(binary_path, ["-solid", "-dev", device])
+        # -dump streams the full report to stdout, so one invocation replaces
+        # the -solid probe plus a second run writing a temp report file.
+        dump_result = _run_hdsentinel_command(
+            binary_path, ["-dev", device, "-dump"], deadline=deadline
+        )
+    except TimeoutExpired:
+        snapshot["error"] = DRIVE_HEALTH_TIMEOUT_MESSAGE
+        return snapshot
+    report_data = (
+        parse_hdsentinel_report(dump_result.stdout or "") if dump_result.returncode == 0 else {}
+    )
+    if any(value is not None for value in report_data.values()):
+        _merge_hdsentinel_report(snapshot, report_data)
+        snapshot["available"] = True
+        return snapshot
+
+    # Builds that cannot dump a report fall back to the -solid summary plus a
+    # report file.
+    return _collect_hdsentinel_with_report_file(snapshot, binary_path, device, deadline)
+
+
+def _merge_hdsentinel_report(snapshot, report_data):
+    for key, value in report_data.items():
+        if value not in {None, ""}:
+            snapshot[key] = value
+    if snapshot["size_text"] is None and snapshot["size_mb"] is not None:
+        snapshot["size_text"] = _format_size_mb(snapshot["size_mb"])
+    if snapshot["power_on_time_text"] is None and snapshot["power_on_hours"] is not None:
+        snapshot["power_on_time_text"] = _format_power_on_time_from_hours(
+            snapshot["power_on_hours"]
+        )
+
+
+def _collect_hdsentinel_with_report_file(snapshot, binary_path, device, deadline):
+    try:
+        solid_result = _run_hdsentinel_command(
+            binary_path, ["-solid", "-dev", device], deadline=deadline
+        )
     except TimeoutExpired:
-        snapshot["device"] = device
         snapshot["error"] = DRIVE_HEALTH_TIMEOUT_MESSAGE
         return snapshot
     if solid_result.returncode != 0:
         stderr = (solid_result.stderr or solid_result.stdout or "").strip()
-        snapshot["device"] = device
         snapshot["error"] = stderr or "HDSentinel did not return drive data."
         return snapshot
 
     solid_data = parse_hdsentinel_solid_output(solid_result.stdout, device=device)
     if not solid_data:
-        snapshot["device"] = device
         snapshot["error"] = "HDSentinel returned output that could not be parsed."
         return snapshot
 
@@ -693,7 +1188,7 @@ def collect_hdsentinel_snapshot(config_manager, system_utils, runtime=None, devi
     try:
         try:
             report_result = _run_hdsentinel_command(
-                binary_path, ["-dev", device, "-r", str(report_path)]
+                binary_path, ["-dev", device, "-r", str(report_path)], deadline=deadline
             )
         except TimeoutExpired:
             report_result = None
@@ -706,14 +1201,7 @@ def collect_hdsentinel_snapshot(config_manager, system_utils, runtime=None, devi
             report_path.unlink()
 
     snapshot.update(solid_data)
-    for key, value in report_data.items():
-        if value not in {None, ""}:
-            snapshot[key] = value
-
-    if snapshot["power_on_time_text"] is None and snapshot["power_on_hours"] is not None:
-        snapshot["power_on_time_text"] = _format_power_on_time_from_hours(
-            snapshot["power_on_hours"]
-        )
+    _merge_hdsentinel_report(snapshot, report_data)
 
     # HDSentinel can time out while writing the report after the quick SOLID
     # probe succeeded. Preserve that partial data as available so the dashboard
@@ -731,10 +1219,14 @@ def _log_and_email_alert(config_manager, runtime, title, message, *, alert_type,
     ).notify(title, message, alert_type=alert_type, source=source)
 
 
-def run_hdsentinel_health_monitor(config_manager, system_utils, runtime=None):
+def run_hdsentinel_health_monitor(
+    config_manager, system_utils, runtime=None, device=None, deadline=None
+):
     runtime = runtime or get_runtime()
     previous_snapshot = load_hdsentinel_state(runtime)
-    current_snapshot = collect_hdsentinel_snapshot(config_manager, system_utils, runtime=runtime)
+    current_snapshot = collect_hdsentinel_snapshot(
+        config_manager, system_utils, runtime=runtime, device=device, deadline=deadline
+    )
     settings = get_hdsentinel_settings(config_manager)
     alert_sent = False
 
@@ -781,7 +1273,33 @@ def run_hdsentinel_health_monitor(config_manager, system_utils, runtime=None):
     }
 
 
-def run_scheduled_drive_health_check(config_manager, system_utils, runtime=None):
+def _record_scheduled_history(
+    config_manager, runtime, history_store, device, smart, hdsentinel, summary
+):
+    owns_store = history_store is None
+    if owns_store:
+        history_store = DriveHealthHistoryStore(get_drive_health_history_path(runtime))
+    try:
+        drive = drive_history_key(config_manager, device)
+        # Score before recording so the live reading's rate is measured
+        # against the previous check rather than against itself.
+        apply_drive_risk(summary, history_store, drive, smart)
+        record_drive_health_history(history_store, drive, smart, hdsentinel.get("snapshot"))
+    finally:
+        if owns_store:
+            history_store.close()
+
+
+def _scheduled_summary(smart, smart_error, hdsentinel, probe_ms):
+    summary = _new_probe_summary(datetime.now().isoformat(), source="scheduled")
+    summary["probe_ms"] = probe_ms
+    return _apply_probe_results(summary, smart, smart_error, hdsentinel.get("snapshot"))
+
+
+def run_scheduled_drive_health_check(
+    config_manager, system_utils, runtime=None, history_store=None, summary_service=None
+):
+    """Run the nightly backup drive check and publish its summary to ``summary_service``."""
     runtime = runtime or get_runtime()
     mount_point = config_manager.get_value("backup", "mount_point", runtime.default_mount_point)
 
@@ -811,30 +1329,67 @@ def run_scheduled_drive_health_check(config_manager, system_utils, runtime=None)
         )
         raise RuntimeError(error)
 
-    smart, missing_attrs, smart_error = get_smart_attributes(
-        config_manager,
-        system_utils,
-        device=device,
-        runtime=runtime,
+    if (
+        not get_drive_health_settings(config_manager)["wake_for_scheduled_check"]
+        and get_drive_power_state(device, runtime=runtime) == POWER_STATE_STANDBY
+    ):
+        LOGGER.info("Skipping scheduled drive health check: %s", DRIVE_ASLEEP_MESSAGE)
+        if summary_service is not None:
+            summary_service.publish(
+                _asleep_summary(summary_service.get_summary(), datetime.now().isoformat(), runtime)
+            )
+        return {
+            "device": device,
+            "smart": None,
+            "missing_attrs": None,
+            "hdsentinel": {},
+            "power_state": POWER_STATE_STANDBY,
+            "skipped": DRIVE_ASLEEP_MESSAGE,
+        }
+
+    outcome = run_drive_probes(
+        {
+            "smart": lambda deadline: get_smart_attributes(
+                config_manager, system_utils, device=device, runtime=runtime, deadline=deadline
+            ),
+            "hdsentinel": lambda deadline: run_hdsentinel_health_monitor(
+                config_manager, system_utils, runtime=runtime, device=device, deadline=deadline
+            ),
+        },
+        DRIVE_HEALTH_SCHEDULED_DEADLINE_SECONDS,
+        parallel=probes_can_run_in_parallel(device),
+    )
+    smart, missing_attrs, smart_error = outcome["results"].get(
+        "smart", (None, None, DRIVE_HEALTH_TIMEOUT_MESSAGE)
     )
+    hdsentinel_result = outcome["results"].get(
+        "hdsentinel", {"snapshot": {"error": DRIVE_HEALTH_TIMEOUT_MESSAGE}, "alert_sent": False}
+    )
+    summary = _scheduled_summary(smart, smart_error, hdsentinel_result, outcome["probe_ms"])
     if smart is None:
-        hdsentinel_result = run_hdsentinel_health_monitor(
-            config_manager, system_utils, runtime=runtime
-        )
         if smart_error == SMARTCTL_JSON_UPGRADE_MESSAGE and hdsentinel_snapshot_has_health(
             hdsentinel_result.get("snapshot", {})
         ):
             LOGGER.warning(smart_error)
+            _record_scheduled_history(
+                config_manager, runtime, history_store, device, None, hdsentinel_result, summary
+            )
+            if summary_service is not None:
+                summary_service.publish(summary)
             return {
                 "device": device,
                 "smart": None,
                 "missing_attrs": None,
                 "hdsentinel": hdsentinel_result,
                 "smart_warning": smart_error,
+                "probe_ms": outcome["probe_ms"],
+                "summary": summary,
             }
 
         message = smart_error or f"Could not retrieve SMART data from {device}."
         LOGGER.warning("Drive health check could not retrieve SMART data: %s", message)
+        if summary_service is not None:
+            summary_service.publish(summary)
         _log_and_email_alert(
             config_manager,
             runtime,
@@ -845,10 +1400,272 @@ def run_scheduled_drive_health_check(config_manager, system_utils, runtime=None)
         )
         raise RuntimeError(message)
 
-    hdsentinel_result = run_hdsentinel_health_monitor(config_manager, system_utils, runtime=runtime)
+    _record_scheduled_history(
+        config_manager, runtime, history_store, device, smart, hdsentinel_result, summary
+    )
+    if summary_service is not None:
+        summary_service.publish(summary)
     return {
         "device": device,
         "smart": smart,
         "missing_attrs": missing_attrs,
         "hdsentinel": hdsentinel_result,
+        "probe_ms": outcome["probe_ms"],
+        "summary": summary,
+    }
+
+
+def get_drive_health_drives_path(runtime=None):
+    runtime = runtime or get_runtime()
+    return runtime.data_dir / DRIVE_HEALTH_DRIVES_FILENAME
+
+
+def load_drive_health_snapshots(runtime=None):
+    """Return the last stored summary per drive serial."""
+    runtime = runtime or get_runtime()
+    try:
+        state = read_json(get_drive_health_drives_path(runtime), None)
+    except Exception as exc:
+        LOGGER.warning("Failed to load drive health snapshots: %s", exc)
+        return {}
+    return (state or {}).get("drives", {})
+
+
+def save_drive_health_snapshots(snapshots, runtime=None):
+    runtime = runtime or get_runtime()
+    _write_json_atomically(get_drive_health_drives_path(runtime), {"drives": snapshots})
+
+
+def get_fake_monitored_drives():
+    return [
+        {
+            "device": "/dev/fakebackup",
+            "serial": "FAKE-BACKUP-0001",
+            "model": "Fake Developer Backup Drive",
+            "transport": "usb",
+            "bus": "usb:fake",
+        }
+    ]
+
+
+def discover_monitored_drives(runtime=None, command_adapter=None):
+    """List every non-system disk with the serial and bus used to schedule probes."""
+    runtime = runtime or get_runtime()
+    if runtime.is_fake:
+        return get_fake_monitored_drives()
+
+    blockdevices = _load_lsblk_devices(command_adapter=command_adapter)
+    system_drive = _get_system_drive_path(command_adapter=command_adapter)
+    drives = []
+    seen_serials = set()
+    for block in _iter_non_system_disks(blockdevices, system_drive=system_drive):
+        device = block["path"]
+        info = block_device_index.device_info(device) or {}
+        transport = info.get("transport") or block.get("tran") or None
+        # Device names move between boots and hotplugs, so snapshots are keyed
+        # by serial. Bridges that report no serial, or the same one for every
+        # disk, fall back to the device path so no drive is dropped.
+        serial = info.get("serial")
+        if not serial or serial in seen_serials:
+            serial = device
+        seen_serials.add(serial)
+        drives.append(
+            {
+                "device": device,
+                "serial": serial,
+                "model": info.get("model") or block.get("model"),
+                "transport": transport,
+                "bus": block_device_index.bus_key(device) or transport or "unknown",
+            }
+        )
+    return drives
+
+
+def _bus_probe_limit(bus):
+    return BUS_PROBE_CONCURRENCY.get(bus.split(":", 1)[0], DEFAULT_BUS_PROBE_CONCURRENCY)
+
+
+def run_bus_limited_probes(drives, probe, deadline_seconds):
+    """Probe ``drives`` concurrently, but never more than the bus limit at once per bus.
+
+    ``probe(drive, deadline)`` returns one drive's result. Returns the
+    ``run_drive_probes`` outcome keyed by serial; a drive that cannot get its
+    bus or finish before the deadline has a missing or ``None`` result.
+    """
+    semaphores = {}
+    for drive in drives:
+        semaphores.setdefault(
+            drive["bus"], threading.BoundedSemaphore(_bus_probe_limit(drive["bus"]))
+        )
+
+    def limited(drive):
+        semaphore = semaphores[drive["bus"]]
+
+        def run(deadline):
+            # Waiting for a busy bus counts against the same deadline.
+            if not semaphore.acquire(timeout=max(0.0, deadline - time.monotonic())):
+                return None
+            try:
+                return probe(drive, deadline)
+            finally:
+                semaphore.release()
+
+        return run
+
+    return run_drive_probes({drive["serial"]: limited(drive) for drive in drives}, deadline_seconds)
+
+
+_MONITORED_DRIVE_OWN_FIELDS = (
+    "serial",
+    "device",
+    "model",
+    "transport",
+    "bus",
+    "connected",
+    "probe_ms",
+)
+
+
+def _monitored_drive_summary(drive, checked_at):
+    return {
+        "serial": drive["serial"],
+        "device": drive["device"],
+        "model": drive.get("model"),
+        "transport": drive.get("transport"),
+        "bus": drive.get("bus"),
+        "connected": True,
+        "status": "unknown",
+        "source": "live",
+        "checked_at": checked_at,
+        "temperature": None,
+        "hdsentinel_health": None,
+        "hdsentinel_performance": None,
+        "detail": DRIVE_HEALTH_TIMEOUT_MESSAGE,
+        "error": DRIVE_HEALTH_TIMEOUT_MESSAGE,
+        "power_state": None,
+        "reading_at": None,
+        "probe_ms": None,
+        "risk_score": None,
+        "risk_level": None,
     }
+
+
+def probe_monitored_drive(
+    config_manager, drive, deadline, runtime=None, *, wake_drive=False, previous_summary=None
+):
+    """Probe one monitored drive and return its summary."""
+    runtime = runtime or get_runtime()
+    checked_at = datetime.now().isoformat()
+    summary = _monitored_drive_summary(drive, checked_at)
+    device = drive["device"]
+
+    if not wake_drive:
+        power_state = get_drive_power_state(device, runtime=runtime)
+        if power_state == POWER_STATE_STANDBY:
+            asleep = _asleep_summary(previous_summary, checked_at, runtime, state_fallback=False)
+            if not asleep["reading_at"]:
+                asleep["detail"] = "Drive asleep. It has no earlier reading to show."
+            return {**summary, **asleep}
+        summary["power_state"] = power_state
+
+    # The bus limit already decides how many disks are busy at once, so one
+    # drive's probes run back to back rather than in parallel.
+    smart, _missing_attrs, smart_error = get_smart_attributes(
+        config_manager, None, device=device, runtime=runtime, deadline=deadline
+    )
+    hdsentinel_snapshot = None
+    if get_hdsentinel_settings(config_manager)["enabled"]:
+        hdsentinel_snapshot = collect_hdsentinel_snapshot(
+            config_manager, None, runtime=runtime, device=device, deadline=deadline
+        )
+    summary.update(
+        {
+            "detail": "Drive health data is not available.",
+            "error": None,
+            "reading_at": checked_at,
+        }
+    )
+    _apply_probe_results(summary, smart, smart_error, hdsentinel_snapshot)
+    # History is recorded for the backup drive only, so other drives are
+    # scored on their current counts.
+    return apply_drive_risk(summary, None, drive["serial"], smart)
+
+
+def run_drive_health_monitor(
+    config_manager,
+    runtime=None,
+    *,
+    wake_drives=False,
+    deadline_seconds=DRIVE_HEALTH_SCHEDULED_DEADLINE_SECONDS,
+    known_summaries=None,
+):
+    """Probe every non-system disk and store one summary per drive serial.
+
+    ``known_summaries`` maps a device path to a summary already probed in this
+    run, such as the scheduled backup drive check; those drives are stored
+    from it instead of being probed twice. Drives that were seen before but
+    are no longer attached keep their last summary with ``connected`` set to
+    false.
+    """
+    runtime = runtime or get_runtime()
+    known_summaries = known_summaries or {}
+    drives = discover_monitored_drives(runtime)
+    snapshots = load_drive_health_snapshots(runtime)
+    for snapshot in snapshots.values():
+        snapshot["connected"] = False
+
+    checked_at = datetime.now().isoformat()
+    probed = []
+    for drive in drives:
+        known = known_summaries.get(drive["device"])
+        if known is None:
+            probed.append(drive)
+            continue
+        # Readings come from the earlier probe; identity stays as discovered,
+        # and the monitor itself spent no probe time on this drive.
+        summary = _monitored_drive_summary(drive, checked_at)
+        summary.update(
+            {
+                key: value
+                for key, value in known.items()
+                if key in summary and key not in _MONITORED_DRIVE_OWN_FIELDS
+            }
+        )
+        snapshots[drive["serial"]] = summary
+
+    def probe(drive, deadline):
+        try:
+            return probe_monitored_drive(
+                config_manager,
+                drive,
+                deadline,
+                runtime,
+                wake_drive=wake_drives,
+                previous_summary=snapshots.get(drive["serial"]),
+            )
+        except Exception as exc:
+            # One broken disk must not cost every other drive its reading.
+            LOGGER.exception("Drive health probe failed for %s", drive["device"])
+            summary = _monitored_drive_summary(drive, checked_at)
+            summary.update({"detail": str(exc), "error": str(exc)})
+            return summary
+
+    if probed:
+        outcome = run_bus_limited_probes(probed, probe, deadline_seconds)
+        for drive in probed:
+            summary = outcome["results"].get(drive["serial"]) or _monitored_drive_summary(
+                drive, checked_at
+            )
+            summary["probe_ms"] = outcome["probe_ms"][drive["serial"]]
+            snapshots[drive["serial"]] = summary
+
+    save_drive_health_snapshots(snapshots, runtime)
+    return list_drive_health_snapshots(snapshots)
+
+
+def list_drive_health_snapshots(snapshots):
+    """Order stored summaries for display: attached drives first, then by device."""
+    return sorted(
+        snapshots.values(),
+        key=lambda snapshot: (not snapshot.get("connected"), snapshot.get("device") or ""),
+    )
@@ -0,0 +1,198 @@
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+DRIVE_HEALTH_HISTORY_FILENAME = "drive_health_history.sqlite3"
+RAW_RETENTION_DAYS = 90
+HOURLY_RETENTION_DAYS = 730
+HISTORY_RESOLUTIONS = ("auto", "raw", "hour", "day")
+ROLLUP_SECONDS = {"hour": 3600, "day": 86400}
+
+# Both tables are WITHOUT ROWID so the primary key is the clustered index: a
+# range query for one drive/metric is a single contiguous B-tree scan.
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS samples (
+    drive TEXT NOT NULL,
+    metric TEXT NOT NULL,
+    ts INTEGER NOT NULL,
+    value REAL NOT NULL,
+    PRIMARY KEY (drive, metric, ts)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS rollups (
+    drive TEXT NOT NULL,
+    metric TEXT NOT NULL,
+    resolution TEXT NOT NULL,
+    bucket INTEGER NOT NULL,
+    count INTEGER NOT NULL,
+    min REAL NOT NULL,
+    max REAL NOT NULL,
+    sum REAL NOT NULL,
+    last REAL NOT NULL,
+    PRIMARY KEY (drive, metric, resolution, bucket)
+) WITHOUT ROWID;
+"""
+
+
+def pick_resolution(start: int, end: int, now: float | None = None) -> str:
+    """Choose the finest resolution that still has data for the whole range."""
+    now = time.time() if now is None else now
+    span = end - start
+    if span <= 31 * 86400 and start >= now - RAW_RETENTION_DAYS * 86400:
+        return "raw"
+    if span <= 180 * 86400 and start >= now - HOURLY_RETENTION_DAYS * 86400:
+        return "hour"
+    return "day"
+
+
+class DriveHealthHistoryStore:
+    """SQLite time series of SMART and HDSentinel readings per drive.
+
+    Raw samples are rolled up into hourly and daily buckets as they are
+    recorded, so a trend chart over years reads a few hundred pre-aggregated
+    rows instead of re-scanning every check or probing the drive.
+    """
+
+    def __init__(self, db_path: Path, *, timeout: float = 5.0) -> None:
+        self.db_path = db_path
+        self._timeout = timeout
+        self._local = threading.local()
+        self._schema_lock = threading.Lock()
+        self._schema_ready = False
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            return connection
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(str(self.db_path), timeout=self._timeout)
+        connection.row_factory = sqlite3.Row
+        connection.execute("PRAGMA journal_mode=WAL")
+        # Losing the last nightly sample to a power cut only leaves a gap in a
+        # trend line, so WAL's NORMAL sync level is enough.
+        connection.execute("PRAGMA synchronous=NORMAL")
+        with self._schema_lock:
+            if not self._schema_ready:
+                with connection:
+                    connection.executescript(_SCHEMA)
+                self._schema_ready = True
+        self._local.connection = connection
+        return connection
+
+    def record(self, drive: str, timestamp: float, values: dict[str, Any]) -> int:
+        """Record one reading per metric at ``timestamp``; returns the new sample count.
+
+        ``None`` values are skipped, and re-recording the same timestamp is a
+        no-op so rollups never count a reading twice.
+        """
+        ts = int(timestamp)
+        recorded = 0
+        connection = self._connection()
+        with connection:
+            for metric, value in values.items():
+                if value is None:
+                    continue
+                value = float(value)
+                inserted = connection.execute(
+                    "INSERT OR IGNORE INTO samples (drive, metric, ts, value) VALUES (?, ?, ?, ?)",
+                    (drive, metric, ts, value),
+                ).rowcount
+                if not inserted:
+                    continue
+                recorded += 1
+                for resolution, seconds in ROLLUP_SECONDS.items():
+                    connection.execute(
+                        "INSERT INTO rollups "
+                        "(drive, metric, resolution, bucket, count, min, max, sum, last) "
+                        "VALUES (?, ?, ?, ?, 1, ?, ?, ?, ?) "
+                        "ON CONFLICT (drive, metric, resolution, bucket) DO UPDATE SET "
+                        "count = count + 1, min = MIN(min, excluded.min), "
+                        "max = MAX(max, excluded.max), sum = sum + excluded.sum, "
+                        "last = excluded.last",
+                        (drive, metric, resolution, ts - ts % seconds, value, value, value, value),
+                    )
+            if recorded:
+                self._prune(connection, ts)
+        return recorded
+
+    def _prune(self, connection: sqlite3.Connection, now: int) -> None:
+        # Daily rollups are kept forever; at one row per metric per day they
+        # stay small enough for a decade of history.
+        connection.execute("DELETE FROM samples WHERE ts < ?", (now - RAW_RETENTION_DAYS * 86400,))
+        connection.execute(
+            "DELETE FROM rollups WHERE resolution = 'hour' AND bucket < ?",
+            (now - HOURLY_RETENTION_DAYS * 86400,),
+        )
+
+    def query(
+        self,
+        drive: str,
+        metric: str,
+        start: int,
+        end: int,
+        resolution: str = "auto",
+    ) -> dict[str, Any]:
+        """Return points for ``metric`` between ``start`` and ``end`` (epoch seconds)."""
+        if resolution not in HISTORY_RESOLUTIONS:
+            raise ValueError(f"Unknown resolution: {resolution}")
+        if resolution == "auto":
+            resolution = pick_resolution(start, end)
+        connection = self._connection()
+        if resolution == "raw":
+            rows = connection.execute(
+                "SELECT ts, value FROM samples "
+                "WHERE drive = ? AND metric = ? AND ts BETWEEN ? AND ? ORDER BY ts",
+                (drive, metric, start, end),
+            )
+            points = [
+                {"t": row["ts"], "value": row["value"], "min": row["value"], "max": row["value"]}
+                for row in rows
+            ]
+        else:
+            # Include the bucket that straddles ``start`` so the first point is
+            # not dropped when the range starts mid-day.
+            bucket_start = start - start % ROLLUP_SECONDS[resolution]
+            rows = connection.execute(
+                "SELECT bucket, count, min, max, sum FROM rollups "
+                "WHERE drive = ? AND metric = ? AND resolution = ? "
+                "AND bucket BETWEEN ? AND ? ORDER BY bucket",
+                (drive, metric, resolution, bucket_start, end),
+            )
+            points = [
+                {
+                    "t": row["bucket"],
+                    "value": round(row["sum"] / row["count"], 3),
+                    "min": row["min"],
+                    "max": row["max"],
+                }
+                for row in rows
+            ]
+        return {"resolution": resolution, "points": points}
+
+    def samples(self, drives: list[str], metrics) -> list[tuple[str, str, int, float]]:
+        """Return raw ``(drive, metric, ts, value)`` rows ordered by drive and time."""
+        if not drives or not metrics:
+            return []
+        drive_marks = ", ".join("?" * len(drives))
+        metric_marks = ", ".join("?" * len(metrics))
+        # Only "?" placeholders are interpolated; every value is bound.
+        sql = (
+            "SELECT drive, metric, ts, value FROM samples "  # nosec B608
+            f"WHERE drive IN ({drive_marks}) AND metric IN ({metric_marks}) "
+            "ORDER BY drive, ts"
+        )
+        rows = self._connection().execute(sql, (*drives, *metrics))
+        return [(row["drive"], row["metric"], row["ts"], row["value"]) for row in rows]
+
+    def drives(self) -> list[str]:
+        rows = self._connection().execute(
+            "SELECT DISTINCT drive FROM rollups WHERE resolution = 'day' ORDER BY drive"
+        )
+        return [row["drive"] for row in rows]
+
+    def close(self) -> None:
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
@@ -0,0 +1,208 @@
+import json
+import math
+import time
+from array import array
+from dataclasses import dataclass, field
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+DRIVE_RISK_MODEL_PATH = Path(__file__).with_name("drive_risk_model.json")
+# Reallocated, reported-uncorrectable, pending and offline-uncorrectable sector
+# counts are the SMART attributes most consistently tied to drive failure.
+RISK_METRICS = ("smart_5_raw", "smart_187_raw", "smart_197_raw", "smart_198_raw")
+RISK_LEVEL_LOW = "low"
+RISK_LEVEL_ELEVATED = "elevated"
+RISK_LEVEL_HIGH = "high"
+# Readings taken minutes apart would turn one new bad sector into a huge
+# monthly rate, so rates are measured over at least a day.
+MIN_RATE_INTERVAL_DAYS = 1.0
+
+
+@dataclass(frozen=True)
+class DriveRiskModel:
+    bias: float
+    level_weights: dict[str, float]
+    rate_weights: dict[str, float]
+    rate_days: float
+    elevated_at: float
+    high_at: float
+
+
+@cache
+def load_drive_risk_model(path: Path = DRIVE_RISK_MODEL_PATH) -> DriveRiskModel:
+    """Read the scoring weights on first use so app startup never pays for it."""
+    with path.open(encoding="utf-8") as handle:
+        data = json.load(handle)
+    return DriveRiskModel(
+        bias=float(data["bias"]),
+        level_weights={key: float(value) for key, value in data["level_weights"].items()},
+        rate_weights={key: float(value) for key, value in data["rate_weights"].items()},
+        rate_days=float(data["rate_days"]),
+        elevated_at=float(data["elevated_at"]),
+        high_at=float(data["high_at"]),
+    )
+
+
+@cache
+def _load_numpy():
+    # NumPy is not a dependency, and importing it costs more than the rest of
+    # the app on the low-end CPUs this runs on, so only try when scoring.
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+@dataclass
+class HistoryColumns:
+    """Drive readings pivoted into one contiguous array per metric, one row per reading."""
+
+    metrics: tuple[str, ...] = RISK_METRICS
+    drives: list[str] = field(default_factory=list)
+    drive_index: array = field(default_factory=lambda: array("q"))
+    ts: array = field(default_factory=lambda: array("q"))
+    values: dict[str, array] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        for metric in self.metrics:
+            self.values.setdefault(metric, array("d"))
+
+    def __len__(self) -> int:
+        return len(self.ts)
+
+
+def build_history_columns(rows, metrics=RISK_METRICS) -> HistoryColumns:
+    """Pivot ``(drive, metric, ts, value)`` rows ordered by drive and time.
+
+    A metric missing from a reading carries the drive's previous value
+    forward, or the SMART default of 0 before its first reading.
+    """
+    columns = HistoryColumns(metrics=tuple(metrics))
+    current = None
+    last: dict[str, float] = {}
+    for drive, metric, timestamp, value in rows:
+        if metric not in columns.values:
+            continue
+        if current is None or drive != current[0]:
+            columns.drives.append(drive)
+            last = dict.fromkeys(columns.metrics, 0.0)
+        if (drive, timestamp) != current:
+            current = (drive, timestamp)
+            columns.drive_index.append(len(columns.drives) - 1)
+            columns.ts.append(int(timestamp))
+            for name in columns.metrics:
+                columns.values[name].append(last[name])
+        last[metric] = float(value)
+        columns.values[metric][-1] = last[metric]
+    return columns
+
+
+def score_history_columns(
+    columns: HistoryColumns, model: DriveRiskModel | None = None, *, use_numpy: bool | None = None
+) -> array:
+    """Return a 0-100 failure risk for every row, computed column by column.
+
+    Each row combines the current counts with how fast they grew since the
+    drive's previous reading. ``use_numpy=None`` uses NumPy when it is
+    installed; both paths return the same scores.
+    """
+    model = model or load_drive_risk_model()
+    if not len(columns):
+        return array("d")
+    numpy = _load_numpy() if use_numpy is not False else None
+    if use_numpy and numpy is None:
+        raise RuntimeError("NumPy is not installed.")
+    if numpy is not None:
+        return _score_with_numpy(numpy, columns, model)
+    return _score_with_python(columns, model)
+
+
+def _score_with_python(columns: HistoryColumns, model: DriveRiskModel) -> array:
+    ts = columns.ts
+    drive_index = columns.drive_index
+    # A drive's first row has no earlier reading, so its rates are zero.
+    rate_scale = [0.0] + [
+        model.rate_days / max((now - before) / 86400, MIN_RATE_INTERVAL_DAYS)
+        if drive == previous_drive
+        else 0.0
+        for now, before, drive, previous_drive in zip(
+            ts[1:], ts, drive_index[1:], drive_index, strict=False
+        )
+    ]
+    logits = [model.bias] * len(ts)
+    for metric in columns.metrics:
+        column = columns.values[metric]
+        level_weight = model.level_weights.get(metric, 0.0)
+        rate_weight = model.rate_weights.get(metric, 0.0)
+        rates = [0.0] + [
+            max(value - previous, 0.0) * scale
+            for value, previous, scale in zip(column[1:], column, rate_scale[1:], strict=False)
+        ]
+        logits = [
+            logit + level_weight * math.log1p(max(value, 0.0)) + rate_weight * math.log1p(rate)
+            for logit, value, rate in zip(logits, column, rates, strict=True)
+        ]
+    return array("d", (100.0 / (1.0 + math.exp(-logit)) for logit in logits))
+
+
+def _score_with_numpy(numpy, columns: HistoryColumns, model: DriveRiskModel) -> array:
+    # frombuffer wraps the array() storage without copying it.
+    ts = numpy.frombuffer(columns.ts, dtype=numpy.int64)
+    drive_index = numpy.frombuffer(columns.drive_index, dtype=numpy.int64)
+    days = numpy.maximum(numpy.diff(ts) / 86400, MIN_RATE_INTERVAL_DAYS)
+    rate_scale = numpy.zeros(len(ts))
+    rate_scale[1:] = numpy.where(drive_index[1:] == drive_index[:-1], model.rate_days / days, 0.0)
+    logits = numpy.full(len(ts), model.bias)
+    for metric in columns.metrics:
+        column = numpy.frombuffer(columns.values[metric], dtype=numpy.float64)
+        rates = numpy.zeros(len(ts))
+        rates[1:] = numpy.maximum(numpy.diff(column), 0.0) * rate_scale[1:]
+        logits += model.level_weights.get(metric, 0.0) * numpy.log1p(numpy.maximum(column, 0.0))
+        logits += model.rate_weights.get(metric, 0.0) * numpy.log1p(rates)
+    scores = array("d")
+    scores.frombytes((100.0 / (1.0 + numpy.exp(-logits))).astype(numpy.float64).tobytes())
+    return scores
+
+
+def risk_level(score: float | None, model: DriveRiskModel | None = None) -> str | None:
+    if score is None:
+        return None
+    model = model or load_drive_risk_model()
+    if score >= model.high_at:
+        return RISK_LEVEL_HIGH
+    if score >= model.elevated_at:
+        return RISK_LEVEL_ELEVATED
+    return RISK_LEVEL_LOW
+
+
+def score_drive_histories(
+    history_store, drives: list[str], *, use_numpy: bool | None = None
+) -> dict[str, list[dict[str, Any]]]:
+    """Score every stored reading for ``drives`` in one pass; returns points per drive."""
+    columns = build_history_columns(history_store.samples(drives, RISK_METRICS))
+    scores = score_history_columns(columns, use_numpy=use_numpy)
+    points: dict[str, list[dict[str, Any]]] = {drive: [] for drive in drives}
+    for index, timestamp, score in zip(columns.drive_index, columns.ts, scores, strict=True):
+        points[columns.drives[index]].append({"t": timestamp, "score": round(score, 1)})
+    return points
+
+
+def current_drive_risk(history_store, drive: str, smart: dict[str, Any] | None, timestamp=None):
+    """Score a live SMART reading against the drive's stored history.
+
+    Without a history store, only the current counts contribute.
+    """
+    if not smart:
+        return {"risk_score": None, "risk_level": None}
+    rows = list(history_store.samples([drive], RISK_METRICS)) if history_store else []
+    timestamp = int(time.time() if timestamp is None else timestamp)
+    rows.extend(
+        (drive, metric, timestamp, smart[metric])
+        for metric in RISK_METRICS
+        if smart.get(metric) is not None
+    )
+    scores = score_history_columns(build_history_columns(rows))
+    score = round(scores[-1], 1) if scores else None
+    return {"risk_score": score, "risk_level": risk_level(score)}
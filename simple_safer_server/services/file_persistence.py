@@ -1,11 +1,33 @@
+import atexit
+import copy
 import fcntl
 import json
 import os
 import tempfile
+import threading
+import weakref
+from collections import OrderedDict
 from collections.abc import Callable, Iterator
 from contextlib import contextmanager, suppress
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
+
+# Every store picks one tier explicitly:
+# - VOLATILE: replaced atomically, never fsynced. For progress, status and cache
+#   files that are rebuilt or harmless to lose after a power cut.
+# - BATCHED: replaced atomically; file and directory fsyncs are deferred to a
+#   shared group commit, so bursts cost one fsync per path per interval. A power
+#   cut can lose up to GROUP_COMMIT_INTERVAL_SECONDS of updates.
+# - DURABLE: file and directory are fsynced before the write returns. For
+#   configuration, credentials and anything the operator would have to re-enter.
+Durability = Literal["volatile", "batched", "durable"]
+VOLATILE: Durability = "volatile"
+BATCHED: Durability = "batched"
+DURABLE: Durability = "durable"
+
+GROUP_COMMIT_INTERVAL_SECONDS = 1.0
+COALESCE_WINDOW_SECONDS = 0.25
+JSON_READ_CACHE_MAX_ENTRIES = 128
 
 
 def _fsync_directory(path: Path) -> None:
@@ -16,15 +38,67 @@ def _fsync_directory(path: Path) -> None:
         os.close(directory_fd)
 
 
+def _fsync_path(path: Path) -> None:
+    file_fd = os.open(str(path), os.O_RDONLY)
+    try:
+        os.fsync(file_fd)
+    finally:
+        os.close(file_fd)
+
+
+class _GroupCommitter:
+    """Fsync batched writes once per interval instead of once per write."""
+
+    def __init__(self, interval: float) -> None:
+        self._interval = interval
+        self._lock = threading.Lock()
+        self._pending: set[Path] = set()
+        self._timer: threading.Timer | None = None
+
+    def add(self, path: Path) -> None:
+        with self._lock:
+            self._pending.add(path)
+            if self._timer is None:
+                self._timer = threading.Timer(self._interval, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self) -> None:
+        with self._lock:
+            paths, self._pending = self._pending, set()
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        # Fsyncing the path reaches whichever inode was published last, so one
+        # call covers every replace of that path since the previous commit.
+        directories = set()
+        for path in paths:
+            with suppress(FileNotFoundError):
+                _fsync_path(path)
+                directories.add(path.parent)
+        for directory in directories:
+            with suppress(FileNotFoundError):
+                _fsync_directory(directory)
+
+
+_group_committer = _GroupCommitter(GROUP_COMMIT_INTERVAL_SECONDS)
+
+
+def flush_batched_writes() -> None:
+    """Commit every pending BATCHED write to disk now."""
+    _group_committer.flush()
+
+
 def atomic_write_text(
     path: Path,
     content: str,
     *,
     mode: int | None = None,
     encoding: str = "utf-8",
-    durable: bool = True,
+    durability: Durability = DURABLE,
 ) -> None:
     """Publish text with a same-directory temp file and atomic replace."""
+    durable = durability == DURABLE
     path.parent.mkdir(parents=True, exist_ok=True)
     temp_path = None
     try:
@@ -49,6 +123,8 @@ def atomic_write_text(
         temp_path = None
         if durable:
             _fsync_directory(path.parent)
+        elif durability == BATCHED:
+            _group_committer.add(path)
     finally:
         if temp_path is not None:
             with suppress(OSError):
@@ -60,17 +136,86 @@ def atomic_write_json(
     payload: Any,
     *,
     mode: int | None = None,
-    durable: bool = True,
+    durability: Durability = DURABLE,
     indent: int = 2,
 ) -> None:
     atomic_write_text(
         path,
         json.dumps(payload, indent=indent),
         mode=mode,
-        durable=durable,
+        durability=durability,
     )
 
 
+_coalescing_writers: weakref.WeakSet = weakref.WeakSet()
+
+
+class CoalescingJsonWriter:
+    """Merge bursts of JSON publishes to the same path into one atomic write.
+
+    publish() only records the latest payload; the write happens once the
+    window closes, or on flush(). read() sees pending payloads, so the owning
+    process keeps read-your-writes while other processes lag by one window.
+    """
+
+    def __init__(self, *, window: float = COALESCE_WINDOW_SECONDS) -> None:
+        self._window = window
+        self._lock = threading.Lock()
+        # Writes run under their own lock so a timer flush and an explicit
+        # flush cannot land an older payload after a newer one.
+        self._flush_lock = threading.Lock()
+        self._pending: dict[Path, tuple[Any, int | None, Durability]] = {}
+        self._timer: threading.Timer | None = None
+        _coalescing_writers.add(self)
+
+    def publish(
+        self,
+        path: Path,
+        payload: Any,
+        *,
+        mode: int | None = None,
+        durability: Durability = VOLATILE,
+    ) -> None:
+        with self._lock:
+            self._pending[path] = (copy.deepcopy(payload), mode, durability)
+            if self._timer is None:
+                self._timer = threading.Timer(self._window, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def read(self, path: Path, default: Any) -> Any:
+        with self._lock:
+            if path in self._pending:
+                return copy.deepcopy(self._pending[path][0])
+        return read_json(path, default)
+
+    def flush(self, path: Path | None = None) -> None:
+        """Write pending payloads now, for one path or all of them."""
+        with self._flush_lock:
+            with self._lock:
+                if path is None:
+                    pending, self._pending = self._pending, {}
+                else:
+                    pending = {path: self._pending.pop(path)} if path in self._pending else {}
+                if not self._pending and self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+            for pending_path, (payload, mode, durability) in pending.items():
+                atomic_write_json(pending_path, payload, mode=mode, durability=durability)
+
+
+@atexit.register
+def _flush_at_exit() -> None:
+    for writer in list(_coalescing_writers):
+        with suppress(Exception):
+            writer.flush()
+    with suppress(Exception):
+        flush_batched_writes()
+
+
+_locked_sections = threading.local()
+
+
 @contextmanager
 def locked_path(lock_path: Path, *, mode: int | None = None) -> Iterator[None]:
     """Hold an exclusive flock on a stable sidecar path."""
@@ -79,13 +224,17 @@ def locked_path(lock_path: Path, *, mode: int | None = None) -> Iterator[None]:
         if mode is not None:
             lock_path.chmod(mode)
         fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        # Read/modify/write sections must see the file itself, never a cached
+        # parse, so read_json bypasses the cache while this thread holds a lock.
+        _locked_sections.depth = getattr(_locked_sections, "depth", 0) + 1
         try:
             yield
         finally:
+            _locked_sections.depth -= 1
             fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
 
 
-def read_json(path: Path, default: Any) -> Any:
+def _read_json_file(path: Path, default: Any) -> Any:
     try:
         data = path.read_text(encoding="utf-8").strip()
     except FileNotFoundError:
@@ -95,6 +244,82 @@ def read_json(path: Path, default: Any) -> Any:
     return json.loads(data)
 
 
+def _copy_json(value: Any) -> Any:
+    # JSON values are only dicts, lists and immutable scalars, so this is a
+    # complete deep copy at a fraction of copy.deepcopy's cost.
+    if isinstance(value, dict):
+        return {key: _copy_json(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_json(item) for item in value]
+    return value
+
+
+def _stat_signature(path: Path) -> tuple[int, int, int] | None:
+    try:
+        file_stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (file_stat.st_ino, file_stat.st_mtime_ns, file_stat.st_size)
+
+
+class JsonReadCache:
+    """Parsed JSON files keyed on path and (inode, mtime_ns, size).
+
+    Writers publish with an atomic replace, so a new inode invalidates an entry
+    the moment another thread or process writes; mtime and size catch in-place
+    edits. Every read returns a private copy so callers cannot corrupt entries.
+    """
+
+    def __init__(self, max_entries: int = JSON_READ_CACHE_MAX_ENTRIES) -> None:
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Path, tuple[tuple[int, int, int], Any]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def read(self, path: Path, default: Any) -> Any:
+        signature = _stat_signature(path)
+        if signature is None:
+            return default
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry[0] == signature:
+                self._entries.move_to_end(path)
+                self.hits += 1
+                return _copy_json(entry[1])
+            self.misses += 1
+        value = _read_json_file(path, default)
+        # A replace that lands mid-read leaves a newer signature; caching under
+        # the old one would be wrong, so only cache when the file held still.
+        if value is not default and _stat_signature(path) == signature:
+            with self._lock:
+                self._entries[path] = (signature, _copy_json(value))
+                self._entries.move_to_end(path)
+                while len(self._entries) > self._max_entries:
+                    self._entries.popitem(last=False)
+        return value
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries)}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+json_read_cache = JsonReadCache()
+
+
+def read_json(path: Path, default: Any) -> Any:
+    """Parse a JSON file through the shared read cache; missing or empty files yield default."""
+    if getattr(_locked_sections, "depth", 0):
+        return _read_json_file(path, default)
+    return json_read_cache.read(path, default)
+
+
 def locked_json_update(
     path: Path,
     lock_path: Path,
@@ -103,11 +328,11 @@ def locked_json_update(
     *,
     file_mode: int | None = None,
     lock_mode: int | None = None,
-    durable: bool = True,
+    durability: Durability = DURABLE,
 ) -> Any:
     """Serialize read/modify/write JSON updates across processes."""
     with locked_path(lock_path, mode=lock_mode):
         current = read_json(path, default)
         updated = update_fn(current)
-        atomic_write_json(path, updated, mode=file_mode, durable=durable)
+        atomic_write_json(path, updated, mode=file_mode, durability=durability)
         return updated
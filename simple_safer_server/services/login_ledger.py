@@ -0,0 +1,142 @@
+import sqlite3
+import threading
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+LOGIN_LEDGER_FILENAME = "login_ledger.sqlite3"
+LOGIN_STATE_FIELDS = ("failed_attempts", "locked_until", "last_login")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS login_state (
+    username TEXT PRIMARY KEY,
+    failed_attempts INTEGER NOT NULL DEFAULT 0,
+    locked_until TEXT,
+    last_login TEXT
+)
+"""
+
+
+class LoginLedger:
+    """Per-user lockout counters and last-login stamps, kept out of users.json.
+
+    Every login attempt touches one row in a WAL-mode database instead of
+    rewriting and fsyncing the whole user store, so a password-guessing burst
+    costs a WAL append per attempt while lockouts still survive restarts.
+    """
+
+    def __init__(self, db_path: Path, *, timeout: float = 5.0) -> None:
+        self.db_path = db_path
+        self._timeout = timeout
+        self._local = threading.local()
+        self._schema_lock = threading.Lock()
+        self._schema_ready = False
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            return connection
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(str(self.db_path), timeout=self._timeout)
+        connection.row_factory = sqlite3.Row
+        connection.execute("PRAGMA journal_mode=WAL")
+        # NORMAL keeps each attempt off the fsync path. Committed rows survive a
+        # process restart; only a power cut can drop the last few attempts.
+        connection.execute("PRAGMA synchronous=NORMAL")
+        with self._schema_lock:
+            if not self._schema_ready:
+                with connection:
+                    connection.execute(_SCHEMA)
+                self.db_path.chmod(0o600)
+                self._schema_ready = True
+        self._local.connection = connection
+        return connection
+
+    def state(self, username: str) -> dict[str, Any] | None:
+        row = (
+            self._connection()
+            .execute("SELECT * FROM login_state WHERE username = ?", (username,))
+            .fetchone()
+        )
+        if row is None:
+            return None
+        return {field: row[field] for field in LOGIN_STATE_FIELDS}
+
+    def last_logins(self) -> dict[str, str | None]:
+        rows = self._connection().execute("SELECT username, last_login FROM login_state")
+        return {row["username"]: row["last_login"] for row in rows}
+
+    def import_states(self, states: Iterable[tuple[str, dict[str, Any]]]) -> None:
+        """Seed rows from older users.json records without overriding newer ledger state."""
+        rows = [
+            {
+                "username": username,
+                "failed_attempts": int(state.get("failed_attempts") or 0),
+                "locked_until": state.get("locked_until"),
+                "last_login": state.get("last_login"),
+            }
+            for username, state in states
+        ]
+        if not rows:
+            return
+        connection = self._connection()
+        with connection:
+            connection.executemany(
+                "INSERT OR IGNORE INTO login_state "
+                "(username, failed_attempts, locked_until, last_login) "
+                "VALUES (:username, :failed_attempts, :locked_until, :last_login)",
+                rows,
+            )
+
+    def record_success(self, username: str, timestamp: str) -> None:
+        connection = self._connection()
+        with connection:
+            connection.execute(
+                "INSERT INTO login_state (username, failed_attempts, locked_until, last_login) "
+                "VALUES (?, 0, NULL, ?) "
+                "ON CONFLICT (username) DO UPDATE SET "
+                "failed_attempts = 0, locked_until = NULL, last_login = excluded.last_login",
+                (username, timestamp),
+            )
+
+    def record_failure(self, username: str, max_attempts: int, locked_until: str) -> int:
+        """Count a failed attempt, locking the account at ``max_attempts``; returns the count."""
+        # The increment runs inside SQLite so concurrent workers cannot lose
+        # each other's attempts the way a read/modify/write of users.json could.
+        connection = self._connection()
+        with connection:
+            connection.execute(
+                "INSERT INTO login_state (username, failed_attempts) VALUES (?, 1) "
+                "ON CONFLICT (username) DO UPDATE SET failed_attempts = failed_attempts + 1",
+                (username,),
+            )
+            connection.execute(
+                "UPDATE login_state SET locked_until = ? "
+                "WHERE username = ? AND failed_attempts >= ?",
+                (locked_until, username, max_attempts),
+            )
+            row = connection.execute(
+                "SELECT failed_attempts FROM login_state WHERE username = ?", (username,)
+            ).fetchone()
+        return row["failed_attempts"]
+
+    def reset(self, username: str) -> None:
+        """Clear lockout state while keeping the last-login stamp."""
+        connection = self._connection()
+        with connection:
+            connection.execute(
+                "UPDATE login_state SET failed_attempts = 0, locked_until = NULL "
+                "WHERE username = ?",
+                (username,),
+            )
+
+    def forget(self, username: str) -> None:
+        connection = self._connection()
+        with connection:
+            connection.execute("DELETE FROM login_state WHERE username = ?", (username,))
+
+    def close(self) -> None:
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
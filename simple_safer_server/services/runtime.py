@@ -1,14 +1,25 @@
+import atexit
+import copy
+import json
 import os
 import secrets
 import tempfile
 import threading
 import time
+from collections import deque
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, ClassVar
 
-from simple_safer_server.services.file_persistence import atomic_write_json, read_json
+from simple_safer_server.services.file_persistence import VOLATILE, atomic_write_json, read_json
+
+# Fake state is served from memory; state.json only has to survive restarts, so
+# bursts of updates are written once after this quiet period.
+FAKE_STATE_FLUSH_DELAY_SECONDS = 0.5
+# Recent task log lines kept in memory for the UI; full logs stay on disk.
+FAKE_TASK_LOG_BUFFER_LINES = 1000
+FAKE_TASK_LOG_TAIL_BYTES = 256 * 1024
 
 
 @dataclass(frozen=True)
@@ -58,7 +69,15 @@ class FakeState:
     def __init__(self, runtime: Runtime):
         self.runtime = runtime
         self._lock = threading.RLock()
+        # Flushes are serialized separately so a slow disk write never holds the
+        # state lock that every request reads through.
+        self._flush_lock = threading.Lock()
+        self._flush_timer: threading.Timer | None = None
+        self._dirty = False
+        self._task_logs: dict[str, deque[tuple[int, str]]] = {}
+        self._task_log_sizes: dict[str, int] = {}
         self._ensure_layout()
+        self._state = self._read_state()
 
     def _ensure_layout(self) -> None:
         self.runtime.data_dir.mkdir(parents=True, exist_ok=True)
@@ -73,7 +92,7 @@ class FakeState:
         self.runtime.cloud_target_dir.mkdir(parents=True, exist_ok=True)
         self.runtime.volatile_dir.mkdir(parents=True, exist_ok=True)
         if not self.runtime.state_path.exists():
-            self.save(self.default_state())
+            self._write_state(self.default_state())
 
     def default_state(self) -> dict[str, Any]:
         return {
@@ -88,32 +107,74 @@ class FakeState:
                     "status": "Not Run Yet",
                     "last_run": "",
                     "last_run_duration": "-",
-                    "log": "",
                 }
                 for task_name in self.TASK_NAMES
             },
         }
 
-    def load(self) -> dict[str, Any]:
+    def _read_state(self) -> dict[str, Any]:
         try:
-            return read_json(self.runtime.state_path, self.default_state())
+            state = read_json(self.runtime.state_path, self.default_state())
         except Exception:
             state = self.default_state()
-            self.save(state)
-            return state
+            self._write_state(state)
+        # Older snapshots kept each task log inside state.json; move any such log
+        # to its append-only file once so state writes stay small.
+        for task_name, task_state in state.get("tasks", {}).items():
+            legacy_log = task_state.pop("log", "")
+            log_path = self._task_log_path(task_name)
+            if legacy_log and not log_path.exists():
+                log_path.write_text(legacy_log, encoding="utf-8")
+        return state
+
+    def load(self) -> dict[str, Any]:
+        with self._lock:
+            return copy.deepcopy(self._state)
 
     def _write_state(self, state: dict[str, Any]) -> None:
         """Write state atomically via a unique temp file and rename to avoid partial writes."""
-        atomic_write_json(self.runtime.state_path, state, mode=0o644)
+        atomic_write_json(self.runtime.state_path, state, mode=0o644, durability=VOLATILE)
 
     def save(self, state: dict[str, Any]) -> None:
         with self._lock:
-            self._write_state(state)
+            self._state = state
+            self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        # Callers hold self._lock. Bursts of updates (a fake backup logging and
+        # changing status) coalesce into one state.json write per delay window.
+        self._dirty = True
+        if self._flush_timer is None:
+            self._flush_timer = threading.Timer(FAKE_STATE_FLUSH_DELAY_SECONDS, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def flush(self) -> None:
+        """Write pending in-memory state to state.json now."""
+        with self._flush_lock:
+            with self._lock:
+                if self._flush_timer is not None:
+                    self._flush_timer.cancel()
+                    self._flush_timer = None
+                if not self._dirty:
+                    return
+                self._dirty = False
+                snapshot = json.loads(json.dumps(self._state))
+            # Fake data directories are often temporary; never recreate one that
+            # was removed while a write was pending.
+            if not self.runtime.state_path.parent.is_dir():
+                return
+            try:
+                self._write_state(snapshot)
+            except OSError:
+                with self._lock:
+                    self._schedule_flush()
 
     def get_virtual_drives(self) -> list[dict[str, Any]]:
-        state = self.load()
-        mount_point = state.get("mount_point", str(self.runtime.backup_drive_dir))
-        partition_mount = mount_point if state.get("mounted") else ""
+        with self._lock:
+            mount_point = self._state.get("mount_point", str(self.runtime.backup_drive_dir))
+            partition_mount = mount_point if self._state.get("mounted") else ""
+            selected_drive = self._state.get("selected_drive", "/dev/fakebackup1")
         return [
             {
                 "path": "/dev/fakebackup",
@@ -122,7 +183,7 @@ class FakeState:
                 "type": "usb",
                 "partitions": [
                     {
-                        "path": state.get("selected_drive", "/dev/fakebackup1"),
+                        "path": selected_drive,
                         "type": "ntfs",
                         "label": "DEV_BACKUP",
                         "size": "Local Folder",
@@ -136,31 +197,32 @@ class FakeState:
         self, mounted: bool, mount_point: str | None = None, drive: str | None = None
     ) -> None:
         with self._lock:
-            state = self.load()
-            state["mounted"] = mounted
+            self._state["mounted"] = mounted
             if mount_point:
-                state["mount_point"] = mount_point
+                self._state["mount_point"] = mount_point
             if drive:
-                state["selected_drive"] = drive
-            self.save(state)
+                self._state["selected_drive"] = drive
+            self._schedule_flush()
 
     def is_mounted(self, mount_point: str | None = None) -> bool:
-        state = self.load()
-        if mount_point and state.get("mount_point") != mount_point:
-            return False
-        return bool(state.get("mounted"))
+        with self._lock:
+            if mount_point and self._state.get("mount_point") != mount_point:
+                return False
+            return bool(self._state.get("mounted"))
 
     def set_smb_services(self, smbd: str, nmbd: str, wsdd2: str = "active") -> None:
         with self._lock:
-            state = self.load()
-            state["smb_services"] = {"smbd": smbd, "nmbd": nmbd, "wsdd2": wsdd2}
-            self.save(state)
+            self._state["smb_services"] = {"smbd": smbd, "nmbd": nmbd, "wsdd2": wsdd2}
+            self._schedule_flush()
 
     def get_smb_services(self) -> dict[str, str]:
-        services = self.load().get(
-            "smb_services",
-            {"smbd": "active", "nmbd": "active", "wsdd2": "active"},
-        )
+        with self._lock:
+            services = dict(
+                self._state.get(
+                    "smb_services",
+                    {"smbd": "active", "nmbd": "active", "wsdd2": "active"},
+                )
+            )
         # Fake state can survive across branch changes; normalize old two-unit
         # snapshots so UI tests and manual fake-mode sessions match real status.
         return {
@@ -179,40 +241,95 @@ class FakeState:
         log: str | None = None,
     ) -> None:
         with self._lock:
-            state = self.load()
-            task_state = state.setdefault("tasks", {}).setdefault(task_name, {})
+            task_state = self._state.setdefault("tasks", {}).setdefault(task_name, {})
             if status is not None:
                 task_state["status"] = status
             if last_run is not None:
                 task_state["last_run"] = last_run
             if last_run_duration is not None:
                 task_state["last_run_duration"] = last_run_duration
+            self._schedule_flush()
             if log is not None:
-                task_state["log"] = log
-            self.save(state)
+                self._task_log_path(task_name).write_text(log, encoding="utf-8")
+                self._task_logs.pop(task_name, None)
+
+    def _task_log_path(self, task_name: str) -> Path:
+        return self.runtime.tasks_log_dir / f"{task_name.lower().replace(' ', '_')}.log"
+
+    def _task_log_buffer(self, task_name: str) -> deque[tuple[int, str]]:
+        """Return the recent-lines ring for ``task_name``, seeding it from the file tail.
+
+        Each entry is ``(end_offset, line)`` where ``end_offset`` is the byte
+        offset in the log file just past that line, so readers can resume.
+        """
+        buffer = self._task_logs.get(task_name)
+        if buffer is not None:
+            return buffer
+        buffer = deque(maxlen=FAKE_TASK_LOG_BUFFER_LINES)
+        size = start = 0
+        try:
+            with self._task_log_path(task_name).open("rb") as log_file:
+                size = log_file.seek(0, os.SEEK_END)
+                start = max(0, size - FAKE_TASK_LOG_TAIL_BYTES)
+                log_file.seek(start)
+                tail = log_file.read()
+        except FileNotFoundError:
+            tail = b""
+        else:
+            if start:
+                # Drop the partial first line of a tail that starts mid-file.
+                newline = tail.find(b"\n")
+                start += newline + 1
+                tail = tail[newline + 1 :]
+        offset = start
+        for raw_line in tail.splitlines(keepends=True):
+            offset += len(raw_line)
+            buffer.append((offset, raw_line.decode("utf-8", errors="replace")))
+        self._task_logs[task_name] = buffer
+        self._task_log_sizes[task_name] = size
+        return buffer
 
     def append_task_log(self, task_name: str, message: str) -> None:
         now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        entry = f"{now} {message}\n".encode()
         with self._lock:
-            state = self.load()
-            task_state = state.setdefault("tasks", {}).setdefault(task_name, {})
-            current = task_state.get("log", "")
-            task_state["log"] = f"{current}{now} {message}\n"
-            self.save(state)
-            log_path = self.runtime.tasks_log_dir / f"{task_name.lower().replace(' ', '_')}.log"
-            log_path.write_text(task_state["log"])
+            buffer = self._task_log_buffer(task_name)
+            # Appending keeps each log write proportional to the new entry
+            # instead of rewriting the whole history on every line.
+            with self._task_log_path(task_name).open("ab") as log_file:
+                log_file.write(entry)
+            offset = self._task_log_sizes[task_name]
+            for raw_line in entry.splitlines(keepends=True):
+                offset += len(raw_line)
+                buffer.append((offset, raw_line.decode("utf-8", errors="replace")))
+            self._task_log_sizes[task_name] = offset
 
     def get_task_log(self, task_name: str) -> str:
-        state = self.load()
-        task_state = state.setdefault("tasks", {}).setdefault(task_name, {})
-        return task_state.get("log", "") or "No logs yet."
+        with self._lock:
+            buffer = self._task_log_buffer(task_name)
+            return "".join(line for _offset, line in buffer) or "No logs yet."
+
+    def read_task_log(self, task_name: str, offset: int = 0) -> tuple[str, int]:
+        """Return buffered log text written after ``offset`` and the offset to resume from.
+
+        An offset past the end means the log was reset, so the whole buffer is returned.
+        """
+        with self._lock:
+            buffer = self._task_log_buffer(task_name)
+            size = self._task_log_sizes[task_name]
+            if offset > size:
+                offset = 0
+            lines = [line for end_offset, line in buffer if end_offset > offset]
+            return "".join(lines), size
 
     def get_task_state(self, task_name: str) -> dict[str, Any]:
-        state = self.load()
-        return state.setdefault("tasks", {}).setdefault(
-            task_name,
-            {"status": "Not Run Yet", "last_run": "", "last_run_duration": "-", "log": ""},
-        )
+        with self._lock:
+            return dict(
+                self._state.setdefault("tasks", {}).setdefault(
+                    task_name,
+                    {"status": "Not Run Yet", "last_run": "", "last_run_duration": "-"},
+                )
+            )
 
     def get_next_run(self, task_name: str, backup_time: str) -> str:
         try:
@@ -402,5 +519,8 @@ def get_fake_state(runtime: Runtime | None = None) -> FakeState:
     global _fake_state
     runtime = runtime or get_runtime()
     if _fake_state is None or _fake_state.runtime != runtime:
+        if _fake_state is not None:
+            _fake_state.flush()
         _fake_state = FakeState(runtime)
+        atexit.register(_fake_state.flush)
     return _fake_state
@@ -7,7 +7,7 @@ from typing import Any
 from simple_safer_server.adapters.server_identity_commands import (
     ServerIdentityCommandAdapter,
 )
-from simple_safer_server.services.file_persistence import atomic_write_text
+from simple_safer_server.services.file_persistence import DURABLE, atomic_write_text
 from simple_safer_server.services.runtime import get_runtime
 
 LOGGER = logging.getLogger(__name__)
@@ -216,15 +216,15 @@ class ServerIdentityService:
         if updated != content:
             backup_path = self.hosts_path.with_name(f"{self.hosts_path.name}.SimpleSaferServer.bak")
             if content and not backup_path.exists():
-                atomic_write_text(backup_path, content, mode=0o644)
-            atomic_write_text(self.hosts_path, updated, mode=0o644)
+                atomic_write_text(backup_path, content, mode=0o644, durability=DURABLE)
+            atomic_write_text(self.hosts_path, updated, mode=0o644, durability=DURABLE)
         return content
 
     def _restore_hosts_file(self, content: str | None) -> None:
         if content is None:
             return
         try:
-            atomic_write_text(self.hosts_path, content, mode=0o644)
+            atomic_write_text(self.hosts_path, content, mode=0o644, durability=DURABLE)
         except Exception:
             LOGGER.exception("Failed to restore %s after hostname update failure", self.hosts_path)
 
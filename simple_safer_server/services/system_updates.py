@@ -11,8 +11,13 @@ from pathlib import Path
 from typing import Any
 
 from simple_safer_server.adapters.command_runner import CalledProcessError, TimeoutExpired
+from simple_safer_server.adapters.process_output import ProcessOutputMultiplexer
 from simple_safer_server.adapters.system_updates_commands import SystemUpdatesCommandAdapter
-from simple_safer_server.services.file_persistence import atomic_write_json, atomic_write_text
+from simple_safer_server.services.file_persistence import (
+    VOLATILE,
+    CoalescingJsonWriter,
+    atomic_write_text,
+)
 from simple_safer_server.services.os_support import (
     DEFAULT_AUTOCLEAN_INTERVAL_DAYS,
     SUPPORT_SOURCES,
@@ -98,16 +103,20 @@ def _is_apt_process(name: str, cmdline_parts: list[str]) -> bool:
 
 
 class SystemUpdatesManager:
-    def __init__(self, config_manager, runtime=None, command_adapter=None):
+    def __init__(self, config_manager, runtime=None, command_adapter=None, process_output=None):
         self.config_manager = config_manager
         self.runtime = runtime or get_runtime()
         self.command_adapter = command_adapter or SystemUpdatesCommandAdapter()
+        self.process_output = process_output or ProcessOutputMultiplexer()
         self.state_path = self.runtime.volatile_dir / "system_updates_state.json"
         self.state_log_path = self.runtime.volatile_dir / "system_updates.log"
         self._lock = threading.RLock()
         self._thread: threading.Thread | None = None
         self._process: Any | None = None
         self._cancel_event: threading.Event | None = None
+        # apt progress lines update the state many times a second; coalesce
+        # them so pollers see one state.json replace per window.
+        self._state_writer = CoalescingJsonWriter()
         self.state_path.parent.mkdir(parents=True, exist_ok=True)
         self.state_log_path.parent.mkdir(parents=True, exist_ok=True)
         if not self.state_path.exists():
@@ -128,7 +137,7 @@ class SystemUpdatesManager:
 
     def _read_state(self) -> dict[str, Any]:
         try:
-            state = json.loads(self.state_path.read_text(encoding="utf-8"))
+            state = self._state_writer.read(self.state_path, {})
         except Exception:
             state = self._default_state()
         state = {**self._default_state(), **state}
@@ -146,7 +155,13 @@ class SystemUpdatesManager:
         state_without_log.pop("log", None)
         # Readers poll this file from the UI, so replace it atomically instead
         # of exposing half-written JSON during an update.
-        atomic_write_json(self.state_path, state_without_log, mode=0o644, durable=False)
+        self._state_writer.publish(
+            self.state_path, state_without_log, mode=0o644, durability=VOLATILE
+        )
+        if state_without_log.get("status") != "running":
+            # Terminal and idle states are published at once so other workers
+            # and the next process never start from a stale "running" state.
+            self._state_writer.flush(self.state_path)
 
     def _update_state(self, **updates) -> dict[str, Any]:
         with self._lock:
@@ -158,7 +173,7 @@ class SystemUpdatesManager:
                     self.state_log_path,
                     updates.pop("log") or "",
                     mode=0o644,
-                    durable=False,
+                    durability=VOLATILE,
                 )
             state.update(updates)
             self._write_state(state)
@@ -404,17 +419,18 @@ class SystemUpdatesManager:
                 self._process = proc
 
             progress = 5
-            if proc.stdout:
-                for raw_line in iter(proc.stdout.readline, ""):
-                    if not raw_line and proc.poll() is not None:
-                        break
-                    line = raw_line.rstrip()
-                    if line:
-                        self._append_log(line)
-                        progress, phase = self._progress_from_line(operation, line, progress)
-                        self._update_state(progress=progress, phase=phase)
-                    if cancel_event.is_set():
-                        break
+
+            def _on_line(_stream: str, raw_line: str) -> None:
+                nonlocal progress
+                line = raw_line.rstrip()
+                if line:
+                    self._append_log(line)
+                    progress, phase = self._progress_from_line(operation, line, progress)
+                    self._update_state(progress=progress, phase=phase)
+
+            # No cancel_event here: stop_operation signals apt's whole process
+            # group itself, and the watch ends as soon as apt-get exits.
+            self.process_output.watch(proc, _on_line).wait()
 
             if cancel_event.is_set() and proc.poll() is None:
                 self.command_adapter.terminate_process(proc)
@@ -5,8 +5,9 @@ import re
 import shutil
 
 from simple_safer_server.adapters.command_runner import CalledProcessError, CommandRunner
+from simple_safer_server.services.block_devices import block_device_index
 from simple_safer_server.services.disabled_timers import DISABLED_TIMERS_FILENAME
-from simple_safer_server.services.file_persistence import atomic_write_text, read_json
+from simple_safer_server.services.file_persistence import DURABLE, atomic_write_text, read_json
 from simple_safer_server.services.runtime import get_fake_state, get_runtime
 from simple_safer_server.services.schedule_time import systemd_schedule_time
 
@@ -49,7 +50,7 @@ class SystemUtils:
 
             # Write rclone config
             config_path = rclone_dir / 'rclone.conf'
-            atomic_write_text(config_path, config, mode=0o600)
+            atomic_write_text(config_path, config, mode=0o600, durability=DURABLE)
 
             return True
         except Exception as e:
@@ -74,7 +75,7 @@ password {password}
 account default : simplesaferserver
 """
             path = self.runtime.msmtp_config_path
-            atomic_write_text(path, content, mode=0o600)
+            atomic_write_text(path, content, mode=0o600, durability=DURABLE)
             return True
         except Exception as e:
             self.logger.error(f"Error writing msmtp config: {e}")
@@ -84,8 +85,11 @@ account default : simplesaferserver
         """Given a partition device path (e.g. /dev/sda1), return the parent drive (e.g. /dev/sda)."""
         if self.runtime.is_fake and partition_path.startswith('/dev/fakebackup'):
             return '/dev/fakebackup'
+        parent = block_device_index.parent_device(partition_path)
+        if parent:
+            return parent
         try:
-            # Use lsblk to get the parent device
+            # Fall back to lsblk when sysfs cannot answer
             result = self.run_command(['lsblk', '-no', 'PKNAME', partition_path])
             if result:
                 parent = result.strip()
@@ -146,6 +150,7 @@ account default : simplesaferserver
                 'ddns_update.sh',
                 'ddns_update.py',
                 'restore_disabled_timers.py',
+                'record_task_run.py',
             ]
 
             for script_file in script_files:
@@ -223,7 +228,7 @@ account default : simplesaferserver
             # Write the config file
             config_path = config_dir / 'config.conf'
             # This file contains backup/DDNS credentials and is read by root-owned services.
-            atomic_write_text(config_path, config_content, mode=0o600)
+            atomic_write_text(config_path, config_content, mode=0o600, durability=DURABLE)
             self.logger.info(f"Created systemd config file: {config_path}")
             return True, None
         except Exception as e:
@@ -271,6 +276,7 @@ After=network.target
 [Service]
 Type=oneshot
 ExecStart=/usr/local/bin/check_mount.sh
+ExecStopPost=-/opt/SimpleSaferServer/.venv/bin/python /opt/SimpleSaferServer/scripts/record_task_run.py %n
 User=root
 StandardOutput=journal
 StandardError=journal
@@ -285,6 +291,7 @@ After=network.target
 [Service]
 Type=oneshot
 ExecStart=/usr/local/bin/check_health.sh
+ExecStopPost=-/opt/SimpleSaferServer/.venv/bin/python /opt/SimpleSaferServer/scripts/record_task_run.py %n
 User=root
 StandardOutput=journal
 StandardError=journal
@@ -299,6 +306,7 @@ After=network.target
 [Service]
 Type=oneshot
 ExecStart=/usr/local/bin/backup_cloud.sh
+ExecStopPost=-/opt/SimpleSaferServer/.venv/bin/python /opt/SimpleSaferServer/scripts/record_task_run.py %n
 User=root
 StandardOutput=journal
 StandardError=journal
@@ -347,6 +355,7 @@ Wants=network-online.target
 [Service]
 Type=oneshot
 ExecStart=/usr/local/bin/ddns_update.sh
+ExecStopPost=-/opt/SimpleSaferServer/.venv/bin/python /opt/SimpleSaferServer/scripts/record_task_run.py %n
 User=root
 StandardOutput=journal
 StandardError=journal
@@ -375,6 +384,7 @@ Wants=network-online.target
 [Service]
 Type=oneshot
 ExecStart=/usr/local/bin/app_update.sh
+ExecStopPost=-/opt/SimpleSaferServer/.venv/bin/python /opt/SimpleSaferServer/scripts/record_task_run.py %n
 User=root
 StandardOutput=journal
 StandardError=journal
@@ -422,7 +432,7 @@ WantedBy=timers.target
             # Write all service and timer files
             for filename, content in services.items():
                 file_path = self.runtime.systemd_dir / filename
-                atomic_write_text(file_path, content, mode=0o644)
+                atomic_write_text(file_path, content, mode=0o644, durability=DURABLE)
                 self.logger.info(f"Created systemd file: {file_path}")
 
             # Reload after writing the units so systemd sees the current generated files even
@@ -0,0 +1,187 @@
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+TASK_HISTORY_FILENAME = "task_history.sqlite3"
+TASK_HISTORY_RETENTION_DAYS = 400
+TASK_HISTORY_PAGE_LIMIT = 200
+
+# The UNIQUE key doubles as the (unit, started_at) index every query reads, and
+# lets the unit hook and the web app both record the same run without coordinating.
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS task_runs (
+    id INTEGER PRIMARY KEY,
+    unit TEXT NOT NULL,
+    started_at REAL NOT NULL,
+    finished_at REAL,
+    result TEXT NOT NULL,
+    exit_code INTEGER,
+    UNIQUE (unit, started_at)
+)
+"""
+
+
+def _format_time(value: float | None) -> str:
+    if value is None:
+        return ""
+    return datetime.fromtimestamp(value).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _run_from_row(row: sqlite3.Row) -> dict[str, Any]:
+    started_at = row["started_at"]
+    finished_at = row["finished_at"]
+    duration = None
+    if finished_at is not None:
+        duration = max(0, int(finished_at - started_at))
+    return {
+        "id": row["id"],
+        "unit": row["unit"],
+        "started_at": _format_time(started_at),
+        "finished_at": _format_time(finished_at),
+        "duration_seconds": duration,
+        "result": row["result"],
+        "exit_code": row["exit_code"],
+        "success": row["result"] == "success",
+    }
+
+
+class TaskHistoryStore:
+    """Indexed SQLite history of finished task runs.
+
+    The web app and the ExecStopPost hook write to the same WAL-mode database,
+    so readers never block the writer and history outlives journal vacuuming.
+    """
+
+    def __init__(self, db_path: Path, *, timeout: float = 5.0) -> None:
+        self.db_path = db_path
+        self._timeout = timeout
+        self._local = threading.local()
+        self._schema_lock = threading.Lock()
+        self._schema_ready = False
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            return connection
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(str(self.db_path), timeout=self._timeout)
+        connection.row_factory = sqlite3.Row
+        connection.execute("PRAGMA journal_mode=WAL")
+        # History is rebuilt from the next snapshot if the last commit is lost,
+        # so WAL's NORMAL sync level is enough and keeps inserts cheap.
+        connection.execute("PRAGMA synchronous=NORMAL")
+        with self._schema_lock:
+            if not self._schema_ready:
+                with connection:
+                    connection.execute(_SCHEMA)
+                self._schema_ready = True
+        self._local.connection = connection
+        return connection
+
+    def record_run(
+        self,
+        unit: str,
+        started_at: float,
+        finished_at: float | None,
+        result: str,
+        exit_code: int | None = None,
+    ) -> bool:
+        """Record one finished run; returns False when it was already recorded."""
+        return (
+            self.record_runs(
+                [
+                    {
+                        "unit": unit,
+                        "started_at": started_at,
+                        "finished_at": finished_at,
+                        "result": result,
+                        "exit_code": exit_code,
+                    }
+                ]
+            )
+            == 1
+        )
+
+    def record_runs(self, runs: Iterable[dict[str, Any]]) -> int:
+        connection = self._connection()
+        with connection:
+            before = connection.total_changes
+            connection.executemany(
+                "INSERT OR IGNORE INTO task_runs "
+                "(unit, started_at, finished_at, result, exit_code) "
+                "VALUES (:unit, :started_at, :finished_at, :result, :exit_code)",
+                list(runs),
+            )
+            return connection.total_changes - before
+
+    def history(
+        self,
+        unit: str,
+        limit: int = 50,
+        before_id: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Return the newest runs of ``unit``, paging backwards from ``before_id``."""
+        limit = max(1, min(limit, TASK_HISTORY_PAGE_LIMIT))
+        query = "SELECT * FROM task_runs WHERE unit = ?"
+        params: list[Any] = [unit]
+        if before_id is not None:
+            query += (
+                " AND started_at < (SELECT started_at FROM task_runs WHERE id = ? AND unit = ?)"
+            )
+            params.extend([before_id, unit])
+        query += " ORDER BY started_at DESC LIMIT ?"
+        params.append(limit)
+        rows = self._connection().execute(query, params).fetchall()
+        return [_run_from_row(row) for row in rows]
+
+    def latest_runs(self) -> dict[str, dict[str, Any]]:
+        """Return the most recent recorded run of every unit."""
+        rows = (
+            self._connection()
+            .execute(
+                "SELECT task_runs.* FROM task_runs JOIN ("
+                "SELECT unit, MAX(started_at) AS started_at FROM task_runs GROUP BY unit"
+                ") latest USING (unit, started_at)"
+            )
+            .fetchall()
+        )
+        return {row["unit"]: _run_from_row(row) for row in rows}
+
+    def failure_stats(self, since: float) -> dict[str, dict[str, Any]]:
+        """Return run and failure counts per unit for runs started after ``since``."""
+        rows = (
+            self._connection()
+            .execute(
+                "SELECT unit, COUNT(*) AS runs, "
+                "SUM(CASE WHEN result = 'success' THEN 0 ELSE 1 END) AS failures "
+                "FROM task_runs WHERE started_at >= ? GROUP BY unit",
+                (since,),
+            )
+            .fetchall()
+        )
+        return {
+            row["unit"]: {
+                "runs": row["runs"],
+                "failures": row["failures"],
+                "failure_rate": round(row["failures"] / row["runs"], 4),
+            }
+            for row in rows
+        }
+
+    def prune(self, retention_days: int = TASK_HISTORY_RETENTION_DAYS) -> int:
+        cutoff = time.time() - retention_days * 86400
+        connection = self._connection()
+        with connection:
+            return connection.execute(
+                "DELETE FROM task_runs WHERE started_at < ?", (cutoff,)
+            ).rowcount
+
+    def close(self) -> None:
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
@@ -1,8 +1,10 @@
 import os
-import queue
+import re
+import sqlite3
 import sys
 import threading
 import time
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Any
 
@@ -10,8 +12,8 @@ from simple_safer_server.adapters.command_runner import (
     PIPE,
     CommandRunner,
     SubprocessError,
-    TimeoutExpired,
 )
+from simple_safer_server.adapters.process_output import ProcessOutputMultiplexer, ProcessWatch
 from simple_safer_server.adapters.rclone import RcloneAdapter
 from simple_safer_server.adapters.systemd import CalledProcessError, SystemdAdapter
 from simple_safer_server.services.disabled_timers import (
@@ -20,6 +22,8 @@ from simple_safer_server.services.disabled_timers import (
     utc_now,
 )
 from simple_safer_server.services.drive_health import (
+    DriveHealthSummaryService,
+    get_drive_health_summary_path,
     hdsentinel_snapshot_has_health,
     run_scheduled_drive_health_check,
 )
@@ -41,6 +45,36 @@ TERMINAL_FAKE_STATUSES = {Status.SUCCESS, Status.FAILURE, Status.ERROR, Status.S
 # do not quietly drift apart after app-update output grows or shrinks.
 TASK_LOG_LINE_LIMIT = 500
 
+# journald cursors are "s=<hex>;i=<hex>;b=<hex>..." strings and fake mode uses a
+# plain offset. Anything else is treated as a fresh load, never passed to journalctl.
+TASK_LOG_CURSOR_PATTERN = re.compile(
+    r"\d{1,20}|[a-z]=[0-9a-f]{1,64}(?:;[a-z]=[0-9a-f]{1,64}){0,15}"
+)
+
+# Every systemd property the task views read. Summaries fetch all of them for
+# every task service and timer in one `systemctl show` call instead of forking
+# once per property per task.
+TASK_SYSTEMD_PROPERTIES = (
+    "LoadState",
+    "ActiveState",
+    "UnitFileState",
+    "Result",
+    "ExecMainStartTimestamp",
+    "ExecMainStartTimestampMonotonic",
+    "ExecMainExitTimestamp",
+    "ExecMainExitTimestampMonotonic",
+    "ExecMainStatus",
+    "NextElapseUSecRealtime",
+)
+# Units that are still running report the previous run's exit fields, so only
+# settled units are turned into history records.
+TASK_RUNNING_STATES = {"activating", "active", "deactivating", "reloading"}
+TASK_HISTORY_STATS_DAYS = 30
+# Status polls from every open tab share one systemd snapshot for this long.
+# Task actions invalidate it immediately, so the TTL only bounds how late an
+# externally triggered change (a timer firing, a manual systemctl) can appear.
+TASK_STATE_CACHE_TTL_SECONDS = 2.0
+
 
 def parse_systemd_datetime(value: str) -> datetime | None:
     if not value or value in {"Unknown", "Retrieval Error"}:
@@ -58,6 +92,38 @@ def parse_systemd_datetime(value: str) -> datetime | None:
     return None
 
 
+def finished_run_from_properties(
+    unit_name: str,
+    properties: dict[str, str],
+    result: str | None = None,
+) -> dict[str, Any] | None:
+    """Build a task history record from a service's systemd properties.
+
+    Returns None while the unit is running or when it has never finished a run.
+    ``result`` overrides the unit's Result for ExecStopPost hooks, which run
+    before systemd settles it.
+    """
+    if result is None:
+        if properties.get("ActiveState") in TASK_RUNNING_STATES:
+            return None
+        result = properties.get("Result", "")
+    started_at = parse_systemd_datetime(properties.get("ExecMainStartTimestamp", ""))
+    if not result or started_at is None:
+        return None
+    finished_at = parse_systemd_datetime(properties.get("ExecMainExitTimestamp", ""))
+    try:
+        exit_code: int | None = int(properties.get("ExecMainStatus", ""))
+    except ValueError:
+        exit_code = None
+    return {
+        "unit": unit_name,
+        "started_at": started_at.timestamp(),
+        "finished_at": finished_at.timestamp() if finished_at else None,
+        "result": result,
+        "exit_code": exit_code,
+    }
+
+
 def format_compact_schedule_datetime(value: datetime | None, now: datetime) -> str:
     if value is None:
         return "Unknown"
@@ -76,6 +142,68 @@ def clamp_task_log_lines(lines: Any) -> int:
     return max(1, min(parsed_lines, TASK_LOG_LINE_LIMIT))
 
 
+@dataclass(frozen=True)
+class TaskLogPage:
+    """A slice of task log text plus the cursor to resume from.
+
+    ``append`` is False when ``text`` is a full window that replaces what the
+    caller already shows, and True when it only holds entries after the cursor.
+    """
+
+    text: str
+    cursor: str | None
+    append: bool
+
+
+class TaskStateCache:
+    """Single-flight, TTL-bounded holder for the latest task state snapshot.
+
+    Concurrent callers that miss the cache wait for the one in-flight load
+    instead of starting their own. A load that overlaps ``invalidate()`` is
+    returned to its caller but never cached, so a read started before a task
+    action cannot mask that action's effect.
+    """
+
+    def __init__(self, ttl: float, clock: Any = time.monotonic) -> None:
+        self._ttl = ttl
+        self._clock = clock
+        self._condition = threading.Condition()
+        self._value: Any | None = None
+        self._expires_at = 0.0
+        self._loading = False
+        self._generation = 0
+
+    def get(self, load: Any) -> Any:
+        with self._condition:
+            while True:
+                if self._value is not None and self._clock() < self._expires_at:
+                    return self._value
+                if not self._loading:
+                    break
+                self._condition.wait()
+            self._loading = True
+            generation = self._generation
+        try:
+            value = load()
+        except BaseException:
+            with self._condition:
+                self._loading = False
+                self._condition.notify_all()
+            raise
+        with self._condition:
+            self._loading = False
+            if value is not None and generation == self._generation:
+                self._value = value
+                self._expires_at = self._clock() + self._ttl
+            self._condition.notify_all()
+        return value
+
+    def invalidate(self) -> None:
+        with self._condition:
+            self._generation += 1
+            self._value = None
+
+
 class Task:
     def __init__(self, service: TaskService, name: str, service_name: str, timer_name: str):
         self._service = service
@@ -87,6 +215,12 @@ class Task:
         """Return the latest systemd journal logs for this service."""
         return self._service.get_logs(self, lines)
 
+    def get_log_page(
+        self, cursor: str | None = None, lines: int = TASK_LOG_LINE_LIMIT
+    ) -> TaskLogPage:
+        """Return log entries after ``cursor``, or the latest window without one."""
+        return self._service.get_log_page(self, cursor, lines)
+
     def start(self) -> None:
         """Start the associated service asynchronously."""
         self._service.start_task(self)
@@ -130,6 +264,9 @@ class TaskService:
         systemd_adapter: SystemdAdapter | None = None,
         rclone_adapter: RcloneAdapter | None = None,
         disabled_timer_service: DisabledTimerService | None = None,
+        state_cache_ttl: float = TASK_STATE_CACHE_TTL_SECONDS,
+        history_store: Any | None = None,
+        process_output: ProcessOutputMultiplexer | None = None,
     ):
         self.runtime = runtime
         self.config_manager = config_manager
@@ -139,6 +276,7 @@ class TaskService:
         self.command_runner = command_runner or CommandRunner()
         self.systemd_adapter = systemd_adapter or SystemdAdapter(self.command_runner)
         self.rclone_adapter = rclone_adapter or RcloneAdapter(self.command_runner)
+        self.process_output = process_output or ProcessOutputMultiplexer()
         self.disabled_timer_service = disabled_timer_service or DisabledTimerService(
             runtime,
             self.systemd_adapter,
@@ -147,6 +285,10 @@ class TaskService:
         self._fake_task_threads: dict[str, threading.Thread] = {}
         self._fake_task_cancel_events: dict[str, threading.Event] = {}
         self._fake_task_lock = threading.Lock()
+        self._state_cache = TaskStateCache(state_cache_ttl)
+        self.history_store = history_store
+        self._last_recorded_starts: dict[str, float] = {}
+        self._record_runs_lock = threading.Lock()
         self._tasks = [
             Task(self, "Check Mount", "check_mount.service", "check_mount.timer"),
             Task(self, "Drive Health Check", "check_health.service", "check_health.timer"),
@@ -161,15 +303,21 @@ class TaskService:
                 return task
         return None
 
-    def task_summary(self, task: Task) -> dict[str, Any]:
+    def task_summary(
+        self,
+        task: Task,
+        snapshot: dict[str, dict[str, str]] | None = None,
+    ) -> dict[str, Any]:
         try:
-            schedule = self.schedule_state(task)
+            if snapshot is None:
+                snapshot = self.systemd_snapshot()
+            schedule = self.schedule_state(task, snapshot)
             return {
                 "name": task.name,
                 "next_run": schedule["label"],
-                "last_run": task.last_run,
-                "status": task.status,
-                "last_run_duration": task.last_run_duration,
+                "last_run": self.get_last_run(task, snapshot),
+                "status": self.get_status(task, snapshot),
+                "last_run_duration": self.get_last_run_duration(task, snapshot),
                 "schedule": schedule,
             }
         except Exception as exc:
@@ -192,7 +340,118 @@ class TaskService:
             }
 
     def task_summaries(self) -> list[dict[str, Any]]:
-        return [self.task_summary(task) for task in self._tasks]
+        snapshot = self.systemd_snapshot()
+        return [self.task_summary(task, snapshot) for task in self._tasks]
+
+    def task_run_state(self, task: Task) -> dict[str, str]:
+        """Return raw run fields for one task from a single systemd snapshot."""
+        snapshot = self.systemd_snapshot()
+        return {
+            "status": self.get_status(task, snapshot),
+            "last_run": self.get_last_run(task, snapshot),
+            "next_run": self.get_next_run(task, snapshot),
+            "last_run_duration": self.get_last_run_duration(task, snapshot),
+        }
+
+    def systemd_snapshot(self) -> dict[str, dict[str, str]] | None:
+        """Return the cached service and timer properties of every task.
+
+        Returns ``None`` in fake mode or when systemd cannot be queried; the
+        per-field getters then fall back to their own lookups and report
+        retrieval errors the same way they always have.
+        """
+        if self.runtime.is_fake:
+            return None
+        try:
+            return self._cached_systemd_snapshot()
+        except (CalledProcessError, ValueError) as exc:
+            if self.logger:
+                self.logger.warning("Could not read task state from systemd: %s", exc)
+            return None
+
+    def invalidate_state_cache(self) -> None:
+        self._state_cache.invalidate()
+
+    def _cached_systemd_snapshot(self) -> dict[str, dict[str, str]]:
+        # One batched read covers every task, so a cache miss costs the same
+        # single systemd query whether the caller wanted one task or all of them.
+        snapshot = self._state_cache.get(self._load_systemd_snapshot)
+        # Every snapshot doubles as a history sample, so runs are captured even
+        # on installs whose units predate the ExecStopPost recording hook. This
+        # runs after the loader returns so SQLite writes never hold up callers
+        # waiting on the in-flight systemd read; cached snapshots repeat runs
+        # that are already recorded and are skipped before reaching SQLite.
+        self._record_runs(
+            run
+            for task in self._tasks
+            if (
+                run := finished_run_from_properties(
+                    task.service_name, snapshot.get(task.service_name, {})
+                )
+            )
+        )
+        return snapshot
+
+    def _load_systemd_snapshot(self) -> dict[str, dict[str, str]]:
+        units = [unit for task in self._tasks for unit in (task.service_name, task.timer_name)]
+        return self.systemd_adapter.snapshot(units, TASK_SYSTEMD_PROPERTIES)
+
+    def _record_runs(self, runs: Any) -> None:
+        if self.history_store is None:
+            return
+        # Request threads and fake-task threads both record; holding the lock
+        # across the insert keeps the check and the bookkeeping atomic, so one
+        # run is written once. New runs are rare, so the insert is seldom held.
+        with self._record_runs_lock:
+            # Snapshots repeat the same last run until the next one finishes;
+            # skip those before they reach SQLite instead of relying on
+            # INSERT OR IGNORE.
+            new_runs = [
+                run
+                for run in runs
+                if self._last_recorded_starts.get(run["unit"]) != run["started_at"]
+            ]
+            if not new_runs:
+                return
+            try:
+                self.history_store.record_runs(new_runs)
+            except sqlite3.Error as exc:
+                if self.logger:
+                    self.logger.warning("Could not record task run history: %s", exc)
+                return
+            for run in new_runs:
+                self._last_recorded_starts[run["unit"]] = run["started_at"]
+
+    def task_history(
+        self,
+        task: Task,
+        limit: int = 50,
+        before_id: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Return recorded runs of ``task``, newest first."""
+        if self.history_store is None:
+            return []
+        try:
+            return self.history_store.history(task.service_name, limit=limit, before_id=before_id)
+        except sqlite3.Error as exc:
+            if self.logger:
+                self.logger.warning("Could not read task run history: %s", exc)
+            return []
+
+    def task_failure_stats(self, days: int = TASK_HISTORY_STATS_DAYS) -> dict[str, dict[str, Any]]:
+        """Return run and failure counts per task name over the last ``days``."""
+        if self.history_store is None:
+            return {}
+        try:
+            stats = self.history_store.failure_stats(time.time() - days * 86400)
+        except sqlite3.Error as exc:
+            if self.logger:
+                self.logger.warning("Could not read task run history: %s", exc)
+            return {}
+        return {
+            task.name: stats.get(task.service_name, {"runs": 0, "failures": 0, "failure_rate": 0.0})
+            for task in self._tasks
+        }
 
     def get_check_mount_next_run(self) -> str | None:
         check_mount_task = self.get_task("Check Mount")
@@ -213,7 +472,43 @@ class TaskService:
         except CalledProcessError:
             return "Retrieval Error"
 
+    def get_log_page(
+        self, task: Task, cursor: str | None = None, lines: int = TASK_LOG_LINE_LIMIT
+    ) -> TaskLogPage:
+        if cursor is not None and not TASK_LOG_CURSOR_PATTERN.fullmatch(cursor):
+            cursor = None
+        if self.runtime.is_fake:
+            return self._fake_log_page(task, cursor)
+        if cursor is not None:
+            try:
+                text, next_cursor = self.systemd_adapter.journal_page(
+                    task.service_name, lines, after_cursor=cursor
+                )
+                return TaskLogPage(text, next_cursor or cursor, append=True)
+            except CalledProcessError:
+                # A cursor from a vacuumed or rotated journal cannot be resumed;
+                # fall back to a fresh window instead of showing an error.
+                pass
+        try:
+            text, next_cursor = self.systemd_adapter.journal_page(task.service_name, lines)
+        except CalledProcessError:
+            return TaskLogPage("Retrieval Error", None, append=False)
+        return TaskLogPage(text, next_cursor, append=False)
+
+    def _fake_log_page(self, task: Task, cursor: str | None) -> TaskLogPage:
+        offset = int(cursor) if cursor is not None and cursor.isdigit() else 0
+        text, next_offset = self._require_fake_state().read_task_log(task.name, offset)
+        if offset and next_offset >= offset:
+            return TaskLogPage(text, str(next_offset), append=True)
+        return TaskLogPage(text or "No logs yet.", str(next_offset), append=False)
+
     def start_task(self, task: Task) -> None:
+        try:
+            self._start_task(task)
+        finally:
+            self.invalidate_state_cache()
+
+    def _start_task(self, task: Task) -> None:
         if self.runtime.is_fake:
             self._start_fake_task(task.name)
             return
@@ -223,6 +518,12 @@ class TaskService:
             raise RuntimeError(f"Failed to start {task.service_name}: {exc}") from exc
 
     def stop_task(self, task: Task) -> None:
+        try:
+            self._stop_task(task)
+        finally:
+            self.invalidate_state_cache()
+
+    def _stop_task(self, task: Task) -> None:
         if self.runtime.is_fake:
             fake_state = self._require_fake_state()
             with self._fake_task_lock:
@@ -231,6 +532,7 @@ class TaskService:
                 is_running = bool(thread and thread.is_alive() and cancel_event)
                 if is_running and cancel_event is not None:
                     cancel_event.set()
+                    self.process_output.wake()
             if is_running:
                 fake_state.append_task_log(task.name, f"Stopped {task.name} in fake mode.")
             else:
@@ -263,18 +565,28 @@ class TaskService:
             if hours is None:
                 raise ValueError("temporary schedule disable requires hours")
             expires_at = utc_now() + timedelta(hours=hours)
-        self.disabled_timer_service.disable(
-            task.name,
-            task.timer_name,
-            mode=mode,
-            expires_at=expires_at,
-        )
+        try:
+            self.disabled_timer_service.disable(
+                task.name,
+                task.timer_name,
+                mode=mode,
+                expires_at=expires_at,
+            )
+        finally:
+            self.invalidate_state_cache()
 
     def enable_schedule(self, task: Task) -> None:
-        self.disabled_timer_service.enable(task.timer_name)
+        try:
+            self.disabled_timer_service.enable(task.timer_name)
+        finally:
+            self.invalidate_state_cache()
 
-    def schedule_state(self, task: Task) -> dict[str, Any]:
-        raw_next_run = self.get_next_run(task)
+    def schedule_state(
+        self,
+        task: Task,
+        snapshot: dict[str, dict[str, str]] | None = None,
+    ) -> dict[str, Any]:
+        raw_next_run = self.get_next_run(task, snapshot)
         record = self.disabled_timer_service.get_record(task.timer_name)
         if record:
             state = "restore_failed" if record.get("restore_failed") else record.get("mode")
@@ -311,11 +623,12 @@ class TaskService:
             }
 
         try:
-            unit_state = self._systemd_property(task.timer_name, "UnitFileState")
-            active_state = self._systemd_property(task.timer_name, "ActiveState")
-            load_state = self._systemd_property(task.timer_name, "LoadState")
+            timer = self._unit_properties(task.timer_name, snapshot)
         except CalledProcessError as exc:
             return self._schedule_issue_state(raw_next_run, str(exc))
+        unit_state = timer["UnitFileState"]
+        active_state = timer["ActiveState"]
+        load_state = timer["LoadState"]
 
         if unit_state in {"disabled", "masked"}:
             return {
@@ -361,11 +674,16 @@ class TaskService:
             "can_enable": True,
         }
 
-    def _systemd_property(self, unit_name: str, property_name: str) -> str:
-        output = self.systemd_adapter.show_property(unit_name, property_name)
-        if "=" in output:
-            return output.split("=", 1)[1].strip()
-        return output.strip()
+    def _unit_properties(
+        self,
+        unit_name: str,
+        snapshot: dict[str, dict[str, str]] | None,
+    ) -> dict[str, str]:
+        if snapshot is None:
+            snapshot = self._cached_systemd_snapshot()
+        if unit_name in snapshot:
+            return snapshot[unit_name]
+        return self.systemd_adapter.snapshot([unit_name], TASK_SYSTEMD_PROPERTIES)[unit_name]
 
     def _format_compact_datetime(self, value: datetime | None) -> str:
         if value is not None and value.tzinfo is not None:
@@ -374,7 +692,11 @@ class TaskService:
             value = value.astimezone().replace(tzinfo=None)
         return format_compact_schedule_datetime(value, datetime.now())
 
-    def get_next_run(self, task: Task) -> str:
+    def get_next_run(
+        self,
+        task: Task,
+        snapshot: dict[str, dict[str, str]] | None = None,
+    ) -> str:
         if self.runtime.is_fake:
             if task.name == "DDNS Update":
                 # Fake-mode DDNS reports the next 5-minute boundary: start with
@@ -395,95 +717,85 @@ class TaskService:
             backup_time = self.config_manager.get_value("schedule", "backup_cloud_time", "03:00")
             return self._require_fake_state().get_next_run(task.name, backup_time or "03:00")
         try:
-            output = self.systemd_adapter.show_property(task.timer_name, "NextElapseUSecRealtime")
-            if "=" in output:
-                return output.split("=")[-1].strip()
-            return "Unknown"
+            timer = self._unit_properties(task.timer_name, snapshot)
         except CalledProcessError:
             return "Retrieval Error"
+        return timer["NextElapseUSecRealtime"] or "Unknown"
 
-    def get_last_run(self, task: Task) -> str:
+    def get_last_run(
+        self,
+        task: Task,
+        snapshot: dict[str, dict[str, str]] | None = None,
+    ) -> str:
         if self.runtime.is_fake:
             task_state = self._require_fake_state().get_task_state(task.name)
             return task_state.get("last_run") or "Not Run Yet"
         try:
-            output = self.systemd_adapter.show_property(task.service_name, "ExecMainStartTimestamp")
-            if "=" in output:
-                return output.split("=")[-1].strip()
-            return "Unknown"
+            service = self._unit_properties(task.service_name, snapshot)
         except CalledProcessError:
             return "Retrieval Error"
+        return service["ExecMainStartTimestamp"] or "Unknown"
 
-    def get_last_run_duration(self, task: Task) -> str:
+    def get_last_run_duration(
+        self,
+        task: Task,
+        snapshot: dict[str, dict[str, str]] | None = None,
+    ) -> str:
         if self.runtime.is_fake:
             task_state = self._require_fake_state().get_task_state(task.name)
             return task_state.get("last_run_duration", "-")
         try:
-            output = self.systemd_adapter.show_properties(
-                task.service_name,
-                "ExecMainStartTimestampMonotonic",
-                "ExecMainExitTimestampMonotonic",
-            )
-            start = exit_ts = None
-            for line in output.splitlines():
-                if line.startswith("ExecMainStartTimestampMonotonic="):
-                    value = line.split("=", 1)[1].strip()
-                    if value:
-                        start = int(value)
-                elif line.startswith("ExecMainExitTimestampMonotonic="):
-                    value = line.split("=", 1)[1].strip()
-                    if value:
-                        exit_ts = int(value)
-
-            if start is not None and exit_ts is not None and exit_ts >= start:
-                delta = timedelta(microseconds=exit_ts - start)
-                total_seconds = int(delta.total_seconds())
-                months, days = divmod(delta.days, 30)
-                hours, rem = divmod(total_seconds % 86400, 3600)
-                minutes, seconds = divmod(rem, 60)
-                parts = []
-                if months:
-                    parts.append(f"{months}mo")
-                if days:
-                    parts.append(f"{days}d")
-                if hours:
-                    parts.append(f"{hours}h")
-                if minutes:
-                    parts.append(f"{minutes}m")
-                parts.append(f"{seconds}s")
-                return " ".join(parts)
-            return "Unknown"
+            service = self._unit_properties(task.service_name, snapshot)
         except CalledProcessError:
             return "Retrieval Error"
+        start_value = service["ExecMainStartTimestampMonotonic"]
+        exit_value = service["ExecMainExitTimestampMonotonic"]
+        start = int(start_value) if start_value else None
+        exit_ts = int(exit_value) if exit_value else None
+
+        if start is not None and exit_ts is not None and exit_ts >= start:
+            delta = timedelta(microseconds=exit_ts - start)
+            total_seconds = int(delta.total_seconds())
+            months, days = divmod(delta.days, 30)
+            hours, rem = divmod(total_seconds % 86400, 3600)
+            minutes, seconds = divmod(rem, 60)
+            parts = []
+            if months:
+                parts.append(f"{months}mo")
+            if days:
+                parts.append(f"{days}d")
+            if hours:
+                parts.append(f"{hours}h")
+            if minutes:
+                parts.append(f"{minutes}m")
+            parts.append(f"{seconds}s")
+            return " ".join(parts)
+        return "Unknown"
 
-    def get_status(self, task: Task) -> str:
+    def get_status(
+        self,
+        task: Task,
+        snapshot: dict[str, dict[str, str]] | None = None,
+    ) -> str:
         if self.runtime.is_fake:
             task_state = self._require_fake_state().get_task_state(task.name)
             return task_state.get("status", Status.NOT_RUN_YET)
         try:
-            output = self.systemd_adapter.show_property(task.service_name, "LoadState")
-            if "not-found" in output:
-                return Status.MISSING
-
-            output = self.systemd_adapter.is_active(task.service_name)
-            if output == "activating":
-                return Status.RUNNING
-
-            result_output = self.systemd_adapter.show_property(task.service_name, "Result")
-            if "=" in result_output:
-                result_value = result_output.split("=")[-1].strip()
-                if result_value == "success":
-                    output = self.systemd_adapter.show_property(
-                        task.service_name, "ExecMainStartTimestamp"
-                    )
-                    if output.endswith("=") or output == "":
-                        return Status.NOT_RUN_YET
-                    return Status.SUCCESS
-                return Status.FAILURE
-
-            return Status.ERROR
+            service = self._unit_properties(task.service_name, snapshot)
         except CalledProcessError:
             return Status.ERROR
+        if service["LoadState"] == "not-found":
+            return Status.MISSING
+        if service["ActiveState"] == "activating":
+            return Status.RUNNING
+        result_value = service["Result"]
+        if result_value == "success":
+            if not service["ExecMainStartTimestamp"]:
+                return Status.NOT_RUN_YET
+            return Status.SUCCESS
+        if result_value:
+            return Status.FAILURE
+        return Status.ERROR
 
     def _run_fake_cloud_backup(self, cancel_event: threading.Event) -> None:
         fake_state = self._require_fake_state()
@@ -514,16 +826,12 @@ class TaskService:
             config_path=str(rclone_config_path) if rclone_config_path.exists() else None,
             bandwidth_limit=bandwidth_limit,
         )
-        stdout_output, stderr_output = self._collect_process_output(
-            proc, cancel_event, "fake-cloud-backup"
-        )
-        output = f"{stdout_output}{stderr_output}"
-        if output.strip():
-            fake_state.append_task_log("Cloud Backup", output.strip())
+        watch = self._stream_process_output("Cloud Backup", proc, cancel_event)
         if cancel_event.is_set():
             raise RuntimeError("Cloud backup was cancelled.")
         if proc.returncode != 0:
-            raise RuntimeError(output.strip() or "Cloud backup failed.")
+            output = "\n".join(line for line in watch.tail if line.strip())
+            raise RuntimeError(output or "Cloud backup failed.")
 
     def _start_fake_task(self, task_name: str) -> None:
         fake_state = self._require_fake_state()
@@ -571,6 +879,7 @@ class TaskService:
                 last_run_duration=f"{duration}s",
             )
             fake_state.append_task_log(task_name, f"{task_name} finished successfully.")
+            self._record_fake_run(task_name, start_time, "success")
         except Exception as exc:
             duration = max(0, int((datetime.now() - start_time).total_seconds()))
             if cancel_event.is_set():
@@ -580,6 +889,7 @@ class TaskService:
                     last_run=start_time.strftime("%Y-%m-%d %H:%M:%S"),
                     last_run_duration=f"{duration}s",
                 )
+                self._record_fake_run(task_name, start_time, "signal")
             else:
                 fake_state.set_task_state(
                     task_name,
@@ -587,6 +897,7 @@ class TaskService:
                     last_run=start_time.strftime("%Y-%m-%d %H:%M:%S"),
                     last_run_duration=f"{duration}s",
                 )
+                self._record_fake_run(task_name, start_time, "exit-code", exit_code=1)
                 fake_state.append_task_log(task_name, f"{task_name} failed: {exc}")
                 if self.logger:
                     self.logger.warning("Fake task %s failed: %s", task_name, exc)
@@ -597,6 +908,29 @@ class TaskService:
                     self._fake_task_threads.pop(task_name, None)
                     self._fake_task_cancel_events.pop(task_name, None)
 
+    def _record_fake_run(
+        self,
+        task_name: str,
+        start_time: datetime,
+        result: str,
+        exit_code: int = 0,
+    ) -> None:
+        task = self.get_task(task_name)
+        if task is None:
+            return
+        # Use systemd's Result vocabulary so fake and real history read the same.
+        self._record_runs(
+            [
+                {
+                    "unit": task.service_name,
+                    "started_at": start_time.timestamp(),
+                    "finished_at": time.time(),
+                    "result": result,
+                    "exit_code": exit_code,
+                }
+            ]
+        )
+
     def _run_fake_check_mount(self, task_name: str, cancel_event: threading.Event) -> None:
         fake_state = self._require_fake_state()
         mount_point = self.config_manager.get_value(
@@ -624,6 +958,7 @@ class TaskService:
             self.config_manager,
             self.system_utils,
             runtime=self.runtime,
+            summary_service=DriveHealthSummaryService(get_drive_health_summary_path(self.runtime)),
         )
         if result.get("smart") is not None:
             fake_state.append_task_log(task_name, "SMART details collected.")
@@ -660,13 +995,7 @@ class TaskService:
                 text=True,
                 bufsize=1,
             )
-            stdout_output, stderr_output = self._collect_process_output(
-                proc, cancel_event, "ddns-update"
-            )
-            if stdout_output:
-                fake_state.append_task_log(task_name, stdout_output)
-            if stderr_output:
-                fake_state.append_task_log(task_name, stderr_output)
+            self._stream_process_output(task_name, proc, cancel_event)
 
             if cancel_event.is_set():
                 raise RuntimeError("Task was cancelled.")
@@ -677,67 +1006,19 @@ class TaskService:
             fake_state.append_task_log(task_name, f"Subprocess error: {exc!s}")
             raise RuntimeError(f"Failed to run DDNS update script: {exc!s}") from exc
 
-    def _collect_process_output(
+    def _stream_process_output(
         self,
+        task_name: str,
         proc: Any,
         cancel_event: threading.Event,
-        thread_name_prefix: str,
-    ) -> tuple[str, str]:
-        output_queue: queue.Queue[tuple[str, str]] = queue.Queue()
+    ) -> ProcessWatch:
+        """Append each output line to the task log as it arrives and wait for exit."""
+        fake_state = self._require_fake_state()
 
-        def _drain_stream(stream: Any, stream_name: str) -> None:
-            try:
-                for line in iter(stream.readline, ""):
-                    output_queue.put((stream_name, line))
-            finally:
-                stream.close()
-
-        stdout_thread = threading.Thread(
-            target=_drain_stream,
-            args=(proc.stdout, "stdout"),
-            name=f"{thread_name_prefix}-stdout",
-            daemon=True,
-        )
-        stderr_thread = threading.Thread(
-            target=_drain_stream,
-            args=(proc.stderr, "stderr"),
-            name=f"{thread_name_prefix}-stderr",
-            daemon=True,
-        )
-        stdout_thread.start()
-        stderr_thread.start()
-
-        stdout_chunks: list[str] = []
-        stderr_chunks: list[str] = []
-        while True:
-            self._drain_output_queue(output_queue, stdout_chunks, stderr_chunks)
-            if proc.poll() is not None:
-                break
-            if cancel_event.is_set():
-                proc.terminate()
-                try:
-                    proc.wait(timeout=5.0)
-                except TimeoutExpired:
-                    proc.kill()
-                    proc.wait()
-                break
-            time.sleep(0.1)
-
-        stdout_thread.join(timeout=1.0)
-        stderr_thread.join(timeout=1.0)
-        self._drain_output_queue(output_queue, stdout_chunks, stderr_chunks)
-        return "".join(stdout_chunks).strip(), "".join(stderr_chunks).strip()
-
-    @staticmethod
-    def _drain_output_queue(
-        output_queue: Any, stdout_chunks: list[str], stderr_chunks: list[str]
-    ) -> None:
-        while True:
-            try:
-                stream_name, chunk = output_queue.get_nowait()
-            except queue.Empty:
-                break
-            if stream_name == "stdout":
-                stdout_chunks.append(chunk)
-            else:
-                stderr_chunks.append(chunk)
+        def _append_line(_stream: str, line: str) -> None:
+            if line.strip():
+                fake_state.append_task_log(task_name, line)
+
+        watch = self.process_output.watch(proc, _append_line, cancel_event=cancel_event)
+        watch.wait()
+        return watch
@@ -1,20 +1,50 @@
 import datetime
+import hashlib
 import logging
+import os
 import re
+import threading
+import time
 from functools import wraps
 
-from flask import flash, redirect, session, url_for
+from flask import current_app, flash, redirect, session, url_for
 from werkzeug.security import check_password_hash, generate_password_hash
 
 from simple_safer_server.adapters.command_runner import CalledProcessError
 from simple_safer_server.adapters.user_commands import UserCommandAdapter
-from simple_safer_server.services.file_persistence import atomic_write_json, read_json
+from simple_safer_server.services.file_persistence import (
+    BATCHED,
+    DURABLE,
+    atomic_write_json,
+    read_json,
+)
+from simple_safer_server.services.login_ledger import (
+    LOGIN_LEDGER_FILENAME,
+    LOGIN_STATE_FIELDS,
+    LoginLedger,
+)
 from simple_safer_server.services.runtime import get_runtime
 from simple_safer_server.web.api import json_problem
 from simple_safer_server.web.problems import ForbiddenProblem, UnauthorizedProblem
 
 logger = logging.getLogger(__name__)
 
+USERS_FILENAME = 'users.json'
+LOGIN_LOCKOUT_ATTEMPTS = 5
+LOGIN_LOCKOUT_DURATION = datetime.timedelta(minutes=15)
+
+PASSWORD_HASHING_FILENAME = 'password_hashing.json'
+PASSWORD_HASH_TARGET_SECONDS = 0.25
+# scrypt memory is 128 * n * r bytes per hash. The floor is deliberately half
+# werkzeug's scrypt:32768:8:1 default: on slow CPUs that default alone takes
+# well over the target, so calibration must be able to go below it to make
+# logins faster. N=16384, r=8 is still the cost scrypt's authors recommend for
+# interactive logins. The ceiling bounds RAM for concurrent logins.
+PASSWORD_SCRYPT_MIN_N = 2**14
+PASSWORD_SCRYPT_MAX_N = 2**16
+PASSWORD_SCRYPT_R = 8
+PASSWORD_SCRYPT_P = 1
+
 
 def _parse_user_timestamp(value):
     timestamp = datetime.datetime.fromisoformat(value)
@@ -25,6 +55,50 @@ def _parse_user_timestamp(value):
     return timestamp
 
 
+def _scrypt_seconds(n):
+    started = time.perf_counter()
+    hashlib.scrypt(
+        b'calibration-password',
+        salt=b'calibration-salt',
+        n=n,
+        r=PASSWORD_SCRYPT_R,
+        p=PASSWORD_SCRYPT_P,
+        maxmem=132 * n * PASSWORD_SCRYPT_R * PASSWORD_SCRYPT_P,
+    )
+    return time.perf_counter() - started
+
+
+def benchmark_password_hashing(target_seconds=PASSWORD_HASH_TARGET_SECONDS):
+    """Pick the largest scrypt cost that hashes within target_seconds on this host."""
+    # scrypt time is linear in n, so one timing at the floor predicts every
+    # larger power of two without running the slow candidates.
+    base_seconds = min(_scrypt_seconds(PASSWORD_SCRYPT_MIN_N) for _ in range(2))
+    n = PASSWORD_SCRYPT_MIN_N
+    while n < PASSWORD_SCRYPT_MAX_N and base_seconds * (2 * n // PASSWORD_SCRYPT_MIN_N) <= (
+        target_seconds
+    ):
+        n *= 2
+    return {
+        'method': f'scrypt:{n}:{PASSWORD_SCRYPT_R}:{PASSWORD_SCRYPT_P}',
+        'target_ms': round(target_seconds * 1000),
+        'estimated_ms': round(base_seconds * (n // PASSWORD_SCRYPT_MIN_N) * 1000, 1),
+        'calibrated_at': datetime.datetime.now(datetime.UTC).isoformat(),
+    }
+
+
+def _scrypt_cost(password_hash):
+    # werkzeug stores scrypt hashes as "scrypt:n:r:p$salt$hash"; any other
+    # method, or a malformed prefix, has no comparable cost.
+    method = password_hash.split('$', 1)[0]
+    parts = method.split(':')
+    if len(parts) != 4 or parts[0] != 'scrypt':
+        return None
+    try:
+        return int(parts[1])
+    except ValueError:
+        return None
+
+
 class PasswordPolicy:
     def __init__(self):
         self.min_length = 4
@@ -39,9 +113,13 @@ class UserManager:
     def __init__(self, runtime=None, command_adapter=None):
         self.runtime = runtime or get_runtime()
         self.command_adapter = command_adapter or UserCommandAdapter()
-        self.users_file = self.runtime.config_dir / 'users.json'
-        self.users = self._load_users()
+        self.users_file = self.runtime.config_dir / USERS_FILENAME
+        self.login_ledger = LoginLedger(self.runtime.config_dir / LOGIN_LEDGER_FILENAME)
+        self.password_hashing_file = self.runtime.config_dir / PASSWORD_HASHING_FILENAME
+        self._hash_policy = None
+        self._hash_policy_signature = None
         self._ensure_secure_permissions()
+        self.reload_users()
 
     def _ensure_secure_permissions(self):
         """Ensure secure file permissions"""
@@ -70,17 +148,92 @@ class UserManager:
     def reload_users(self):
         """Reload persisted user records into this manager."""
         self.users = self._load_users()
+        self._import_login_state()
+
+    def _import_login_state(self):
+        # Older releases kept lockout counters and last-login stamps inside
+        # users.json. Seed the ledger from them once, then drop them from the
+        # in-memory records so the next account change stops persisting them.
+        legacy_states = []
+        for username, user in self.users.items():
+            state = {field: user.pop(field, None) for field in LOGIN_STATE_FIELDS}
+            if any(state.values()):
+                legacy_states.append((username, state))
+        self.login_ledger.import_states(legacy_states)
 
     def _save_users(self):
         """Save users to the JSON file"""
         try:
             # User records include password hashes and lockout counters, so the
             # replacement inode must be private before it is published.
-            atomic_write_json(self.users_file, self.users, mode=0o600)
+            atomic_write_json(self.users_file, self.users, mode=0o600, durability=DURABLE)
         except Exception as e:
             logger.error(f"Error saving users: {e}")
             raise
 
+    def password_hash_policy(self):
+        """Return the host's calibrated hashing policy.
+
+        The app calibrates at startup; a manager that was never calibrated
+        benchmarks on first use.
+        """
+        try:
+            file_stat = os.stat(self.password_hashing_file)
+            signature = (file_stat.st_ino, file_stat.st_mtime_ns, file_stat.st_size)
+        except FileNotFoundError:
+            signature = None
+        if signature is not None and signature == self._hash_policy_signature:
+            return self._hash_policy
+        if signature is not None:
+            try:
+                policy = read_json(self.password_hashing_file, {})
+            except Exception as e:
+                logger.error(f"Error loading password hashing policy: {e}")
+                policy = {}
+            if isinstance(policy, dict) and str(policy.get('method', '')).startswith('scrypt:'):
+                self._hash_policy = policy
+                self._hash_policy_signature = signature
+                return policy
+        if self._hash_policy is not None:
+            # A lost file keeps the cost measured at startup rather than
+            # benchmarking inside a login or user-creation request.
+            return self._hash_policy
+        return self.calibrate_password_hashing()
+
+    def calibrate_password_hashing(self, target_seconds=PASSWORD_HASH_TARGET_SECONDS):
+        """Benchmark this host and persist the KDF cost used for new password hashes."""
+        policy = benchmark_password_hashing(target_seconds)
+        # A lost calibration is simply re-measured on the next start.
+        atomic_write_json(self.password_hashing_file, policy, mode=0o600, durability=BATCHED)
+        logger.info(
+            f"Calibrated password hashing to {policy['method']} (~{policy['estimated_ms']} ms)"
+        )
+        self._hash_policy = policy
+        self._hash_policy_signature = None
+        return policy
+
+    def _hash_password(self, password):
+        return generate_password_hash(password, method=self.password_hash_policy()['method'])
+
+    def _rehash_if_outdated(self, username, password):
+        # Only a verified plaintext can be rehashed, so upgrades ride on the next
+        # successful login. This is the one login path that rewrites users.json.
+        user = self.users[username]
+        method = self.password_hash_policy()['method']
+        stored_cost = _scrypt_cost(user['password_hash'])
+        # Recalibrating on a slower host must never weaken existing hashes, so
+        # only hashes below the policy's cost (or not scrypt at all) move.
+        if stored_cost is not None and stored_cost >= _scrypt_cost(method):
+            return
+        previous_hash = user['password_hash']
+        user['password_hash'] = generate_password_hash(password, method=method)
+        try:
+            self._save_users()
+        except Exception:
+            # The stored hash is still valid; keep memory aligned with disk and
+            # retry the upgrade on a later login.
+            user['password_hash'] = previous_hash
+
     def _sync_user_to_samba(self, username, password):
         """Sync a user to the Samba user database"""
         if self.runtime.is_fake:
@@ -140,12 +293,9 @@ class UserManager:
 
         # Store user with additional security measures
         self.users[username] = {
-            'password_hash': generate_password_hash(password),
+            'password_hash': self._hash_password(password),
             'is_admin': is_admin,
             'created_at': datetime.datetime.now(datetime.UTC).isoformat(),
-            'last_login': None,
-            'failed_attempts': 0,
-            'locked_until': None,
         }
 
         # Sync to Samba
@@ -172,51 +322,56 @@ class UserManager:
         user = self.users[username]
         now = datetime.datetime.now(datetime.UTC)
 
-        # Check if account is locked
-        if user.get('locked_until'):
-            if now < _parse_user_timestamp(user['locked_until']):
+        # Attempts are recorded in the login ledger rather than users.json, so
+        # a guessing burst never rewrites the account store.
+        locked_until = (self.login_ledger.state(username) or {}).get('locked_until')
+        if locked_until:
+            if now < _parse_user_timestamp(locked_until):
                 return False
             # Reset lock if time has passed
-            user['locked_until'] = None
-            user['failed_attempts'] = 0
+            self.login_ledger.reset(username)
 
         # Successful login clears rate-limit state; password policy applies when credentials are created.
         if check_password_hash(user['password_hash'], password):
-            # Reset failed attempts on successful login
-            user['failed_attempts'] = 0
-            user['last_login'] = now.isoformat()
-            self._save_users()
+            self.login_ledger.record_success(username, now.isoformat())
+            self._rehash_if_outdated(username, password)
             return True
 
-        # Increment failed attempts
-        user['failed_attempts'] = user.get('failed_attempts', 0) + 1
-
-        # Lock account after 5 failed attempts
-        if user['failed_attempts'] >= 5:
-            user['locked_until'] = (now + datetime.timedelta(minutes=15)).isoformat()
-
-        self._save_users()
+        self.login_ledger.record_failure(
+            username,
+            LOGIN_LOCKOUT_ATTEMPTS,
+            (now + LOGIN_LOCKOUT_DURATION).isoformat(),
+        )
         return False
 
+    def record_login(self, username):
+        """Stamp a login that happened outside verify_user, such as finishing setup."""
+        self.login_ledger.record_success(username, datetime.datetime.now(datetime.UTC).isoformat())
+
     def is_admin(self, username):
         """Check if user is admin"""
         return self.users.get(username, {}).get('is_admin', False)
 
-    def get_user(self, username):
+    def get_user(self, username, last_login=None):
         """Get user information (excluding sensitive data)"""
         user = self.users.get(username, {})
         if user:
+            if last_login is None:
+                last_login = (self.login_ledger.state(username) or {}).get('last_login')
             return {
                 'username': username,
                 'is_admin': user.get('is_admin', False),
                 'created_at': user.get('created_at'),
-                'last_login': user.get('last_login'),
+                'last_login': last_login,
             }
         return None
 
     def list_users(self):
         """List all users without password hashes or lockout internals."""
-        return [self.get_user(username) for username in self.users]
+        last_logins = self.login_ledger.last_logins()
+        return [
+            self.get_user(username, last_login=last_logins.get(username)) for username in self.users
+        ]
 
     def _commit_password_record_after_samba_sync(self, username, password, user_record):
         """Persist a user record only after Samba accepts the same password."""
@@ -225,7 +380,7 @@ class UserManager:
 
         previous_record = dict(self.users[username])
         next_record = dict(user_record)
-        next_record['password_hash'] = generate_password_hash(password)
+        next_record['password_hash'] = self._hash_password(password)
 
         # Samba password changes cannot be rolled back because the app does not
         # retain plaintext passwords. Sync first so a Samba failure leaves the
@@ -245,11 +400,11 @@ class UserManager:
 
         user_record = dict(self.users[username])
         user_record['is_admin'] = True
-        user_record['failed_attempts'] = 0
-        user_record['locked_until'] = None
         user_record.setdefault('created_at', datetime.datetime.now(datetime.UTC).isoformat())
-        user_record.setdefault('last_login', None)
-        return self._commit_password_record_after_samba_sync(username, password, user_record)
+        if not self._commit_password_record_after_samba_sync(username, password, user_record):
+            return False
+        self.login_ledger.reset(username)
+        return True
 
     def set_password(self, username, new_password):
         """Set a user's password from an admin flow and keep Samba in sync."""
@@ -289,6 +444,7 @@ class UserManager:
         # Remove from JSON store
         del self.users[username]
         self._save_users()
+        self.login_ledger.forget(username)
 
         return True, "User deleted successfully"
 
@@ -313,6 +469,63 @@ class UserManager:
             return False
 
 
+class UserRegistry:
+    """Process-wide view of users.json for per-request role checks.
+
+    Every check stats the file and reparses it only when its inode, mtime or
+    size changed. User writes replace the file atomically, so a role change made
+    by any worker is visible on the very next request.
+    """
+
+    def __init__(self, users_file):
+        self.users_file = users_file
+        self._lock = threading.Lock()
+        self._signature = None
+        self._users = {}
+
+    def _current_users(self):
+        try:
+            file_stat = os.stat(self.users_file)
+            signature = (file_stat.st_ino, file_stat.st_mtime_ns, file_stat.st_size)
+        except FileNotFoundError:
+            signature = None
+        with self._lock:
+            if signature != self._signature:
+                try:
+                    self._users = read_json(self.users_file, {}) if signature else {}
+                except Exception as e:
+                    # Fail closed: an unreadable store grants no admin access.
+                    logger.error(f"Error loading users: {e}")
+                    self._users = {}
+                    signature = None
+                self._signature = signature
+            return self._users
+
+    def is_admin(self, username):
+        """Check if user is admin"""
+        return bool(self._current_users().get(username, {}).get('is_admin', False))
+
+
+_user_registries = {}
+_user_registries_lock = threading.Lock()
+
+
+def get_user_registry(runtime=None):
+    """Return the shared registry for this runtime's users.json."""
+    users_file = (runtime or get_runtime()).config_dir / USERS_FILENAME
+    with _user_registries_lock:
+        registry = _user_registries.get(users_file)
+        if registry is None:
+            registry = _user_registries[users_file] = UserRegistry(users_file)
+        return registry
+
+
+def _request_user_registry():
+    services = current_app.extensions.get('simple_safer_server')
+    registry = getattr(services, 'user_registry', None)
+    return registry if registry is not None else get_user_registry()
+
+
 def admin_required(f):
     """Require an administrator session for HTML management pages."""
 
@@ -326,8 +539,7 @@ def admin_required(f):
         # Web UI sessions are admin-only, but roles can change after a cookie is
         # issued. Re-check the user store on every protected request so demoted
         # accounts do not keep a stale management session.
-        user_manager = UserManager()
-        if not user_manager.is_admin(username):
+        if not _request_user_registry().is_admin(username):
             session.clear()
             flash('Admin privileges required', 'error')
             return redirect(url_for('login'))
@@ -349,8 +561,7 @@ def api_admin_required(f):
 
         # API callers need status codes and JSON instead of redirects; keep this
         # separate from admin_required so fetch() handlers can fail predictably.
-        user_manager = UserManager()
-        if not user_manager.is_admin(username):
+        if not _request_user_registry().is_admin(username):
             session.clear()
             return json_problem(
                 ForbiddenProblem("Admin privileges required.", slug="api-admin-required")
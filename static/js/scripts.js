@@ -18,6 +18,9 @@ document.addEventListener("DOMContentLoaded", function () {
       : false;
     const taskName = autoRefreshCheckbox.getAttribute("data-task-name");
     const logLines = autoRefreshCheckbox.getAttribute("data-log-lines") || "500";
+    const maxLogLines = parseInt(logLines, 10) || 500;
+    // The journal cursor of the last line shown; polls only fetch entries after it.
+    let logCursor = autoRefreshCheckbox.getAttribute("data-log-cursor") || "";
     let intervalId;
     let initialLoad = true;
     let failedFetchCount = 0;
@@ -53,11 +56,13 @@ document.addEventListener("DOMContentLoaded", function () {
       return classes.join(" ");
     }
 
-    function renderAnsiLog(text) {
+    function renderAnsiLines(text) {
       // Process each line independently so color cannot spill across lines
       // (handles truncated logs that start mid-color-block).
       const ansiPattern = /\x1b\[([0-9;]*)m/g;
-      return text.split("\n").map(function (line) {
+      const lines = text.split("\n");
+      if (lines.length > 1 && lines[lines.length - 1] === "") lines.pop();
+      return lines.map(function (line) {
         let html = "";
         let open = false;
         let lastIndex = 0;
@@ -73,7 +78,32 @@ document.addEventListener("DOMContentLoaded", function () {
         html += escapeHtml(line.slice(lastIndex));
         if (open) html += "</span>";
         return html;
-      }).join("\n");
+      });
+    }
+
+    function logLineFragment(text) {
+      // One element per line lets appends and trimming touch only the changed
+      // lines instead of re-rendering the whole 500-line window every second.
+      const template = document.createElement("template");
+      template.innerHTML = renderAnsiLines(text)
+        .map((line) => `<span class="task-log-line">${line}\n</span>`)
+        .join("");
+      return template.content;
+    }
+
+    function replaceLog(text) {
+      if (!logContainer) return;
+      logContainer.replaceChildren(logLineFragment(text));
+    }
+
+    function appendLog(text) {
+      if (!logContainer || !text) return;
+      logContainer.appendChild(logLineFragment(text));
+      let overflow = logContainer.childElementCount - maxLogLines;
+      while (overflow > 0) {
+        logContainer.firstElementChild.remove();
+        overflow -= 1;
+      }
     }
 
     function renderTaskStatusBadge(status) {
@@ -152,15 +182,26 @@ document.addEventListener("DOMContentLoaded", function () {
         : 0;
       const stickToBottom = distanceFromBottom < 48;
 
-      return fetch(`/task/${encodeURIComponent(taskName)}/logs?lines=${encodeURIComponent(logLines)}`)
+      const params = new URLSearchParams({ lines: logLines });
+      if (logCursor) params.set("cursor", logCursor);
+      return fetch(`/task/${encodeURIComponent(taskName)}/logs?${params}`)
         .then((resp) => {
           if (!resp.ok) throw new Error(`Log refresh failed with HTTP ${resp.status}`);
-          return resp.text();
+          return resp.text().then((text) => ({
+            text,
+            cursor: resp.headers.get("X-Log-Cursor") || "",
+            append: resp.headers.get("X-Log-Mode") === "append"
+          }));
         })
-        .then((text) => {
+        .then((page) => {
           failedFetchCount = 0;
           if (refreshState) refreshState.textContent = "";
-          if (logContainer) logContainer.innerHTML = renderAnsiLog(text);
+          if (page.append) {
+            appendLog(page.text);
+          } else {
+            replaceLog(page.text);
+          }
+          logCursor = page.cursor;
           if (initialLoad) {
             scrollToBottom();
             initialLoad = false;
@@ -204,6 +245,8 @@ document.addEventListener("DOMContentLoaded", function () {
       }
     });
 
+    // Render the server-provided window once so later polls can append to it.
+    if (logContainer) replaceLog(logContainer.textContent);
     scrollToBottom();
     start();
 
@@ -0,0 +1,66 @@
+import sqlite3
+
+from simple_safer_server.services.alert_store import AlertStore
+
+
+def _store(tmp_path):
+    store = AlertStore(tmp_path / "alerts.sqlite3")
+    store.initialize()
+    return store
+
+
+def test_pages_walk_backwards_by_id_and_filter_unread(tmp_path):
+    store = _store(tmp_path)
+    for index in range(5):
+        store.append_alert(f"Alert {index}", "message", alert_type="error", source="backup")
+    store.mark_alert_read(4)
+
+    first_page = store.page_alerts(limit=2)
+    second_page = store.page_alerts(limit=2, before_id=first_page[-1]["id"])
+    unread = store.page_alerts(limit=10, unread_only=True)
+
+    assert [alert["id"] for alert in first_page] == [5, 4]
+    assert [alert["id"] for alert in second_page] == [3, 2]
+    assert [alert["id"] for alert in unread] == [5, 3, 2, 1]
+    assert store.page_alerts(alert_type="error", source="backup", limit=1)[0]["id"] == 5
+    assert store.get_alert(4)["read"] is True
+    assert store.get_alert(99) is None
+
+
+def test_unread_count_and_mark_all_read(tmp_path):
+    store = _store(tmp_path)
+    for index in range(3):
+        store.append_alert(f"Alert {index}", "message")
+
+    assert store.unread_count() == 3
+    store.mark_all_read()
+    assert store.unread_count() == 0
+
+
+def test_ids_are_not_reused_after_clear(tmp_path):
+    store = _store(tmp_path)
+    store.append_alert("First", "message")
+    store.append_alert("Second", "message")
+
+    store.clear()
+    alert = store.append_alert("Third", "message")
+
+    assert alert["id"] == 3
+    assert [item["title"] for item in store.list_alerts()] == ["Third"]
+
+
+def test_list_queries_use_indexes(tmp_path):
+    store = _store(tmp_path)
+
+    with sqlite3.connect(store.db_path) as connection:
+        unread_plan = connection.execute(
+            "EXPLAIN QUERY PLAN SELECT COUNT(*) FROM alerts WHERE read = 0"
+        ).fetchall()
+        type_plan = connection.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM alerts WHERE type = ? AND id < ? "
+            "ORDER BY id DESC LIMIT 50",
+            ("error", 10),
+        ).fetchall()
+
+    assert "alerts_read" in str(unread_plan)
+    assert "alerts_type" in str(type_plan)
@@ -4,7 +4,7 @@ from pathlib import Path
 from tempfile import TemporaryDirectory
 
 from simple_safer_server.services.alerts_service import AlertsService
-from simple_safer_server.web.problems import ForbiddenProblem, ValidationProblem
+from simple_safer_server.web.problems import ForbiddenProblem, NotFoundProblem, ValidationProblem
 
 
 class FakeConfigManager:
@@ -18,12 +18,27 @@ class FakeConfigManager:
     def set_value(self, section, key, value):
         self.values[(section, key)] = value
 
+    def set_values(self, updates):
+        for section, values in updates.items():
+            for key, value in values.items():
+                self.set_value(section, key, value)
+
     def log_alert(self, title, message, alert_type="info", source=None):
         self.alerts.append((title, message, alert_type, source))
 
     def get_alerts(self):
         return [{"id": 1, "title": "One"}]
 
+    def get_alerts_page(self, limit=50, before_id=None, unread_only=False):
+        ids = range((before_id or 6) - 1, 0, -1)
+        return [{"id": alert_id, "title": f"Alert {alert_id}"} for alert_id in ids][:limit]
+
+    def get_alert(self, alert_id):
+        return {"id": 1, "title": "One"} if alert_id == 1 else None
+
+    def count_unread_alerts(self):
+        return 3
+
     def mark_alert_read(self, alert_id):
         return alert_id == 1
 
@@ -71,6 +86,25 @@ class AlertsServiceTests(unittest.TestCase):
         with self.assertRaisesRegex(ForbiddenProblem, "Not available in production mode"):
             service.generate_test_alerts()
 
+    def test_get_alerts_returns_a_page_with_cursor_and_unread_count(self):
+        service, _config, _system_utils, _runtime = self.make_service()
+
+        first_page = service.get_alerts(limit=2)
+        last_page = service.get_alerts(limit=2, before_id=2)
+
+        self.assertEqual([alert["id"] for alert in first_page.alerts], [5, 4])
+        self.assertEqual(first_page.next_before, 4)
+        self.assertEqual(first_page.unread_count, 3)
+        self.assertEqual([alert["id"] for alert in last_page.alerts], [1])
+        self.assertIsNone(last_page.next_before)
+
+    def test_get_alert_reports_missing_alert(self):
+        service, _config, _system_utils, _runtime = self.make_service()
+
+        self.assertEqual(service.get_alert(1).alert["title"], "One")
+        with self.assertRaises(NotFoundProblem):
+            service.get_alert(2)
+
     def test_email_config_exposes_existing_password_for_admin_editing(self):
         service, _config, _system_utils, runtime = self.make_service()
         runtime.msmtp_config_path.write_text("host smtp.example\npassword secret\n")
@@ -48,7 +48,9 @@ def test_admin_required_clears_stale_non_admin_web_session():
     user_manager.is_admin.return_value = False
 
     with (
-        patch('simple_safer_server.services.user_manager.UserManager', return_value=user_manager),
+        patch(
+            'simple_safer_server.services.user_manager.get_user_registry', return_value=user_manager
+        ),
         app.test_client() as client,
     ):
         with client.session_transaction() as session:
@@ -90,7 +92,9 @@ def test_api_admin_required_clears_stale_non_admin_api_session():
     user_manager.is_admin.return_value = False
 
     with (
-        patch('simple_safer_server.services.user_manager.UserManager', return_value=user_manager),
+        patch(
+            'simple_safer_server.services.user_manager.get_user_registry', return_value=user_manager
+        ),
         app.test_client() as client,
     ):
         with client.session_transaction() as session:
@@ -120,7 +124,9 @@ def test_api_admin_required_allows_admin_sessions():
     user_manager.is_admin.return_value = True
 
     with (
-        patch('simple_safer_server.services.user_manager.UserManager', return_value=user_manager),
+        patch(
+            'simple_safer_server.services.user_manager.get_user_registry', return_value=user_manager
+        ),
         app.test_client() as client,
     ):
         with client.session_transaction() as session:
@@ -0,0 +1,59 @@
+import os
+
+from simple_safer_server.services.block_devices import BlockDeviceIndex
+
+
+def _fake_sysfs(tmp_path):
+    usb_device = tmp_path / "sys/devices/pci0000:00/usb2/2-1"
+    scsi_device = usb_device / "2-1:1.0/host0/target0:0:0/0:0:0:0"
+    disk = scsi_device / "block/sdb"
+    partition = disk / "sdb1"
+    partition.mkdir(parents=True)
+    (usb_device / "idVendor").write_text("152d\n")
+    (usb_device / "serial").write_text("USB-SERIAL-1\n")
+    (scsi_device / "model").write_text("Backup Disk     \n")
+    (disk / "dev").write_text("8:16\n")
+    (disk / "size").write_text("7814037168\n")
+    (disk / "device").symlink_to(scsi_device)
+    (partition / "dev").write_text("8:17\n")
+    (partition / "partition").write_text("1\n")
+    (partition / "size").write_text("2048\n")
+
+    class_block = tmp_path / "sys/class/block"
+    class_block.mkdir(parents=True)
+    (class_block / "sdb").symlink_to(disk)
+    (class_block / "sdb1").symlink_to(partition)
+
+    by_uuid = tmp_path / "dev/disk/by-uuid"
+    by_uuid.mkdir(parents=True)
+    (by_uuid / "2CD49023D48FED80").symlink_to("../../sdb1")
+    return BlockDeviceIndex(class_block, by_uuid)
+
+
+def test_resolves_uuid_parent_and_device_info_from_sysfs(tmp_path):
+    index = _fake_sysfs(tmp_path)
+
+    assert index.device_for_uuid("2CD49023D48FED80") == os.path.realpath(tmp_path / "dev/sdb1")
+    assert index.parent_device("/dev/sdb1") == "/dev/sdb"
+    assert index.device_info("/dev/sdb1") == {
+        "path": "/dev/sdb1",
+        "disk": "/dev/sdb",
+        "model": "Backup Disk",
+        "serial": "USB-SERIAL-1",
+        "transport": "usb",
+        "size_bytes": 2048 * 512,
+    }
+    # Disks behind the same hub share a key so probes can be serialized per hub.
+    assert index.bus_key("/dev/sdb1") == "usb:usb2"
+
+
+def test_returns_none_so_callers_fall_back_to_commands(tmp_path):
+    index = _fake_sysfs(tmp_path)
+
+    assert index.device_for_uuid("missing") is None
+    assert index.device_for_uuid("../sdb1") is None
+    # Whole disks have no parent, and unknown devices are left to lsblk.
+    assert index.parent_device("/dev/sdb") is None
+    assert index.parent_device("/dev/sdz1") is None
+    assert index.device_info("/dev/sdz") is None
+    assert index.bus_key("/dev/sdz") is None
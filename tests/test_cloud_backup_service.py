@@ -25,6 +25,11 @@ class FakeConfigManager:
     def set_value(self, section, key, value):
         self.config.setdefault(section, {})[key] = value
 
+    def set_values(self, updates):
+        for section, values in updates.items():
+            for key, value in values.items():
+                self.set_value(section, key, value)
+
 
 class FakeSystemUtils:
     def __init__(self):
@@ -69,6 +74,14 @@ class FakeTaskService:
             return self.task
         return None
 
+    def task_run_state(self, task):
+        return {
+            "status": task.status,
+            "last_run": task.last_run,
+            "next_run": task.next_run,
+            "last_run_duration": task.last_run_duration,
+        }
+
 
 class FakeCommandRunner:
     def __init__(self):
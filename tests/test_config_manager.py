@@ -97,7 +97,7 @@ class ConfigManagerDefaultsTests(unittest.TestCase):
     def test_alert_ids_stay_monotonic_after_retention_trim(self):
         manager = create_config_manager()
 
-        manager.alerts_path.write_text(
+        manager.alert_store.legacy_path.write_text(
             "[{}]".format(
                 ",".join(
                     f'{{"id": {alert_id}, "title": "old", "read": false}}'
@@ -105,24 +105,44 @@ class ConfigManagerDefaultsTests(unittest.TestCase):
                 )
             )
         )
+        manager.alert_store.initialize()
 
         self.assertTrue(manager.log_alert("Newest", "message"))
         alerts = manager.get_alerts()
         alert_ids = [alert["id"] for alert in alerts]
 
+        self.assertFalse(manager.alert_store.legacy_path.exists())
         self.assertEqual(len(alerts), 1000)
         self.assertEqual(max(alert_ids), 1500)
-        self.assertEqual(sorted(alert_ids), list(range(501, 1501)))
+        self.assertEqual(alert_ids, list(range(501, 1501)))
 
-    def test_store_secret_preserves_existing_keys_with_lock_file(self):
+    def test_secrets_are_decrypted_once_until_the_file_changes(self):
         manager = create_config_manager()
+        manager.store_secrets({"duckdns_token": "duck-token", "cloudflare_token": "cf-token"})
+        other_manager = create_config_manager(runtime=manager.runtime)
 
-        manager.store_secret("duckdns_token", "duck-token")
-        manager.store_secret("cloudflare_token", "cf-token")
+        with patch.object(manager.cipher, "decrypt", wraps=manager.cipher.decrypt) as decrypt:
+            self.assertEqual(
+                manager.get_secrets(["duckdns_token", "cloudflare_token", "missing"], ""),
+                {"duckdns_token": "duck-token", "cloudflare_token": "cf-token", "missing": ""},
+            )
+            self.assertEqual(manager.get_secret("duckdns_token"), "duck-token")
+            self.assertEqual(decrypt.call_count, 2)
+
+            other_manager.store_secret("duckdns_token", "rotated-token")
+
+            self.assertEqual(manager.get_secret("duckdns_token"), "rotated-token")
+            self.assertEqual(decrypt.call_count, 4)
+
+    def test_store_secrets_fsyncs_once_for_the_whole_batch(self):
+        manager = create_config_manager()
+
+        with patch("os.fsync", wraps=os.fsync) as fsync:
+            manager.store_secrets({"duckdns_token": "duck-token", "cloudflare_token": "cf-token"})
 
-        self.assertEqual(manager.get_secret("duckdns_token"), "duck-token")
+        # One temp-file fsync plus one directory fsync for the whole batch.
+        self.assertEqual(fsync.call_count, 2)
         self.assertEqual(manager.get_secret("cloudflare_token"), "cf-token")
-        self.assertTrue(manager.secrets_lock_path.exists())
 
     def test_set_value_preserves_other_manager_update_with_lock_file(self):
         first_manager = create_config_manager()
@@ -159,6 +179,68 @@ class ConfigManagerDefaultsTests(unittest.TestCase):
         self.assertEqual(manager.get_value("system", "server_name"), "imported")
         self.assertIsNone(manager.get_value("backup", "mount_point"))
 
+    def test_unchanged_config_is_not_reparsed(self):
+        manager = create_config_manager()
+
+        with patch.object(configparser.ConfigParser, "read") as read:
+            for _ in range(3):
+                self.assertFalse(manager.is_setup_complete())
+                manager.get_value("system", "server_name")
+
+        read.assert_not_called()
+
+    def test_config_replaced_by_another_writer_is_reparsed(self):
+        first_manager = create_config_manager()
+        second_manager = create_config_manager(runtime=first_manager.runtime)
+        self.assertFalse(first_manager.is_setup_complete())
+
+        second_manager.mark_setup_complete()
+
+        self.assertTrue(first_manager.is_setup_complete())
+
+    def test_in_place_edit_is_reparsed(self):
+        manager = create_config_manager()
+        manager.get_value("system", "server_name")
+        inode = manager.config_path.stat().st_ino
+
+        # Appending with a shell `>>` redirect keeps the inode.
+        with manager.config_path.open("a") as config_file:
+            config_file.write("\n[extra]\nkey = value\n")
+
+        self.assertEqual(manager.config_path.stat().st_ino, inode)
+        self.assertEqual(manager.get_value("extra", "key"), "value")
+
+    def test_set_values_writes_every_section_with_one_fsync(self):
+        manager = create_config_manager()
+
+        with patch("os.fsync", wraps=os.fsync) as fsync:
+            manager.set_values(
+                {
+                    "ddns": {"cloudflare_zone": "example.com", "cloudflare_proxy": "true"},
+                    "schedule": {"backup_cloud_time": "04:30"},
+                }
+            )
+
+        self.assertEqual(fsync.call_count, 2)
+        self.assertEqual(manager.get_value("ddns", "cloudflare_zone"), "example.com")
+        self.assertEqual(manager.get_value("schedule", "backup_cloud_time"), "04:30")
+
+    def test_transaction_applies_on_exit_and_discards_on_error(self):
+        manager = create_config_manager()
+
+        with manager.transaction() as set_value:
+            set_value("backup", "uuid", "new-uuid")
+            set_value("backup", "usb_id", "1234:5678")
+            self.assertEqual(manager.get_value("backup", "uuid"), "")
+
+        self.assertEqual(manager.get_value("backup", "usb_id"), "1234:5678")
+
+        with self.assertRaises(ValueError), manager.transaction() as set_value:
+            set_value("backup", "uuid", "discarded")
+            raise ValueError("invalid form")
+
+        self.assertEqual(manager.get_value("backup", "uuid"), "new-uuid")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,128 @@
+import socket
+import threading
+
+from simple_safer_server.adapters.dbus_wire import (
+    METHOD_CALL,
+    METHOD_RETURN,
+    SIGNAL,
+    DBusConnection,
+    DBusMessage,
+    decode_message,
+    encode_message,
+    message_length,
+    split_signature,
+)
+
+
+def test_split_signature_keeps_containers_whole():
+    assert split_signature("sa{sv}as") == ["s", "a{sv}", "as"]
+    assert split_signature("a(sasbttttuii)t") == ["a(sasbttttuii)", "t"]
+
+
+def test_message_round_trip_preserves_nested_variant_values():
+    message = DBusMessage(
+        SIGNAL,
+        serial=7,
+        path="/org/freedesktop/systemd1/unit/backup_5fcloud_2eservice",
+        interface="org.freedesktop.DBus.Properties",
+        member="PropertiesChanged",
+        signature="sa{sv}as",
+        body=[
+            "org.freedesktop.systemd1.Service",
+            {
+                "Result": ("s", "success"),
+                "ExecMainStartTimestamp": ("t", 1_777_258_800_000_000),
+                "ExecMainStatus": ("i", -1),
+                "Restart": ("b", True),
+                "ExecStart": ("a(sasb)", [("/usr/bin/true", ["true"], False)]),
+            },
+            ["ActiveState"],
+        ],
+    )
+
+    encoded = encode_message(message)
+    decoded = decode_message(encoded)
+
+    assert message_length(encoded) == len(encoded)
+    assert decoded.path == message.path
+    assert decoded.member == "PropertiesChanged"
+    assert decoded.body == [
+        "org.freedesktop.systemd1.Service",
+        {
+            "Result": "success",
+            "ExecMainStartTimestamp": 1_777_258_800_000_000,
+            "ExecMainStatus": -1,
+            "Restart": True,
+            "ExecStart": [("/usr/bin/true", ["true"], False)],
+        },
+        ["ActiveState"],
+    ]
+
+
+def _serve_one_call(server: socket.socket, handled: list[DBusMessage]) -> None:
+    auth = b""
+    while not auth.endswith(b"BEGIN\r\n"):
+        auth += server.recv(1024)
+        if auth.count(b"\r\n") == 1 and auth.startswith(b"\0AUTH EXTERNAL"):
+            server.sendall(b"OK 0123456789abcdef\r\n")
+    buffer = b""
+    while True:
+        length = message_length(buffer)
+        if length is not None and len(buffer) >= length:
+            break
+        buffer += server.recv(4096)
+    call = decode_message(buffer[:length])
+    handled.append(call)
+    server.sendall(
+        encode_message(
+            DBusMessage(
+                SIGNAL,
+                serial=1,
+                path="/org/freedesktop/systemd1",
+                interface="org.freedesktop.systemd1.Manager",
+                member="UnitFilesChanged",
+            )
+        )
+        + encode_message(
+            DBusMessage(
+                METHOD_RETURN,
+                serial=2,
+                reply_serial=call.serial,
+                signature="o",
+                body=["/org/freedesktop/systemd1/unit/check_5fmount_2eservice"],
+            )
+        )
+    )
+
+
+def test_connection_authenticates_and_matches_replies_and_signals():
+    client_socket, server_socket = socket.socketpair()
+    handled: list[DBusMessage] = []
+    server = threading.Thread(target=_serve_one_call, args=(server_socket, handled))
+    server.start()
+    signals: list[DBusMessage] = []
+    connection = DBusConnection(client_socket)
+    try:
+        connection.authenticate()
+        connection.add_signal_handler(signals.append)
+        connection.start()
+
+        reply = connection.call(
+            "org.freedesktop.systemd1",
+            "/org/freedesktop/systemd1",
+            "org.freedesktop.systemd1.Manager",
+            "LoadUnit",
+            "s",
+            ["check_mount.service"],
+        )
+    finally:
+        server.join(timeout=5)
+        connection.close()
+        server_socket.close()
+
+    assert reply == ["/org/freedesktop/systemd1/unit/check_5fmount_2eservice"]
+    assert handled[0].message_type == METHOD_CALL
+    assert handled[0].destination == "org.freedesktop.systemd1"
+    assert handled[0].body == ["check_mount.service"]
+    assert [signal.member for signal in signals] == ["UnitFilesChanged"]
+    assert connection.closed
@@ -1,3 +1,4 @@
+import contextlib
 import logging
 import types
 import unittest
@@ -18,12 +19,33 @@ class FakeConfigManager:
     def set_value(self, section, key, value):
         self.values[(section, key)] = value
 
+    def set_values(self, updates):
+        for section, values in updates.items():
+            for key, value in values.items():
+                self.set_value(section, key, value)
+
+    @contextlib.contextmanager
+    def transaction(self):
+        updates = {}
+
+        def stage(section, key, value):
+            updates.setdefault(section, {})[key] = value
+
+        yield stage
+        self.set_values(updates)
+
     def get_secret(self, key, default=None):
         return self.secrets.get(key, default)
 
+    def get_secrets(self, keys, default=None):
+        return {key: self.secrets.get(key, default) for key in keys}
+
     def store_secret(self, key, value):
         self.secrets[key] = value
 
+    def store_secrets(self, values):
+        self.secrets.update(values)
+
 
 class FakeTask:
     def __init__(self):
@@ -43,6 +65,9 @@ class FakeTaskService:
             return self.task
         return None
 
+    def task_run_state(self, task):
+        return {"next_run": task.next_run}
+
 
 class DdnsServiceTests(unittest.TestCase):
     def make_service(self, config=None, task=None):
@@ -107,6 +132,23 @@ class DdnsServiceTests(unittest.TestCase):
         self.assertEqual(config.secrets["cloudflare_token"], "cf-token")
         self.assertEqual(task.starts, 1)
 
+    def test_failed_token_write_leaves_provider_disabled(self):
+        task = FakeTask()
+        config = FakeConfigManager()
+        config.values[("ddns", "duckdns_enabled")] = "false"
+
+        def fail_store_secrets(_values):
+            raise OSError("disk full")
+
+        config.store_secrets = fail_store_secrets
+        service, _config, _task_service = self.make_service(config=config, task=task)
+
+        with self.assertRaisesRegex(OSError, "disk full"):
+            service.save_config({"duckdns": {"enabled": True, "domain": "home", "token": "t"}})
+
+        self.assertEqual(config.values, {("ddns", "duckdns_enabled"): "false"})
+        self.assertEqual(task.starts, 0)
+
     def test_run_manual_reports_missing_task(self):
         service, _config, _task_service = self.make_service()
 
@@ -72,6 +72,9 @@ class CloudflareDdnsTests(unittest.TestCase):
             def get_secret(self, key, default=None):
                 return secrets.get(key, default)
 
+            def get_secrets(self, keys, default=None):
+                return {key: secrets.get(key, default) for key in keys}
+
             def log_alert(self, *args, **kwargs):
                 self.alerts.append((args, kwargs))
 
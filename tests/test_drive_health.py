@@ -4,7 +4,7 @@ import unittest
 from pathlib import Path
 from subprocess import TimeoutExpired
 from types import SimpleNamespace
-from unittest.mock import MagicMock, patch
+from unittest.mock import ANY, MagicMock, patch
 
 from simple_safer_server.services import drive_health
 
@@ -212,6 +212,25 @@ class DriveHealthTests(unittest.TestCase):
                 root / "var-lib" / "hdsentinel_state.json",
             )
 
+    @patch(
+        "simple_safer_server.services.drive_health.drive_health_command_adapter.find_device_by_uuid",
+        side_effect=AssertionError("blkid must not run when udev already knows the UUID"),
+    )
+    @patch(
+        "simple_safer_server.services.drive_health.block_device_index.device_for_uuid",
+        return_value="/dev/sdb1",
+    )
+    def test_resolve_backup_partition_prefers_udev_symlink_over_blkid(
+        self, mock_device_for_uuid, _mock_blkid
+    ):
+        config_manager = SimpleNamespace(get_value=lambda section, key, default=None: "UUID-1")
+        runtime = SimpleNamespace(is_fake=False)
+
+        result = drive_health.resolve_backup_partition_device(config_manager, runtime=runtime)
+
+        self.assertEqual(result, ("/dev/sdb1", None))
+        mock_device_for_uuid.assert_called_once_with("UUID-1")
+
     @patch("simple_safer_server.services.drive_health._log_and_email_alert")
     @patch("simple_safer_server.services.drive_health.run_hdsentinel_health_monitor")
     @patch("simple_safer_server.services.drive_health.get_smart_attributes")
@@ -242,10 +261,15 @@ class DriveHealthTests(unittest.TestCase):
         mock_smart_attributes.return_value = (smart, [], None)
         mock_hdsentinel_monitor.return_value = hdsentinel_result
 
+        history_store = MagicMock()
+        summary_service = drive_health.DriveHealthSummaryService()
+
         result = drive_health.run_scheduled_drive_health_check(
             config_manager,
             system_utils,
             runtime=runtime,
+            history_store=history_store,
+            summary_service=summary_service,
         )
 
         self.assertEqual(result["device"], "/dev/sdb")
@@ -254,8 +278,45 @@ class DriveHealthTests(unittest.TestCase):
         self.assertEqual(result["hdsentinel"], hdsentinel_result)
         mock_alert.assert_not_called()
         mock_hdsentinel_monitor.assert_called_once_with(
-            config_manager, system_utils, runtime=runtime
+            config_manager, system_utils, runtime=runtime, device="/dev/sdb", deadline=ANY
         )
+        drive, _, values = history_store.record.call_args.args
+        self.assertEqual(drive, "/dev/sdb")
+        self.assertEqual(values["smart_194_raw"], 31.0)
+        summary = summary_service.get_summary()
+        self.assertEqual(summary["source"], "scheduled")
+        self.assertEqual(summary["status"], "good")
+        self.assertEqual(summary["temperature"], 31.0)
+        self.assertEqual(values["hdsentinel_health"], 100)
+        history_store.close.assert_not_called()
+
+    @patch(
+        "simple_safer_server.services.drive_health.get_drive_power_state",
+        return_value=drive_health.POWER_STATE_STANDBY,
+    )
+    @patch("simple_safer_server.services.drive_health.get_smart_attributes")
+    @patch(
+        "simple_safer_server.services.drive_health.resolve_backup_parent_device",
+        return_value=("/dev/sdb", "/dev/sdb1", None),
+    )
+    def test_scheduled_check_leaves_sleeping_drive_alone_when_configured(
+        self, _mock_resolve_device, mock_smart_attributes, _mock_power_state
+    ):
+        config_manager = SimpleNamespace(
+            get_value=lambda section, key, default=None: {
+                ("backup", "mount_point"): "/media/backup",
+                ("drive_health", "wake_for_scheduled_check"): "false",
+            }.get((section, key), default)
+        )
+        system_utils = SimpleNamespace(is_mounted=lambda mount_point: True)
+        runtime = SimpleNamespace(is_fake=False, default_mount_point="/media/backup")
+
+        result = drive_health.run_scheduled_drive_health_check(
+            config_manager, system_utils, runtime=runtime, history_store=MagicMock()
+        )
+
+        self.assertEqual(result["skipped"], drive_health.DRIVE_ASLEEP_MESSAGE)
+        mock_smart_attributes.assert_not_called()
 
     @patch("simple_safer_server.services.drive_health._log_and_email_alert")
     @patch("simple_safer_server.services.drive_health.run_hdsentinel_health_monitor")
@@ -300,7 +361,7 @@ class DriveHealthTests(unittest.TestCase):
         self.assertIn("smartctl", str(exc.exception))
         mock_alert.assert_called_once()
         mock_hdsentinel_monitor.assert_called_once_with(
-            config_manager, system_utils, runtime=runtime
+            config_manager, system_utils, runtime=runtime, device="/dev/sdb", deadline=ANY
         )
 
 
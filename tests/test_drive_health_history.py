@@ -0,0 +1,65 @@
+import sqlite3
+import time
+
+from simple_safer_server.services.drive_health_history import (
+    RAW_RETENTION_DAYS,
+    DriveHealthHistoryStore,
+    pick_resolution,
+)
+
+DAY = 86400
+
+
+def test_record_rolls_samples_into_hourly_and_daily_buckets(tmp_path):
+    store = DriveHealthHistoryStore(tmp_path / "history.sqlite3")
+    now = int(time.time())
+    day_start = now - now % DAY - DAY
+
+    store.record("uuid-1", day_start + 60, {"smart_194_raw": 30.0, "smart_5_raw": None})
+    store.record("uuid-1", day_start + 120, {"smart_194_raw": 40.0})
+    # Re-recording the same check must not be counted twice by the rollups.
+    assert store.record("uuid-1", day_start + 120, {"smart_194_raw": 40.0}) == 0
+
+    daily = store.query("uuid-1", "smart_194_raw", day_start, now, resolution="day")
+    raw = store.query("uuid-1", "smart_194_raw", day_start, now, resolution="raw")
+
+    assert daily["points"] == [{"t": day_start, "value": 35.0, "min": 30.0, "max": 40.0}]
+    assert [point["value"] for point in raw["points"]] == [30.0, 40.0]
+    assert store.query("uuid-1", "smart_5_raw", day_start, now)["points"] == []
+    assert store.drives() == ["uuid-1"]
+
+
+def test_retention_prunes_raw_samples_but_keeps_daily_rollups(tmp_path):
+    store = DriveHealthHistoryStore(tmp_path / "history.sqlite3")
+    now = int(time.time())
+    old = now - (RAW_RETENTION_DAYS + 5) * DAY
+
+    store.record("uuid-1", old, {"hdsentinel_health": 98})
+    store.record("uuid-1", now, {"hdsentinel_health": 97})
+
+    raw = store.query("uuid-1", "hdsentinel_health", old - DAY, now, resolution="raw")
+    daily = store.query("uuid-1", "hdsentinel_health", old - DAY, now, resolution="day")
+
+    assert [point["value"] for point in raw["points"]] == [97.0]
+    assert [point["value"] for point in daily["points"]] == [98.0, 97.0]
+
+
+def test_auto_resolution_coarsens_with_span():
+    now = 1_700_000_000
+    assert pick_resolution(now - 7 * DAY, now, now=now) == "raw"
+    assert pick_resolution(now - 120 * DAY, now, now=now) == "hour"
+    assert pick_resolution(now - 5 * 365 * DAY, now, now=now) == "day"
+
+
+def test_range_queries_scan_the_primary_key(tmp_path):
+    store = DriveHealthHistoryStore(tmp_path / "history.sqlite3")
+    store.record("uuid-1", time.time(), {"smart_194_raw": 30.0})
+
+    with sqlite3.connect(store.db_path) as connection:
+        plan = connection.execute(
+            "EXPLAIN QUERY PLAN SELECT bucket FROM rollups WHERE drive = ? AND metric = ? "
+            "AND resolution = ? AND bucket BETWEEN ? AND ?",
+            ("uuid-1", "smart_194_raw", "day", 0, 1),
+        ).fetchall()
+
+    assert "PRIMARY KEY" in str(plan)
@@ -0,0 +1,163 @@
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from simple_safer_server.services import drive_health as drive_health_service
+
+
+def _drive(serial, bus, device=None):
+    return {
+        "device": device or f"/dev/{serial.lower()}",
+        "serial": serial,
+        "model": "Disk",
+        "transport": bus.split(":", 1)[0],
+        "bus": bus,
+    }
+
+
+def test_bus_limit_serializes_one_usb_hub_but_not_other_buses():
+    drives = [_drive("A", "usb:2-1"), _drive("B", "usb:2-1"), _drive("C", "sata")]
+    lock = threading.Lock()
+    active = {"usb:2-1": 0, "sata": 0}
+    peak = {"usb:2-1": 0, "total": 0}
+
+    def probe(drive, _deadline):
+        with lock:
+            active[drive["bus"]] += 1
+            peak["usb:2-1"] = max(peak["usb:2-1"], active["usb:2-1"])
+            peak["total"] = max(peak["total"], sum(active.values()))
+        time.sleep(0.05)
+        with lock:
+            active[drive["bus"]] -= 1
+        return drive["serial"]
+
+    outcome = drive_health_service.run_bus_limited_probes(drives, probe, 5)
+
+    assert outcome["results"] == {"A": "A", "B": "B", "C": "C"}
+    assert peak == {"usb:2-1": 1, "total": 2}
+
+
+def test_discover_lists_non_system_disks_keyed_by_serial():
+    blockdevices = [
+        {"path": "/dev/sda", "type": "disk", "tran": "sata", "model": "System"},
+        {"path": "/dev/sdb", "type": "disk", "tran": "usb", "model": "Backup"},
+        {"path": "/dev/sdc", "type": "disk", "tran": "usb", "model": "Clone"},
+        {"path": "/dev/sdd", "type": "disk", "tran": "sata", "model": "Data"},
+    ]
+    serials = {"/dev/sdb": "SER-1", "/dev/sdc": "SER-1", "/dev/sdd": None}
+    index = MagicMock()
+    index.device_info.side_effect = lambda device: {
+        "serial": serials[device],
+        "model": None,
+        "transport": None,
+    }
+    index.bus_key.side_effect = lambda device: "usb:2-1" if device != "/dev/sdd" else "sata"
+
+    with (
+        patch.object(drive_health_service, "_load_lsblk_devices", return_value=blockdevices),
+        patch.object(drive_health_service, "_get_system_drive_path", return_value="/dev/sda2"),
+        patch.object(drive_health_service, "block_device_index", index),
+    ):
+        drives = drive_health_service.discover_monitored_drives(SimpleNamespace(is_fake=False))
+
+    # A bridge repeating one serial, or reporting none, falls back to the device.
+    assert [(drive["device"], drive["serial"], drive["bus"]) for drive in drives] == [
+        ("/dev/sdb", "SER-1", "usb:2-1"),
+        ("/dev/sdc", "/dev/sdc", "usb:2-1"),
+        ("/dev/sdd", "/dev/sdd", "sata"),
+    ]
+    assert drives[0]["model"] == "Backup"
+
+
+def test_monitor_stores_one_summary_per_serial_and_keeps_missing_drives(tmp_path):
+    runtime = SimpleNamespace(is_fake=False, data_dir=tmp_path)
+    drive_health_service.save_drive_health_snapshots(
+        {"OLD-1": {"serial": "OLD-1", "device": "/dev/sdz", "connected": True}}, runtime
+    )
+    drives = [_drive("SER-1", "usb:2-1", "/dev/sdb"), _drive("SER-2", "sata", "/dev/sdc")]
+
+    def probe(_config_manager, drive, _deadline, _runtime, **_kwargs):
+        return {"serial": drive["serial"], "device": drive["device"], "connected": True}
+
+    with (
+        patch.object(drive_health_service, "discover_monitored_drives", return_value=drives),
+        patch.object(drive_health_service, "probe_monitored_drive", side_effect=probe),
+    ):
+        summaries = drive_health_service.run_drive_health_monitor(MagicMock(), runtime)
+
+    assert [(summary["serial"], summary["connected"]) for summary in summaries] == [
+        ("SER-1", True),
+        ("SER-2", True),
+        ("OLD-1", False),
+    ]
+    stored = drive_health_service.load_drive_health_snapshots(runtime)
+    assert set(stored) == {"SER-1", "SER-2", "OLD-1"}
+    assert isinstance(stored["SER-1"]["probe_ms"], int)
+
+
+def test_sleeping_drive_keeps_its_own_last_reading_without_probing():
+    runtime = SimpleNamespace(is_fake=False)
+    previous = {"status": "good", "hdsentinel_health": 97, "reading_at": "2026-01-01T00:00:00"}
+
+    with (
+        patch.object(
+            drive_health_service,
+            "get_drive_power_state",
+            return_value=drive_health_service.POWER_STATE_STANDBY,
+        ),
+        patch.object(
+            drive_health_service,
+            "get_smart_attributes",
+            side_effect=AssertionError("asleep drives must not be probed"),
+        ),
+        patch.object(
+            drive_health_service,
+            "load_hdsentinel_state",
+            side_effect=AssertionError("other drives must not read the backup drive state"),
+        ),
+    ):
+        summary = drive_health_service.probe_monitored_drive(
+            MagicMock(),
+            _drive("SER-2", "sata"),
+            time.monotonic() + 5,
+            runtime,
+            previous_summary=previous,
+        )
+        fresh = drive_health_service.probe_monitored_drive(
+            MagicMock(), _drive("SER-3", "sata"), time.monotonic() + 5, runtime
+        )
+
+    assert summary["serial"] == "SER-2"
+    assert summary["power_state"] == "standby"
+    assert summary["hdsentinel_health"] == 97
+    assert summary["reading_at"] == "2026-01-01T00:00:00"
+    assert fresh["reading_at"] is None
+
+
+def test_monitor_reuses_known_summary_and_isolates_probe_errors(tmp_path):
+    runtime = SimpleNamespace(is_fake=False, data_dir=tmp_path)
+    drives = [_drive("SER-1", "usb:2-1", "/dev/sdb"), _drive("SER-2", "sata", "/dev/sdc")]
+    backup_summary = {"status": "good", "hdsentinel_health": 98, "probe_ms": {"smart": 5}}
+
+    def probe(_config_manager, drive, _deadline, _runtime, **_kwargs):
+        assert drive["device"] != "/dev/sdb", "the backup drive was already probed"
+        raise OSError("bridge reset")
+
+    with (
+        patch.object(drive_health_service, "discover_monitored_drives", return_value=drives),
+        patch.object(drive_health_service, "probe_monitored_drive", side_effect=probe),
+    ):
+        summaries = drive_health_service.run_drive_health_monitor(
+            MagicMock(), runtime, known_summaries={"/dev/sdb": backup_summary}
+        )
+
+    backup, other = summaries
+    assert (backup["serial"], backup["status"], backup["hdsentinel_health"]) == (
+        "SER-1",
+        "good",
+        98,
+    )
+    assert backup["bus"] == "usb:2-1"
+    assert backup["probe_ms"] is None
+    assert (other["serial"], other["error"]) == ("SER-2", "bridge reset")
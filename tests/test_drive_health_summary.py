@@ -1,5 +1,6 @@
 import os
 import subprocess
+import time
 from tempfile import TemporaryDirectory
 from types import SimpleNamespace
 from unittest.mock import patch
@@ -9,6 +10,7 @@ from flask import Flask
 from simple_safer_server.services import drive_health as drive_health_service
 from simple_safer_server.services import runtime
 from simple_safer_server.services.drive_health import DriveHealthSummaryService
+from simple_safer_server.services.file_persistence import read_json
 
 
 def _create_fake_app():
@@ -310,3 +312,83 @@ def test_drive_health_summary_service_accepts_later_publish_with_same_timestamp(
     assert latest["status"] == "warning"
     assert "_publish_seq" not in latest
     assert service.get_summary()["hdsentinel_health"] == 42
+
+
+def test_shared_summary_file_serves_every_worker_and_restart(tmp_path):
+    summary_path = tmp_path / "run" / "drive_health_summary.json"
+    worker_a = DriveHealthSummaryService(summary_path)
+    worker_b = DriveHealthSummaryService(summary_path)
+
+    worker_a.publish({"status": "good", "hdsentinel_health": 99, "checked_at": "2026-05-02T14:05"})
+    # A probe that started earlier but finished later in another worker loses.
+    stale = worker_b.publish(
+        {"status": "warning", "hdsentinel_health": 42, "checked_at": "2026-05-02T14:00"}
+    )
+    worker_b.publish(
+        {"status": "critical", "hdsentinel_health": 20, "checked_at": "2026-05-02T14:05"}
+    )
+
+    assert stale["hdsentinel_health"] == 99
+    assert worker_a.get_summary()["hdsentinel_health"] == 20
+    restarted = DriveHealthSummaryService(summary_path)
+    assert restarted.get_summary()["status"] == "critical"
+    assert read_json(summary_path, None)["_publish_seq"] == 2
+
+
+def test_history_endpoint_reads_store_without_probing_drive():
+    app, cleanup = _create_fake_app()
+    try:
+        services = app.extensions["simple_safer_server"]
+        services.config_manager.set_value("backup", "uuid", "uuid-1")
+        services.drive_health_history.record("uuid-1", time.time(), {"hdsentinel_health": 91})
+        with (
+            patch(
+                "simple_safer_server.routes.drive_health.get_smart_attributes",
+                side_effect=AssertionError("history must not probe SMART"),
+            ),
+            app.test_client() as client,
+        ):
+            response = client.get("/api/drive_health/history?metric=hdsentinel_health&days=30")
+            invalid = client.get("/api/drive_health/history?metric=nope")
+
+        data = response.get_json()["data"]
+        assert response.status_code == 200
+        assert data["drive"] == "uuid-1"
+        assert data["resolution"] == "raw"
+        assert [point["value"] for point in data["points"]] == [91.0]
+        assert invalid.status_code == 400
+    finally:
+        cleanup()
+
+
+def test_check_all_drives_stores_and_shows_one_summary_per_drive():
+    app, cleanup = _create_fake_app()
+    try:
+        with app.test_client() as client:
+            before = client.get("/drives")
+            checked = client.post("/drives", data={"form_action": "check_all_drives"})
+            after = client.get("/drives")
+
+        services = app.extensions["simple_safer_server"]
+        stored = drive_health_service.load_drive_health_snapshots(services.runtime)
+        assert b"No drives checked yet" in before.data
+        assert checked.status_code == 200
+        assert list(stored) == ["FAKE-BACKUP-0001"]
+        assert stored["FAKE-BACKUP-0001"]["hdsentinel_health"] == 100
+        assert b"FAKE-BACKUP-0001" in after.data
+    finally:
+        cleanup()
+
+
+def test_refresh_summary_includes_failure_risk_score():
+    app, cleanup = _create_fake_app()
+    try:
+        with app.test_client() as client:
+            response = client.post("/api/drive_health/refresh")
+
+        data = response.get_json()["data"]
+        assert response.status_code == 200
+        assert data["risk_level"] == "low"
+        assert 0 <= data["risk_score"] < 20
+    finally:
+        cleanup()
@@ -1,6 +1,11 @@
+import os
+import tempfile
+import threading
+import time
 import unittest
+from pathlib import Path
 from types import SimpleNamespace
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 from simple_safer_server.services import drive_health
 
@@ -23,3 +28,244 @@ class DriveHealthSupportTests(unittest.TestCase):
         self.assertEqual(second_result, (True, None))
         self.assertEqual(mock_which.call_count, 2)
         mock_run.assert_called_once_with()
+
+    @patch("simple_safer_server.services.drive_health.drive_health_command_adapter.smartctl_help")
+    @patch("simple_safer_server.services.drive_health.shutil.which")
+    def test_get_smartctl_json_support_reprobes_only_when_binary_changes(
+        self, mock_which, mock_run
+    ):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            smartctl = Path(temp_dir) / "smartctl"
+            smartctl.write_text("old")
+            mock_which.return_value = str(smartctl)
+            mock_run.return_value = SimpleNamespace(returncode=0, stdout="usage", stderr="")
+
+            first_result = drive_health.get_smartctl_json_support()
+            drive_health.get_smartctl_json_support()
+            mock_run.return_value = SimpleNamespace(
+                returncode=0, stdout="smartctl supports --json", stderr=""
+            )
+            smartctl.write_text("upgraded")
+            upgraded_result = drive_health.get_smartctl_json_support()
+
+        self.assertEqual(first_result, (False, drive_health.SMARTCTL_JSON_UPGRADE_MESSAGE))
+        self.assertEqual(upgraded_result, (True, None))
+        self.assertEqual(mock_run.call_count, 2)
+
+    def test_hdsentinel_binary_status_follows_the_file_on_disk(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            runtime = SimpleNamespace(bin_dir=Path(temp_dir))
+            binary = runtime.bin_dir / "hdsentinel"
+
+            missing = drive_health.get_hdsentinel_binary_status(runtime)
+            binary.write_text("binary")
+            os.chmod(binary, 0o644)
+            not_executable = drive_health.get_hdsentinel_binary_status(runtime)
+            os.chmod(binary, 0o755)
+            ready = drive_health.get_hdsentinel_binary_status(runtime)
+
+        self.assertFalse(missing[0])
+        self.assertEqual(
+            not_executable, (True, f"HDSentinel binary at {binary} is not executable.")
+        )
+        self.assertEqual(ready, (True, None))
+
+    @patch(
+        "simple_safer_server.services.drive_health.shutil.which", return_value="/usr/sbin/smartctl"
+    )
+    @patch(
+        "simple_safer_server.services.drive_health.drive_health_command_adapter.smartctl_power_mode"
+    )
+    def test_drive_power_state_reads_smartctl_standby_exit_code(self, mock_power_mode, _mock_which):
+        runtime = SimpleNamespace(is_fake=False)
+        mock_power_mode.side_effect = [
+            SimpleNamespace(returncode=3, stdout="Device is in STANDBY mode, exit(3)", stderr=""),
+            SimpleNamespace(returncode=0, stdout="Power mode is:    ACTIVE or IDLE", stderr=""),
+            SimpleNamespace(returncode=2, stdout="", stderr="Unknown USB bridge"),
+            drive_health.TimeoutExpired(["smartctl"], 15),
+        ]
+
+        states = [drive_health.get_drive_power_state("/dev/sdb", runtime=runtime) for _ in range(4)]
+
+        self.assertEqual(
+            states,
+            [
+                drive_health.POWER_STATE_STANDBY,
+                drive_health.POWER_STATE_ACTIVE,
+                drive_health.POWER_STATE_UNKNOWN,
+                drive_health.POWER_STATE_UNKNOWN,
+            ],
+        )
+        mock_power_mode.assert_called_with("/dev/sdb")
+
+    @patch(
+        "simple_safer_server.services.drive_health.get_smart_attributes",
+        side_effect=AssertionError("a sleeping drive must not be probed"),
+    )
+    @patch(
+        "simple_safer_server.services.drive_health.get_drive_power_state",
+        return_value=drive_health.POWER_STATE_STANDBY,
+    )
+    @patch(
+        "simple_safer_server.services.drive_health.resolve_backup_parent_device",
+        return_value=("/dev/sdb", "/dev/sdb1", None),
+    )
+    def test_refresh_serves_previous_reading_while_drive_sleeps(self, *_mocks):
+        runtime = SimpleNamespace(is_fake=False)
+        previous = {
+            "status": "good",
+            "checked_at": "2026-10-01T03:00:00",
+            "temperature": 31.0,
+            "hdsentinel_health": 97,
+            "hdsentinel_performance": 100,
+            "reading_at": "2026-10-01T03:00:00",
+        }
+
+        summary = drive_health.build_drive_health_summary(
+            None, None, runtime=runtime, previous_summary=previous
+        )
+
+        self.assertEqual(summary["power_state"], drive_health.POWER_STATE_STANDBY)
+        self.assertEqual(summary["source"], "cache")
+        self.assertEqual(summary["status"], "good")
+        self.assertEqual(summary["hdsentinel_health"], 97)
+        self.assertEqual(summary["reading_at"], "2026-10-01T03:00:00")
+        self.assertNotEqual(summary["checked_at"], previous["checked_at"])
+
+    def test_run_drive_probes_overlaps_probes_and_returns_partial_results(self):
+        both_started = threading.Barrier(2, timeout=2)
+        release_slow = threading.Event()
+
+        def fast(deadline):
+            both_started.wait()
+            return "smart"
+
+        def slow(deadline):
+            both_started.wait()
+            release_slow.wait(timeout=2)
+            return "hdsentinel"
+
+        started = time.monotonic()
+        outcome = drive_health.run_drive_probes({"smart": fast, "hdsentinel": slow}, 0.3)
+        elapsed = time.monotonic() - started
+        release_slow.set()
+
+        # The barrier only passes if both probes were running at once.
+        self.assertEqual(outcome["results"], {"smart": "smart"})
+        self.assertEqual(outcome["timed_out"], ["hdsentinel"])
+        self.assertEqual(outcome["probe_ms"]["hdsentinel"], 300)
+        self.assertLess(outcome["probe_ms"]["smart"], 300)
+        self.assertLess(elapsed, 1.5)
+
+    def test_run_drive_probes_runs_back_to_back_under_the_same_deadline(self):
+        order = []
+
+        def probe(name, seconds):
+            def run(deadline):
+                order.append(f"{name}-start")
+                time.sleep(seconds)
+                order.append(f"{name}-end")
+                return name
+
+            return run
+
+        outcome = drive_health.run_drive_probes(
+            {"smart": probe("smart", 0.2), "hdsentinel": probe("hdsentinel", 0.2)},
+            0.3,
+            parallel=False,
+        )
+
+        # HDSentinel only starts once SMART is done, and the deadline covers both.
+        self.assertEqual(order[:2], ["smart-start", "smart-end"])
+        self.assertEqual(outcome["results"], {"smart": "smart"})
+        self.assertEqual(outcome["timed_out"], ["hdsentinel"])
+
+    def test_only_sata_and_nvme_drives_are_probed_in_parallel(self):
+        transports = {"/dev/sda": "sata", "/dev/nvme0n1": "nvme", "/dev/sdb": "usb"}
+        with patch.object(drive_health.block_device_index, "device_info") as device_info:
+            device_info.side_effect = lambda device: (
+                {"transport": transports[device]} if device in transports else None
+            )
+
+            self.assertTrue(drive_health.probes_can_run_in_parallel("/dev/sda"))
+            self.assertTrue(drive_health.probes_can_run_in_parallel("/dev/nvme0n1"))
+            self.assertFalse(drive_health.probes_can_run_in_parallel("/dev/sdb"))
+            self.assertFalse(drive_health.probes_can_run_in_parallel("/dev/sdz"))
+            self.assertFalse(drive_health.probes_can_run_in_parallel(None))
+
+    def test_summary_probes_a_usb_backup_drive_sequentially(self):
+        runtime = SimpleNamespace(is_fake=False)
+        outcome = {"results": {}, "probe_ms": {}, "timed_out": []}
+        with (
+            patch.object(
+                drive_health,
+                "resolve_backup_parent_device",
+                return_value=("/dev/sdb", None, None),
+            ),
+            patch.object(drive_health, "get_drive_power_state", return_value="active"),
+            patch.object(drive_health, "get_hdsentinel_settings", return_value={"enabled": True}),
+            patch.object(drive_health, "probes_can_run_in_parallel", return_value=False),
+            patch.object(drive_health, "run_drive_probes", return_value=outcome) as run_probes,
+        ):
+            drive_health.build_drive_health_summary(MagicMock(), None, runtime=runtime)
+
+        self.assertEqual(list(run_probes.call_args.args[0]), ["smart", "hdsentinel"])
+        self.assertIs(run_probes.call_args.kwargs["parallel"], False)
+
+    def test_probe_timeout_is_capped_by_the_shared_deadline(self):
+        self.assertEqual(drive_health._probe_timeout(45, None), 45)
+        self.assertLessEqual(drive_health._probe_timeout(45, time.monotonic() + 5), 5)
+        with self.assertRaises(drive_health.TimeoutExpired):
+            drive_health._probe_timeout(45, time.monotonic() - 1)
+
+    def test_parse_hdsentinel_report_reads_dot_leader_and_console_layouts(self):
+        report = "\n".join(
+            [
+                "Hard Disk Sentinel for LINUX console 0.20c",
+                "Hard Disk Model ID . . . . . . . . . . : WDC WD40EFRX-68N32N0",
+                "Firmware Revision  . . . . . . . . . . : 82.00A82",
+                "Hard Disk Serial Number  . . . . . . . : WD-WCC7K0000001",
+                "Total Size . . . . . . . . . . . . . . : 3815447 MB",
+                "Current Temperature  . . . . . . . . . : 33 °C",
+                "Maximum temperature (during entire lifespan) : 51 °C",
+                "Power on time  . . . . . . . . . . . . : 25 days, 12 hours",
+                "Health . . . . . . . . . . . . . . . . : 97 %",
+                "Performance  . . . . . . . . . . . . . : 100 %",
+            ]
+        )
+        console = "HDD Device  0: /dev/sdb\nHDD Model ID : Backup\nHealth       : 88 %\n"
+
+        parsed = drive_health.parse_hdsentinel_report(report)
+
+        self.assertEqual(parsed["model"], "WDC WD40EFRX-68N32N0")
+        self.assertEqual(parsed["serial"], "WD-WCC7K0000001")
+        self.assertEqual(parsed["firmware"], "82.00A82")
+        self.assertEqual(parsed["size_mb"], 3815447)
+        self.assertEqual(parsed["temperature_c"], 33)
+        self.assertEqual((parsed["health_pct"], parsed["performance_pct"]), (97, 100))
+        self.assertEqual(parsed["power_on_hours"], 612)
+        self.assertEqual(drive_health.parse_hdsentinel_report(console)["health_pct"], 88)
+
+    @patch("simple_safer_server.services.drive_health.drive_health_command_adapter.hdsentinel")
+    def test_collect_hdsentinel_snapshot_uses_one_dump_invocation(self, mock_hdsentinel):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            runtime = SimpleNamespace(is_fake=False, bin_dir=Path(temp_dir))
+            binary = runtime.bin_dir / "hdsentinel"
+            binary.write_text("binary")
+            os.chmod(binary, 0o755)
+            config_manager = SimpleNamespace(get_value=lambda section, key, default=None: default)
+            mock_hdsentinel.return_value = SimpleNamespace(
+                returncode=0,
+                stdout="Health . . . : 97 %\nHDD Size . . : 953869 MB\n",
+                stderr="",
+            )
+
+            snapshot = drive_health.collect_hdsentinel_snapshot(
+                config_manager, None, runtime=runtime, device="/dev/sdb"
+            )
+
+        self.assertTrue(snapshot["available"])
+        self.assertEqual(snapshot["health_pct"], 97)
+        self.assertEqual(snapshot["size_text"], "953869 MB")
+        mock_hdsentinel.assert_called_once()
+        self.assertEqual(mock_hdsentinel.call_args.args[0][1:], ["-dev", "/dev/sdb", "-dump"])
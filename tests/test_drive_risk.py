@@ -0,0 +1,85 @@
+import pytest
+
+from simple_safer_server.services.drive_health_history import DriveHealthHistoryStore
+from simple_safer_server.services.drive_risk import (
+    RISK_LEVEL_ELEVATED,
+    RISK_LEVEL_LOW,
+    build_history_columns,
+    current_drive_risk,
+    score_drive_histories,
+    score_history_columns,
+)
+
+DAY = 86400
+
+
+def _rows():
+    return [
+        ("healthy", "smart_5_raw", 0, 0.0),
+        ("healthy", "smart_197_raw", 0, 0.0),
+        ("healthy", "smart_5_raw", 30 * DAY, 0.0),
+        ("failing", "smart_197_raw", 0, 8.0),
+        ("failing", "smart_197_raw", 30 * DAY, 8.0),
+        ("failing", "smart_197_raw", 60 * DAY, 200.0),
+    ]
+
+
+def test_columns_pivot_readings_and_carry_missing_metrics_forward():
+    columns = build_history_columns(_rows())
+
+    assert columns.drives == ["healthy", "failing"]
+    assert list(columns.drive_index) == [0, 0, 1, 1, 1]
+    assert list(columns.ts) == [0, 30 * DAY, 0, 30 * DAY, 60 * DAY]
+    # The second "healthy" reading had no 197 sample, so it keeps the last value.
+    assert list(columns.values["smart_197_raw"]) == [0.0, 0.0, 8.0, 8.0, 200.0]
+    assert list(columns.values["smart_198_raw"]) == [0.0] * 5
+
+
+def test_scores_rise_with_counts_and_with_their_growth():
+    scores = score_history_columns(build_history_columns(_rows()), use_numpy=False)
+
+    healthy, _, first_failing, steady_failing, growing_failing = scores
+    assert healthy < first_failing
+    # Same count, no growth: the score does not move.
+    assert steady_failing == pytest.approx(first_failing)
+    assert growing_failing > steady_failing + 30
+    # The first reading of a drive never inherits a rate from the drive before it.
+    assert first_failing == pytest.approx(
+        score_history_columns(build_history_columns(_rows()[3:4]), use_numpy=False)[0]
+    )
+
+
+def test_numpy_path_matches_pure_python():
+    pytest.importorskip("numpy")
+    columns = build_history_columns(_rows())
+
+    python_scores = score_history_columns(columns, use_numpy=False)
+    numpy_scores = score_history_columns(columns, use_numpy=True)
+
+    assert list(numpy_scores) == pytest.approx(list(python_scores))
+
+
+def test_scores_every_stored_reading_for_several_drives(tmp_path):
+    store = DriveHealthHistoryStore(tmp_path / "history.sqlite3")
+    for drive, metric, ts, value in _rows():
+        store.record(drive, 1_700_000_000 + ts, {metric: value})
+
+    points = score_drive_histories(store, ["healthy", "failing", "missing"], use_numpy=False)
+
+    assert [len(points[drive]) for drive in ("healthy", "failing", "missing")] == [2, 3, 0]
+    assert points["failing"][-1]["score"] > points["failing"][0]["score"]
+
+
+def test_current_risk_scores_live_reading_against_history(tmp_path):
+    store = DriveHealthHistoryStore(tmp_path / "history.sqlite3")
+    store.record("uuid-1", 1_700_000_000, {"smart_197_raw": 0.0})
+
+    assert current_drive_risk(store, "uuid-1", None) == {"risk_score": None, "risk_level": None}
+    steady = current_drive_risk(None, "uuid-1", {"smart_197_raw": 0.0, "smart_5_raw": 0.0})
+    growing = current_drive_risk(
+        store, "uuid-1", {"smart_197_raw": 4.0}, timestamp=1_700_000_000 + 10 * DAY
+    )
+
+    assert steady["risk_level"] == RISK_LEVEL_LOW
+    assert growing["risk_level"] == RISK_LEVEL_ELEVATED
+    assert growing["risk_score"] > steady["risk_score"]
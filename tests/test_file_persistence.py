@@ -3,10 +3,18 @@ import os
 import subprocess
 import sys
 from contextlib import suppress
+from unittest.mock import patch
 
 from simple_safer_server.services.file_persistence import (
+    BATCHED,
+    VOLATILE,
+    CoalescingJsonWriter,
     atomic_write_json,
     atomic_write_text,
+    flush_batched_writes,
+    json_read_cache,
+    locked_json_update,
+    read_json,
 )
 
 
@@ -64,3 +72,68 @@ locked_json_update(path, lock_path, {"count": 0}, update, file_mode=0o644)
 
     assert all(process.returncode == 0 for process in processes)
     assert json.loads(path.read_text()) == {"count": 5}
+
+
+def test_batched_writes_share_one_group_commit(tmp_path):
+    path = tmp_path / "status.json"
+
+    with patch("os.fsync", wraps=os.fsync) as fsync:
+        for index in range(5):
+            atomic_write_json(path, {"count": index}, durability=BATCHED)
+        assert fsync.call_count == 0
+
+        flush_batched_writes()
+
+    # One fsync for the latest inode plus one for its directory.
+    assert fsync.call_count == 2
+    assert json.loads(path.read_text()) == {"count": 4}
+
+
+def test_coalescing_writer_publishes_latest_payload_once(tmp_path):
+    path = tmp_path / "progress.json"
+    writer = CoalescingJsonWriter(window=60)
+
+    with patch("simple_safer_server.services.file_persistence.atomic_write_json") as write_json:
+        for progress in range(10):
+            writer.publish(path, {"progress": progress}, durability=VOLATILE)
+        assert writer.read(path, {}) == {"progress": 9}
+        writer.flush()
+        writer.flush()
+
+    write_json.assert_called_once_with(path, {"progress": 9}, mode=None, durability=VOLATILE)
+
+
+def test_read_json_cache_returns_private_copies_until_the_file_changes(tmp_path):
+    path = tmp_path / "records.json"
+    atomic_write_json(path, {"timer": {"disabled": True}})
+    json_read_cache.clear()
+
+    first = read_json(path, {})
+    first["timer"]["disabled"] = False
+    second = read_json(path, {})
+
+    assert second == {"timer": {"disabled": True}}
+    assert json_read_cache.stats()["hits"] == 1
+    assert json_read_cache.stats()["misses"] == 1
+
+    atomic_write_json(path, {"timer": {"disabled": False}})
+
+    assert read_json(path, {}) == {"timer": {"disabled": False}}
+    assert json_read_cache.stats()["misses"] == 2
+
+
+def test_locked_json_update_bypasses_the_read_cache(tmp_path):
+    path = tmp_path / "counter.json"
+    atomic_write_json(path, {"count": 1})
+    json_read_cache.clear()
+    read_json(path, {})
+
+    def increment(payload):
+        payload["count"] += 1
+        return payload
+
+    with patch.object(json_read_cache, "read", wraps=json_read_cache.read) as cached_read:
+        locked_json_update(path, tmp_path / "counter.lock", {}, increment)
+
+    cached_read.assert_not_called()
+    assert read_json(path, {}) == {"count": 2}
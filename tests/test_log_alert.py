@@ -1,11 +1,22 @@
 import importlib.util
 import json
 import os
+import sqlite3
 import subprocess
 import sys
 from pathlib import Path
 from types import SimpleNamespace
 
+from simple_safer_server.services.alert_store import AlertStore
+
+
+def _stored_alerts(config_dir):
+    store = AlertStore(config_dir / "alerts.sqlite3")
+    try:
+        return store.list_alerts()
+    finally:
+        store.close()
+
 
 def _load_log_alert_module():
     script_path = Path(__file__).resolve().parents[1] / "scripts" / "log_alert.py"
@@ -32,28 +43,26 @@ def test_log_alert_uses_monotonic_ids_after_retention_trim(tmp_path, monkeypatch
 
     assert module.log_alert("Newest", "message")
 
-    alerts = json.loads(alerts_path.read_text())
-    assert alerts[-1]["id"] == 1006
+    alerts = _stored_alerts(tmp_path)
+    assert [alert["id"] for alert in alerts] == [998, 1005, 1006]
     assert alerts[-1]["title"] == "Newest"
+    assert not alerts_path.exists()
 
 
-def test_log_alert_keeps_current_alerts_when_atomic_replace_fails(tmp_path, monkeypatch):
+def test_log_alert_keeps_current_alerts_when_insert_fails(tmp_path, monkeypatch):
     module = _load_log_alert_module()
-    from simple_safer_server.services import file_persistence
-
     monkeypatch.setenv("SSS_CONFIG_DIR", str(tmp_path))
-    alerts_path = tmp_path / "alerts.json"
-    original_alerts = [{"id": 7, "title": "existing"}]
-    alerts_path.write_text(json.dumps(original_alerts))
-
-    def fail_replace(source, target):
-        raise OSError("replace failed")
+    assert module.log_alert("Existing", "message")
 
-    monkeypatch.setattr(file_persistence.os, "replace", fail_replace)
+    # A read-only store makes the insert fail part-way through the transaction.
+    with sqlite3.connect(tmp_path / "alerts.sqlite3") as connection:
+        connection.execute(
+            "CREATE TRIGGER reject_alerts BEFORE INSERT ON alerts "
+            "BEGIN SELECT RAISE(ABORT, 'read-only'); END"
+        )
 
     assert not module.log_alert("Newest", "message")
-    assert json.loads(alerts_path.read_text()) == original_alerts
-    assert list(tmp_path.glob(".*.tmp")) == []
+    assert [alert["title"] for alert in _stored_alerts(tmp_path)] == ["Existing"]
 
 
 def test_log_alert_script_and_config_manager_share_alert_store(tmp_path, monkeypatch):
@@ -68,7 +77,7 @@ def test_log_alert_script_and_config_manager_share_alert_store(tmp_path, monkeyp
     assert module.log_alert("Script alert", "message")
     assert manager.log_alert("App alert", "message")
 
-    alerts = json.loads((tmp_path / "alerts.json").read_text())
+    alerts = _stored_alerts(tmp_path)
     assert [alert["id"] for alert in alerts] == [1, 2]
     assert [alert["title"] for alert in alerts] == ["Script alert", "App alert"]
 
@@ -102,6 +111,6 @@ def test_log_alert_initialization_does_not_overwrite_concurrent_append(tmp_path)
         process.wait(timeout=5)
 
     assert all(process.returncode == 0 for process in processes)
-    alerts = json.loads((tmp_path / "alerts.json").read_text())
+    alerts = _stored_alerts(tmp_path)
     assert len(alerts) == 5
     assert sorted(alert["id"] for alert in alerts) == [1, 2, 3, 4, 5]
@@ -0,0 +1,84 @@
+import subprocess
+import sys
+import threading
+import time
+
+from simple_safer_server.adapters.process_output import ProcessOutputMultiplexer
+
+
+def _python(code):
+    return subprocess.Popen(
+        [sys.executable, "-c", code],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        bufsize=1,
+    )
+
+
+def test_lines_from_both_streams_arrive_before_the_child_exits():
+    multiplexer = ProcessOutputMultiplexer()
+    first_line = threading.Event()
+    lines = []
+
+    def on_line(stream, line):
+        lines.append((stream, line))
+        first_line.set()
+
+    proc = _python(
+        "import sys, time\n"
+        "print('starting', flush=True)\n"
+        "print('warning', file=sys.stderr, flush=True)\n"
+        "time.sleep(0.5)\n"
+        "print('done')"
+    )
+    watch = multiplexer.watch(proc, on_line)
+
+    assert first_line.wait(5)
+    assert not watch.done
+    assert watch.wait(10) == 0
+    assert ("stdout", "starting") in lines
+    assert ("stderr", "warning") in lines
+    assert lines[-1] == ("stdout", "done")
+
+
+def test_partial_last_line_and_tail_are_kept():
+    multiplexer = ProcessOutputMultiplexer()
+    proc = _python("import sys; sys.stdout.write('one\\ntwo\\nno newline')")
+
+    watch = multiplexer.watch(proc, tail_lines=2)
+
+    assert watch.wait(10) == 0
+    assert list(watch.tail) == ["two", "no newline"]
+
+
+def test_cancel_event_terminates_the_child_without_polling():
+    multiplexer = ProcessOutputMultiplexer()
+    cancel_event = threading.Event()
+    proc = _python("import time; print('sleeping', flush=True); time.sleep(60)")
+    watch = multiplexer.watch(proc, cancel_event=cancel_event)
+
+    started = time.monotonic()
+    cancel_event.set()
+    multiplexer.wake()
+
+    assert watch.wait(10) is not None
+    assert watch.cancelled
+    assert proc.returncode != 0
+    assert time.monotonic() - started < 5
+
+
+def test_one_reader_serves_several_children():
+    multiplexer = ProcessOutputMultiplexer()
+    outputs = {index: [] for index in range(3)}
+    watches = [
+        multiplexer.watch(
+            _python(f"print('child {index}')"),
+            lambda _stream, line, index=index: outputs[index].append(line),
+        )
+        for index in range(3)
+    ]
+
+    assert [watch.wait(10) for watch in watches] == [0, 0, 0]
+    assert outputs == {index: [f"child {index}"] for index in range(3)}
+    assert [thread.name for thread in threading.enumerate()].count("process-output") >= 1
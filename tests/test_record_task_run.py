@@ -0,0 +1,41 @@
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from scripts import record_task_run
+from simple_safer_server.services.task_history import TASK_HISTORY_FILENAME, TaskHistoryStore
+
+SERVICE_PROPERTIES = {
+    "ActiveState": "deactivating",
+    "Result": "success",
+    "ExecMainStartTimestamp": "Sun 2026-04-26 03:00:00 UTC",
+    "ExecMainExitTimestamp": "Sun 2026-04-26 03:01:30 UTC",
+    "ExecMainStatus": "0",
+}
+
+
+def _run_hook(tmp_path, environ):
+    runtime = SimpleNamespace(data_dir=tmp_path)
+    with (
+        patch("scripts.record_task_run.get_runtime", return_value=runtime),
+        patch("scripts.record_task_run.SystemdAdapter") as adapter,
+        patch.dict("os.environ", environ, clear=False),
+    ):
+        adapter.return_value.snapshot.return_value = {"backup_cloud.service": SERVICE_PROPERTIES}
+        return record_task_run.main(["backup_cloud.service"])
+
+
+def test_hook_records_the_result_systemd_passes_to_exec_stop_post(tmp_path):
+    assert _run_hook(tmp_path, {"SERVICE_RESULT": "exit-code", "EXIT_STATUS": "3"}) == 0
+
+    store = TaskHistoryStore(tmp_path / TASK_HISTORY_FILENAME)
+    [run] = store.history("backup_cloud.service")
+    assert run["result"] == "exit-code"
+    assert run["exit_code"] == 3
+    assert run["duration_seconds"] == 90
+
+
+def test_hook_never_fails_the_unit_when_history_cannot_be_written(tmp_path):
+    blocked = tmp_path / "not-a-directory"
+    blocked.write_text("")
+
+    assert _run_hook(blocked, {"SERVICE_RESULT": "success"}) == 0
@@ -1,3 +1,4 @@
+import json
 import os
 import tempfile
 import unittest
@@ -154,3 +155,99 @@ class RuntimeHelpersTests(unittest.TestCase):
 
             self.assertEqual(mock_read_secret.call_count, 3)
             self.assertEqual(mock_sleep.call_count, 1)
+
+
+def _fake_runtime(data_dir: Path) -> runtime.Runtime:
+    return runtime.Runtime(
+        mode="fake",
+        skip_login=True,
+        repo_root=data_dir,
+        data_dir=data_dir,
+        volatile_dir=data_dir / "run",
+        config_dir=data_dir / "config",
+        logs_dir=data_dir / "logs",
+        tasks_log_dir=data_dir / "logs" / "tasks",
+        rclone_config_dir=data_dir / "rclone",
+        samba_dir=data_dir / "samba",
+        systemd_dir=data_dir / "systemd",
+        bin_dir=data_dir / "bin",
+        backup_drive_dir=data_dir / "backup-drive",
+        cloud_target_dir=data_dir / "cloud-target",
+        msmtp_config_path=data_dir / "msmtprc",
+        state_path=data_dir / "state.json",
+    )
+
+
+class FakeStateTests(unittest.TestCase):
+    def test_state_is_served_from_memory_and_written_behind(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            fake_runtime = _fake_runtime(Path(temp_dir))
+            with patch.object(runtime, "FAKE_STATE_FLUSH_DELAY_SECONDS", 60):
+                fake_state = runtime.FakeState(fake_runtime)
+                fake_state.set_mount(True, "/media/fake")
+                fake_state.set_task_state("Cloud Backup", status="Running")
+
+                on_disk = json.loads(fake_runtime.state_path.read_text())
+                self.assertFalse(on_disk["mounted"])
+                self.assertTrue(fake_state.is_mounted("/media/fake"))
+                self.assertEqual(fake_state.get_task_state("Cloud Backup")["status"], "Running")
+
+                fake_state.flush()
+
+            on_disk = json.loads(fake_runtime.state_path.read_text())
+            self.assertTrue(on_disk["mounted"])
+            self.assertEqual(on_disk["tasks"]["Cloud Backup"]["status"], "Running")
+            self.assertEqual(
+                runtime.FakeState(fake_runtime).get_task_state("Cloud Backup")["status"],
+                "Running",
+            )
+
+    def test_task_logs_append_to_files_and_resume_from_byte_offsets(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            fake_runtime = _fake_runtime(Path(temp_dir))
+            fake_state = runtime.FakeState(fake_runtime)
+
+            self.assertEqual(fake_state.get_task_log("Cloud Backup"), "No logs yet.")
+            fake_state.append_task_log("Cloud Backup", "first")
+            _text, offset = fake_state.read_task_log("Cloud Backup")
+            fake_state.append_task_log("Cloud Backup", "second\nthird")
+            text, next_offset = fake_state.read_task_log("Cloud Backup", offset)
+
+            log_path = fake_runtime.tasks_log_dir / "cloud_backup.log"
+            self.assertEqual(next_offset, log_path.stat().st_size)
+            self.assertTrue(text.endswith(" second\nthird\n"))
+            self.assertNotIn("first", text)
+            self.assertNotIn(
+                "log", json.loads(fake_runtime.state_path.read_text())["tasks"]["Cloud Backup"]
+            )
+            # A fresh instance picks up the same offsets from the file tail.
+            reloaded = runtime.FakeState(fake_runtime)
+            self.assertEqual(reloaded.read_task_log("Cloud Backup", offset), (text, next_offset))
+
+    def test_ui_log_buffer_is_bounded_while_the_file_keeps_everything(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            fake_runtime = _fake_runtime(Path(temp_dir))
+            with patch.object(runtime, "FAKE_TASK_LOG_BUFFER_LINES", 3):
+                fake_state = runtime.FakeState(fake_runtime)
+                for index in range(10):
+                    fake_state.append_task_log("Check Mount", f"line {index}")
+
+                buffered = fake_state.get_task_log("Check Mount").splitlines()
+
+            self.assertEqual(
+                [line.split(" ", 2)[2] for line in buffered], ["line 7", "line 8", "line 9"]
+            )
+            log_text = (fake_runtime.tasks_log_dir / "check_mount.log").read_text()
+            self.assertEqual(len(log_text.splitlines()), 10)
+
+    def test_legacy_logs_inside_state_json_move_to_task_log_files(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            fake_runtime = _fake_runtime(Path(temp_dir))
+            fake_runtime.state_path.write_text(
+                json.dumps({"tasks": {"App Update": {"status": "Success", "log": "old line\n"}}})
+            )
+
+            fake_state = runtime.FakeState(fake_runtime)
+
+            self.assertEqual(fake_state.get_task_log("App Update"), "old line\n")
+            self.assertEqual(fake_state.get_task_state("App Update")["status"], "Success")
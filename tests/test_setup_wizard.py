@@ -663,7 +663,7 @@ class SetupWizardTests(unittest.TestCase):
 
         self.assertEqual(response.status_code, 400)
         self.assertProblemDetail(response, 'Invalid time format')
-        config_manager.set_value.assert_not_called()
+        config_manager.set_values.assert_not_called()
 
     def test_setup_schedule_saves_two_digit_time(self):
         config_manager = MagicMock()
@@ -677,8 +677,9 @@ class SetupWizardTests(unittest.TestCase):
                 )
 
         self.assertEqual(response.status_code, 200)
-        config_manager.set_value.assert_any_call('schedule', 'backup_cloud_time', '07:05')
-        config_manager.set_value.assert_any_call('backup', 'bandwidth_limit', '4M')
+        config_manager.set_values.assert_called_once_with(
+            {'schedule': {'backup_cloud_time': '07:05'}, 'backup': {'bandwidth_limit': '4M'}}
+        )
 
     def test_setup_schedule_requires_time(self):
         config_manager = MagicMock()
@@ -690,7 +691,7 @@ class SetupWizardTests(unittest.TestCase):
 
         self.assertEqual(response.status_code, 400)
         self.assertProblemDetail(response, 'Missing required fields')
-        config_manager.set_value.assert_not_called()
+        config_manager.set_values.assert_not_called()
 
     def test_format_drive_rejects_non_string_disk(self):
         # JSON clients can send numeric or other non-string values; reject cleanly.
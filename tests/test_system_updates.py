@@ -1,4 +1,7 @@
+import subprocess
+import sys
 import tempfile
+import threading
 import unittest
 from pathlib import Path
 from subprocess import CalledProcessError, TimeoutExpired
@@ -125,6 +128,40 @@ class SystemUpdatesTests(unittest.TestCase):
             _is_apt_process("backup", ["/usr/local/bin/backup", "/var/log/apt/history.log"])
         )
 
+    def test_real_operation_streams_apt_output_into_log_and_progress(self):
+        class StreamingCommandAdapter(FakeSystemUpdatesCommandAdapter):
+            def start_apt_operation(self, command, env):
+                self.calls.append(("start_apt_operation", command))
+                return subprocess.Popen(
+                    [
+                        sys.executable,
+                        "-c",
+                        "print('Hit:1 http://archive.ubuntu.com noble InRelease')\n"
+                        "print('Reading package lists...')",
+                    ],
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    text=True,
+                    bufsize=1,
+                )
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            runtime = make_real_runtime(Path(temp_dir))
+            manager = SystemUpdatesManager(
+                FakeConfigManager(),
+                runtime=runtime,
+                command_adapter=StreamingCommandAdapter(),
+            )
+
+            manager._run_real_operation("update", threading.Event())
+
+            state = manager._read_state()
+            self.assertEqual(state["status"], "success")
+            self.assertEqual(state["progress"], 100)
+            log = manager._read_log()
+            self.assertIn("Hit:1 http://archive.ubuntu.com noble InRelease", log)
+            self.assertIn("Reading package lists...", log)
+
     def test_livepatch_json_status_timeout_returns_unavailable_payload(self):
         with tempfile.TemporaryDirectory() as temp_dir:
             runtime = make_real_runtime(Path(temp_dir))
@@ -27,7 +27,9 @@ def test_livepatch_setup_returns_validation_problem_for_empty_token():
     user_manager.is_admin.return_value = True
 
     with (
-        patch("simple_safer_server.services.user_manager.UserManager", return_value=user_manager),
+        patch(
+            "simple_safer_server.services.user_manager.get_user_registry", return_value=user_manager
+        ),
         app.test_client() as client,
     ):
         with client.session_transaction() as session:
@@ -61,7 +63,9 @@ def test_application_update_returns_conflict_when_no_update_is_available():
     user_manager.is_admin.return_value = True
 
     with (
-        patch("simple_safer_server.services.user_manager.UserManager", return_value=user_manager),
+        patch(
+            "simple_safer_server.services.user_manager.get_user_registry", return_value=user_manager
+        ),
         app.test_client() as client,
     ):
         with client.session_transaction() as session:
@@ -88,7 +92,9 @@ def test_application_update_starts_task_and_returns_task_url():
     user_manager.is_admin.return_value = True
 
     with (
-        patch("simple_safer_server.services.user_manager.UserManager", return_value=user_manager),
+        patch(
+            "simple_safer_server.services.user_manager.get_user_registry", return_value=user_manager
+        ),
         app.test_client() as client,
     ):
         with client.session_transaction() as session:
@@ -117,7 +123,9 @@ def test_application_force_update_starts_task_and_returns_task_url():
     user_manager.is_admin.return_value = True
 
     with (
-        patch("simple_safer_server.services.user_manager.UserManager", return_value=user_manager),
+        patch(
+            "simple_safer_server.services.user_manager.get_user_registry", return_value=user_manager
+        ),
         app.test_client() as client,
     ):
         with client.session_transaction() as session:
@@ -146,7 +154,9 @@ def test_application_force_update_does_not_queue_request_when_task_is_missing():
     user_manager.is_admin.return_value = True
 
     with (
-        patch("simple_safer_server.services.user_manager.UserManager", return_value=user_manager),
+        patch(
+            "simple_safer_server.services.user_manager.get_user_registry", return_value=user_manager
+        ),
         app.test_client() as client,
     ):
         with client.session_transaction() as session:
@@ -175,7 +185,9 @@ def test_application_force_update_clears_request_when_task_start_fails():
     user_manager.is_admin.return_value = True
 
     with (
-        patch("simple_safer_server.services.user_manager.UserManager", return_value=user_manager),
+        patch(
+            "simple_safer_server.services.user_manager.get_user_registry", return_value=user_manager
+        ),
         app.test_client() as client,
     ):
         with client.session_transaction() as session:
@@ -200,7 +212,9 @@ def test_application_branches_returns_remote_branch_choices():
     user_manager.is_admin.return_value = True
 
     with (
-        patch("simple_safer_server.services.user_manager.UserManager", return_value=user_manager),
+        patch(
+            "simple_safer_server.services.user_manager.get_user_registry", return_value=user_manager
+        ),
         app.test_client() as client,
     ):
         with client.session_transaction() as session:
@@ -226,7 +240,9 @@ def test_application_switch_branch_starts_task_and_returns_task_url():
     user_manager.is_admin.return_value = True
 
     with (
-        patch("simple_safer_server.services.user_manager.UserManager", return_value=user_manager),
+        patch(
+            "simple_safer_server.services.user_manager.get_user_registry", return_value=user_manager
+        ),
         app.test_client() as client,
     ):
         with client.session_transaction() as session:
@@ -255,7 +271,9 @@ def test_application_switch_branch_does_not_queue_request_when_task_is_missing()
     user_manager.is_admin.return_value = True
 
     with (
-        patch("simple_safer_server.services.user_manager.UserManager", return_value=user_manager),
+        patch(
+            "simple_safer_server.services.user_manager.get_user_registry", return_value=user_manager
+        ),
         app.test_client() as client,
     ):
         with client.session_transaction() as session:
@@ -284,7 +302,9 @@ def test_application_switch_branch_clears_request_when_task_start_fails():
     user_manager.is_admin.return_value = True
 
     with (
-        patch("simple_safer_server.services.user_manager.UserManager", return_value=user_manager),
+        patch(
+            "simple_safer_server.services.user_manager.get_user_registry", return_value=user_manager
+        ),
         app.test_client() as client,
     ):
         with client.session_transaction() as session:
@@ -311,7 +331,9 @@ def test_application_switch_branch_rejects_dirty_checkout():
     user_manager.is_admin.return_value = True
 
     with (
-        patch("simple_safer_server.services.user_manager.UserManager", return_value=user_manager),
+        patch(
+            "simple_safer_server.services.user_manager.get_user_registry", return_value=user_manager
+        ),
         app.test_client() as client,
     ):
         with client.session_transaction() as session:
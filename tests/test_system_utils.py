@@ -184,6 +184,33 @@ class SystemUtilsTimerActivationTests(unittest.TestCase):
             )
             self.assertNotIn("ExecStart=/usr/local/bin/restore_disabled_timers.py", service_text)
 
+    def test_task_services_record_run_history_after_each_run(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            runtime = self._runtime(temp_dir)
+            runtime.systemd_dir.mkdir()
+            system_utils = RecordingSystemUtils(runtime)
+
+            ok, error = system_utils.install_systemd_services_and_timers(
+                self._config(),
+                activate_timers=False,
+            )
+
+            self.assertTrue(ok, error)
+            for unit_name in [
+                "check_mount.service",
+                "check_health.service",
+                "backup_cloud.service",
+                "ddns_update.service",
+                "app_update.service",
+            ]:
+                service_text = (runtime.systemd_dir / unit_name).read_text()
+                # The leading "-" keeps a history write failure from failing the task.
+                self.assertIn(
+                    "ExecStopPost=-/opt/SimpleSaferServer/.venv/bin/python "
+                    "/opt/SimpleSaferServer/scripts/record_task_run.py %n",
+                    service_text,
+                )
+
     def test_pre_backup_timers_keep_two_minute_spacing(self):
         with tempfile.TemporaryDirectory() as temp_dir:
             runtime = self._runtime(temp_dir)
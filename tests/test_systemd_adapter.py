@@ -15,6 +15,30 @@ def test_journal_uses_all_output_so_ansi_color_sequences_survive():
     assert command[2:] == ["-u", "app_update.service", "-n", "50", "--no-pager"]
 
 
+def test_journal_page_returns_text_and_trailing_cursor():
+    runner = MagicMock()
+    runner.run.return_value.stdout = "line one\nline two\n-- cursor: s=abc;i=2\n"
+    adapter = SystemdAdapter(runner)
+
+    assert adapter.journal_page("app_update.service", 50) == (
+        "line one\nline two\n",
+        "s=abc;i=2",
+    )
+    assert runner.run.call_args[0][0][-1] == "--show-cursor"
+
+
+def test_journal_page_after_cursor_is_quiet_and_keeps_empty_pages_empty():
+    runner = MagicMock()
+    runner.run.return_value.stdout = ""
+    adapter = SystemdAdapter(runner)
+
+    assert adapter.journal_page("app_update.service", 50, after_cursor="s=abc;i=2") == ("", None)
+
+    command = runner.run.call_args[0][0]
+    assert "--after-cursor=s=abc;i=2" in command
+    assert "-q" in command
+
+
 def test_timer_disable_and_enable_use_systemd_timer_unit_only():
     runner = MagicMock()
     adapter = SystemdAdapter(runner)
@@ -34,3 +58,40 @@ def test_timer_disable_and_enable_use_systemd_timer_unit_only():
         "--now",
         "backup_cloud.timer",
     ]
+
+
+def test_snapshot_reads_all_units_in_one_show_call_and_splits_unit_blocks():
+    runner = MagicMock()
+    runner.run.return_value.stdout = (
+        "LoadState=loaded\nResult=success\nExecMainStartTimestamp=\n"
+        "\n"
+        "LoadState=loaded\nNextElapseUSecRealtime=Mon 2026-04-27 03:00:00 UTC\n"
+    )
+    adapter = SystemdAdapter(runner)
+
+    snapshot = adapter.snapshot(
+        ["backup_cloud.service", "backup_cloud.timer"],
+        ("LoadState", "Result", "ExecMainStartTimestamp", "NextElapseUSecRealtime"),
+    )
+
+    assert runner.run.call_count == 1
+    assert runner.run.call_args[0][0] == [
+        "systemctl",
+        "show",
+        "backup_cloud.service",
+        "backup_cloud.timer",
+        "--property=LoadState",
+        "--property=Result",
+        "--property=ExecMainStartTimestamp",
+        "--property=NextElapseUSecRealtime",
+    ]
+    assert snapshot["backup_cloud.service"] == {
+        "LoadState": "loaded",
+        "Result": "success",
+        "ExecMainStartTimestamp": "",
+        "NextElapseUSecRealtime": "",
+    }
+    assert snapshot["backup_cloud.timer"]["NextElapseUSecRealtime"] == (
+        "Mon 2026-04-27 03:00:00 UTC"
+    )
+    assert snapshot["backup_cloud.timer"]["Result"] == ""
@@ -0,0 +1,173 @@
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from simple_safer_server.adapters.systemd_bus import (
+    FakeSystemdBus,
+    SystemdBusAdapter,
+    format_property_value,
+)
+from simple_safer_server.services.task_service import (
+    TASK_SYSTEMD_PROPERTIES,
+    Status,
+    TaskService,
+)
+
+START_USEC = int(datetime(2026, 4, 26, 3, 0, 0).timestamp() * 1_000_000)
+
+
+def _fake_bus():
+    return FakeSystemdBus(
+        {
+            "backup_cloud.service": {
+                "LoadState": "loaded",
+                "ActiveState": "inactive",
+                "Result": "success",
+                "ExecMainStartTimestamp": START_USEC,
+                "ExecMainStartTimestampMonotonic": 1_000_000,
+                "ExecMainExitTimestampMonotonic": 4_000_000,
+            },
+            "backup_cloud.timer": {
+                "LoadState": "loaded",
+                "ActiveState": "active",
+                "UnitFileState": "enabled",
+                "NextElapseUSecRealtime": START_USEC + 86_400_000_000,
+            },
+        }
+    )
+
+
+def _get_all_calls(bus):
+    return [call for call in bus.calls if call[1] == "GetAll"]
+
+
+def test_format_property_value_matches_systemctl_show_rendering():
+    assert format_property_value("ExecMainStartTimestamp", 0) == ""
+    assert format_property_value("NextElapseUSecRealtime", 2**64 - 1) == ""
+    assert format_property_value("ExecMainStartTimestamp", START_USEC).startswith(
+        "Sun 2026-04-26 03:00:00"
+    )
+    assert format_property_value("ExecMainStartTimestampMonotonic", 1_000_000) == "1000000"
+    assert format_property_value("CanStart", True) == "yes"
+
+
+def test_snapshot_loads_each_unit_once_then_serves_from_the_table():
+    bus = _fake_bus()
+    runner = MagicMock()
+    adapter = SystemdBusAdapter(runner, connect=lambda: bus)
+    units = ["backup_cloud.service", "backup_cloud.timer"]
+
+    first = adapter.snapshot(units, TASK_SYSTEMD_PROPERTIES)
+    second = adapter.snapshot(units, TASK_SYSTEMD_PROPERTIES)
+
+    assert first == second
+    assert bus.subscribed
+    assert len(_get_all_calls(bus)) == 4
+    assert any("PropertiesChanged" in rule for rule in bus.matches)
+    runner.run.assert_not_called()
+    assert first["backup_cloud.service"]["Result"] == "success"
+    assert first["backup_cloud.service"]["ExecMainExitTimestampMonotonic"] == "4000000"
+    assert first["backup_cloud.timer"]["UnitFileState"] == "enabled"
+    assert first["backup_cloud.timer"]["ExecMainStartTimestamp"] == ""
+
+
+def test_properties_changed_signal_updates_table_without_new_calls():
+    bus = _fake_bus()
+    adapter = SystemdBusAdapter(MagicMock(), connect=lambda: bus)
+    adapter.snapshot(["backup_cloud.service"], TASK_SYSTEMD_PROPERTIES)
+    calls_before = len(bus.calls)
+
+    bus.emit_properties_changed("backup_cloud.service", {"ActiveState": "activating"})
+    snapshot = adapter.snapshot(["backup_cloud.service"], TASK_SYSTEMD_PROPERTIES)
+
+    assert snapshot["backup_cloud.service"]["ActiveState"] == "activating"
+    assert len(bus.calls) == calls_before
+
+
+def test_invalidations_and_unit_file_changes_force_a_refetch():
+    bus = _fake_bus()
+    adapter = SystemdBusAdapter(MagicMock(), connect=lambda: bus)
+    units = ["backup_cloud.service", "backup_cloud.timer"]
+    adapter.snapshot(units, TASK_SYSTEMD_PROPERTIES)
+
+    bus.emit_properties_changed("backup_cloud.service", {}, invalidated=["Result"])
+    adapter.snapshot(units, TASK_SYSTEMD_PROPERTIES)
+    assert len(_get_all_calls(bus)) == 6
+
+    # UnitFileState never emits PropertiesChanged, so enable/disable is only
+    # visible through the manager's UnitFilesChanged signal.
+    bus.units["backup_cloud.timer"]["UnitFileState"] = "disabled"
+    bus.emit_manager_signal("UnitFilesChanged")
+    snapshot = adapter.snapshot(units, TASK_SYSTEMD_PROPERTIES)
+
+    assert snapshot["backup_cloud.timer"]["UnitFileState"] == "disabled"
+    assert len(_get_all_calls(bus)) == 10
+
+
+def test_own_timer_changes_mark_the_unit_stale():
+    bus = _fake_bus()
+    adapter = SystemdBusAdapter(MagicMock(), connect=lambda: bus)
+    adapter.snapshot(["backup_cloud.timer"], TASK_SYSTEMD_PROPERTIES)
+
+    bus.units["backup_cloud.timer"]["UnitFileState"] = "disabled"
+    adapter.disable_timer_now("backup_cloud.timer")
+
+    snapshot = adapter.snapshot(["backup_cloud.timer"], TASK_SYSTEMD_PROPERTIES)
+    assert snapshot["backup_cloud.timer"]["UnitFileState"] == "disabled"
+
+
+def test_unreachable_bus_falls_back_to_systemctl_and_backs_off():
+    runner = MagicMock()
+    runner.run.return_value.stdout = "LoadState=loaded\n"
+    connect = MagicMock(side_effect=FileNotFoundError("no bus socket"))
+    now = [100.0]
+    adapter = SystemdBusAdapter(runner, connect=connect, clock=lambda: now[0])
+
+    adapter.snapshot(["check_mount.service"], ("LoadState",))
+    adapter.snapshot(["check_mount.service"], ("LoadState",))
+    now[0] += 60
+    snapshot = adapter.snapshot(["check_mount.service"], ("LoadState",))
+
+    assert snapshot == {"check_mount.service": {"LoadState": "loaded"}}
+    assert connect.call_count == 2
+    assert runner.run.call_count == 3
+
+
+def test_closed_bus_drops_table_and_uses_systemctl_for_the_read():
+    bus = _fake_bus()
+    runner = MagicMock()
+    runner.run.return_value.stdout = "LoadState=loaded\n"
+    adapter = SystemdBusAdapter(runner, connect=lambda: bus)
+    adapter.snapshot(["backup_cloud.service"], ("LoadState",))
+
+    bus.emit_properties_changed("backup_cloud.service", {}, invalidated=["ActiveState"])
+    bus.call = MagicMock(side_effect=ConnectionError("bus went away"))
+
+    assert adapter.snapshot(["backup_cloud.service"], ("LoadState",)) == {
+        "backup_cloud.service": {"LoadState": "loaded"}
+    }
+    assert runner.run.call_count == 1
+
+
+def test_task_service_status_follows_bus_events():
+    bus = _fake_bus()
+    adapter = SystemdBusAdapter(MagicMock(), connect=lambda: bus)
+    runtime = SimpleNamespace(is_fake=False, data_dir=Path("/tmp/simple-safer-server-bus-test"))
+    service = TaskService(
+        runtime=runtime,
+        config_manager=MagicMock(),
+        system_utils=MagicMock(),
+        systemd_adapter=adapter,
+        disabled_timer_service=MagicMock(get_record=MagicMock(return_value=None)),
+        state_cache_ttl=0,
+    )
+    task = service.get_task("Cloud Backup")
+    assert task is not None
+
+    assert task.status == Status.SUCCESS
+    assert task.last_run_duration == "3s"
+
+    bus.emit_properties_changed("backup_cloud.service", {"ActiveState": "activating"})
+
+    assert task.status == Status.RUNNING
@@ -0,0 +1,67 @@
+import sqlite3
+import time
+
+from simple_safer_server.services.task_history import TaskHistoryStore
+
+
+def _store(tmp_path):
+    return TaskHistoryStore(tmp_path / "task_history.sqlite3")
+
+
+def test_store_uses_wal_and_records_each_run_once(tmp_path):
+    store = _store(tmp_path)
+
+    assert store.record_run("backup_cloud.service", 1000.0, 1060.0, "success", 0)
+    assert not store.record_run("backup_cloud.service", 1000.0, 1060.0, "success", 0)
+
+    with sqlite3.connect(store.db_path) as connection:
+        assert connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    [run] = store.history("backup_cloud.service")
+    assert run["duration_seconds"] == 60
+    assert run["success"] is True
+
+
+def test_history_pages_backwards_from_the_oldest_seen_run(tmp_path):
+    store = _store(tmp_path)
+    store.record_runs(
+        {
+            "unit": "ddns_update.service",
+            "started_at": 1000.0 + index * 300,
+            "finished_at": 1001.0 + index * 300,
+            "result": "success",
+            "exit_code": 0,
+        }
+        for index in range(5)
+    )
+
+    first_page = store.history("ddns_update.service", limit=2)
+    second_page = store.history("ddns_update.service", limit=2, before_id=first_page[-1]["id"])
+
+    assert [run["id"] for run in first_page] == [5, 4]
+    assert [run["id"] for run in second_page] == [3, 2]
+
+
+def test_latest_runs_and_failure_stats_are_per_unit(tmp_path):
+    store = _store(tmp_path)
+    now = time.time()
+    store.record_run("check_mount.service", now - 7200, now - 7190, "success", 0)
+    store.record_run("check_mount.service", now - 3600, now - 3590, "exit-code", 1)
+    store.record_run("backup_cloud.service", now - 600, None, "success")
+
+    latest = store.latest_runs()
+    stats = store.failure_stats(now - 86400)
+
+    assert latest["check_mount.service"]["result"] == "exit-code"
+    assert latest["backup_cloud.service"]["finished_at"] == ""
+    assert stats["check_mount.service"] == {"runs": 2, "failures": 1, "failure_rate": 0.5}
+    assert stats["backup_cloud.service"]["failures"] == 0
+
+
+def test_prune_drops_runs_older_than_retention(tmp_path):
+    store = _store(tmp_path)
+    now = time.time()
+    store.record_run("app_update.service", now - 10 * 86400, now - 10 * 86400 + 5, "success")
+    store.record_run("app_update.service", now - 60, now - 55, "success")
+
+    assert store.prune(retention_days=7) == 1
+    assert len(store.history("app_update.service")) == 1
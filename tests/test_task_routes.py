@@ -4,7 +4,7 @@ from unittest.mock import MagicMock, call, patch
 from flask import Flask
 
 from simple_safer_server.routes.tasks import tasks
-from simple_safer_server.services.task_service import TASK_LOG_LINE_LIMIT
+from simple_safer_server.services.task_service import TASK_LOG_LINE_LIMIT, TaskLogPage
 
 
 def _build_app(task_service):
@@ -29,7 +29,7 @@ def test_task_detail_loads_maximum_log_window():
     task = MagicMock()
     task.name = "App Update"
     task.status = "Success"
-    task.get_logs.return_value = "full log"
+    task.get_log_page.return_value = TaskLogPage("full log", "s=1", append=False)
     task_service = MagicMock()
     task_service.get_task.return_value = task
     task_service.task_summary.return_value = {"schedule": {"state": "active"}}
@@ -38,7 +38,9 @@ def test_task_detail_loads_maximum_log_window():
     user_manager.is_admin.return_value = True
 
     with (
-        patch("simple_safer_server.services.user_manager.UserManager", return_value=user_manager),
+        patch(
+            "simple_safer_server.services.user_manager.get_user_registry", return_value=user_manager
+        ),
         patch(
             "simple_safer_server.routes.tasks.render_template", return_value="rendered"
         ) as render,
@@ -50,14 +52,16 @@ def test_task_detail_loads_maximum_log_window():
         response = client.get("/task/App%20Update")
 
     assert response.status_code == 200
-    task.get_logs.assert_called_once_with(TASK_LOG_LINE_LIMIT)
+    task.get_log_page.assert_called_once_with(lines=TASK_LOG_LINE_LIMIT)
+    assert render.call_args[1]["logs"] == "full log"
+    assert render.call_args[1]["log_cursor"] == "s=1"
     assert render.call_args[1]["log_lines"] == TASK_LOG_LINE_LIMIT
     assert render.call_args[1]["task_summary"] == {"schedule": {"state": "active"}}
 
 
 def test_task_logs_defaults_to_global_log_window():
     task = MagicMock()
-    task.get_logs.return_value = "full log"
+    task.get_log_page.return_value = TaskLogPage("full log", "s=1", append=False)
     task_service = MagicMock()
     task_service.get_task.return_value = task
     app = _build_app(task_service)
@@ -65,7 +69,9 @@ def test_task_logs_defaults_to_global_log_window():
     user_manager.is_admin.return_value = True
 
     with (
-        patch("simple_safer_server.services.user_manager.UserManager", return_value=user_manager),
+        patch(
+            "simple_safer_server.services.user_manager.get_user_registry", return_value=user_manager
+        ),
         app.test_client() as client,
     ):
         with client.session_transaction() as session:
@@ -75,12 +81,14 @@ def test_task_logs_defaults_to_global_log_window():
 
     assert response.status_code == 200
     assert response.text == "full log"
-    task.get_logs.assert_called_once_with(TASK_LOG_LINE_LIMIT)
+    assert response.headers["X-Log-Cursor"] == "s=1"
+    assert response.headers["X-Log-Mode"] == "replace"
+    task.get_log_page.assert_called_once_with(None, TASK_LOG_LINE_LIMIT)
 
 
 def test_task_logs_clamps_invalid_and_oversized_windows_to_global_limit():
     task = MagicMock()
-    task.get_logs.return_value = "full log"
+    task.get_log_page.return_value = TaskLogPage("full log", "s=1", append=False)
     task_service = MagicMock()
     task_service.get_task.return_value = task
     app = _build_app(task_service)
@@ -88,7 +96,9 @@ def test_task_logs_clamps_invalid_and_oversized_windows_to_global_limit():
     user_manager.is_admin.return_value = True
 
     with (
-        patch("simple_safer_server.services.user_manager.UserManager", return_value=user_manager),
+        patch(
+            "simple_safer_server.services.user_manager.get_user_registry", return_value=user_manager
+        ),
         app.test_client() as client,
     ):
         with client.session_transaction() as session:
@@ -99,15 +109,15 @@ def test_task_logs_clamps_invalid_and_oversized_windows_to_global_limit():
 
     assert invalid_response.status_code == 200
     assert oversized_response.status_code == 200
-    assert task.get_logs.call_args_list == [
-        call(TASK_LOG_LINE_LIMIT),
-        call(TASK_LOG_LINE_LIMIT),
+    assert task.get_log_page.call_args_list == [
+        call(None, TASK_LOG_LINE_LIMIT),
+        call(None, TASK_LOG_LINE_LIMIT),
     ]
 
 
 def test_task_logs_keeps_smaller_requested_window():
     task = MagicMock()
-    task.get_logs.return_value = "short log"
+    task.get_log_page.return_value = TaskLogPage("short log", "s=1", append=False)
     task_service = MagicMock()
     task_service.get_task.return_value = task
     app = _build_app(task_service)
@@ -115,7 +125,9 @@ def test_task_logs_keeps_smaller_requested_window():
     user_manager.is_admin.return_value = True
 
     with (
-        patch("simple_safer_server.services.user_manager.UserManager", return_value=user_manager),
+        patch(
+            "simple_safer_server.services.user_manager.get_user_registry", return_value=user_manager
+        ),
         app.test_client() as client,
     ):
         with client.session_transaction() as session:
@@ -124,7 +136,34 @@ def test_task_logs_keeps_smaller_requested_window():
         response = client.get("/task/App%20Update/logs?lines=25")
 
     assert response.status_code == 200
-    task.get_logs.assert_called_once_with(25)
+    task.get_log_page.assert_called_once_with(None, 25)
+
+
+def test_task_logs_passes_cursor_and_reports_appended_entries():
+    task = MagicMock()
+    task.get_log_page.return_value = TaskLogPage("new line\n", "s=2", append=True)
+    task_service = MagicMock()
+    task_service.get_task.return_value = task
+    app = _build_app(task_service)
+    user_manager = MagicMock()
+    user_manager.is_admin.return_value = True
+
+    with (
+        patch(
+            "simple_safer_server.services.user_manager.get_user_registry", return_value=user_manager
+        ),
+        app.test_client() as client,
+    ):
+        with client.session_transaction() as session:
+            session["username"] = "admin"
+
+        response = client.get("/task/App%20Update/logs?cursor=s%3D1")
+
+    assert response.status_code == 200
+    assert response.text == "new line\n"
+    assert response.headers["X-Log-Cursor"] == "s=2"
+    assert response.headers["X-Log-Mode"] == "append"
+    task.get_log_page.assert_called_once_with("s=1", TASK_LOG_LINE_LIMIT)
 
 
 def test_task_status_returns_current_task_summary():
@@ -143,7 +182,9 @@ def test_task_status_returns_current_task_summary():
     user_manager.is_admin.return_value = True
 
     with (
-        patch("simple_safer_server.services.user_manager.UserManager", return_value=user_manager),
+        patch(
+            "simple_safer_server.services.user_manager.get_user_registry", return_value=user_manager
+        ),
         app.test_client() as client,
     ):
         with client.session_transaction() as session:
@@ -165,7 +206,9 @@ def test_task_status_returns_not_found_for_unknown_task():
     user_manager.is_admin.return_value = True
 
     with (
-        patch("simple_safer_server.services.user_manager.UserManager", return_value=user_manager),
+        patch(
+            "simple_safer_server.services.user_manager.get_user_registry", return_value=user_manager
+        ),
         app.test_client() as client,
     ):
         with client.session_transaction() as session:
@@ -190,7 +233,9 @@ def test_disable_schedule_route_calls_task_and_returns_updated_summary():
     user_manager.is_admin.return_value = True
 
     with (
-        patch("simple_safer_server.services.user_manager.UserManager", return_value=user_manager),
+        patch(
+            "simple_safer_server.services.user_manager.get_user_registry", return_value=user_manager
+        ),
         app.test_client() as client,
     ):
         with client.session_transaction() as session:
@@ -216,7 +261,9 @@ def test_disable_schedule_route_rejects_invalid_mode_before_calling_task():
     user_manager.is_admin.return_value = True
 
     with (
-        patch("simple_safer_server.services.user_manager.UserManager", return_value=user_manager),
+        patch(
+            "simple_safer_server.services.user_manager.get_user_registry", return_value=user_manager
+        ),
         app.test_client() as client,
     ):
         with client.session_transaction() as session:
@@ -242,7 +289,9 @@ def test_disable_schedule_route_rejects_invalid_hours_before_calling_task():
     user_manager.is_admin.return_value = True
 
     with (
-        patch("simple_safer_server.services.user_manager.UserManager", return_value=user_manager),
+        patch(
+            "simple_safer_server.services.user_manager.get_user_registry", return_value=user_manager
+        ),
         app.test_client() as client,
     ):
         with client.session_transaction() as session:
@@ -268,7 +317,9 @@ def test_disable_schedule_route_rejects_non_positive_hours_before_calling_task()
     user_manager.is_admin.return_value = True
 
     with (
-        patch("simple_safer_server.services.user_manager.UserManager", return_value=user_manager),
+        patch(
+            "simple_safer_server.services.user_manager.get_user_registry", return_value=user_manager
+        ),
         app.test_client() as client,
     ):
         with client.session_transaction() as session:
@@ -298,7 +349,9 @@ def test_enable_schedule_route_calls_task_and_returns_updated_summary():
     user_manager.is_admin.return_value = True
 
     with (
-        patch("simple_safer_server.services.user_manager.UserManager", return_value=user_manager),
+        patch(
+            "simple_safer_server.services.user_manager.get_user_registry", return_value=user_manager
+        ),
         app.test_client() as client,
     ):
         with client.session_transaction() as session:
@@ -322,7 +375,9 @@ def test_disable_schedule_route_returns_not_found_for_unknown_task():
     user_manager.is_admin.return_value = True
 
     with (
-        patch("simple_safer_server.services.user_manager.UserManager", return_value=user_manager),
+        patch(
+            "simple_safer_server.services.user_manager.get_user_registry", return_value=user_manager
+        ),
         app.test_client() as client,
     ):
         with client.session_transaction() as session:
@@ -362,7 +417,9 @@ def test_enable_schedule_route_returns_json_admin_required_for_demoted_fetch_ses
     user_manager.is_admin.return_value = False
 
     with (
-        patch("simple_safer_server.services.user_manager.UserManager", return_value=user_manager),
+        patch(
+            "simple_safer_server.services.user_manager.get_user_registry", return_value=user_manager
+        ),
         app.test_client() as client,
     ):
         with client.session_transaction() as session:
@@ -395,7 +452,9 @@ def test_enable_schedule_route_reports_operation_failure():
     user_manager.is_admin.return_value = True
 
     with (
-        patch("simple_safer_server.services.user_manager.UserManager", return_value=user_manager),
+        patch(
+            "simple_safer_server.services.user_manager.get_user_registry", return_value=user_manager
+        ),
         app.test_client() as client,
     ):
         with client.session_transaction() as session:
@@ -408,3 +467,36 @@ def test_enable_schedule_route_reports_operation_failure():
 
     assert response.status_code == 500
     assert response.get_json()["type"].endswith("#task-operation-failed")
+
+
+def test_task_history_api_returns_runs_stats_and_next_page():
+    task = MagicMock()
+    task_service = MagicMock()
+    task_service.get_task.return_value = task
+    task_service.task_history.return_value = [{"id": 9}, {"id": 7}]
+    task_service.task_failure_stats.return_value = {
+        "App Update": {"runs": 2, "failures": 0, "failure_rate": 0.0}
+    }
+    task.name = "App Update"
+    app = _build_app(task_service)
+    user_manager = MagicMock()
+    user_manager.is_admin.return_value = True
+
+    with (
+        patch(
+            "simple_safer_server.services.user_manager.get_user_registry", return_value=user_manager
+        ),
+        app.test_client() as client,
+    ):
+        with client.session_transaction() as session:
+            session["username"] = "admin"
+
+        response = client.get("/api/tasks/App%20Update/history?limit=2&before=12")
+        invalid = client.get("/api/tasks/App%20Update/history?before=abc")
+
+    assert response.status_code == 200
+    data = response.get_json()["data"]
+    assert data["next_before"] == 7
+    assert data["stats"]["runs"] == 2
+    task_service.task_history.assert_called_once_with(task, limit=2, before_id=12)
+    assert invalid.status_code == 400
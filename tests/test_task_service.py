@@ -1,13 +1,16 @@
 import json
 import os
+import tempfile
 import threading
 import time
 import unittest
 from datetime import UTC, datetime
 from pathlib import Path
+from subprocess import CalledProcessError
 from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
+from simple_safer_server.services.task_history import TaskHistoryStore
 from simple_safer_server.services.task_service import (
     TASK_LOG_LINE_LIMIT,
     Status,
@@ -45,6 +48,12 @@ class FakeState:
     def append_task_log(self, task_name, message):
         self.logs.append((task_name, message))
 
+    def read_task_log(self, task_name, offset=0):
+        log = "".join(f"{message}\n" for name, message in self.logs if name == task_name)
+        if offset > len(log):
+            offset = 0
+        return log[offset:], len(log)
+
     def set_task_state(self, task_name, **kwargs):
         self.task_state.setdefault(task_name, {}).update(kwargs)
 
@@ -91,11 +100,20 @@ class FakeSystemdAdapter:
         }
         self.active = "inactive"
         self.journal_calls = []
+        self.journal_page_calls = []
+        self.journal_cursor = "s=1;i=2"
+        self.snapshot_calls = []
 
     def journal(self, unit_name, lines):
         self.journal_calls.append((unit_name, lines))
         return self.journal_output
 
+    def journal_page(self, unit_name, lines, after_cursor=None):
+        self.journal_page_calls.append((unit_name, lines, after_cursor))
+        if after_cursor == "s=dead":
+            raise CalledProcessError(1, ["journalctl"])
+        return self.journal_output, self.journal_cursor
+
     def start_unit(self, unit_name):
         self.started.append(unit_name)
 
@@ -117,14 +135,38 @@ class FakeSystemdAdapter:
     def is_active(self, unit_name):
         return self.active
 
+    def snapshot(self, unit_names, property_names):
+        self.snapshot_calls.append(list(unit_names))
+        result = {}
+        for unit_name in unit_names:
+            values = {"ActiveState": self.active} if unit_name.endswith(".service") else {}
+            for (unit, _property_name), line in self.properties.items():
+                if unit == unit_name:
+                    key, _separator, value = line.partition("=")
+                    values[key] = value
+            for line in self.multi_properties.get(unit_name, "").splitlines():
+                key, _separator, value = line.partition("=")
+                values[key] = value
+            result[unit_name] = {name: values.get(name, "") for name in property_names}
+        return result
+
+
+def _finished_pipe(text):
+    # The output multiplexer selects on real file descriptors, so fake
+    # processes hand it a pipe that already holds their whole output.
+    read_fd, write_fd = os.pipe()
+    os.write(write_fd, text.encode())
+    os.close(write_fd)
+    return os.fdopen(read_fd, "r")
+
 
 class FakeProcess:
-    def __init__(self, returncode=0, stdout="", stderr=""):
-        from io import StringIO
+    pid = None
 
+    def __init__(self, returncode=0, stdout="", stderr=""):
         self.returncode = returncode
-        self.stdout = StringIO(stdout)
-        self.stderr = StringIO(stderr)
+        self.stdout = _finished_pipe(stdout)
+        self.stderr = _finished_pipe(stderr)
         self._polled = False
         self.terminated = False
         self.killed = False
@@ -153,10 +195,12 @@ class TaskServiceTests(unittest.TestCase):
         is_fake=True,
         systemd_adapter=None,
         rclone_dir="",
+        state_cache_ttl=0,
     ):
         runtime = SimpleNamespace(
             is_fake=is_fake,
             data_dir=Path("/tmp/simple-safer-server-test-data"),
+            volatile_dir=Path("/tmp/simple-safer-server-test-data/run"),
             default_mount_point=mount_point,
             repo_root=Path("."),
             rclone_config_dir=Path("."),
@@ -169,6 +213,7 @@ class TaskServiceTests(unittest.TestCase):
             fake_state=fake_state,
             logger=MagicMock(),
             systemd_adapter=systemd_adapter,
+            state_cache_ttl=state_cache_ttl,
         )
         return service, fake_state
 
@@ -298,6 +343,104 @@ class TaskServiceTests(unittest.TestCase):
         self.assertEqual(task.last_run_duration, "3s")
         self.assertEqual(task.status, Status.SUCCESS)
 
+    def test_task_summaries_read_every_task_unit_with_one_systemd_snapshot(self):
+        systemd_adapter = FakeSystemdAdapter()
+        service, _fake_state = self.build_service(is_fake=False, systemd_adapter=systemd_adapter)
+
+        summaries = service.task_summaries()
+
+        self.assertEqual(len(systemd_adapter.snapshot_calls), 1)
+        self.assertEqual(len(systemd_adapter.snapshot_calls[0]), 10)
+        cloud_backup = next(item for item in summaries if item["name"] == "Cloud Backup")
+        self.assertEqual(cloud_backup["status"], Status.SUCCESS)
+        self.assertEqual(cloud_backup["last_run_duration"], "3s")
+        check_mount = next(item for item in summaries if item["name"] == "Check Mount")
+        self.assertEqual(check_mount["last_run"], "Unknown")
+
+    def test_task_run_state_reports_retrieval_errors_when_systemd_is_unreachable(self):
+        systemd_adapter = FakeSystemdAdapter()
+        systemd_adapter.snapshot = MagicMock(
+            side_effect=CalledProcessError(1, ["systemctl", "show"])
+        )
+        service, _fake_state = self.build_service(is_fake=False, systemd_adapter=systemd_adapter)
+        task = service.get_task("Cloud Backup")
+        assert task is not None
+
+        self.assertEqual(
+            service.task_run_state(task),
+            {
+                "status": Status.ERROR,
+                "last_run": "Retrieval Error",
+                "next_run": "Retrieval Error",
+                "last_run_duration": "Retrieval Error",
+            },
+        )
+
+    def test_concurrent_status_polls_share_one_in_flight_systemd_read(self):
+        systemd_adapter = FakeSystemdAdapter()
+        release = threading.Event()
+        original_snapshot = systemd_adapter.snapshot
+
+        def slow_snapshot(unit_names, property_names):
+            release.wait(timeout=5)
+            return original_snapshot(unit_names, property_names)
+
+        systemd_adapter.snapshot = slow_snapshot
+        service, _fake_state = self.build_service(
+            is_fake=False, systemd_adapter=systemd_adapter, state_cache_ttl=60
+        )
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(service.task_summaries()))
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.05)
+        release.set()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        self.assertEqual(len(results), 5)
+        self.assertEqual(len(systemd_adapter.snapshot_calls), 1)
+
+    def test_task_actions_invalidate_cached_state_immediately(self):
+        systemd_adapter = FakeSystemdAdapter()
+        service, _fake_state = self.build_service(
+            is_fake=False, systemd_adapter=systemd_adapter, state_cache_ttl=60
+        )
+        task = service.get_task("Cloud Backup")
+        assert task is not None
+
+        self.assertEqual(task.status, Status.SUCCESS)
+        systemd_adapter.active = "activating"
+        self.assertEqual(task.status, Status.SUCCESS)
+        self.assertEqual(len(systemd_adapter.snapshot_calls), 1)
+
+        task.start()
+
+        self.assertEqual(task.status, Status.RUNNING)
+        self.assertEqual(len(systemd_adapter.snapshot_calls), 2)
+
+    def test_state_loaded_across_an_invalidation_is_not_cached(self):
+        systemd_adapter = FakeSystemdAdapter()
+        service, _fake_state = self.build_service(
+            is_fake=False, systemd_adapter=systemd_adapter, state_cache_ttl=60
+        )
+        original_snapshot = systemd_adapter.snapshot
+
+        def snapshot_then_race_an_action(unit_names, property_names):
+            result = original_snapshot(unit_names, property_names)
+            service.invalidate_state_cache()
+            return result
+
+        systemd_adapter.snapshot = snapshot_then_race_an_action
+        service.task_summaries()
+        systemd_adapter.snapshot = original_snapshot
+        service.task_summaries()
+
+        self.assertEqual(len(systemd_adapter.snapshot_calls), 2)
+
     def test_real_task_start_stop_and_logs_use_systemd_adapter(self):
         systemd_adapter = FakeSystemdAdapter()
         service, _fake_state = self.build_service(is_fake=False, systemd_adapter=systemd_adapter)
@@ -315,6 +458,130 @@ class TaskServiceTests(unittest.TestCase):
         self.assertEqual(systemd_adapter.started, ["backup_cloud.service"])
         self.assertEqual(systemd_adapter.stopped, ["backup_cloud.service"])
 
+    def test_snapshots_record_each_finished_run_once(self):
+        systemd_adapter = FakeSystemdAdapter()
+        service, _fake_state = self.build_service(is_fake=False, systemd_adapter=systemd_adapter)
+        service.history_store = MagicMock()
+
+        service.task_summaries()
+        service.task_summaries()
+
+        service.history_store.record_runs.assert_called_once()
+        [run] = service.history_store.record_runs.call_args[0][0]
+        self.assertEqual(run["unit"], "backup_cloud.service")
+        self.assertEqual(run["result"], "success")
+        self.assertEqual(run["started_at"], datetime(2026, 4, 26, 3, 0, 0).timestamp())
+
+    def test_concurrent_polls_record_a_new_run_once_outside_the_systemd_read(self):
+        systemd_adapter = FakeSystemdAdapter()
+        service, _fake_state = self.build_service(
+            is_fake=False, systemd_adapter=systemd_adapter, state_cache_ttl=60
+        )
+        service.history_store = MagicMock()
+        loading_during_record = []
+
+        def slow_record(_runs):
+            loading_during_record.append(service._state_cache._loading)
+            time.sleep(0.05)
+
+        service.history_store.record_runs.side_effect = slow_record
+        threads = [threading.Thread(target=service.task_summaries) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        service.history_store.record_runs.assert_called_once()
+        self.assertEqual(loading_during_record, [False])
+
+    def test_running_units_are_not_recorded_with_their_previous_result(self):
+        systemd_adapter = FakeSystemdAdapter()
+        systemd_adapter.active = "activating"
+        service, _fake_state = self.build_service(is_fake=False, systemd_adapter=systemd_adapter)
+        service.history_store = MagicMock()
+
+        service.task_summaries()
+
+        service.history_store.record_runs.assert_not_called()
+
+    def test_fake_runs_are_recorded_in_task_history(self):
+        service, _fake_state = self.build_service(mount_point=".")
+        with tempfile.TemporaryDirectory() as temp_dir:
+            service.history_store = TaskHistoryStore(Path(temp_dir) / "task_history.sqlite3")
+            task = service.get_task("Check Mount")
+            assert task is not None
+
+            service._run_fake_task("Check Mount", threading.Event())
+            history = service.task_history(task)
+            stats = service.task_failure_stats()
+            service.history_store.close()
+
+        self.assertEqual([run["result"] for run in history], ["success"])
+        self.assertEqual(stats["Check Mount"]["runs"], 1)
+        self.assertEqual(stats["Cloud Backup"]["runs"], 0)
+
+    def test_real_log_pages_resume_from_the_journal_cursor(self):
+        systemd_adapter = FakeSystemdAdapter()
+        service, _fake_state = self.build_service(is_fake=False, systemd_adapter=systemd_adapter)
+        task = service.get_task("Cloud Backup")
+        assert task is not None
+
+        first = task.get_log_page()
+        systemd_adapter.journal_output = "new line\n"
+        systemd_adapter.journal_cursor = "s=1;i=3"
+        second = task.get_log_page(first.cursor)
+        systemd_adapter.journal_output = ""
+        systemd_adapter.journal_cursor = None
+        idle = task.get_log_page(second.cursor)
+
+        self.assertEqual(
+            (first.text, first.cursor, first.append), ("journal output", "s=1;i=2", False)
+        )
+        self.assertEqual(
+            (second.text, second.cursor, second.append), ("new line\n", "s=1;i=3", True)
+        )
+        # An idle poll keeps the previous cursor instead of losing its place.
+        self.assertEqual((idle.text, idle.cursor, idle.append), ("", "s=1;i=3", True))
+        self.assertEqual(
+            [call[2] for call in systemd_adapter.journal_page_calls],
+            [None, "s=1;i=2", "s=1;i=3"],
+        )
+
+    def test_unusable_log_cursors_fall_back_to_a_full_window(self):
+        systemd_adapter = FakeSystemdAdapter()
+        service, _fake_state = self.build_service(is_fake=False, systemd_adapter=systemd_adapter)
+        task = service.get_task("Cloud Backup")
+        assert task is not None
+
+        vacuumed = task.get_log_page("s=dead")
+        malformed = task.get_log_page("--since=yesterday")
+
+        self.assertFalse(vacuumed.append)
+        self.assertFalse(malformed.append)
+        self.assertEqual(
+            systemd_adapter.journal_page_calls,
+            [
+                ("backup_cloud.service", TASK_LOG_LINE_LIMIT, "s=dead"),
+                ("backup_cloud.service", TASK_LOG_LINE_LIMIT, None),
+                ("backup_cloud.service", TASK_LOG_LINE_LIMIT, None),
+            ],
+        )
+
+    def test_fake_log_pages_use_offsets_into_the_task_log(self):
+        service, fake_state = self.build_service()
+        task = service.get_task("Cloud Backup")
+        assert task is not None
+
+        empty = task.get_log_page()
+        fake_state.append_task_log("Cloud Backup", "first")
+        first = task.get_log_page(empty.cursor)
+        fake_state.append_task_log("Cloud Backup", "second")
+        second = task.get_log_page(first.cursor)
+
+        self.assertEqual((empty.text, empty.append), ("No logs yet.", False))
+        self.assertEqual((first.text, first.append), ("first\n", False))
+        self.assertEqual((second.text, second.append), ("second\n", True))
+
     def test_disable_schedule_disables_timer_not_service_and_manual_start_still_works(self):
         systemd_adapter = FakeSystemdAdapter()
         service, _fake_state = self.build_service(is_fake=False, systemd_adapter=systemd_adapter)
@@ -4,7 +4,17 @@ from pathlib import Path
 from types import SimpleNamespace
 from unittest.mock import patch
 
-from simple_safer_server.services.user_manager import UserManager
+from werkzeug.security import generate_password_hash
+
+from simple_safer_server.services.file_persistence import atomic_write_json
+from simple_safer_server.services.user_manager import (
+    PASSWORD_SCRYPT_MAX_N,
+    PASSWORD_SCRYPT_MIN_N,
+    UserManager,
+    UserRegistry,
+    benchmark_password_hashing,
+    get_user_registry,
+)
 
 
 class FakeUserCommandAdapter:
@@ -162,6 +172,150 @@ class UserManagerTests(unittest.TestCase):
         self.assertEqual(message, "Failed to remove user from Samba")
         self.assertIn("operator", manager.users)
 
+    def test_failed_logins_do_not_rewrite_users_file(self):
+        manager, _adapter = self.make_manager(is_fake=True)
+        manager.create_user("operator", "OperatorPassw0rd!", is_admin=True)
+        before = manager.users_file.stat()
+
+        for _attempt in range(3):
+            self.assertFalse(manager.verify_user("operator", "wrong"))
+        self.assertTrue(manager.verify_user("operator", "OperatorPassw0rd!"))
+
+        after = manager.users_file.stat()
+        self.assertEqual((before.st_ino, before.st_mtime_ns), (after.st_ino, after.st_mtime_ns))
+        self.assertIsNotNone(manager.get_user("operator")["last_login"])
+
+    def test_lockout_survives_restart(self):
+        manager, adapter = self.make_manager(is_fake=True)
+        manager.create_user("operator", "OperatorPassw0rd!", is_admin=True)
+        for _attempt in range(5):
+            manager.verify_user("operator", "wrong")
+
+        restarted = UserManager(runtime=manager.runtime, command_adapter=adapter)
+
+        self.assertFalse(restarted.verify_user("operator", "OperatorPassw0rd!"))
+        self.assertEqual(restarted.login_ledger.state("operator")["failed_attempts"], 5)
+
+    def test_legacy_lockout_fields_are_imported_into_ledger(self):
+        manager, adapter = self.make_manager(is_fake=True)
+        manager.create_user("operator", "OperatorPassw0rd!", is_admin=True)
+        users = manager._load_users()
+        users["operator"].update(
+            failed_attempts=5,
+            locked_until="2999-01-01T00:00:00+00:00",
+            last_login="2024-01-01T00:00:00+00:00",
+        )
+        atomic_write_json(manager.users_file, users, mode=0o600)
+
+        migrated = UserManager(runtime=manager.runtime, command_adapter=adapter)
+
+        self.assertFalse(migrated.verify_user("operator", "OperatorPassw0rd!"))
+        self.assertEqual(migrated.get_user("operator")["last_login"], "2024-01-01T00:00:00+00:00")
+        self.assertNotIn("failed_attempts", migrated.users["operator"])
+
+    def test_benchmark_picks_largest_cost_within_target(self):
+        with patch("simple_safer_server.services.user_manager._scrypt_seconds", return_value=0.05):
+            policy = benchmark_password_hashing(target_seconds=0.12)
+
+        self.assertEqual(policy["method"], "scrypt:32768:8:1")
+        self.assertEqual(policy["estimated_ms"], 100.0)
+
+        with patch("simple_safer_server.services.user_manager._scrypt_seconds", return_value=0.001):
+            policy = benchmark_password_hashing(target_seconds=10)
+
+        self.assertEqual(policy["method"], f"scrypt:{PASSWORD_SCRYPT_MAX_N}:8:1")
+
+        # A host too slow for werkzeug's default drops to the documented floor.
+        with patch("simple_safer_server.services.user_manager._scrypt_seconds", return_value=0.2):
+            policy = benchmark_password_hashing(target_seconds=0.25)
+
+        self.assertEqual(policy["method"], f"scrypt:{PASSWORD_SCRYPT_MIN_N}:8:1")
+        self.assertEqual(policy["estimated_ms"], 200.0)
+
+    def test_calibration_is_persisted_for_new_hashes(self):
+        manager, adapter = self.make_manager(is_fake=True)
+        policy = manager.calibrate_password_hashing()
+        manager.create_user("operator", "OperatorPassw0rd!")
+
+        restarted = UserManager(runtime=manager.runtime, command_adapter=adapter)
+        with patch(
+            "simple_safer_server.services.user_manager.benchmark_password_hashing"
+        ) as benchmark:
+            self.assertEqual(restarted.password_hash_policy(), policy)
+
+        benchmark.assert_not_called()
+        self.assertTrue(restarted.users["operator"]["password_hash"].startswith(policy["method"]))
+
+    def test_successful_login_upgrades_outdated_hash(self):
+        manager, _adapter = self.make_manager(is_fake=True)
+        manager.create_user("operator", "OperatorPassw0rd!", is_admin=True)
+        manager.users["operator"]["password_hash"] = generate_password_hash(
+            "OperatorPassw0rd!", method="pbkdf2:sha256:1000"
+        )
+        manager._save_users()
+
+        self.assertFalse(manager.verify_user("operator", "wrong"))
+        self.assertTrue(manager._load_users()["operator"]["password_hash"].startswith("pbkdf2:"))
+        self.assertTrue(manager.verify_user("operator", "OperatorPassw0rd!"))
+
+        stored_hash = manager._load_users()["operator"]["password_hash"]
+        self.assertTrue(stored_hash.startswith(manager.password_hash_policy()["method"] + "$"))
+        self.assertTrue(manager.verify_user("operator", "OperatorPassw0rd!"))
+
+    def test_login_never_downgrades_a_stronger_hash(self):
+        manager, _adapter = self.make_manager(is_fake=True)
+        atomic_write_json(manager.password_hashing_file, {"method": "scrypt:32768:8:1"})
+        manager.create_user("operator", "OperatorPassw0rd!", is_admin=True)
+        manager.users["operator"]["password_hash"] = generate_password_hash(
+            "OperatorPassw0rd!", method="scrypt:65536:8:1"
+        )
+        manager._save_users()
+
+        self.assertTrue(manager.verify_user("operator", "OperatorPassw0rd!"))
+
+        stored_hash = manager._load_users()["operator"]["password_hash"]
+        self.assertTrue(stored_hash.startswith("scrypt:65536:8:1$"))
+
+
+class UserRegistryTests(unittest.TestCase):
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.runtime = SimpleNamespace(config_dir=Path(temp_dir.name), is_fake=True)
+        self.manager = UserManager(runtime=self.runtime, command_adapter=FakeUserCommandAdapter())
+
+    def test_demotion_by_another_manager_is_seen_on_next_check(self):
+        self.manager.create_user("operator", "OperatorPassw0rd!", is_admin=True)
+        registry = UserRegistry(self.manager.users_file)
+        self.assertTrue(registry.is_admin("operator"))
+
+        # A second manager stands in for another gthread worker's request.
+        other_manager = UserManager(runtime=self.runtime, command_adapter=FakeUserCommandAdapter())
+        other_manager.update_admin_status("operator", False)
+
+        self.assertFalse(registry.is_admin("operator"))
+
+    def test_unchanged_file_is_not_reparsed(self):
+        self.manager.create_user("operator", "OperatorPassw0rd!", is_admin=True)
+        registry = UserRegistry(self.manager.users_file)
+
+        with patch(
+            "simple_safer_server.services.user_manager.read_json", return_value={}
+        ) as read_json:
+            registry.is_admin("operator")
+            registry.is_admin("operator")
+            registry.is_admin("missing")
+
+        read_json.assert_called_once()
+
+    def test_missing_store_grants_no_admin_access(self):
+        registry = UserRegistry(self.manager.users_file)
+
+        self.assertFalse(registry.is_admin("operator"))
+
+    def test_registry_is_shared_per_users_file(self):
+        self.assertIs(get_user_registry(self.runtime), get_user_registry(self.runtime))
+
 
 if __name__ == "__main__":
     unittest.main()
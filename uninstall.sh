@@ -43,6 +43,7 @@ SCRIPT_FILES=(
   app_update.sh
   app_update.py
   restore_disabled_timers.py
+  record_task_run.py
 )
 
 # The installer writes rclone config where the root-owned scheduled tasks can